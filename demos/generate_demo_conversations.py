@@ -6,7 +6,9 @@ This script simulates conversations with preset questions and saves the agent's
 audio responses as WAV files for website demos.
 """
 
+import argparse
 import asyncio
+import hashlib
 import os
 import sys
 import json
@@ -14,7 +16,7 @@ import re
 import time
 import shutil
 from pathlib import Path
-from typing import List, Dict
+from typing import List, Dict, Optional
 import logging
 import aiohttp
 
@@ -147,15 +149,81 @@ IMPORTANT: Include the language code in your speak action:
 """
 
 
+class TokenBucket:
+    """
+    Async token bucket limiting how often a backend is called.
+
+    Parameters
+    ----------
+    rate : float
+        Tokens added per second. 0 or less disables the limit.
+    burst : int
+        Bucket size, i.e. how many calls may start back to back.
+    """
+
+    def __init__(self, rate: float, burst: int = 1):
+        self.rate = rate
+        self.burst = max(1, burst)
+        self.tokens = float(self.burst)
+        self.updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        """Wait until a token is available and take it"""
+        if self.rate <= 0:
+            return
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+
+class _session_scope:
+    """Use the given aiohttp session, or open (and close) a private one"""
+
+    def __init__(self, session: Optional[aiohttp.ClientSession]):
+        self.session = session
+        self.owned = None
+
+    async def __aenter__(self) -> aiohttp.ClientSession:
+        if self.session is not None:
+            return self.session
+        self.owned = aiohttp.ClientSession()
+        return self.owned
+
+    async def __aexit__(self, *exc):
+        if self.owned is not None:
+            await self.owned.close()
+
+
 class DemoConversationGenerator:
-    def __init__(self, output_dir: str = "demo_conversations"):
+    def __init__(
+        self,
+        output_dir: str = "demo_conversations",
+        llm_concurrency: int = 2,
+        tts_concurrency: int = 2,
+        llm_rate: float = 2.0,
+        tts_rate: float = 0.0,
+    ):
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(exist_ok=True)
+        self.manifest_file = self.output_dir / "manifest.json"
         
         # Ollama settings
         self.ollama_url = "http://localhost:11434"
         self.model = "llama3.1:8b"
         self.system_prompt = SYSTEM_PROMPT
+
+        # Pipeline settings: workers per stage and requests/second per backend
+        self.llm_concurrency = max(1, llm_concurrency)
+        self.tts_concurrency = max(1, tts_concurrency)
+        self.llm_limiter = TokenBucket(llm_rate, burst=self.llm_concurrency)
+        self.tts_limiter = TokenBucket(tts_rate, burst=self.tts_concurrency)
         
         logging.info(f"Demo generator initialized. Output: {self.output_dir}")
         
@@ -171,11 +239,66 @@ class DemoConversationGenerator:
             log_sentences=True,
             clear_on_speak=False,
         )
+        self.voice_models = {
+            "en": tts_config.model_en,
+            "es": tts_config.model_es,
+            "ru": tts_config.model_ru,
+        }
         self.tts = PiperTTSConnector(tts_config)
         
         logging.info(f"Demo generator initialized. Output: {self.output_dir}")
 
-    async def generate_response(self, question: str, language: str, context: str) -> Dict:
+    def content_hash(self, conv: Dict, language: str) -> str:
+        """Hash of everything that determines a conversation's output"""
+        key = json.dumps(
+            {
+                "model": self.model,
+                "system_prompt": self.system_prompt,
+                "voice": self.voice_models.get(language),
+                "language": language,
+                "question": conv["question"],
+                "context": conv["context"],
+            },
+            sort_keys=True,
+            ensure_ascii=False,
+        )
+        return hashlib.sha256(key.encode("utf-8")).hexdigest()
+
+    def load_manifest(self) -> Dict[str, Dict]:
+        """Previously generated conversations by content hash"""
+        if not self.manifest_file.exists():
+            return {}
+        try:
+            with open(self.manifest_file, 'r', encoding='utf-8') as f:
+                conversations = json.load(f).get('conversations', [])
+        except (OSError, json.JSONDecodeError) as e:
+            logging.warning(f"Ignoring unreadable manifest: {e}")
+            return {}
+        return {
+            c['content_hash']: c
+            for c in conversations
+            if c.get('content_hash') and os.path.exists(c.get('audio_file', ''))
+        }
+
+    def save_manifest(self, results: List[Dict]):
+        """Write the manifest atomically so an interrupted run can resume"""
+        results = sorted(results, key=lambda r: r['index'])
+        tmp_file = self.manifest_file.with_suffix('.json.tmp')
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            json.dump({
+                'generated_at': time.strftime('%Y-%m-%d %H:%M:%S'),
+                'total_conversations': len(results),
+                'conversations': results
+            }, f, indent=2, ensure_ascii=False)
+        os.replace(tmp_file, self.manifest_file)
+
+    async def generate_response(
+        self,
+        question: str,
+        language: str,
+        context: str,
+        session: Optional[aiohttp.ClientSession] = None,
+    ) -> Dict:
         """Generate LLM response for a question"""
         
         # Build prompt with language context
@@ -197,7 +320,7 @@ Response:"""
         
         # Call Ollama API directly
         try:
-            async with aiohttp.ClientSession() as session:
+            async with _session_scope(session) as session:
                 payload = {
                     "model": self.model,
                     "messages": [
@@ -275,8 +398,11 @@ Response:"""
         # Create SpeakInput
         speak_input = SpeakInput(sentence=sentence, language=language)
         
-        # Synthesize using Piper (this will create temp file in output_dir)
-        audio_path = self.tts._synthesize_with_piper(sentence, language)
+        # Synthesize using Piper (this will create temp file in output_dir).
+        # Piper runs as a blocking subprocess, so keep it off the event loop.
+        audio_path = await asyncio.to_thread(
+            self.tts._synthesize_with_piper, sentence, language
+        )
         
         if audio_path and os.path.exists(audio_path):
             # Move to final location
@@ -328,51 +454,140 @@ Response:"""
         
         return None
 
-    async def generate_all_demos(self):
-        """Generate all demo conversations"""
+    async def generate_all_demos(self, force: bool = False):
+        """
+        Generate all demo conversations.
+
+        LLM responses and TTS synthesis run as two stages connected by a
+        queue, each with its own worker pool and rate limit, so speech for
+        one answer is synthesized while the next answers are generated.
+        Conversations whose content hash is already in the manifest (with
+        the audio file present) are skipped unless `force` is set.
+        """
         
         logging.info("🎬 Starting demo conversation generation...")
-        
-        all_results = []
-        total = sum(len(lang['conversations']) for lang in DEMO_CONVERSATIONS)
-        current = 0
-        
+
+        jobs = []
         for lang_group in DEMO_CONVERSATIONS:
-            language = lang_group['language']
-            conversations = lang_group['conversations']
-            
-            logging.info(f"\n{'#'*60}")
-            logging.info(f"Processing {language.upper()} conversations")
-            logging.info(f"{'#'*60}")
-            
-            for conv in conversations:
-                current += 1
-                logging.info(f"\n[{current}/{total}] Processing...")
-                
-                result = await self.generate_conversation(conv, language, current)
-                if result:
-                    all_results.append(result)
-                
-                # Small delay between requests
-                await asyncio.sleep(1)
-        
+            for conv in lang_group['conversations']:
+                jobs.append((len(jobs) + 1, lang_group['language'], conv))
+        total = len(jobs)
+
+        previous = {} if force else self.load_manifest()
+        all_results = []
+        pending = []
+        for index, language, conv in jobs:
+            content_hash = self.content_hash(conv, language)
+            if content_hash in previous:
+                all_results.append({**previous[content_hash], 'index': index})
+            else:
+                pending.append((index, language, conv, content_hash))
+
+        skipped = len(all_results)
+        if skipped:
+            logging.info(f"⏭️  Skipping {skipped}/{total} conversations already in the manifest")
+
+        started = time.monotonic()
+        failed = 0
+        responses: asyncio.Queue = asyncio.Queue(maxsize=self.tts_concurrency * 2)
+        jobs_queue: asyncio.Queue = asyncio.Queue()
+        for job in pending:
+            jobs_queue.put_nowait(job)
+
+        def report(conv_id: str, ok: bool):
+            done = len(all_results) - skipped + failed
+            elapsed = time.monotonic() - started
+            rate = done / elapsed if elapsed > 0 else 0.0
+            eta = (len(pending) - done) / rate if rate > 0 else 0.0
+            logging.info(
+                f"[{done + skipped}/{total}] {'✅' if ok else '❌'} {conv_id} "
+                f"- {rate * 60:.1f} conversations/min, ETA {eta:.0f}s"
+            )
+
+        async def llm_worker(session: aiohttp.ClientSession):
+            nonlocal failed
+            while True:
+                try:
+                    index, language, conv, content_hash = jobs_queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+                await self.llm_limiter.acquire()
+                logging.info(f"Conversation: {conv['id']} - Question: {conv['question']}")
+                response = await self.generate_response(
+                    conv['question'], language, conv['context'], session=session
+                )
+                if not response['sentence']:
+                    logging.warning(f"Empty response for {conv['id']}")
+                    failed += 1
+                    report(conv['id'], False)
+                    continue
+                await responses.put((index, language, conv, content_hash, response))
+
+        async def tts_worker():
+            nonlocal failed
+            while True:
+                item = await responses.get()
+                try:
+                    if item is None:
+                        return
+                    index, language, conv, content_hash, response = item
+                    output_file = self.output_dir / f"{language}_{conv['id']}_response.wav"
+                    await self.tts_limiter.acquire()
+                    try:
+                        ok = await self.synthesize_audio(
+                            response['sentence'], response['language'], output_file
+                        )
+                    except Exception as e:
+                        logging.error(f"Error synthesizing {conv['id']}: {e}")
+                        ok = False
+                    if ok:
+                        all_results.append({
+                            'id': conv['id'],
+                            'language': language,
+                            'question': conv['question'],
+                            'response': response['sentence'],
+                            'audio_file': str(output_file),
+                            'index': index,
+                            'content_hash': content_hash,
+                        })
+                        self.save_manifest(all_results)
+                    else:
+                        failed += 1
+                    report(conv['id'], ok)
+                finally:
+                    responses.task_done()
+
+        if pending:
+            tts_tasks = [asyncio.create_task(tts_worker()) for _ in range(self.tts_concurrency)]
+            try:
+                async with aiohttp.ClientSession() as session:
+                    await asyncio.gather(*(
+                        llm_worker(session) for _ in range(min(self.llm_concurrency, len(pending)))
+                    ))
+                for _ in tts_tasks:
+                    await responses.put(None)
+                await asyncio.gather(*tts_tasks)
+            finally:
+                for task in tts_tasks:
+                    task.cancel()
+
         # Save manifest
-        manifest_file = self.output_dir / "manifest.json"
-        with open(manifest_file, 'w', encoding='utf-8') as f:
-            json.dump({
-                'generated_at': time.strftime('%Y-%m-%d %H:%M:%S'),
-                'total_conversations': len(all_results),
-                'conversations': all_results
-            }, f, indent=2, ensure_ascii=False)
+        self.save_manifest(all_results)
+        elapsed = time.monotonic() - started
+        generated = len(all_results) - skipped
         
         logging.info(f"\n{'='*60}")
         logging.info(f"✅ Generation complete!")
         logging.info(f"📁 Output directory: {self.output_dir}")
-        logging.info(f"📊 Generated {len(all_results)} conversations")
-        logging.info(f"📄 Manifest: {manifest_file}")
+        logging.info(
+            f"📊 Generated {generated}, skipped {skipped}, failed {failed} "
+            f"in {elapsed:.1f}s"
+            + (f" ({generated / elapsed * 60:.1f} conversations/min)" if generated and elapsed > 0 else "")
+        )
+        logging.info(f"📄 Manifest: {self.manifest_file}")
         logging.info(f"{'='*60}")
         
-        return all_results
+        return sorted(all_results, key=lambda r: r['index'])
 
 
 async def main():
@@ -384,10 +599,30 @@ async def main():
 ╚════════════════════════════════════════════════════════════╝
     """)
     
-    generator = DemoConversationGenerator()
+    parser = argparse.ArgumentParser(description="Generate demo conversation audio")
+    parser.add_argument("--output-dir", default="demo_conversations")
+    parser.add_argument("--llm-concurrency", type=int, default=2,
+                        help="Concurrent LLM requests")
+    parser.add_argument("--tts-concurrency", type=int, default=2,
+                        help="Concurrent Piper processes")
+    parser.add_argument("--llm-rate", type=float, default=2.0,
+                        help="Max LLM requests per second (0 = unlimited)")
+    parser.add_argument("--tts-rate", type=float, default=0.0,
+                        help="Max TTS syntheses per second (0 = unlimited)")
+    parser.add_argument("--force", action="store_true",
+                        help="Regenerate conversations already in the manifest")
+    args = parser.parse_args()
+
+    generator = DemoConversationGenerator(
+        output_dir=args.output_dir,
+        llm_concurrency=args.llm_concurrency,
+        tts_concurrency=args.tts_concurrency,
+        llm_rate=args.llm_rate,
+        tts_rate=args.tts_rate,
+    )
     
     try:
-        results = await generator.generate_all_demos()
+        results = await generator.generate_all_demos(force=args.force)
         
         print("\n" + "="*60)
         print("📋 SUMMARY")
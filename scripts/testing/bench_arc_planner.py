@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Benchmark the vectorized ArcPlanner against the lidar scan period, and
+against the straight-path check in RPLidarProvider, on synthetic scans.
+
+Run from the repository root, ideally on the robot's own (ARM) computer:
+
+    uv run scripts/testing/bench_arc_planner.py
+"""
+
+import argparse
+import os
+import platform
+import sys
+import timeit
+
+sys.path.insert(
+    0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "src")
+)
+
+import numpy as np  # noqa: E402
+
+from providers.arc_planner import ArcPlanner  # noqa: E402
+
+
+def scan(beams: int, max_range: float = 1.1):
+    """
+    A cluttered room: random returns within `max_range`, as x forwards and
+    y to the left, after RPLidarProvider's range filtering.
+    """
+    rng = np.random.default_rng(0)
+    bearings = np.linspace(-np.pi, np.pi, beams, endpoint=False)
+    ranges = rng.uniform(0.2, max_range, beams)
+    return ranges * np.cos(bearings), ranges * np.sin(bearings)
+
+
+def straight_paths(x, y, half_width: float = 0.2):
+    """
+    The existing 10-path check: every path against every point, one path
+    at a time.
+    """
+    blocked = []
+    for angle in (-60, -45, -30, -15, 0, 15, 30, 45, 60, 180):
+        a = np.radians(angle)
+        dx, dy = np.cos(a), -np.sin(a)
+        t = np.clip(x * dx + y * dy, 0, 1)
+        blocked.append(np.any(np.hypot(x - t * dx, y - t * dy) < half_width))
+    return blocked
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=50)
+    parser.add_argument(
+        "--scan-hz", type=float, default=10.0, help="lidar scan rate, A1M8 ~ 10 Hz"
+    )
+    args = parser.parse_args()
+
+    period_ms = 1000.0 / args.scan_hz
+    print(f"{platform.machine()} {platform.processor() or ''} numpy {np.__version__}")
+    print(f"scan period {period_ms:.0f} ms\n")
+    print(
+        f"{'planner':<28} {'arcs':>6} {'points':>7} {'ms/scan':>9} "
+        f"{'% of scan':>10}"
+    )
+
+    for linear, angular in ((5, 21), (9, 41), (15, 61)):
+        planner = ArcPlanner(linear_samples=linear, angular_samples=angular)
+        for beams in (360, 720, 1440):
+            x, y = scan(beams)
+            planner.plan(x, y)
+            seconds = min(
+                timeit.repeat(lambda: planner.plan(x, y), number=1, repeat=args.repeat)
+            )
+            print(
+                f"{f'ArcPlanner {linear}x{angular}':<28} {planner.arc_count:>6} "
+                f"{beams:>7} {seconds * 1e3:>9.3f} "
+                f"{100 * seconds * 1e3 / period_ms:>9.1f}%"
+            )
+
+    for beams in (360, 720, 1440):
+        x, y = scan(beams)
+        seconds = min(
+            timeit.repeat(lambda: straight_paths(x, y), number=1, repeat=args.repeat)
+        )
+        print(
+            f"{'straight paths (baseline)':<28} {10:>6} {beams:>7} "
+            f"{seconds * 1e3:>9.3f} {100 * seconds * 1e3 / period_ms:>9.1f}%"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Benchmark the numpy CDR decoders in zenoh_msgs.cdr against pycdr2
+IdlStruct.deserialize on realistic message sizes.
+
+Run from the repository root:
+
+    uv run scripts/testing/bench_cdr_decoding.py
+"""
+
+import argparse
+import os
+import sys
+import timeit
+
+sys.path.insert(
+    0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "src")
+)
+
+import numpy as np  # noqa: E402
+
+from zenoh_msgs import (  # noqa: E402
+    Image,
+    LaserScan,
+    Point32,
+    PointCloud,
+    decode_image,
+    decode_laser_scan,
+    decode_point_cloud,
+    prepare_header,
+)
+
+
+def laser_scan(beams: int) -> bytes:
+    rng = np.random.default_rng(0)
+    return LaserScan(
+        header=prepare_header("laser"),
+        angle_min=-np.pi,
+        angle_max=np.pi,
+        angle_increment=2 * np.pi / beams,
+        time_increment=0.0,
+        scan_time=0.1,
+        range_min=0.15,
+        range_max=12.0,
+        ranges=rng.uniform(0.15, 12.0, beams).astype(np.float32).tolist(),
+        intensities=rng.uniform(0, 47, beams).astype(np.float32).tolist(),
+    ).serialize()
+
+
+def point_cloud(points: int) -> bytes:
+    rng = np.random.default_rng(0)
+    xyz = rng.uniform(-3, 3, (points, 3)).astype(np.float32).tolist()
+    return PointCloud(
+        header=prepare_header("camera_depth_optical_frame"),
+        points=[Point32(x=x, y=y, z=z) for x, y, z in xyz],
+        channels=[],
+    ).serialize()
+
+
+def image(width: int, height: int) -> bytes:
+    return Image(
+        header=prepare_header("camera_color_optical_frame"),
+        height=height,
+        width=width,
+        encoding="rgb8",
+        is_bigendian=0,
+        step=width * 3,
+        data=np.zeros(width * height * 3, dtype=np.uint8).tobytes(),
+    ).serialize()
+
+
+def bench(name: str, payload: bytes, slow, fast, to_array, repeat: int):
+    def slow_path():
+        return to_array(slow(payload))
+
+    def fast_path():
+        return fast(payload)
+
+    slow_s = min(timeit.repeat(slow_path, number=1, repeat=repeat))
+    fast_s = min(timeit.repeat(fast_path, number=1, repeat=repeat))
+    print(
+        f"{name:<28} {len(payload) / 1024:>9.1f} KiB "
+        f"{slow_s * 1e3:>10.3f} ms {fast_s * 1e3:>10.3f} ms "
+        f"{slow_s / fast_s:>8.1f}x"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    print(f"{'message':<28} {'size':>13} {'pycdr2':>13} {'numpy':>13} {'speedup':>9}")
+
+    for beams in (720, 2000):
+        bench(
+            f"LaserScan {beams} beams",
+            laser_scan(beams),
+            LaserScan.deserialize,
+            decode_laser_scan,
+            lambda scan: np.array(scan.ranges, dtype=np.float32),
+            args.repeat,
+        )
+
+    for points in (2000, 20000):
+        bench(
+            f"PointCloud {points} points",
+            point_cloud(points),
+            PointCloud.deserialize,
+            decode_point_cloud,
+            lambda cloud: np.array([[p.x, p.y, p.z] for p in cloud.points]),
+            args.repeat,
+        )
+
+    bench(
+        "Image 640x480 rgb8",
+        image(640, 480),
+        Image.deserialize,
+        decode_image,
+        lambda img: np.array(img.data, dtype=np.uint8),
+        max(3, args.repeat // 4),
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+Benchmark input-triggered mode transition matching on large synthetic rule
+sets: the compiled per-mode keyword automaton in ModeManager against the
+previous scan over every rule and keyword.
+
+Run from the repository root:
+
+    uv run scripts/testing/bench_mode_transitions.py
+"""
+
+import argparse
+import os
+import random
+import sys
+import timeit
+from unittest.mock import patch
+
+sys.path.insert(
+    0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "src")
+)
+
+from runtime.multi_mode.config import (  # noqa: E402
+    ModeConfig,
+    ModeSystemConfig,
+    TransitionRule,
+    TransitionType,
+)
+from runtime.multi_mode.manager import ModeManager  # noqa: E402
+
+WORDS = (
+    "badge visitor lobby elevator parking meeting room floor desk security "
+    "delivery package tour guide coffee restroom wifi password schedule "
+    "appointment doctor nurse pharmacy emergency exit stairs cafeteria "
+    "reception checkin checkout interview conference"
+).split()
+
+
+def build_config(modes: int, rules_per_mode: int, keywords_per_rule: int):
+    rng = random.Random(0)
+    names = [f"mode_{i}" for i in range(modes)]
+    config = ModeSystemConfig(
+        name="bench",
+        default_mode=names[0],
+        mode_memory_enabled=False,
+        modes={
+            name: ModeConfig(
+                name=name, display_name=name, description="", system_prompt_base=""
+            )
+            for name in names
+        },
+    )
+
+    for source in names + ["*"]:
+        for _ in range(rules_per_mode):
+            keywords = [
+                " ".join(rng.sample(WORDS, 2)) + f" {rng.randrange(1000)}"
+                for _ in range(keywords_per_rule)
+            ]
+            config.transition_rules.append(
+                TransitionRule(
+                    from_mode=source,
+                    to_mode=rng.choice(names),
+                    transition_type=TransitionType.INPUT_TRIGGERED,
+                    trigger_keywords=keywords,
+                    priority=rng.randrange(10),
+                )
+            )
+    return config
+
+
+def legacy_match(manager: ModeManager, input_text: str):
+    """
+    The matching loop ModeManager used before rules were compiled.
+    """
+    input_lower = input_text.lower()
+    matching_rules = []
+    for rule in manager.config.transition_rules:
+        if (
+            rule.from_mode == manager.state.current_mode or rule.from_mode == "*"
+        ) and rule.transition_type == TransitionType.INPUT_TRIGGERED:
+            for keyword in rule.trigger_keywords:
+                if keyword.lower() in input_lower:
+                    if manager._can_transition(rule):
+                        matching_rules.append(rule)
+                    break
+    if matching_rules:
+        matching_rules.sort(key=lambda r: r.priority, reverse=True)
+        return matching_rules[0].to_mode
+    return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--number", type=int, default=200)
+    args = parser.parse_args()
+
+    rng = random.Random(1)
+    inputs = [
+        " ".join(rng.choice(WORDS) for _ in range(rng.randint(5, 25)))
+        for _ in range(50)
+    ]
+
+    print(
+        f"{'modes':>6} {'rules':>6} {'keywords':>9} {'compile':>10} "
+        f"{'legacy':>12} {'compiled':>12} {'speedup':>8}"
+    )
+    for modes, rules_per_mode, keywords_per_rule in (
+        (5, 4, 5),
+        (20, 10, 10),
+        (50, 10, 20),
+    ):
+        config = build_config(modes, rules_per_mode, keywords_per_rule)
+        with patch("runtime.multi_mode.manager.open_zenoh_session"):
+            manager = ModeManager(config)
+
+        compile_s = min(timeit.repeat(manager.compile_transition_rules, number=1))
+        for text in inputs:
+            assert legacy_match(manager, text) == (
+                manager.check_input_triggered_transitions(text)
+            )
+
+        def legacy():
+            for text in inputs:
+                legacy_match(manager, text)
+
+        def compiled():
+            for text in inputs:
+                manager.check_input_triggered_transitions(text)
+
+        per_input = args.number * len(inputs)
+        legacy_s = min(timeit.repeat(legacy, number=args.number, repeat=3))
+        compiled_s = min(timeit.repeat(compiled, number=args.number, repeat=3))
+        keywords = sum(len(r.trigger_keywords) for r in config.transition_rules)
+        print(
+            f"{modes:>6} {len(config.transition_rules):>6} {keywords:>9} "
+            f"{compile_s * 1e3:>7.1f} ms "
+            f"{legacy_s / per_input * 1e6:>9.1f} us "
+            f"{compiled_s / per_input * 1e6:>9.1f} us "
+            f"{legacy_s / compiled_s:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,524 @@
+import logging
+import math
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Callable, Deque, Dict, List, Optional, Tuple
+
+
+def wrap_degrees(angle: float) -> float:
+    """
+    Wrap an angle to [-180, 180) degrees.
+    """
+    return (angle + 180.0) % 360.0 - 180.0
+
+
+@dataclass
+class Pose:
+    """
+    Robot pose in the odometry frame.
+
+    Parameters
+    ----------
+    x : float
+        Position in meters.
+    y : float
+        Position in meters.
+    yaw : float
+        Heading in degrees, increasing counter-clockwise (to the left).
+    stamp : float
+        Time the pose was measured.
+    """
+
+    x: float
+    y: float
+    yaw: float
+    stamp: float
+
+
+def pose_from_odom(odom) -> Optional[Pose]:
+    """
+    Read the latest pose of an `OdomProvider`.
+
+    Parameters
+    ----------
+    odom : OdomProvider
+        The odometry provider.
+
+    Returns
+    -------
+    Optional[Pose]
+        The pose, or None while the provider is waiting for its first sample.
+    """
+    position = odom.position
+    if position["odom_x"] == 0.0:
+        # never precisely zero except while waiting for data to arrive
+        return None
+    return Pose(
+        x=position["odom_x"],
+        y=position["odom_y"],
+        yaw=position["odom_yaw_m180_p180"],
+        stamp=position["odom_subscriber_ts"] or time.time(),
+    )
+
+
+@dataclass
+class MotionGoal:
+    """
+    Turn to a heading, then drive a distance along it.
+
+    Parameters
+    ----------
+    yaw : Optional[float]
+        Heading to turn to, in degrees.
+    turn : float
+        Turn relative to the heading the robot has when the goal starts, in
+        degrees, positive to the left; used when `yaw` is None. Queued goals
+        are usually relative, since the robot moves before they start.
+    distance : float
+        Distance to drive after the turn, in meters; negative drives
+        backwards.
+    max_speed : Optional[float]
+        Speed limit of the goal in m/s; the controller limit when not given.
+    label : str
+        Name used in logs and reports, e.g. "turn left".
+    """
+
+    yaw: Optional[float] = None
+    turn: float = 0.0
+    distance: float = 0.0
+    max_speed: Optional[float] = None
+    label: str = ""
+
+
+@dataclass
+class GoalReport:
+    """
+    How a goal went.
+
+    Parameters
+    ----------
+    label : str
+        Label of the goal.
+    outcome : str
+        "reached", "timeout", "blocked", "cancelled" or "stale odometry".
+    time_to_goal_s : float
+        Time from the start of the goal to its end.
+    heading_error : float
+        Heading error at the end, in degrees.
+    distance_error : float
+        Distance still to drive at the end, in meters.
+    max_overshoot : float
+        Largest heading overshoot past the target during the turn, in
+        degrees.
+    rms_cross_track : float
+        RMS distance from the straight line of the drive, in meters.
+    cycles : int
+        Control cycles spent on the goal.
+    """
+
+    label: str
+    outcome: str
+    time_to_goal_s: float
+    heading_error: float
+    distance_error: float
+    max_overshoot: float
+    rms_cross_track: float
+    cycles: int
+
+
+@dataclass
+class _ActiveGoal:
+    goal: MotionGoal
+    started: float
+    start: Pose
+    yaw: float
+    turning: bool = True
+    initial_sign: float = 0.0
+    max_overshoot: float = 0.0
+    cross_track_sq: float = 0.0
+    drive_cycles: int = 0
+    cycles: int = 0
+    settled: int = 0
+
+
+@dataclass
+class MotionLimits:
+    """
+    Velocity and acceleration limits and tolerances of a robot.
+
+    Parameters
+    ----------
+    max_linear : float
+        Top driving speed in m/s.
+    linear_accel : float
+        Driving acceleration and deceleration in m/s^2.
+    min_linear : float
+        Smallest driving speed that still moves the robot, in m/s.
+    max_angular : float
+        Top turn rate in rad/s.
+    angular_accel : float
+        Turn acceleration and deceleration in rad/s^2.
+    min_angular : float
+        Smallest turn rate that still turns the robot, in rad/s.
+    heading_gain : float
+        Proportional gain of heading hold while driving, in (rad/s) per rad.
+    yaw_tolerance : float
+        Heading error at which a turn is done, in degrees.
+    distance_tolerance : float
+        Distance error at which a drive is done, in meters.
+    settle_cycles : int
+        Consecutive cycles within tolerance before a turn counts as done.
+    checked_turn : float
+        Heading error, in degrees, above which the turn side is checked for
+        obstacles; the last small rotations are not.
+    """
+
+    max_linear: float = 0.5
+    linear_accel: float = 0.5
+    min_linear: float = 0.05
+    max_angular: float = 0.8
+    angular_accel: float = 1.5
+    min_angular: float = 0.1
+    heading_gain: float = 1.5
+    yaw_tolerance: float = 3.0
+    distance_tolerance: float = 0.03
+    settle_cycles: int = 2
+    checked_turn: float = 10.0
+
+
+def _profile(error: float, max_rate: float, accel: float, min_rate: float) -> float:
+    """
+    Trapezoidal velocity profile: the fastest rate from which the robot can
+    still stop within `error`, capped at `max_rate`.
+    """
+    rate = min(max_rate, math.sqrt(2.0 * accel * abs(error)))
+    return math.copysign(max(rate, min_rate), error)
+
+
+def _slew(target: float, previous: float, accel: float, dt: float) -> float:
+    step = accel * dt
+    return min(previous + step, max(previous - step, target))
+
+
+class MotionController:
+    """
+    Closed-loop motion controller running at a fixed control rate.
+
+    Goals are queued and executed in order: a profiled turn in place to the
+    goal heading, then a profiled drive along it with proportional heading
+    hold. Every cycle the controller reads the latest odometry pose and sends
+    a velocity command, so the command tracks the robot instead of assuming
+    a fixed response to a fixed command.
+
+    Parameters
+    ----------
+    send_velocity : Callable[[float, float], None]
+        Sends a command: forward speed in m/s and turn rate in rad/s,
+        positive to the left.
+    read_pose : Callable[[], Optional[Pose]]
+        Latest odometry pose, or None while there is none.
+    rate_hz : float
+        Control rate.
+    limits : Optional[MotionLimits]
+        Robot limits and tolerances.
+    max_queue : int
+        Goals submitted while this many are queued are rejected.
+    goal_timeout : float
+        Seconds a goal may take before it is abandoned.
+    odom_timeout : float
+        The robot is stopped while the latest pose is older than this.
+    can_drive : Optional[Callable[[int], bool]]
+        Whether driving forwards (1) or backwards (-1) is clear of obstacles;
+        a blocked drive ends the goal.
+    can_turn : Optional[Callable[[int], bool]]
+        Whether turning left (1) or right (-1) is clear of obstacles; a
+        blocked turn ends the goal.
+    clock : Callable[[], float]
+        Time source; odometry stamps must use the same clock.
+    """
+
+    def __init__(
+        self,
+        send_velocity: Callable[[float, float], None],
+        read_pose: Callable[[], Optional[Pose]],
+        rate_hz: float = 20.0,
+        limits: Optional[MotionLimits] = None,
+        max_queue: int = 3,
+        goal_timeout: float = 15.0,
+        odom_timeout: float = 0.5,
+        can_drive: Optional[Callable[[int], bool]] = None,
+        can_turn: Optional[Callable[[int], bool]] = None,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.send_velocity = send_velocity
+        self.read_pose = read_pose
+        self.period = 1.0 / rate_hz
+        self.limits = limits or MotionLimits()
+        self.max_queue = max_queue
+        self.goal_timeout = goal_timeout
+        self.odom_timeout = odom_timeout
+        self.can_drive = can_drive
+        self.can_turn = can_turn
+        self.clock = clock
+
+        self.reports: Deque[GoalReport] = deque(maxlen=100)
+        self._goals: Deque[MotionGoal] = deque()
+        self._active: Optional[_ActiveGoal] = None
+        self._command: Tuple[float, float] = (0.0, 0.0)
+        self._lock = threading.Lock()
+        self._next_cycle: Optional[float] = None
+        self._last_step: Optional[float] = None
+
+    @property
+    def busy(self) -> bool:
+        """
+        Whether a goal is running or queued.
+        """
+        with self._lock:
+            return self._active is not None or bool(self._goals)
+
+    def submit(self, goal: MotionGoal) -> bool:
+        """
+        Queue a goal.
+
+        Parameters
+        ----------
+        goal : MotionGoal
+            The goal.
+
+        Returns
+        -------
+        bool
+            False if the queue is full.
+        """
+        with self._lock:
+            if len(self._goals) >= self.max_queue:
+                logging.info(f"Motion queue full: disregarding {goal.label}")
+                return False
+            self._goals.append(goal)
+        logging.info(f"Motion goal queued: {goal}")
+        return True
+
+    def stop(self) -> None:
+        """
+        Cancel the running and queued goals and stop the robot.
+        """
+        with self._lock:
+            if self._active is not None:
+                self._finish(self._active, "cancelled", self.read_pose())
+            self._goals.clear()
+        self._send(0.0, 0.0)
+
+    def tick(self) -> None:
+        """
+        Run one control cycle and wait for the next one. Cycles are scheduled
+        on fixed deadlines, so the time spent computing and sending commands
+        does not lower the rate.
+        """
+        now = self.clock()
+        if self._next_cycle is None or now - self._next_cycle > self.period:
+            # first cycle, or we fell behind: restart the schedule
+            self._next_cycle = now
+        self.step(now)
+        self._next_cycle += self.period
+        delay = self._next_cycle - self.clock()
+        if delay > 0:
+            time.sleep(delay)
+
+    def step(self, now: Optional[float] = None) -> Tuple[float, float]:
+        """
+        Run one control cycle.
+
+        Parameters
+        ----------
+        now : Optional[float]
+            The current time.
+
+        Returns
+        -------
+        Tuple[float, float]
+            The forward speed and turn rate sent.
+        """
+        now = self.clock() if now is None else now
+        dt = self.period if self._last_step is None else now - self._last_step
+        dt = min(max(dt, 0.0), 2 * self.period)
+        self._last_step = now
+
+        pose = self.read_pose()
+        with self._lock:
+            if self._active is None:
+                if not self._goals:
+                    if self._command != (0.0, 0.0):
+                        self._send(0.0, 0.0)
+                    return self._command
+                if pose is None:
+                    return self._command
+                self._active = self._start(self._goals.popleft(), pose, now)
+
+            active = self._active
+            if pose is None or now - pose.stamp > self.odom_timeout:
+                if now - active.started > self.goal_timeout:
+                    self._finish(active, "stale odometry", pose)
+                self._send(0.0, 0.0)
+                return self._command
+
+            active.cycles += 1
+            if now - active.started > self.goal_timeout:
+                self._finish(active, "timeout", pose)
+                self._send(0.0, 0.0)
+                return self._command
+
+            if active.turning:
+                linear, angular = self._turn(active, pose, dt)
+            else:
+                linear, angular = self._drive(active, pose, dt)
+            self._send(linear, angular)
+            return self._command
+
+    def _start(self, goal: MotionGoal, pose: Pose, now: float) -> _ActiveGoal:
+        yaw = wrap_degrees(pose.yaw + goal.turn if goal.yaw is None else goal.yaw)
+        active = _ActiveGoal(goal=goal, started=now, start=pose, yaw=yaw)
+        active.initial_sign = math.copysign(1.0, wrap_degrees(yaw - pose.yaw))
+        logging.info(f"Motion goal started: {goal.label or goal}")
+        return active
+
+    def _turn(self, active: _ActiveGoal, pose: Pose, dt: float) -> Tuple[float, float]:
+        limits = self.limits
+        error = wrap_degrees(active.yaw - pose.yaw)
+        if error * active.initial_sign < 0:
+            active.max_overshoot = max(active.max_overshoot, abs(error))
+
+        if abs(error) <= limits.yaw_tolerance:
+            active.settled += 1
+            if active.settled >= limits.settle_cycles:
+                active.turning = False
+                # the drive starts where the turn ended
+                active.start = pose
+                if active.goal.distance == 0:
+                    self._finish(active, "reached", pose)
+                return 0.0, 0.0
+            return 0.0, 0.0
+        active.settled = 0
+
+        direction = 1 if error > 0 else -1
+        if (
+            self.can_turn is not None
+            and abs(error) > limits.checked_turn
+            and not self.can_turn(direction)
+        ):
+            logging.warning("Motion goal blocked by an obstacle")
+            self._finish(active, "blocked", pose)
+            return 0.0, 0.0
+
+        target = _profile(
+            math.radians(error),
+            limits.max_angular,
+            limits.angular_accel,
+            limits.min_angular,
+        )
+        return 0.0, _slew(target, self._command[1], limits.angular_accel, dt)
+
+    def _drive(self, active: _ActiveGoal, pose: Pose, dt: float) -> Tuple[float, float]:
+        limits = self.limits
+        goal = active.goal
+        heading = math.radians(active.yaw)
+        dx, dy = pose.x - active.start.x, pose.y - active.start.y
+        progress = dx * math.cos(heading) + dy * math.sin(heading)
+        cross_track = -dx * math.sin(heading) + dy * math.cos(heading)
+        active.cross_track_sq += cross_track**2
+        active.drive_cycles += 1
+
+        remaining = goal.distance - progress
+        if abs(remaining) <= limits.distance_tolerance:
+            self._finish(active, "reached", pose)
+            return 0.0, 0.0
+
+        direction = 1 if remaining > 0 else -1
+        if self.can_drive is not None and not self.can_drive(direction):
+            logging.warning("Motion goal blocked by an obstacle")
+            self._finish(active, "blocked", pose)
+            return 0.0, 0.0
+
+        max_speed = min(goal.max_speed or limits.max_linear, limits.max_linear)
+        target = _profile(remaining, max_speed, limits.linear_accel, limits.min_linear)
+        linear = _slew(target, self._command[0], limits.linear_accel, dt)
+
+        # proportional heading hold against drift while driving
+        heading_error = math.radians(wrap_degrees(active.yaw - pose.yaw))
+        angular = limits.heading_gain * heading_error
+        angular = max(-limits.max_angular, min(limits.max_angular, angular))
+        return linear, angular
+
+    def _finish(self, active: _ActiveGoal, outcome: str, pose: Optional[Pose]):
+        heading_error = distance_error = 0.0
+        if pose is not None:
+            heading_error = wrap_degrees(active.yaw - pose.yaw)
+            if not active.turning:
+                heading = math.radians(active.yaw)
+                progress = (pose.x - active.start.x) * math.cos(heading) + (
+                    pose.y - active.start.y
+                ) * math.sin(heading)
+                distance_error = active.goal.distance - progress
+            else:
+                distance_error = active.goal.distance
+        report = GoalReport(
+            label=active.goal.label,
+            outcome=outcome,
+            time_to_goal_s=(
+                self.clock() - active.started
+                if pose is None
+                else pose.stamp - active.started
+            ),
+            heading_error=round(heading_error, 2),
+            distance_error=round(distance_error, 3),
+            max_overshoot=round(active.max_overshoot, 2),
+            rms_cross_track=round(
+                (
+                    math.sqrt(active.cross_track_sq / active.drive_cycles)
+                    if active.drive_cycles
+                    else 0.0
+                ),
+                3,
+            ),
+            cycles=active.cycles,
+        )
+        self.reports.append(report)
+        self._active = None
+        log = logging.info if outcome == "reached" else logging.warning
+        log(f"Motion goal {outcome}: {report}")
+
+    def _send(self, linear: float, angular: float) -> None:
+        self._command = (linear, angular)
+        try:
+            self.send_velocity(linear, angular)
+        except Exception as e:
+            logging.error(f"Error sending velocity command: {e}")
+
+    def summary(self) -> Dict[str, float]:
+        """
+        Get metrics over the recent goals.
+
+        Returns
+        -------
+        Dict[str, float]
+            Goal count, share reached, and the mean time to goal, final
+            heading and distance errors, overshoot and cross-track error of
+            the reached goals.
+        """
+        reports: List[GoalReport] = list(self.reports)
+        reached = [r for r in reports if r.outcome == "reached"]
+
+        def mean(values: List[float]) -> float:
+            return round(sum(values) / len(values), 3) if values else 0.0
+
+        return {
+            "goals": len(reports),
+            "reached_rate": len(reached) / len(reports) if reports else 0.0,
+            "mean_time_to_goal_s": mean([r.time_to_goal_s for r in reached]),
+            "mean_heading_error": mean([abs(r.heading_error) for r in reached]),
+            "mean_distance_error": mean([abs(r.distance_error) for r in reached]),
+            "mean_overshoot": mean([r.max_overshoot for r in reached]),
+            "mean_cross_track": mean([r.rms_cross_track for r in reached]),
+        }
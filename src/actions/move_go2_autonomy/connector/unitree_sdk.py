@@ -1,11 +1,14 @@
 import logging
-import math
 import random
 import time
-from queue import Queue
-from typing import List, Optional
 
-from actions.base import ActionConfig, ActionConnector, MoveCommand
+from actions.base import ActionConfig, ActionConnector
+from actions.motion_controller import (
+    MotionController,
+    MotionGoal,
+    MotionLimits,
+    pose_from_odom,
+)
 from actions.move_go2_autonomy.interface import MoveInput
 from providers.odom_provider import OdomProvider, RobotState
 from providers.rplidar_provider import RPLidarProvider
@@ -24,10 +27,6 @@ class MoveUnitreeSDKConnector(ActionConnector[MoveInput]):
         self.turn_speed = 0.8
         self.angle_tolerance = 5.0  # degrees
         self.distance_tolerance = 0.05  # meters
-        self.pending_movements: Queue[Optional[MoveCommand]] = Queue()
-        self.movement_attempts = 0
-        self.movement_attempt_limit = 15
-        self.gap_previous = 0
 
         self.lidar = RPLidarProvider()
         self.unitree_go2_state = UnitreeGo2StateProvider()
@@ -48,11 +47,33 @@ class MoveUnitreeSDKConnector(ActionConnector[MoveInput]):
         self.odom = OdomProvider(channel=unitree_ethernet)
         logging.info(f"Autonomy Odom Provider: {self.odom}")
 
+        # closed-loop turns and advances at a fixed control rate
+        self.controller = MotionController(
+            send_velocity=lambda vx, vturn: self._move_robot(vx, 0.0, vturn),
+            read_pose=lambda: pose_from_odom(self.odom),
+            rate_hz=getattr(config, "control_rate_hz", 20.0),
+            limits=MotionLimits(
+                max_linear=0.5,
+                max_angular=self.turn_speed,
+                yaw_tolerance=self.angle_tolerance,
+                distance_tolerance=self.distance_tolerance,
+            ),
+            max_queue=getattr(config, "motion_queue_size", 1),
+            can_drive=self._can_drive,
+            can_turn=self._can_turn,
+        )
+
     async def connect(self, output_interface: MoveInput) -> None:
 
         # this is used only by the LLM
         logging.info(f"AI command.connect: {output_interface.action}")
 
+        if output_interface.action == "stand still":
+            # stopping is never queued behind other movements
+            logging.info("AI movement command: stand still")
+            self.controller.stop()
+            return
+
         if self.unitree_go2_state.state_code == 1002:
             if self.sport_client:
                 logging.info("Robot is in jointLock state - issuing BalanceStand()")
@@ -66,17 +87,13 @@ class MoveUnitreeSDKConnector(ActionConnector[MoveInput]):
 
         # fallback to the odom provider
         if not self.unitree_go2_state.state_code:
-            if self.odom.position["moving"]:
+            if self.odom.position["moving"] and not self.controller.busy:
                 # for example due to a teleops or game controller command
                 logging.info(
                     "Disregard new AI movement command - robot is already moving"
                 )
                 return
 
-        if self.pending_movements.qsize() > 0:
-            logging.info("Movement in progress: disregarding new AI command")
-            return
-
         if self.odom.position["odom_x"] == 0.0:
             # this value is never precisely zero EXCEPT while
             # booting and waiting for data to arrive
@@ -89,7 +106,6 @@ class MoveUnitreeSDKConnector(ActionConnector[MoveInput]):
             "turn right": self._process_turn_right,
             "move forwards": self._process_move_forward,
             "move back": self._process_move_back,
-            "stand still": lambda: logging.info("AI movement command: stand still"),
         }
 
         handler = movement_map.get(output_interface.action)
@@ -132,7 +148,7 @@ class MoveUnitreeSDKConnector(ActionConnector[MoveInput]):
         vturn : float, optional
             Angular velocity (turning speed) in radians per second (default is 0.0).
         """
-        logging.info(f"_move_robot: vx={vx}, vy={vy}, vturn={vturn}")
+        logging.debug(f"_move_robot: vx={vx}, vy={vy}, vturn={vturn}")
 
         if not self.sport_client:
             return
@@ -144,18 +160,56 @@ class MoveUnitreeSDKConnector(ActionConnector[MoveInput]):
             self.sport_client.BalanceStand()
 
         try:
-            logging.info(f"self.sport_client.Move: vx={vx}, vy={vy}, vturn={vturn}")
+            logging.debug(f"self.sport_client.Move: vx={vx}, vy={vy}, vturn={vturn}")
             self.sport_client.Move(vx, vy, vturn)
         except Exception as e:
             logging.error(f"Error moving robot: {e}")
 
-    def clean_abort(self) -> None:
+    def _can_drive(self, direction: int) -> bool:
         """
-        Cleanly abort current movement and reset state.
+        Check the lidar before every advance or retreat step.
+
+        Parameters
+        ----------
+        direction : int
+            1 to advance, -1 to retreat.
+
+        Returns
+        -------
+        bool
+            True if the path is clear.
         """
-        self.movement_attempts = 0
-        if not self.pending_movements.empty():
-            self.pending_movements.get()
+        if direction > 0:
+            if 4 not in self.lidar.advance:
+                logging.warning("Cannot advance due to barrier")
+                return False
+        elif not self.lidar.retreat:
+            logging.warning("Cannot retreat due to barrier")
+            return False
+        return True
+
+    def _can_turn(self, direction: int) -> bool:
+        """
+        Check the lidar before every large turn step.
+
+        Parameters
+        ----------
+        direction : int
+            1 to turn left, -1 to turn right.
+
+        Returns
+        -------
+        bool
+            True if the side is clear.
+        """
+        if direction > 0:
+            if not self.lidar.turn_left:
+                logging.warning("Cannot turn left due to barrier")
+                return False
+        elif not self.lidar.turn_right:
+            logging.warning("Cannot turn right due to barrier")
+            return False
+        return True
 
     def tick(self) -> None:
         """
@@ -182,117 +236,52 @@ class MoveUnitreeSDKConnector(ActionConnector[MoveInput]):
 
         # if we got to this point, we have good data and we are able to
         # safely proceed
-        target: List[MoveCommand] = list(self.pending_movements.queue)
+        self.controller.tick()
+
+    def _submit_arc(self, goal_heading: float, label: str) -> bool:
+        """
+        Drive along the chord of the best lidar arc towards a heading.
 
-        if len(target) > 0:
+        Parameters
+        ----------
+        goal_heading : float
+            Desired heading change in degrees, positive to the left.
+        label : str
+            Label of the motion goal.
 
-            current_target = target[0]
+        Returns
+        -------
+        bool
+            True if the local planner is enabled and handled the command.
+        """
+        plan = self.lidar.plan_arc(goal_heading)
+        if plan is None:
+            return False
 
+        if not plan.admissible:
+            logging.warning(f"Cannot {label} - no clear arc")
+        else:
             logging.info(
-                f"Target: {current_target} current yaw: {self.odom.position['odom_yaw_m180_p180']}"
+                f"{label}: arc v={plan.linear:.2f} w={plan.angular:.2f}, "
+                f"turn {plan.turn:.1f} Deg and drive {plan.distance:.2f} m"
             )
-
-            if self.movement_attempts > self.movement_attempt_limit:
-                # abort - we are not converging
-                self.clean_abort()
-                logging.info(
-                    f"TIMEOUT - not converging after {self.movement_attempt_limit} attempts - StopMove()"
-                )
-                return
-
-            goal_dx = current_target.dx
-            goal_yaw = current_target.yaw
-
-            # Phase 1: Turn to face the target direction
-            if not current_target.turn_complete:
-                gap = self._calculate_angle_gap(
-                    -1 * self.odom.position["odom_yaw_m180_p180"], goal_yaw
+            self.controller.submit(
+                MotionGoal(
+                    turn=plan.turn,
+                    distance=plan.distance,
+                    max_speed=plan.linear,
+                    label=label,
                 )
-                logging.info(f"Phase 1 - Turning remaining GAP: {gap}DEG")
-
-                progress = round(abs(self.gap_previous - gap), 2)
-                self.gap_previous = gap
-                if self.movement_attempts > 0:
-                    logging.info(f"Phase 1 - Turn GAP delta: {progress}DEG")
-
-                if abs(gap) > 10.0:
-                    logging.debug("Phase 1 - Gap is big, using large displacements")
-                    self.movement_attempts += 1
-                    if not self._execute_turn(gap):
-                        self.clean_abort()
-                        return
-                elif abs(gap) > self.angle_tolerance and abs(gap) <= 10.0:
-                    logging.debug("Phase 1 - Gap is decreasing, using smaller steps")
-                    self.movement_attempts += 1
-                    # rotate only because we are so close
-                    # no need to check barriers because we are just performing small rotations
-                    if gap > 0:
-                        self._move_robot(0, 0, 0.2)
-                    elif gap < 0:
-                        self._move_robot(0, 0, -0.2)
-                elif abs(gap) <= self.angle_tolerance:
-                    logging.info("Phase 1 - Turn completed, starting movement")
-                    current_target.turn_complete = True
-                    self.gap_previous = 0
-
-            else:
-                # Phase 2: Move towards the target position, if needed
-                if goal_dx == 0:
-                    logging.info("No movement required, processing next AI command")
-                    self.clean_abort()
-                    return
-
-                s_x = current_target.start_x
-                s_y = current_target.start_y
-                speed = current_target.speed
-
-                distance_traveled = math.sqrt(
-                    (self.odom.position["odom_x"] - s_x) ** 2
-                    + (self.odom.position["odom_y"] - s_y) ** 2
-                )
-                gap = round(abs(goal_dx - distance_traveled), 2)
-                progress = round(abs(self.gap_previous - gap), 2)
-                self.gap_previous = gap
-
-                if self.movement_attempts > 0:
-                    logging.info(f"Phase 2 - Forward/retreat GAP delta: {progress}m")
-
-                if goal_dx > 0:
-                    if 4 not in self.lidar.advance:
-                        logging.warning("Cannot advance due to barrier")
-                        self.clean_abort()
-                        return
-                    fb = 1
-
-                if goal_dx < 0:
-                    if not self.lidar.retreat:
-                        logging.warning("Cannot retreat due to barrier")
-                        self.clean_abort()
-                        return
-                    fb = -1
-
-                if gap > self.distance_tolerance:
-                    self.movement_attempts += 1
-                    if distance_traveled < abs(goal_dx):
-                        logging.info(f"Phase 2 - Keep moving. Remaining: {gap}m ")
-                        self._move_robot(fb * speed, 0.0, 0.0)
-                    elif distance_traveled > abs(goal_dx):
-                        logging.debug(
-                            f"Phase 2 - OVERSHOOT: move other way. Remaining: {gap}m"
-                        )
-                        self._move_robot(-1 * fb * 0.2, 0.0, 0.0)
-                else:
-                    logging.info(
-                        "Phase 2 - Movement completed normally, processing next AI command"
-                    )
-                    self.clean_abort()
-
-        time.sleep(0.1)
+            )
+        return True
 
     def _process_turn_left(self):
         """
         Process turn left command with safety check.
         """
+        if self._submit_arc(45.0, "turn left"):
+            return
+
         if not self.lidar.turn_left:
             logging.warning("Cannot turn left due to barrier")
             return
@@ -300,23 +289,18 @@ class MoveUnitreeSDKConnector(ActionConnector[MoveInput]):
         path = random.choice(self.lidar.turn_left)
         path_angle = self.lidar.path_angles[path]
 
-        target_yaw = self._normalize_angle(
-            -1 * self.odom.position["odom_yaw_m180_p180"] + path_angle
-        )
-        self.pending_movements.put(
-            MoveCommand(
-                dx=0.5,
-                yaw=round(target_yaw, 2),
-                start_x=round(self.odom.position["odom_x"], 2),
-                start_y=round(self.odom.position["odom_y"], 2),
-                turn_complete=False,
-            )
+        # path angles increase to the right
+        self.controller.submit(
+            MotionGoal(turn=-path_angle, distance=0.5, label="turn left")
         )
 
     def _process_turn_right(self):
         """
         Process turn right command with safety check.
         """
+        if self._submit_arc(-45.0, "turn right"):
+            return
+
         if not self.lidar.turn_right:
             logging.warning("Cannot turn right due to barrier")
             return
@@ -324,23 +308,17 @@ class MoveUnitreeSDKConnector(ActionConnector[MoveInput]):
         path = random.choice(self.lidar.turn_right)
         path_angle = self.lidar.path_angles[path]
 
-        target_yaw = self._normalize_angle(
-            -1 * self.odom.position["odom_yaw_m180_p180"] + path_angle
-        )
-        self.pending_movements.put(
-            MoveCommand(
-                dx=0.5,
-                yaw=round(target_yaw, 2),
-                start_x=round(self.odom.position["odom_x"], 2),
-                start_y=round(self.odom.position["odom_y"], 2),
-                turn_complete=False,
-            )
+        self.controller.submit(
+            MotionGoal(turn=-path_angle, distance=0.5, label="turn right")
         )
 
     def _process_move_forward(self):
         """
         Process move forward command with safety check.
         """
+        if self._submit_arc(0.0, "move forwards"):
+            return
+
         if not self.lidar.advance:
             logging.warning("Cannot advance due to barrier")
             return
@@ -348,17 +326,8 @@ class MoveUnitreeSDKConnector(ActionConnector[MoveInput]):
         path = random.choice(self.lidar.advance)
         path_angle = self.lidar.path_angles[path]
 
-        target_yaw = self._normalize_angle(
-            -1 * self.odom.position["odom_yaw_m180_p180"] + path_angle
-        )
-        self.pending_movements.put(
-            MoveCommand(
-                dx=0.5,
-                yaw=target_yaw,
-                start_x=round(self.odom.position["odom_x"], 2),
-                start_y=round(self.odom.position["odom_y"], 2),
-                turn_complete=True if path_angle == 0 else False,
-            )
+        self.controller.submit(
+            MotionGoal(turn=-path_angle, distance=0.5, label="move forwards")
         )
 
     def _process_move_back(self):
@@ -369,84 +338,6 @@ class MoveUnitreeSDKConnector(ActionConnector[MoveInput]):
             logging.warning("Cannot retreat due to barrier")
             return
 
-        self.pending_movements.put(
-            MoveCommand(
-                dx=-0.5,
-                yaw=0.0,
-                start_x=round(self.odom.position["odom_x"], 2),
-                start_y=round(self.odom.position["odom_y"], 2),
-                turn_complete=True,
-                speed=0.3,
-            )
+        self.controller.submit(
+            MotionGoal(distance=-0.5, max_speed=0.3, label="move back")
         )
-
-    def _normalize_angle(self, angle: float) -> float:
-        """
-        Normalize angle to [-180, 180] range.
-
-        Parameters:
-        -----------
-        angle : float
-            Angle in degrees to normalize.
-
-        Returns:
-        --------
-        float
-            Normalized angle in degrees within the range [-180, 180].
-        """
-        if angle < -180:
-            angle += 360.0
-        elif angle > 180:
-            angle -= 360.0
-        return angle
-
-    def _calculate_angle_gap(self, current: float, target: float) -> float:
-        """
-        Calculate shortest angular distance between two angles.
-
-        Parameters:
-        -----------
-        current : float
-            Current angle in degrees.
-        target : float
-            Target angle in degrees.
-
-        Returns:
-        --------
-        float
-            Shortest angular distance in degrees, rounded to 2 decimal places.
-        """
-        gap = current - target
-        if gap > 180.0:
-            gap -= 360.0
-        elif gap < -180.0:
-            gap += 360.0
-        return round(gap, 2)
-
-    def _execute_turn(self, gap: float) -> bool:
-        """
-        Execute turn based on gap direction and lidar constraints.
-
-        Parameters:
-        -----------
-        gap : float
-            The angle gap in degrees to turn.
-
-        Returns:
-        --------
-        bool
-            True if the turn was executed successfully, False if blocked by a barrier.
-        """
-        if gap > 0:  # Turn left
-            if not self.lidar.turn_left:
-                logging.warning("Cannot turn left due to barrier")
-                return False
-            sharpness = min(self.lidar.turn_left)
-            self._move_robot(sharpness * 0.15, 0, self.turn_speed)
-        else:  # Turn right
-            if not self.lidar.turn_right:
-                logging.warning("Cannot turn right due to barrier")
-                return False
-            sharpness = 8 - max(self.lidar.turn_right)
-            self._move_robot(sharpness * 0.15, 0, -self.turn_speed)
-        return True
@@ -1,10 +1,9 @@
 import logging
 import time
 
-import serial
-
 from actions.base import ActionConfig, ActionConnector
 from actions.move.interface import MoveInput
+from providers.serial_reactor import LineParser, SerialReactor
 
 """
 This only works if you actually have a serial port connected to your computer, such as, via a USB serial dongle. On Mac, you can determine the correct name to use via `ls /dev/cu.usb*`.
@@ -20,9 +19,16 @@ class MoveSerialConnector(ActionConnector[MoveInput]):
         self.port = (
             ""  # specify your serial port here, such as COM1 or /dev/cu.usbmodem14101
         )
-        self.ser = None
+        self.reactor = SerialReactor()
+        self.is_open = False
         if self.port:
-            self.ser = serial.Serial(self.port, 9600)
+            self.is_open = self.reactor.register(
+                self.port, 9600, LineParser(), self._on_lines
+            )
+
+    def _on_lines(self, lines: list, read_ts: float):
+        for line in lines:
+            logging.debug(f"ArduinoSerial: {line}")
 
     async def connect(self, output_interface: MoveInput) -> None:
 
@@ -44,9 +50,8 @@ class MoveSerialConnector(ActionConnector[MoveInput]):
         # Convert the string to bytes using UTF-8 encoding
         byte_data = message.encode("utf-8")
 
-        if self.ser is not None and self.ser.is_open:
+        if self.is_open and self.reactor.write(self.port, byte_data):
             logging.info(f"SendToArduinoSerial: {message}")
-            self.ser.write(byte_data)
         else:
             logging.info(f"SerialNotOpen - Simulating transmit: {message}")
 
@@ -1,13 +1,16 @@
 import logging
-import math
 import random
 import time
-from queue import Queue
-from typing import List, Optional
 
 import zenoh
 
-from actions.base import ActionConfig, ActionConnector, MoveCommand
+from actions.base import ActionConfig, ActionConnector
+from actions.motion_controller import (
+    MotionController,
+    MotionGoal,
+    MotionLimits,
+    pose_from_odom,
+)
 from actions.move_turtle.interface import MoveInput
 from providers.odom_provider import OdomProvider
 from providers.rplidar_provider import RPLidarProvider
@@ -24,10 +27,8 @@ class MoveZenohConnector(ActionConnector[MoveInput]):
         self.angle_tolerance = 5.0
         self.distance_tolerance = 0.05  # m
 
-        self.pending_movements: Queue[Optional[MoveCommand]] = Queue()
-
         self.hazard = None
-        self.emergency = None
+        self.emergency = False
 
         self.session = None
 
@@ -54,6 +55,22 @@ class MoveZenohConnector(ActionConnector[MoveInput]):
         self.lidar = RPLidarProvider()
         self.odom = OdomProvider(URID=URID, use_zenoh=True)
 
+        # closed-loop turns and advances at a fixed control rate
+        self.controller = MotionController(
+            send_velocity=self.move,
+            read_pose=lambda: pose_from_odom(self.odom),
+            rate_hz=getattr(config, "control_rate_hz", 20.0),
+            limits=MotionLimits(
+                max_linear=0.4,
+                max_angular=self.turn_speed,
+                yaw_tolerance=self.angle_tolerance,
+                distance_tolerance=self.distance_tolerance,
+            ),
+            max_queue=getattr(config, "motion_queue_size", 1),
+            can_drive=self._can_drive,
+            can_turn=self._can_turn,
+        )
+
     def listen_hazard(self, data: zenoh.Sample) -> None:
         """
         Callback for Zenoh hazard detection messages.
@@ -109,12 +126,14 @@ class MoveZenohConnector(ActionConnector[MoveInput]):
 
         logging.info(f"AI motion command: {output_interface.action}")
 
-        if self.pending_movements.qsize() > 0:
-            logging.info("Movement in progress: disregarding new AI command")
+        if self.emergency and self.controller.busy:
+            logging.info("Avoiding barrier: disregarding new AI command")
             return
 
-        if self.emergency:
-            logging.info("Avoiding barrier: disregarding new AI command")
+        if output_interface.action == "stand still":
+            # stopping is never queued behind other movements
+            logging.info(f"AI movement command: {output_interface.action}")
+            self.controller.stop()
             return
 
         if self.odom.x == 0.0:
@@ -138,80 +157,65 @@ class MoveZenohConnector(ActionConnector[MoveInput]):
                 retreat_danger = False
 
         if output_interface.action == "turn left":
-            # turn 90 Deg to the left (CCW)
-            target_yaw = self.odom.odom_yaw_m180_p180 - 30.0
-            if target_yaw <= -180:
-                target_yaw += 360.0
-            self.pending_movements.put(MoveCommand(dx=0.0, yaw=target_yaw))
+            # turn 30 Deg to the left (CCW)
+            self.controller.submit(MotionGoal(turn=30.0, label="turn left"))
         elif output_interface.action == "turn right":
-            # turn 90 Deg to the right (CW)
-            target_yaw = self.odom.odom_yaw_m180_p180 + 30.0
-            if target_yaw >= 180.0:
-                target_yaw -= 360.0
-            self.pending_movements.put(MoveCommand(dx=0.0, yaw=target_yaw))
+            # turn 30 Deg to the right (CW)
+            self.controller.submit(MotionGoal(turn=-30.0, label="turn right"))
         elif output_interface.action == "move forwards":
             if advance_danger:
                 return
-            self.pending_movements.put(
-                MoveCommand(
-                    dx=0.5,
-                    yaw=0.0,
-                    start_x=self.odom.x,
-                    start_y=self.odom.y,
-                )
-            )
+            self.controller.submit(MotionGoal(distance=0.5, label="move forwards"))
         elif output_interface.action == "move back":
             if retreat_danger:
                 return
-            self.pending_movements.put(
-                MoveCommand(
-                    dx=-0.5,
-                    yaw=0.0,
-                    start_x=self.odom.x,
-                    start_y=self.odom.y,
-                )
-            )
-        elif output_interface.action == "stand still":
-            logging.info(f"AI movement command: {output_interface.action}")
-            # do nothing
+            self.controller.submit(MotionGoal(distance=-0.5, label="move back"))
         else:
             logging.info(f"AI movement command unknown: {output_interface.action}")
 
-    def _calculate_angle_gap(self, current: float, target: float) -> float:
+    def _can_drive(self, direction: int) -> bool:
         """
-        Calculate shortest angular distance between two angles.
-
-        Parameters:
-        -----------
-        current : float
-            Current angle in degrees.
-        target : float
-            Target angle in degrees.
-
-        Returns:
-        --------
-        float
-            Shortest angular distance in degrees, rounded to 2 decimal places.
+        Reconfirm the lidar paths before every advance or retreat step.
+
+        Parameters
+        ----------
+        direction : int
+            1 to advance, -1 to retreat.
+
+        Returns
+        -------
+        bool
+            True if the path is clear.
         """
-        gap = current - target
-        if gap > 180.0:
-            gap -= 360.0
-        elif gap < -180.0:
-            gap += 360.0
-        return round(gap, 2)
-
-    def clean_abort(self) -> None:
+        pp = self.lidar.valid_paths
+        logging.debug(f"Action - Valid paths: {pp}")
+        return pp is not None and (4 if direction > 0 else 9) in pp
+
+    def _can_turn(self, direction: int) -> bool:
         """
-        Cleanly abort current movement and reset state.
+        Check the lidar before every large turn step.
+
+        Parameters
+        ----------
+        direction : int
+            1 to turn left, -1 to turn right.
+
+        Returns
+        -------
+        bool
+            True if the side is clear.
         """
-        self.movement_attempts = 0
-        if not self.pending_movements.empty():
-            self.pending_movements.get()
+        if direction > 0:
+            if not self.lidar.turn_left:
+                logging.warning("Cannot turn left due to barrier")
+                return False
+        elif not self.lidar.turn_right:
+            logging.warning("Cannot turn right due to barrier")
+            return False
+        return True
 
     def tick(self) -> None:
 
-        time.sleep(0.1)
-
         logging.debug("Move tick")
 
         if self.odom.x == 0.0:
@@ -223,180 +227,20 @@ class MoveZenohConnector(ActionConnector[MoveInput]):
 
         # physical collision event ALWAYS takes precedence
         if self.hazard is not None:
-            if self.hazard == "TURN_RIGHT":
-                target_yaw = self.odom.odom_yaw_m180_p180 + 100.0
-                if target_yaw >= 180.0:
-                    target_yaw -= 360.0
-                self.emergency = target_yaw
-            elif self.hazard == "TURN_LEFT":
-                target_yaw = self.odom.odom_yaw_m180_p180 - 100.0
-                if target_yaw <= -180:
-                    target_yaw += 360.0
-                self.emergency = target_yaw
+            if self.hazard in ("TURN_LEFT", "TURN_RIGHT"):
+                turn = 100.0 if self.hazard == "TURN_LEFT" else -100.0
+                self.controller.stop()
+                self.controller.submit(MotionGoal(turn=turn, label="avoid hazard"))
+                self.emergency = True
+                logging.info(f"Avoiding hazard with a {turn} Deg turn")
             else:
                 logging.error(f"Cannot parse self.hazard: {self.hazard}")
 
             # clear the hazard flag
             self.hazard = None
-            logging.info(f"Should have non-zero avoidance yaw: {self.emergency}")
-
-        if self.emergency:
-
-            # target = self.emergency
-            target = [MoveCommand(dx=0.0, yaw=self.emergency)]
-            logging.info(f"Emergency target: {target}")
-
-            gap = self.odom.odom_yaw_m180_p180 - target[0].yaw
-            if gap > 180.0:
-                gap -= 360.0
-            elif gap < -180.0:
-                gap += 360.0
-
-            """
-            gap is a SIGNED value indicating:
-                * the direction to turn to get to goal, and
-                * the magnitude remaining to turn
-
-            a mathematically equivalent way to do this is
-
-            a = targetA - sourceA
-            a = (a + 180) % 360 - 180
-            where mod = (a, n) -> a - floor(a/n) * n
-            """
-            logging.info(f"GAP: {gap}")
-            if abs(gap) > 10.0:
-                logging.debug("gap is big, using large displacements")
-                if gap > 0:
-                    self.move(0.0, 0.3)
-                elif gap < 0:
-                    self.move(0.0, -0.3)
-            elif abs(gap) > self.angle_tolerance and abs(gap) <= 10.0:
-                logging.debug("gap is getting smaller, using smaller steps")
-                if gap > 0:
-                    self.move(0.0, 0.1)
-                elif gap < 0:
-                    self.move(0.0, -0.1)
-            elif abs(gap) <= self.angle_tolerance:
-                logging.info("avoidance motion completed, clear emergency")
-                self.emergency = None
-
-            # when there is a hazard, focus on clearing it
-            return
-
-        # if we got to this point, we have good data and there is hard wall
-        # touch emergency
-
-        target: List[MoveCommand] = list(self.pending_movements.queue)
-
-        if len(target) > 0:
-
-            current_target = target[0]
-
-            logging.debug(
-                f"Target: {current_target} current yaw: {self.odom.odom_yaw_m180_p180}"
-            )
-
-            goal_dx = current_target.dx
-            goal_yaw = current_target.yaw
-
-            if not current_target.turn_complete:
-                gap = self._calculate_angle_gap(
-                    -1 * self.odom.position["odom_yaw_m180_p180"], goal_yaw
-                )
-                logging.info(f"Phase 1 - Turning remaining GAP: {gap}DEG")
-
-                progress = round(abs(self.gap_previous - gap), 2)
-                self.gap_previous = gap
-                if self.movement_attempts > 0:
-                    logging.info(f"Phase 1 - Turn GAP delta: {progress}DEG")
-
-                if abs(gap) > 10.0:
-                    logging.debug("Phase 1 - Gap is big, using large displacements")
-                    self.movement_attempts += 1
-                    if not self._execute_turn(gap):
-                        self.clean_abort()
-                        return
-                elif abs(gap) > self.angle_tolerance and abs(gap) <= 10.0:
-                    logging.debug("Phase 1 - Gap is decreasing, using smaller steps")
-                    self.movement_attempts += 1
-                    # rotate only because we are so close
-                    # no need to check barriers because we are just performing small rotations
-                    if gap > 0:
-                        self.move(0, 0.2)
-                    elif gap < 0:
-                        self.move(0, -0.2)
-                elif abs(gap) <= self.angle_tolerance:
-                    logging.info("Phase 1 - Turn completed, starting movement")
-                    current_target.turn_complete = True
-                    self.gap_previous = 0
-            else:
-                if goal_dx == 0:
-                    logging.info("No movement required, processing next AI command")
-                    self.clean_abort()
-                    return
-
-                # reconfirm possible paths
-                pp = self.lidar.valid_paths
-
-                logging.debug(f"Action - Valid paths: {pp}")
-
-                s_x = current_target.start_x
-                s_y = current_target.start_y
-                distance_traveled = math.sqrt(
-                    (self.odom.x - s_x) ** 2 + (self.odom.y - s_y) ** 2
-                )
-                remaining = abs(goal_dx - distance_traveled)
-                logging.info(f"remaining advance GAP: {round(remaining,2)}")
-
-                fb = 0
-                if pp is not None and 4 in pp:
-                    fb = 1
-                elif pp is not None and 9 in pp:
-                    fb = -1
-                else:
-                    logging.info("danger, pop 1 off queue")
-                    self.pending_movements.get()
-                    return
-
-                if remaining > self.distance_tolerance:
-                    if distance_traveled < goal_dx:  # keep advancing
-                        logging.debug(f"keep moving. remaining:{remaining} ")
-                        self.move(fb * 0.4, 0.0)
-                    elif distance_traveled > goal_dx:  # you moved too far
-                        logging.debug(
-                            f"OVERSHOOT: move other way. remaining:{remaining} "
-                        )
-                        self.move(-1 * fb * 0.1, 0.0)
-                else:
-                    logging.info(
-                        "advance is completed, gap is small enough, done, pop 1 off queue"
-                    )
-                    self.pending_movements.get()
-
-    def _execute_turn(self, gap: float) -> bool:
-        """
-        Execute turn based on gap direction and lidar constraints.
 
-        Parameters:
-        -----------
-        gap : float
-            The angle gap in degrees to turn.
+        if self.emergency and not self.controller.busy:
+            logging.info("avoidance motion completed, clear emergency")
+            self.emergency = False
 
-        Returns:
-        --------
-        bool
-            True if the turn was executed successfully, False if blocked by a barrier.
-        """
-        if gap > 0:  # Turn left
-            if not self.lidar.turn_left:
-                logging.warning("Cannot turn left due to barrier")
-                return False
-            sharpness = min(self.lidar.turn_left)
-            self.move(sharpness * 0.15, self.turn_speed)
-        else:  # Turn right
-            if not self.lidar.turn_right:
-                logging.warning("Cannot turn right due to barrier")
-                return False
-            sharpness = 8 - max(self.lidar.turn_right)
-            self.move(sharpness * 0.15, -self.turn_speed)
-        return True
+        self.controller.tick()
@@ -1,9 +1,12 @@
 import logging
+import shutil
 import subprocess
-from typing import Optional
+from typing import List, Optional
 
 from actions.base import ActionConfig, ActionConnector
 from actions.speak.interface import SpeakInput
+from providers.audio_session_provider import AudioSessionProvider
+from providers.tts_cache_provider import TTSCacheProvider, tts_cache_key
 
 
 class EspeakTTSConnector(ActionConnector[SpeakInput]):
@@ -27,6 +30,69 @@ class EspeakTTSConnector(ActionConnector[SpeakInput]):
         
         if not self.espeak_available:
             self.logger.warning("Espeak not found. Please install with: brew install espeak (macOS) or apt-get install espeak (Ubuntu)")
+
+        # Shared with the ASR inputs so they do not transcribe our own speech
+        self.audio_session = AudioSessionProvider()
+
+        # Synthesized speech cache, rendered with --stdout and played from file.
+        # Needs a command line audio player, otherwise espeak speaks directly.
+        self.cache = None
+        self.play_command = self._detect_audio_player()
+        if getattr(config, 'cache_enabled', True) and self.espeak_available and self.play_command:
+            self.cache = TTSCacheProvider(
+                cache_dir=getattr(config, 'cache_dir', 'dump/tts_cache'),
+                max_disk_mb=getattr(config, 'cache_max_disk_mb', 256),
+                max_memory_mb=getattr(config, 'cache_max_memory_mb', 64),
+            )
+            self.cache.warm_up(getattr(config, 'cache_warmup_phrases', []), self._get_audio)
+
+    def _detect_audio_player(self) -> Optional[List[str]]:
+        """Find a command line player for cached audio files."""
+        for player in ['afplay', 'aplay', 'paplay']:
+            if shutil.which(player):
+                return [player]
+        return None
+
+    def _get_audio(self, text: str) -> Optional[str]:
+        """
+        Get the cached audio file for a sentence, rendering it on a miss.
+
+        Parameters
+        ----------
+        text : str
+            Text to synthesize
+
+        Returns
+        -------
+        Optional[str]
+            Path to the cached audio file, or None if rendering failed
+        """
+        key = tts_cache_key(
+            "espeak",
+            text,
+            voice=self.voice,
+            rate=self.rate,
+            pitch=self.pitch,
+            volume=self.volume,
+        )
+        cached_path = self.cache.get_path(key)
+        if cached_path:
+            return cached_path
+
+        cmd = [
+            'espeak',
+            f'-v{self.voice}',
+            f'-s{self.rate}',
+            f'-p{self.pitch}',
+            f'-a{self.volume}',
+            '--stdout',
+            text
+        ]
+        result = subprocess.run(cmd, capture_output=True)
+        if result.returncode != 0 or not result.stdout:
+            self.logger.error(f"Espeak rendering failed: {result.stderr.decode(errors='ignore')}")
+            return None
+        return self.cache.put_bytes(key, result.stdout, "wav")
     
     def _check_espeak_availability(self) -> bool:
         """Check if espeak is available on the system."""
@@ -52,6 +118,14 @@ class EspeakTTSConnector(ActionConnector[SpeakInput]):
             True if synthesis was successful
         """
         try:
+            if self.cache is not None:
+                audio_path = self._get_audio(text)
+                if audio_path:
+                    result = self.audio_session.run_player(self.play_command + [audio_path], text=text)
+                    if result.returncode == 0 or self.audio_session.interrupted.is_set():
+                        return True
+                    self.logger.warning("Cached audio playback failed, speaking directly")
+
             cmd = [
                 'espeak',
                 f'-v{self.voice}',
@@ -62,11 +136,14 @@ class EspeakTTSConnector(ActionConnector[SpeakInput]):
             ]
             
             self.logger.info(f"Running espeak command: {' '.join(cmd)}")
-            result = subprocess.run(cmd, capture_output=True, text=True)
+            result = self.audio_session.run_player(cmd, text=text)
+            if self.audio_session.interrupted.is_set():
+                self.logger.info("Espeak interrupted by barge-in")
+                return True
             
             if result.returncode != 0:
                 self.logger.error(f"Espeak failed with return code {result.returncode}")
-                self.logger.error(f"Stderr: {result.stderr}")
+                self.logger.error(f"Stderr: {result.stderr.decode(errors='ignore')}")
             else:
                 self.logger.info("Espeak synthesis successful")
                 
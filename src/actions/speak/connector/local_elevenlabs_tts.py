@@ -12,7 +12,9 @@ import sounddevice as sd
 import soundfile as sf
 from actions.base import ActionConfig, ActionConnector
 from actions.speak.interface import SpeakInput
+from providers.audio_session_provider import AudioSessionProvider
 from providers.io_provider import IOProvider
+from providers.tts_cache_provider import TTSCacheProvider, tts_cache_key
 
 
 class LocalElevenLabsTTSConnector(ActionConnector[SpeakInput]):
@@ -61,6 +63,24 @@ class LocalElevenLabsTTSConnector(ActionConnector[SpeakInput]):
             logging.info("ElevenLabs API key not found. Will use Piper TTS as fallback.")
             self._check_piper_availability()
 
+        # Shared with the ASR inputs so they do not transcribe our own speech,
+        # barge-in stops the sounddevice playback
+        self.audio_session = AudioSessionProvider()
+        self.audio_session.register_interrupt_callback(sd.stop)
+
+        # Synthesized speech cache, saves the API round trip for repeated sentences
+        self.cache = None
+        if getattr(self.config, "cache_enabled", True):
+            self.cache = TTSCacheProvider(
+                cache_dir=getattr(self.config, "cache_dir", "dump/tts_cache"),
+                max_disk_mb=getattr(self.config, "cache_max_disk_mb", 256),
+                max_memory_mb=getattr(self.config, "cache_max_memory_mb", 64),
+            )
+            self.cache.warm_up(
+                getattr(self.config, "cache_warmup_phrases", []),
+                self._render_to_cache,
+            )
+
     def _check_piper_availability(self):
         """Check if Piper TTS is available on the system."""
         try:
@@ -83,6 +103,42 @@ class LocalElevenLabsTTSConnector(ActionConnector[SpeakInput]):
             self.session = aiohttp.ClientSession()
         return self.session
 
+    def _cache_key(self, text: str, use_elevenlabs: bool) -> str:
+        """Cache key of a sentence for the given engine and its settings."""
+        if use_elevenlabs:
+            return tts_cache_key(
+                "elevenlabs",
+                text,
+                voice=self.voice_id,
+                model_id=self.model_id,
+                stability=self.stability,
+                similarity_boost=self.similarity_boost,
+            )
+        return tts_cache_key("piper", text, voice=self.piper_model)
+
+    def _cache_put(self, text: str, use_elevenlabs: bool, audio_data: bytes):
+        """Store synthesized audio in the cache."""
+        if self.cache is not None:
+            self.cache.put_bytes(
+                self._cache_key(text, use_elevenlabs),
+                audio_data,
+                "mp3" if use_elevenlabs else "wav",
+            )
+
+    def _render_to_cache(self, text: str):
+        """Synthesize a warm-up phrase on its own event loop and HTTP session."""
+        if self.cache.contains(self._cache_key(text, self.use_elevenlabs)):
+            return
+
+        async def render():
+            if self.use_elevenlabs:
+                async with aiohttp.ClientSession() as session:
+                    await self._synthesize_elevenlabs(text, session)
+            else:
+                await self._synthesize_piper(text)
+
+        asyncio.run(render())
+
     async def synthesize(self, text: str) -> Optional[bytes]:
         """
         Synthesize text to speech audio.
@@ -97,12 +153,21 @@ class LocalElevenLabsTTSConnector(ActionConnector[SpeakInput]):
         Optional[bytes]
             Audio data as bytes, or None if synthesis fails
         """
+        if self.cache is not None:
+            key = self._cache_key(text, self.use_elevenlabs)
+            if self.cache.contains(key):
+                audio_data = self.cache.get_bytes(key)
+                if audio_data:
+                    return audio_data
+
         if self.use_elevenlabs:
             return await self._synthesize_elevenlabs(text)
         else:
             return await self._synthesize_piper(text)
 
-    async def _synthesize_elevenlabs(self, text: str) -> Optional[bytes]:
+    async def _synthesize_elevenlabs(
+        self, text: str, session: Optional[aiohttp.ClientSession] = None
+    ) -> Optional[bytes]:
         """
         Synthesize text using ElevenLabs API.
 
@@ -110,6 +175,8 @@ class LocalElevenLabsTTSConnector(ActionConnector[SpeakInput]):
         ----------
         text : str
             Text to synthesize
+        session : Optional[aiohttp.ClientSession]
+            Session to use instead of the connector's own
 
         Returns
         -------
@@ -134,12 +201,14 @@ class LocalElevenLabsTTSConnector(ActionConnector[SpeakInput]):
                 }
             }
             
-            session = await self._get_session()
+            if session is None:
+                session = await self._get_session()
             
             async with session.post(url, json=data, headers=headers) as response:
                 if response.status == 200:
                     audio_data = await response.read()
                     logging.info(f"ElevenLabs TTS synthesized {len(text)} characters")
+                    self._cache_put(text, True, audio_data)
                     return audio_data
                 else:
                     error_text = await response.text()
@@ -205,6 +274,7 @@ class LocalElevenLabsTTSConnector(ActionConnector[SpeakInput]):
                 os.unlink(audio_file_path)
                 
                 logging.info(f"Piper TTS synthesized {len(text)} characters")
+                self._cache_put(text, False, audio_data)
                 return audio_data
             else:
                 logging.error(f"Piper TTS error: {stderr.decode()}")
@@ -234,13 +304,28 @@ class LocalElevenLabsTTSConnector(ActionConnector[SpeakInput]):
             True if speech was successful, False otherwise
         """
         try:
-            # Synthesize audio
-            audio_data = await self.synthesize(text)
-            if not audio_data:
-                return False
-            
+            # Repeated sentences are played from the decoded cache
+            pcm = None
+            if self.cache is not None:
+                pcm = self.cache.get_pcm(self._cache_key(text, self.use_elevenlabs))
+
+            if pcm is None:
+                # Synthesize audio
+                audio_data = await self.synthesize(text)
+                if not audio_data:
+                    return False
+                if self.cache is not None:
+                    pcm = self.cache.get_pcm(
+                        self._cache_key(text, self.use_elevenlabs)
+                    )
+
             # Play audio
-            await self._play_audio(audio_data)
+            with self.audio_session.playback(text):
+                if pcm is not None:
+                    sd.play(*pcm)
+                    sd.wait()  # Wait until playback is finished
+                else:
+                    await self._play_audio(audio_data)
             return True
             
         except Exception as e:
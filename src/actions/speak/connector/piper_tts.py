@@ -8,6 +8,8 @@ from typing import Optional
 
 from actions.base import ActionConfig, ActionConnector
 from actions.speak.interface import SpeakInput
+from providers.audio_session_provider import AudioSessionProvider
+from providers.tts_cache_provider import TTSCacheProvider, tts_cache_key
 
 
 class PiperTTSConnector(ActionConnector[SpeakInput]):
@@ -55,6 +57,22 @@ class PiperTTSConnector(ActionConnector[SpeakInput]):
         if not self.piper_available:
             self.logger.warning("Piper TTS not available. Speech will be logged only.")
 
+        # Shared with the ASR inputs so they do not transcribe our own speech
+        self.audio_session = AudioSessionProvider()
+
+        # Synthesized speech cache, repeated sentences are played without synthesis
+        self.cache = None
+        if getattr(config, 'cache_enabled', True):
+            self.cache = TTSCacheProvider(
+                cache_dir=getattr(config, 'cache_dir', 'dump/tts_cache'),
+                max_disk_mb=getattr(config, 'cache_max_disk_mb', 256),
+                max_memory_mb=getattr(config, 'cache_max_memory_mb', 64),
+            )
+            if self.piper_available:
+                self.cache.warm_up(
+                    getattr(config, 'cache_warmup_phrases', []), self._get_audio
+                )
+
     def _detect_voice_paths(self):
         """Auto-detect voice model paths in common locations."""
         search_paths = [
@@ -195,7 +213,51 @@ class PiperTTSConnector(ActionConnector[SpeakInput]):
             self.logger.error(f"Piper TTS synthesis error: {str(e)}")
             return None
 
-    def _play_audio(self, audio_path: str) -> bool:
+    def _cache_key(self, text: str, language: str) -> str:
+        """Cache key of a sentence for the current voice and synthesis settings."""
+        voice_info = self.voice_models.get(language, self.voice_models["en"])
+        return tts_cache_key(
+            "piper",
+            text,
+            voice=voice_info["path"] or voice_info["model"],
+            language=language,
+            speaker_id=self.speaker_id,
+            length_scale=self.length_scale,
+            noise_scale=self.noise_scale,
+            noise_w=self.noise_w,
+        )
+
+    def _get_audio(self, text: str, language: str = "en") -> Optional[str]:
+        """
+        Get the audio file for a sentence, from the cache if it was spoken before.
+
+        Parameters
+        ----------
+        text : str
+            Text to synthesize
+        language : str
+            Language code (en, es, ru)
+
+        Returns
+        -------
+        Optional[str]
+            Path to the audio file, or None if synthesis failed
+        """
+        if self.cache is None:
+            return self._synthesize_with_piper(text, language)
+
+        key = self._cache_key(text, language)
+        cached_path = self.cache.get_path(key)
+        if cached_path:
+            self.logger.info(f"Piper TTS cache hit: {cached_path}")
+            return cached_path
+
+        audio_path = self._synthesize_with_piper(text, language)
+        if audio_path is None:
+            return None
+        return self.cache.put_file(key, audio_path) or audio_path
+
+    def _play_audio(self, audio_path: str, text: str = "") -> bool:
         """
         Play audio file using system audio player.
         
@@ -203,6 +265,8 @@ class PiperTTSConnector(ActionConnector[SpeakInput]):
         ----------
         audio_path : str
             Path to the audio file
+        text : str
+            The sentence being played, used for echo detection
             
         Returns
         -------
@@ -218,11 +282,15 @@ class PiperTTSConnector(ActionConnector[SpeakInput]):
             
             for player in players:
                 try:
-                    result = subprocess.run([player, audio_path], 
-                                          capture_output=True, timeout=10)
+                    result = self.audio_session.run_player(
+                        [player, audio_path], text=text, timeout=10
+                    )
                     if result.returncode == 0:
                         self.logger.info(f"Audio played successfully with {player}")
                         return True
+                    if self.audio_session.interrupted.is_set():
+                        self.logger.info("Audio playback interrupted by barge-in")
+                        return True
                 except (FileNotFoundError, subprocess.TimeoutExpired):
                     continue
             
@@ -254,31 +322,32 @@ class PiperTTSConnector(ActionConnector[SpeakInput]):
             return
 
         # Synthesize speech with appropriate language model
-        audio_path = self._synthesize_with_piper(sentence, language)
+        audio_path = self._get_audio(sentence, language)
 
         if audio_path:
             # Play the audio and wait for completion
-            success = self._play_audio(audio_path)
+            success = self._play_audio(audio_path, sentence)
             
             # Add a small delay to ensure audio completes
             await asyncio.sleep(0.2)
             
-            # Clean up temporary file and any old files
+            # Clean up temporary file and any old files, cached files are kept
             try:
-                # Clean up the current file
-                os.unlink(audio_path)
+                if self.cache is None or not self.cache.owns(audio_path):
+                    # Clean up the current file
+                    os.unlink(audio_path)
 
-                temp_dir = os.path.dirname(audio_path)
-                current_time = time.time()
-                for f in os.listdir(temp_dir):
-                    if f.startswith("speech_") and f.endswith(".wav"):
-                        file_path = os.path.join(temp_dir, f)
-                        # Remove files older than 60 seconds
-                        if current_time - os.path.getctime(file_path) > 60:
-                            try:
-                                os.unlink(file_path)
-                            except OSError:
-                                pass
+                    temp_dir = os.path.dirname(audio_path)
+                    current_time = time.time()
+                    for f in os.listdir(temp_dir):
+                        if f.startswith("speech_") and f.endswith(".wav"):
+                            file_path = os.path.join(temp_dir, f)
+                            # Remove files older than 60 seconds
+                            if current_time - os.path.getctime(file_path) > 60:
+                                try:
+                                    os.unlink(file_path)
+                                except OSError:
+                                    pass
             except OSError:
                 pass
 
@@ -13,5 +13,9 @@ class D435(Background):
         super().__init__(config)
 
         self.d435_provider = D435Provider()
+        # the provider may already exist through RPLidarProvider
+        self.d435_provider.voxel_size = getattr(config, "voxel_size", 0.0)
+        self.d435_provider.min_height = getattr(config, "min_height", None)
+        self.d435_provider.max_height = getattr(config, "max_height", None)
         self.d435_provider.start()
         logging.info("Initiated D435 Provider in background")
@@ -0,0 +1,75 @@
+import logging
+import math
+import time
+
+import numpy as np
+
+from backgrounds.base import Background, BackgroundConfig
+from providers.occupancy_grid_provider import OccupancyGridProvider
+from providers.rplidar_provider import RPLidarProvider
+
+
+class OccupancyMapper(Background):
+    """
+    Fuses successive RPLidar scans, placed by odometry, into a persistent
+    occupancy grid.
+
+    The RPLidar and Odom backgrounds must be configured before this one so that
+    their providers are booted with the right settings.
+    """
+
+    def __init__(self, config: BackgroundConfig = BackgroundConfig()):
+        super().__init__(config)
+
+        self.max_range = getattr(config, "max_range", 8.0)
+        self.max_free_range = getattr(config, "max_free_range", 4.0)
+        self.beam_stride = max(1, int(getattr(config, "beam_stride", 1)))
+
+        self.grid_provider = OccupancyGridProvider(
+            resolution=getattr(config, "resolution", 0.05),
+            tile_size=getattr(config, "tile_size", 64),
+            max_tiles=getattr(config, "max_tiles", 400),
+        )
+        self.lidar_provider = RPLidarProvider()
+
+        self.last_scan_ts = 0.0
+        logging.info("Initiated Occupancy Grid Provider in background")
+
+    def run(self) -> None:
+        """
+        Integrate the latest scan if it is new, otherwise wait briefly.
+        """
+        record = self.lidar_provider.scan_record
+        if record is None or record[0] == self.last_scan_ts:
+            time.sleep(0.02)
+            return
+
+        scan_ts, scan, pose = record
+        self.last_scan_ts = scan_ts
+        if scan is None or len(scan) == 0:
+            return
+
+        scan = scan[:: self.beam_stride]
+
+        # corrected sensor angles put straight ahead at 180 deg and increase
+        # clockwise, so the counter-clockwise bearing is 180 deg - angle
+        bearings = np.radians(180.0 - scan[:, 0])
+        odom_x, odom_y, yaw_deg = pose
+
+        try:
+            self.grid_provider.integrate_scan(
+                (odom_x, odom_y, math.radians(yaw_deg)),
+                bearings,
+                scan[:, 1],
+                self.max_range,
+                self.max_free_range,
+            )
+        except Exception as e:
+            logging.error(f"Error integrating scan into occupancy grid: {e}")
+            return
+
+        logging.debug(
+            f"Occupancy grid: {self.grid_provider.scans_integrated} scans, "
+            f"{len(self.grid_provider.grid.tiles)} tiles, "
+            f"{round(self.grid_provider.last_integration_ms, 2)} ms"
+        )
@@ -84,7 +84,12 @@ class RFmapper(Background):
         self.odom = OdomProvider()
         logging.info(f"Mapper Odom Provider: {self.odom}")
 
-        self.fds = FabricDataSubmitter(api_key=self.api_key, write_to_local_file=True)
+        self.fds = FabricDataSubmitter(
+            api_key=self.api_key,
+            write_to_local_file=True,
+            batch_size=getattr(config, "uplink_batch_size", 1),
+            compress=getattr(config, "uplink_compress", False),
+        )
 
         self.seen_devices: Dict[str, RFData] = {}
 
@@ -12,6 +12,8 @@ import logging
 from pathlib import Path
 from typing import Optional, Dict, Any
 
+from providers.tts_cache_provider import TTSCacheProvider, tts_cache_key
+
 logger = logging.getLogger(__name__)
 
 
@@ -34,6 +36,8 @@ class AdaptivePiperTTS:
                 - piper_command: Piper executable name
                 - output_dir: Directory for generated audio files
                 - sample_rate: Output sample rate
+                - cache_enabled: Reuse audio of sentences spoken before
+                - cache_warmup_phrases: Phrases to pre-render at boot
         """
         self.config = config
         self.model_name = config.get('model', 'en_US-ryan-medium')
@@ -56,6 +60,16 @@ class AdaptivePiperTTS:
         
         # Create output directory
         os.makedirs(self.output_dir, exist_ok=True)
+
+        # Synthesized speech cache
+        self.cache = None
+        if config.get('cache_enabled', True):
+            self.cache = TTSCacheProvider(
+                cache_dir=config.get('cache_dir', 'dump/tts_cache'),
+                max_disk_mb=config.get('cache_max_disk_mb', 256),
+                max_memory_mb=config.get('cache_max_memory_mb', 64),
+            )
+            self.cache.warm_up(config.get('cache_warmup_phrases', []), self.synthesize)
     
     def _find_voice_directories(self) -> list:
         """Find possible Piper voice directories"""
@@ -207,6 +221,18 @@ class AdaptivePiperTTS:
         except Exception as e:
             logger.warning(f"⚠️ Could not verify piper command: {e}")
     
+    def _cache_key(self, text: str) -> str:
+        """Cache key of a sentence for the current voice and synthesis settings"""
+        return tts_cache_key(
+            'piper',
+            text,
+            voice=self.model_path,
+            speaker_id=self.config.get('speaker_id'),
+            length_scale=self.config.get('length_scale'),
+            noise_scale=self.config.get('noise_scale'),
+            noise_w=self.config.get('noise_w'),
+        )
+
     def synthesize(self, text: str, output_file: Optional[str] = None) -> Optional[str]:
         """
         Synthesize speech from text
@@ -216,9 +242,19 @@ class AdaptivePiperTTS:
             output_file: Output filename (optional, will generate if not provided)
             
         Returns:
-            Path to generated audio file, or None on error
+            Path to generated audio file, or None on error. Without output_file
+            the path may be a cached file, which must not be deleted.
         """
         import time
+
+        # Sentences spoken before are served from the cache
+        cache_key = None
+        if self.cache is not None and not output_file:
+            cache_key = self._cache_key(text)
+            cached_path = self.cache.get_path(cache_key)
+            if cached_path:
+                logger.info(f"✅ Cached speech: {cached_path}")
+                return cached_path
         
         # Generate output filename if not provided
         if not output_file:
@@ -262,6 +298,8 @@ class AdaptivePiperTTS:
             
             if result.returncode == 0 and os.path.exists(output_file):
                 logger.info(f"✅ Generated speech: {output_file}")
+                if cache_key is not None:
+                    return self.cache.put_file(cache_key, output_file) or output_file
                 return output_file
             else:
                 logger.error(f"Piper failed: {result.stderr.decode()}")
@@ -303,8 +341,10 @@ class AdaptivePiperTTS:
             if result.returncode == 0:
                 logger.info(f"✅ Played audio: {audio_file}")
                 
-                # Clean up if configured
-                if self.config.get('clear_on_speak', False):
+                # Clean up if configured, cached files are kept
+                if self.config.get('clear_on_speak', False) and not (
+                    self.cache is not None and self.cache.owns(audio_file)
+                ):
                     try:
                         os.remove(audio_file)
                     except:
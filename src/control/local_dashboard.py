@@ -5,6 +5,7 @@ Follows OM1 architecture patterns - no internet required
 import asyncio
 import json
 import logging
+import re
 import subprocess
 import time
 from pathlib import Path
@@ -23,7 +24,7 @@ except ImportError:
     HAS_PSUTIL = False
 
 try:
-    from fastapi import FastAPI, WebSocket, Request, Form
+    from fastapi import FastAPI, WebSocket, WebSocketDisconnect, Request, Form
     from fastapi.responses import HTMLResponse, RedirectResponse
     from fastapi.templating import Jinja2Templates
     import uvicorn
@@ -32,6 +33,11 @@ except ImportError as e:
     print("Run: uv add fastapi uvicorn jinja2 python-multipart")
     exit(1)
 
+try:
+    from .log_stream import LogFilter, LogRing, read_pipe
+except ImportError:
+    from log_stream import LogFilter, LogRing, read_pipe
+
 class OfflineAgentController:
     """
     Manages Lex agent lifecycle following OM1 runtime patterns.
@@ -45,8 +51,8 @@ class OfflineAgentController:
         self.process = None
         self.is_running = False
         self.start_time = None
-        self.log_buffer = []
         self.max_log_lines = 1000
+        self.logs = LogRing(self.max_log_lines)
         self._log_task = None
     
     def _validate_om1_structure(self) -> bool:
@@ -94,15 +100,17 @@ class OfflineAgentController:
                 cmd,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.STDOUT,
-                universal_newlines=True,
-                bufsize=1
+                bufsize=0  # binary and unbuffered, read by the event loop
             )
             
             # Verify process started successfully (give it 2 seconds)
             time.sleep(2)
             if self.process.poll() is not None:
                 # Process died immediately - get error output
-                error_output = self.process.stdout.read() if self.process.stdout else "Unknown error"
+                error_output = (
+                    self.process.stdout.read().decode("utf-8", errors="replace")
+                    if self.process.stdout else "Unknown error"
+                )
                 return {"status": "error", "message": f"Agent failed to start: {error_output[:200]}..."}
             
             self.is_running = True
@@ -285,37 +293,23 @@ class OfflineAgentController:
             return f"{hours}h {minutes}m"
     
     async def _read_logs(self):
-        """Read logs from agent process asynchronously"""
+        """Stream agent output into the log ring without blocking the event loop"""
         if not self.process or not self.process.stdout:
             return
-            
+
         try:
-            while self.is_running and self.process:
-                line = self.process.stdout.readline()
-                if line:
-                    timestamp = time.strftime("%H:%M:%S")
-                    log_entry = f"[{timestamp}] {line.strip()}"
-                    self.log_buffer.append(log_entry)
-                    
-                    # Keep buffer size manageable
-                    if len(self.log_buffer) > self.max_log_lines:
-                        self.log_buffer.pop(0)
-                elif self.process.poll() is not None:
-                    # Process has ended
-                    break
-                else:
-                    await asyncio.sleep(0.1)
+            await read_pipe(self.process.stdout, self.logs)
         except asyncio.CancelledError:
             logging.info("Log reading task cancelled")
         except Exception as e:
             logging.error(f"Error reading logs: {e}")
-    
+
     def get_logs(self, last_n: int = 50) -> List[str]:
         """Get recent log entries"""
-        if not self.log_buffer:
+        if not len(self.logs):
             return ["[INFO] No logs available - agent may not be running"]
-        return self.log_buffer[-last_n:]
-    
+        return [entry.format() for entry in self.logs.tail(last_n)]
+
     def update_config(self, updates: Dict[str, Any]) -> Dict[str, str]:
         """
         Update agent configuration following OM1 JSON5 format and fuser patterns.
@@ -496,9 +490,30 @@ async def api_status():
     return controller.get_status()
 
 @app.get("/api/logs")
-async def api_logs():
-    """Get logs as JSON API"""
-    return {"logs": controller.get_logs(50)}
+async def api_logs(
+    cursor: Optional[int] = None,
+    limit: int = 50,
+    level: Optional[str] = None,
+    pattern: Optional[str] = None
+):
+    """
+    Get logs as JSON API.
+
+    Without a cursor the latest `limit` lines are returned. Pass the returned
+    `next_cursor` back to page forward through newer lines.
+    """
+    try:
+        log_filter = LogFilter(level, pattern)
+    except re.error as e:
+        return {"error": f"Invalid pattern: {e}"}
+
+    entries, next_cursor = controller.logs.since(cursor, max(1, min(limit, 1000)), log_filter)
+    return {
+        "logs": [entry.format() for entry in entries],
+        "entries": [entry.to_dict() for entry in entries],
+        "next_cursor": next_cursor,
+        "first_seq": controller.logs.first_seq,
+    }
 
 @app.get("/logs", response_class=HTMLResponse)
 async def logs_page(request: Request):
@@ -545,22 +560,54 @@ async def update_config(
 
 @app.websocket("/ws/logs")
 async def websocket_logs(websocket: WebSocket):
-    """Live log streaming via WebSocket"""
+    """
+    Live log streaming via WebSocket.
+
+    Query parameters `level` and `pattern` filter on the server, and `cursor`
+    resumes after the last line a client has seen. New lines are pushed as
+    they are read; a client that falls behind loses its oldest queued lines
+    instead of slowing the agent or other clients.
+    """
     await websocket.accept()
-    
-    last_sent = 0
+
+    params = websocket.query_params
+    try:
+        log_filter = LogFilter(params.get("level"), params.get("pattern"))
+    except re.error as e:
+        await websocket.send_text(f"[ERROR] Invalid pattern: {e}")
+        await websocket.close()
+        return
+
+    cursor = params.get("cursor")
+    subscription = controller.logs.subscribe(log_filter)
     try:
+        # backlog first (the last 50 lines, or everything after the cursor),
+        # then everything pushed since subscribing
+        last_seq = -1
+        if cursor and cursor.isdigit():
+            next_cursor = int(cursor)
+            while next_cursor < controller.logs.next_seq:
+                backlog, next_cursor = controller.logs.since(next_cursor, 200, log_filter)
+                for entry in backlog:
+                    await websocket.send_text(entry.format())
+                last_seq = next_cursor - 1
+        else:
+            backlog, next_cursor = controller.logs.since(None, 50, log_filter)
+            last_seq = next_cursor - 1
+            for entry in backlog:
+                await websocket.send_text(entry.format())
+
         while True:
-            logs = controller.get_logs()
-            if len(logs) > last_sent:
-                new_logs = logs[last_sent:]
-                for log in new_logs:
-                    await websocket.send_text(log)
-                last_sent = len(logs)
-            
-            await asyncio.sleep(1)
+            entry = await subscription.get()
+            if entry.seq <= last_seq:
+                continue
+            await websocket.send_text(entry.format())
+    except WebSocketDisconnect:
+        pass
     except Exception as e:
         logging.error(f"WebSocket error: {e}")
+    finally:
+        controller.logs.unsubscribe(subscription)
 
 def run_dashboard(port: int = 8000, host: str = "127.0.0.1"):
     """Run the local dashboard following OM1 patterns"""
@@ -0,0 +1,253 @@
+"""
+Log fan-out for the local dashboard.
+
+Agent output is read from the subprocess pipe without blocking the event
+loop, stored in a fixed-capacity ring buffer with sequence numbers, and
+pushed to any number of subscribers (WebSocket clients) that each filter
+server-side by level and pattern.
+"""
+
+import asyncio
+import logging
+import re
+import time
+from collections import deque
+from dataclasses import asdict, dataclass
+from typing import Deque, List, Optional, Set, Tuple
+
+LEVELS = {"DEBUG": 10, "INFO": 20, "WARNING": 30, "ERROR": 40, "CRITICAL": 50}
+
+_LEVEL_RE = re.compile(r"\b(DEBUG|INFO|WARNING|WARN|ERROR|CRITICAL)\b")
+
+
+def detect_level(line: str) -> str:
+    """
+    Guess the log level of an agent output line, INFO if none is named.
+    """
+    match = _LEVEL_RE.search(line)
+    if not match:
+        return "INFO"
+    level = match.group(1)
+    return "WARNING" if level == "WARN" else level
+
+
+@dataclass
+class LogEntry:
+    """
+    One line of agent output.
+    """
+
+    seq: int
+    timestamp: float
+    level: str
+    text: str
+
+    def format(self) -> str:
+        """
+        Render the line the way the dashboard always has.
+        """
+        return (
+            f"[{time.strftime('%H:%M:%S', time.localtime(self.timestamp))}] {self.text}"
+        )
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+
+class LogFilter:
+    """
+    Server-side subscriber filter.
+
+    Parameters
+    ----------
+    level : str, optional
+        Minimum level, e.g. "WARNING".
+    pattern : str, optional
+        Regular expression the line must contain (case-insensitive).
+    """
+
+    def __init__(self, level: Optional[str] = None, pattern: Optional[str] = None):
+        self.min_level = LEVELS.get((level or "").upper(), 0)
+        self.pattern = re.compile(pattern, re.IGNORECASE) if pattern else None
+
+    def matches(self, entry: LogEntry) -> bool:
+        if LEVELS.get(entry.level, 20) < self.min_level:
+            return False
+        return self.pattern is None or bool(self.pattern.search(entry.text))
+
+
+class LogSubscription:
+    """
+    A subscriber's bounded queue of pushed entries.
+
+    When a client falls behind, its oldest queued entries are dropped
+    (and counted) rather than slowing the reader or other clients.
+    """
+
+    def __init__(self, log_filter: LogFilter, max_queue: int):
+        self.filter = log_filter
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=max_queue)
+        self.dropped = 0
+
+    def push(self, entry: LogEntry):
+        if not self.filter.matches(entry):
+            return
+        if self.queue.full():
+            self.queue.get_nowait()
+            self.dropped += 1
+        self.queue.put_nowait(entry)
+
+    async def get(self) -> LogEntry:
+        return await self.queue.get()
+
+
+class LogRing:
+    """
+    Fixed-capacity ring buffer of agent output with sequence numbers.
+
+    Sequence numbers increase monotonically and are never reused, so a
+    client can page or resume with a cursor (the next sequence number it
+    wants) even after old lines have been evicted.
+
+    Parameters
+    ----------
+    capacity : int
+        Maximum number of lines kept.
+    """
+
+    def __init__(self, capacity: int = 1000):
+        self.capacity = capacity
+        self.entries: Deque[LogEntry] = deque(maxlen=capacity)
+        self.next_seq = 0
+        self.subscribers: Set[LogSubscription] = set()
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    @property
+    def first_seq(self) -> int:
+        """
+        Sequence number of the oldest retained line.
+        """
+        return self.entries[0].seq if self.entries else self.next_seq
+
+    def append(self, text: str, timestamp: Optional[float] = None) -> LogEntry:
+        """
+        Store a line and push it to every matching subscriber.
+        """
+        text = text.rstrip("\r\n")
+        entry = LogEntry(
+            seq=self.next_seq,
+            timestamp=time.time() if timestamp is None else timestamp,
+            level=detect_level(text),
+            text=text,
+        )
+        self.next_seq += 1
+        self.entries.append(entry)
+        for subscription in self.subscribers:
+            subscription.push(entry)
+        return entry
+
+    def since(
+        self,
+        cursor: Optional[int] = None,
+        limit: int = 100,
+        log_filter: Optional[LogFilter] = None,
+    ) -> Tuple[List[LogEntry], int]:
+        """
+        Page through retained lines.
+
+        Parameters
+        ----------
+        cursor : int, optional
+            First sequence number wanted. None returns the latest `limit`
+            lines.
+        limit : int
+            Maximum number of lines returned.
+        log_filter : LogFilter, optional
+            Only return matching lines.
+
+        Returns
+        -------
+        Tuple[List[LogEntry], int]
+            The lines, oldest first, and the cursor for the next page.
+        """
+        if cursor is None:
+            matching = [
+                e for e in self.entries if not log_filter or log_filter.matches(e)
+            ]
+            page = matching[-limit:] if limit > 0 else []
+            return page, self.next_seq
+
+        # sequence numbers are contiguous, so the start is an offset
+        start = max(cursor - self.first_seq, 0)
+        page: List[LogEntry] = []
+        next_cursor = max(cursor, self.first_seq)
+        for i in range(start, len(self.entries)):
+            entry = self.entries[i]
+            next_cursor = entry.seq + 1
+            if log_filter and not log_filter.matches(entry):
+                continue
+            page.append(entry)
+            if len(page) >= limit:
+                break
+        return page, next_cursor
+
+    def tail(self, n: int = 50) -> List[LogEntry]:
+        """
+        The last `n` lines.
+        """
+        return list(self.entries)[-n:] if n > 0 else []
+
+    def subscribe(
+        self, log_filter: Optional[LogFilter] = None, max_queue: int = 500
+    ) -> LogSubscription:
+        """
+        Register a subscriber for new lines.
+        """
+        subscription = LogSubscription(log_filter or LogFilter(), max_queue)
+        self.subscribers.add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: LogSubscription):
+        self.subscribers.discard(subscription)
+
+
+async def pump_lines(reader: asyncio.StreamReader, ring: LogRing):
+    """
+    Copy lines from a stream into the ring until EOF.
+    """
+    while True:
+        try:
+            line = await reader.readline()
+        except ValueError:
+            # a single line longer than the reader limit
+            logging.warning("Dropping an over-long agent log line")
+            continue
+        if not line:
+            break
+        ring.append(line.decode("utf-8", errors="replace"))
+
+
+async def read_pipe(pipe, ring: LogRing, limit: int = 1 << 20):
+    """
+    Read a subprocess pipe into the ring without blocking the event loop.
+
+    Parameters
+    ----------
+    pipe : file object
+        The subprocess's stdout, opened in binary mode.
+    ring : LogRing
+        Where the lines go.
+    limit : int
+        Longest accepted line in bytes.
+    """
+    loop = asyncio.get_running_loop()
+    reader = asyncio.StreamReader(limit=limit)
+    transport, _ = await loop.connect_read_pipe(
+        lambda: asyncio.StreamReaderProtocol(reader), pipe
+    )
+    try:
+        await pump_lines(reader, ring)
+    finally:
+        transport.close()
@@ -47,6 +47,14 @@ class Fuser:
         # Track if we've greeted for proactive greeting feature
         self._has_greeted = False
         self._last_greeting_time = 0
+
+        # Voice input and language of the latest prompt, for the intent fast
+        # path and the answer cache
+        self.voice_input: T.Optional[str] = None
+        self.voice_question: T.Optional[str] = None
+        self.language = "en"
+        # None when the voice input carried no [LANG:] tag
+        self.voice_language: T.Optional[str] = None
     
     def _build_system_context(self) -> str:
         """
@@ -121,6 +129,27 @@ class Fuser:
             logging.error(f"Error loading knowledge file {file_path}: {e}")
             return None
     
+    @staticmethod
+    def _extract_message(input_str: str) -> T.Optional[str]:
+        """
+        Extract the message between the START and END markers of a formatted input.
+        
+        Parameters
+        ----------
+        input_str : str
+            Formatted input buffer.
+            
+        Returns
+        -------
+        str or None
+            The message, or None if the input has no markers.
+        """
+        start = input_str.find("// START")
+        end = input_str.rfind("// END")
+        if start == -1 or end <= start:
+            return None
+        return input_str[start + len("// START"):end].strip() or None
+
     def get_system_context(self) -> str:
         """
         Get the pre-built system context.
@@ -162,16 +191,23 @@ class Fuser:
         has_vision_input = False
         has_badge_input = False
         detected_language = "en"  # Default to English
+        voice_language = None
+        voice_question = None
+        has_other_input = False
         
         for input_str in input_strings:
+            if input_str and "Voice" not in input_str and input_str.strip():
+                has_other_input = True
             if input_str and "Voice" in input_str and input_str.strip():
                 has_voice_input = True
+                voice_question = self._extract_message(input_str)
                 # Extract language from voice input if present
                 if "[LANG:" in input_str:
                     try:
                         lang_start = input_str.index("[LANG:") + 6
                         lang_end = input_str.index("]", lang_start)
                         detected_language = input_str[lang_start:lang_end]
+                        voice_language = detected_language
                         logging.info(f"Detected language from voice input: {detected_language}")
                     except (ValueError, IndexError):
                         pass  # Keep default language if parsing fails
@@ -384,6 +420,13 @@ Actions:"""
         logging.info("=== USER PROMPT (Dynamic Only) ===\n%s", user_prompt)
         logging.debug("=== SYSTEM CONTEXT (Static, sent separately) ===\n%s", self._system_context)
 
+        # Only a question asked on its own can be answered from the answer
+        # cache; with other inputs in the prompt the answer may depend on them
+        self.voice_input = voice_question
+        self.voice_question = voice_question if not has_other_input else None
+        self.language = detected_language
+        self.voice_language = voice_language
+
         # Record for IO provider
         self.io_provider.set_fuser_system_prompt(self._system_context)
         self.io_provider.set_fuser_inputs(inputs_fused)
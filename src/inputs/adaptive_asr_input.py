@@ -132,18 +132,20 @@ class AdaptiveASRInput:
         
         if engine == 'faster-whisper':
             try:
-                from faster_whisper import WhisperModel
+                from providers.whisper_model_provider import WhisperModelProvider
                 
                 model_size = self.config.get('model_size', 'tiny.en')
                 device = self.config.get('device', 'cpu')
                 compute_type = self.config.get('compute_type', 'int8')
                 
+                # Shared with other ASR inputs; released in cleanup()
                 logger.info(f"Loading Faster-Whisper model: {model_size}")
-                self.asr_model = WhisperModel(
+                self.asr_handle = WhisperModelProvider().acquire(
                     model_size,
                     device=device,
                     compute_type=compute_type
                 )
+                self.asr_model = self.asr_handle.model
                 logger.info("✅ ASR model loaded")
                 
             except ImportError:
@@ -268,6 +270,9 @@ class AdaptiveASRInput:
             except:
                 pass
         
+        if getattr(self, 'asr_handle', None):
+            self.asr_handle.release()
+        
         logger.info("ASR input cleaned up")
 
 
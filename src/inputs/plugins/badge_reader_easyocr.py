@@ -6,6 +6,7 @@ Drop-in replacement for BadgeReaderOCR using pytesseract
 
 import asyncio
 import logging
+import threading
 import time
 import re
 from collections import deque
@@ -17,6 +18,7 @@ import numpy as np
 
 from inputs.base import SensorConfig
 from inputs.base.loop import FuserInput
+from providers.badge_ocr_pipeline import BadgeOCRPipeline, BadgeRead
 from providers.io_provider import IOProvider
 
 # Try to import easyocr
@@ -56,7 +58,7 @@ class BadgeReaderEasyOCR(FuserInput[cv2.typing.MatLike]):
 
         # Camera configuration
         self.camera_index = getattr(config, "camera_index", 0)
-        self.poll_interval = getattr(config, "poll_interval", 5.0)
+        self.poll_interval = getattr(config, "poll_interval", 0.5)  # Region detection is cheap; OCR only runs for new/sharper badges
         self.greeting_cooldown = getattr(config, "greeting_cooldown", 60.0)
         
         # Memory management - forget people after this time
@@ -77,6 +79,13 @@ class BadgeReaderEasyOCR(FuserInput[cv2.typing.MatLike]):
         self.min_confidence = getattr(config, "min_confidence", 0.7)  # Minimum confidence for text detection
         self.gpu = getattr(config, "gpu", True)  # Use GPU by default for faster OCR
 
+        # Region detection and tracking - full OCR only runs for new or sharper badges
+        self.detect_width = getattr(config, "detect_width", 640)
+        self.min_sharpness = getattr(config, "min_sharpness", 30.0)
+        self.max_ocr_attempts = getattr(config, "max_ocr_attempts", 3)
+        # Tracks outlive the poll interval, so a badge in view is read once
+        self.track_ttl = getattr(config, "track_ttl", max(2.0, 2 * self.poll_interval))
+
         # State management
         self.cap = None
         self.pipeline = None  # For RealSense
@@ -84,8 +93,9 @@ class BadgeReaderEasyOCR(FuserInput[cv2.typing.MatLike]):
         self.messages: Deque[Message] = deque(maxlen=self.buffer_size)
         self.last_poll_time = 0.0
         
-        # Track detected people
+        # Track detected people; greetings are made on the OCR worker
         self.detected_people: dict[str, float] = {}
+        self._people_lock = threading.Lock()
         
         # Common badge text to ignore (lowercase for comparison)
         self._ignore_words = {
@@ -111,6 +121,17 @@ class BadgeReaderEasyOCR(FuserInput[cv2.typing.MatLike]):
         logging.info(f"🔄 Loading EasyOCR model with {gpu_status} (one-time, ~10 seconds)...")
         self.reader = easyocr.Reader(['en'], gpu=self.gpu, verbose=False)
         logging.info(f"✅ EasyOCR model loaded ({gpu_status})")
+
+        # OCR runs on the pipeline's worker thread, off the event loop
+        self.pipeline_ocr = BadgeOCRPipeline(
+            ocr=self.reader.readtext,
+            parse=self._parse_ocr,
+            detect_width=self.detect_width,
+            min_sharpness=self.min_sharpness,
+            max_ocr_attempts=self.max_ocr_attempts,
+            track_ttl=self.track_ttl,
+            on_read=self._on_read,
+        )
         
         # Initialize camera
         self._initialize_camera()
@@ -236,6 +257,8 @@ class BadgeReaderEasyOCR(FuserInput[cv2.typing.MatLike]):
                 self.pipeline.stop()
             except:
                 pass
+        if hasattr(self, 'pipeline_ocr'):
+            self.pipeline_ocr.close()
 
     async def _poll(self) -> Optional[cv2.typing.MatLike]:
         """Poll camera for new frames"""
@@ -284,17 +307,37 @@ class BadgeReaderEasyOCR(FuserInput[cv2.typing.MatLike]):
         current_time = time.time()
         to_remove = []
         
-        for name, last_seen in self.detected_people.items():
-            time_since = current_time - last_seen
-            if time_since > self.max_memory_time:
-                to_remove.append(name)
+        with self._people_lock:
+            for name, last_seen in self.detected_people.items():
+                time_since = current_time - last_seen
+                if time_since > self.max_memory_time:
+                    to_remove.append(name)
+            
+            for name in to_remove:
+                del self.detected_people[name]
         
         for name in to_remove:
-            del self.detected_people[name]
             logging.info(f"🧹 Forgot {name} (not seen for {self.max_memory_time:.0f}s)")
 
+    def _parse_ocr(self, results) -> Optional[str]:
+        """Extract the badge holder's name from EasyOCR results (runs on the OCR worker)"""
+        # Extract text with confidence above threshold
+        detected_texts = []
+        for bbox, text, confidence in results:
+            if confidence >= self.min_confidence:
+                detected_texts.append(text)
+                logging.info(f"📝 OCR detected: '{text}' (confidence: {confidence:.2f})")
+
+        if not detected_texts:
+            logging.info("No high-confidence text detected")
+            return None
+
+        # Combine all detected text and extract names
+        names = self._extract_names(" ".join(detected_texts))
+        return names[0] if names else None
+
     async def _raw_to_text(self, raw_input: cv2.typing.MatLike) -> Optional[Message]:
-        """Process video frame with EasyOCR to detect badges and extract names"""
+        """Track badge regions in the frame; names arrive through _on_read"""
         if raw_input is None:
             return None
 
@@ -302,67 +345,44 @@ class BadgeReaderEasyOCR(FuserInput[cv2.typing.MatLike]):
             # Clean up old detections periodically
             self._cleanup_old_detections()
             
-            logging.info("🔍 Processing frame for badge detection with EasyOCR...")
-            
             # Get center region (where badges typically are)
             h, w = raw_input.shape[:2]
             roi = raw_input[h//4:3*h//4, w//4:3*w//4]
             
-            # Run EasyOCR
-            logging.info("🤖 Running EasyOCR on frame...")
-            results = self.reader.readtext(roi)
-            
-            if not results:
-                logging.info("No text detected in frame")
-                return None
-            
-            # Extract text with confidence above threshold
-            detected_texts = []
-            for bbox, text, confidence in results:
-                if confidence >= self.min_confidence:
-                    detected_texts.append(text)
-                    logging.info(f"📝 OCR detected: '{text}' (confidence: {confidence:.2f})")
-            
-            if not detected_texts:
-                logging.info("No high-confidence text detected")
-                return None
-            
-            # Combine all detected text
-            combined_text = " ".join(detected_texts)
-            
-            # Extract names
-            names = self._extract_names(combined_text)
-            
-            if names:
-                name = names[0]
-                
-                # Check cooldown
-                current_time = time.time()
-                
-                if name in self.detected_people:
-                    last_seen = self.detected_people[name]
-                    time_since = current_time - last_seen
-                    
-                    if time_since < self.greeting_cooldown:
-                        logging.info(f"Skipping greeting for {name} (last seen {time_since:.1f}s ago)")
-                        return None
-                
-                # Update last seen
-                self.detected_people[name] = current_time
-                
-                # Create greeting message
-                first_name = name.split()[0] if " " in name else name
-                message = f"BADGE DETECTED: Greet {first_name}. Say: 'Hi {first_name}, my name is Lex' and introduce yourself."
-                
-                logging.info(f"✅ Badge detected: {name} - triggering greeting")
-                return Message(timestamp=current_time, message=message)
-            
+            # Cheap region detection and tracking; the OCR worker greets
+            # through _on_read as soon as it has read a name
+            self.pipeline_ocr.process(roi)
             return None
 
         except Exception as e:
             logging.error(f"Badge reader processing error: {e}", exc_info=True)
             return None
 
+    def _on_read(self, read: BadgeRead) -> None:
+        """Greet a name read by the OCR worker (runs on the OCR worker)"""
+        name = read.value
+        current_time = time.time()
+        
+        with self._people_lock:
+            # Check cooldown
+            if name in self.detected_people:
+                last_seen = self.detected_people[name]
+                time_since = current_time - last_seen
+                
+                if time_since < self.greeting_cooldown:
+                    logging.info(f"Skipping greeting for {name} (last seen {time_since:.1f}s ago)")
+                    return
+            
+            # Update last seen
+            self.detected_people[name] = current_time
+        
+        # Create greeting message
+        first_name = name.split()[0] if " " in name else name
+        message = f"BADGE DETECTED: Greet {first_name}. Say: 'Hi {first_name}, my name is Lex' and introduce yourself."
+        
+        logging.info(f"✅ Badge detected: {name} (track {read.track_id}) - triggering greeting")
+        self.messages.append(Message(timestamp=current_time, message=message))
+
     async def raw_to_text(self, raw_input: cv2.typing.MatLike):
         """Convert raw input to processed text and manage message buffer"""
         pending_message = await self._raw_to_text(raw_input)
@@ -459,9 +479,11 @@ class BadgeReaderEasyOCR(FuserInput[cv2.typing.MatLike]):
 
     def get_detected_people(self) -> list[str]:
         """Get list of people detected in the current session"""
-        return list(self.detected_people.keys())
+        with self._people_lock:
+            return list(self.detected_people.keys())
 
     def reset_detections(self) -> None:
         """Reset detected people history"""
-        self.detected_people.clear()
+        with self._people_lock:
+            self.detected_people.clear()
         logging.info("Badge reader detections reset")
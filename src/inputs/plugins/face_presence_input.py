@@ -2,7 +2,6 @@ import asyncio
 import time
 from collections import deque
 from dataclasses import dataclass
-from queue import Empty, Queue
 from typing import Deque, Optional
 
 from inputs.base import SensorConfig
@@ -35,7 +34,7 @@ class FacePresence(FuserInput[str]):
     Tasks
     ----------------
     - Subscribe to the provider's callbacks and enqueue received text lines.
-    - Poll the queue periodically (non-blocking) in `_poll()`.
+    - Wake `_poll()` as soon as a line arrives, instead of sleeping.
     - Convert raw text into `Message` objects in `_raw_to_text()`.
     - Keep a bounded in-memory history (`self.messages`, deque with maxlen=300).
     - Produce a compact, prompt-ready block via `formatted_latest_buffer()`.
@@ -51,15 +50,25 @@ class FacePresence(FuserInput[str]):
 
         self.messages: Deque[Message] = deque(maxlen=300)
 
-        self.message_buffer: Queue[str] = Queue(maxsize=64)
+        # Lines arrive on the provider thread; the oldest are dropped when full
+        self.message_buffer: Deque[str] = deque(maxlen=64)
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._message_event: Optional[asyncio.Event] = None
 
         # Read config and construct the provider WITH required args
         base_url = getattr(self.config, "face_http_base_url", "http://127.0.0.1:6793")
         recent_sec = float(getattr(self.config, "face_recent_sec", 2.0))
         fps = float(getattr(self.config, "face_poll_fps", 5.0))
+        transport = getattr(self.config, "face_transport", "auto")
+        stream_path = getattr(self.config, "face_stream_path", "/who/stream")
 
         self.provider: FacePresenceProvider = FacePresenceProvider(
-            base_url=base_url, recent_sec=recent_sec, fps=fps, timeout_s=2.0
+            base_url=base_url,
+            recent_sec=recent_sec,
+            fps=fps,
+            timeout_s=2.0,
+            transport=transport,
+            stream_path=stream_path,
         )
         self._is_registered: bool = True
 
@@ -70,47 +79,37 @@ class FacePresence(FuserInput[str]):
 
     def _handle_face_message(self, text_line: str) -> None:
         """
-        Provider callback: push a new line into the bounded queue.
-
-        Tasks
-        --------
-        - Tries a non-blocking enqueue into `self.message_buffer` (capacity=64).
-        - If the queue is full, drops one oldest item and retries once.
+        Provider callback: push a new line into the bounded buffer and wake
+        `_poll()`.
 
         Parameters
         ----------
         text_line : str
             A single, already formatted line (e.g., "present=[alice], unknown=0, ts=...").
         """
-        try:
-            self.message_buffer.put_nowait(text_line)
-        except Exception:
-            try:
-                _ = self.message_buffer.get_nowait()
-            except Empty:
-                pass
-            try:
-                self.message_buffer.put_nowait(text_line)
-            except Exception:
-                pass
+        self.message_buffer.append(text_line)
+
+        if self._loop is not None and self._message_event is not None:
+            self._loop.call_soon_threadsafe(self._message_event.set)
 
     async def _poll(self) -> Optional[str]:
         """
-        Poll for new messages from the face presence service.
-
-        Checks the message buffer for new messages with a brief delay
-        to prevent excessive CPU usage.
+        Wait for the next message from the face presence service.
 
         Returns
         -------
         Optional[str]
-            The next message from the buffer if available, None otherwise
+            The next presence line
         """
-        await asyncio.sleep(0.5)
-        try:
-            return self.message_buffer.get_nowait()
-        except Empty:
-            return None
+        if self._message_event is None:
+            self._loop = asyncio.get_running_loop()
+            self._message_event = asyncio.Event()
+
+        while not self.message_buffer:
+            self._message_event.clear()
+            await self._message_event.wait()
+
+        return self.message_buffer.popleft()
 
     async def _raw_to_text(self, raw_input: str) -> Message:
         """
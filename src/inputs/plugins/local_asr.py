@@ -5,6 +5,7 @@ import os
 import tempfile
 import time
 import wave
+import weakref
 from queue import Empty, Queue
 from typing import Optional
 
@@ -13,8 +14,10 @@ import sounddevice as sd
 import soundfile as sf
 from inputs.base import SensorConfig
 from inputs.base.loop import FuserInput
+from providers.audio_session_provider import AudioSessionProvider
 from providers.io_provider import IOProvider
 from providers.sleep_ticker_provider import SleepTickerProvider
+from providers.whisper_model_provider import WhisperModelProvider
 
 
 class LocalASRInput(FuserInput[str]):
@@ -91,13 +94,21 @@ class LocalASRInput(FuserInput[str]):
             self.openai_client = None
 
         # Initialize Faster-Whisper if using local engine
+        # The model is shared through the process-wide registry, so inputs
+        # rebuilt on a mode switch reuse the loaded (or preloaded) model.
         self.faster_whisper_model = None
         if self.engine == "faster-whisper":
             try:
-                from faster_whisper import WhisperModel
                 model_size = getattr(self.config, "model_size", "base")
-                self.faster_whisper_model = WhisperModel(model_size, device="cpu", compute_type="int8")
-                logging.info(f"Loaded Faster-Whisper model: {model_size}")
+                self._whisper_handle = WhisperModelProvider().acquire(
+                    model_size,
+                    device=getattr(self.config, "device", "cpu"),
+                    compute_type=getattr(self.config, "compute_type", "int8"),
+                )
+                self.faster_whisper_model = self._whisper_handle.model
+                # hand the model back when this input is dropped
+                weakref.finalize(self, self._whisper_handle.release)
+                logging.info(f"Using Faster-Whisper model: {model_size}")
             except ImportError:
                 logging.error("faster-whisper not installed. Install with: pip install faster-whisper")
                 self.engine = "openai-whisper"  # Fallback to OpenAI
@@ -109,6 +120,19 @@ class LocalASRInput(FuserInput[str]):
         # Initialize sleep ticker provider
         self.global_sleep_ticker_provider = SleepTickerProvider()
 
+        # Half-duplex coordination with the speak connectors. "gate" does not
+        # record or transcribe while the robot speaks, "flag" transcribes but
+        # drops transcripts that match what the robot just said, "off" disables it.
+        self.echo_mode = getattr(self.config, "echo_mode", "gate")
+        # The ASR input owns these settings, even if a speak connector created
+        # the shared session first.
+        self.audio_session = AudioSessionProvider()
+        self.audio_session.tail_padding_s = getattr(self.config, "echo_tail_padding", 0.5)
+        self.audio_session.barge_in_rms = getattr(self.config, "barge_in_rms", 0.0)
+        self.audio_session.barge_in_min_s = getattr(self.config, "barge_in_min_duration", 0.3)
+        self.barge_in_block = 0.2  # seconds
+        self._gated = False
+
         # Audio processing task will be started when the event loop is available
         self._audio_task = None
 
@@ -330,8 +354,16 @@ class LocalASRInput(FuserInput[str]):
         """Main audio processing loop."""
         while True:
             try:
+                # Do not record the robot's own voice, only listen for barge-in
+                if self.echo_mode == "gate" and self.audio_session.is_playing():
+                    await self._monitor_playback()
+                    continue
+                self._gated = False
+
                 # Record audio chunk
+                capture_start = time.time()
                 audio_data = await self._record_audio_chunk()
+                capture_end = time.time()
 
                 if audio_data is None:
                     logging.warning("LocalASRInput: failed to capture audio chunk")
@@ -346,9 +378,22 @@ class LocalASRInput(FuserInput[str]):
                 has_speech = self._has_speech(audio_data)
 
                 if has_speech or self.always_transcribe:
+                    overlapped = (
+                        self.echo_mode != "off"
+                        and self.audio_session.overlaps_playback(capture_start, capture_end)
+                    )
+                    if overlapped and self.echo_mode == "gate":
+                        self.audio_session.record_skipped_inference()
+                        logging.debug("LocalASRInput: chunk overlapped playback, skipping inference")
+                        continue
+
                     text = await self._transcribe_audio(audio_data)
                     if text and len(text.strip()) > 0:
                         cleaned = text.strip()
+                        if overlapped and self.audio_session.is_echo(cleaned):
+                            self.audio_session.record_echo_dropped()
+                            logging.info("LocalASRInput: dropped echo of own speech: %s", cleaned)
+                            continue
                         self.message_buffer.put(cleaned)
                         logging.info("=== ASR INPUT ===\n%s", cleaned)
                     else:
@@ -360,12 +405,32 @@ class LocalASRInput(FuserInput[str]):
                 logging.error(f"Error in audio processing loop: {e}")
                 await asyncio.sleep(1)
 
-    async def _record_audio_chunk(self) -> Optional[bytes]:
+    async def _monitor_playback(self):
+        """
+        Wait while the robot is speaking. With barge-in enabled, short blocks
+        are recorded only to measure the input level.
+        """
+        if not self._gated:
+            self._gated = True
+            self.audio_session.record_skipped_capture()
+
+        if self.audio_session.barge_in_rms <= 0:
+            await asyncio.sleep(0.1)
+            return
+
+        block = await self._record_audio_chunk(self.barge_in_block)
+        if block:
+            import numpy as np
+            audio_array = np.frombuffer(block, dtype=np.float32)
+            rms = float(np.sqrt(np.mean(audio_array**2)))
+            self.audio_session.report_input_level(rms, self.barge_in_block)
+
+    async def _record_audio_chunk(self, duration: Optional[float] = None) -> Optional[bytes]:
         """Record a chunk of audio from the microphone."""
         try:
             # Record audio for the specified duration
             audio_data = sd.rec(
-                int(self.sample_rate * self.chunk_duration),
+                int(self.sample_rate * (duration or self.chunk_duration)),
                 samplerate=self.sample_rate,
                 channels=self.channels,  # Use detected channel count
                 dtype='float32',
@@ -160,6 +160,7 @@ class RPLidar(FuserInput[str]):
             "multicast_address": getattr(config, "multicast_address", ""),
             "machine_type": getattr(config, "machine_type", "go2"),
             "log_file": getattr(config, "log_file", False),
+            "local_planner": getattr(config, "local_planner", False),
         }
 
         return lidar_config
@@ -1,14 +1,14 @@
 import asyncio
 import logging
 import time
+from collections import deque
 from dataclasses import dataclass
-from typing import Optional
-
-import serial
+from typing import Deque, List, Optional, Tuple
 
 from inputs.base import SensorConfig
 from inputs.base.loop import FuserInput
 from providers.io_provider import IOProvider
+from providers.serial_reactor import LineParser, SerialReactor
 
 """
 
@@ -59,19 +59,20 @@ class SerialReader(FuserInput[str]):
         """
         super().__init__(config)
 
-        # Configure the serial port
-        port = "/dev/cu.usbmodem1101"  # Replace with your serial port
-        baudrate = 9600
-        timeout = 1  # Optional: set a timeout for reading
+        # Configure the serial port, replace with your serial port
+        port = getattr(config, "serial_port", "/dev/cu.usbmodem1101")
+        baudrate = getattr(config, "baudrate", 9600)
 
-        self.ser = None
+        # Lines arrive on the serial reactor thread and are handed to the
+        # input loop together with the time they were read
+        self.lines: Deque[Tuple[str, float]] = deque(maxlen=100)
+        self.line_ts = 0.0
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._line_event: Optional[asyncio.Event] = None
 
-        try:
-            # Open the serial port
-            self.ser = serial.Serial(port, baudrate, timeout=timeout)
-            logging.info(f"Connected to {port} at {baudrate} baud")
-        except serial.SerialException as e:
-            logging.error(f"Error: {e}")
+        self.connected = SerialReactor().register(
+            port, baudrate, LineParser(), self._on_lines
+        )
 
         # Track IO
         self.io_provider = IOProvider()
@@ -81,29 +82,47 @@ class SerialReader(FuserInput[str]):
 
         self.descriptor_for_LLM = "Heart Rate and Grip Strength"
 
+    def _on_lines(self, lines: List[str], read_ts: float):
+        """
+        Callback for the serial reactor.
+
+        Parameters
+        ----------
+        lines : List[str]
+            Complete lines read from the serial port.
+        read_ts : float
+            Time at which the lines were read.
+        """
+        for line in lines:
+            self.lines.append((line, read_ts))
+
+        if self._loop is not None and self._line_event is not None:
+            self._loop.call_soon_threadsafe(self._line_event.set)
+
     async def _poll(self) -> str | None:
         """
-        Poll for serial data.
+        Wait for the next line of serial data.
 
         Returns
         -------
         str
             message on serial bus
         """
-
-        await asyncio.sleep(0.5)
-
-        if self.ser is None:
+        if not self.connected:
+            await asyncio.sleep(0.5)
             return None
 
-        data = self.ser.readline().decode("utf-8").strip()
-        # Read a line, decode, and remove whitespace
+        if self._line_event is None:
+            self._loop = asyncio.get_running_loop()
+            self._line_event = asyncio.Event()
 
-        if data:
-            logging.info(f"Serial: {data}")
-            return data
-        else:
-            return None
+        while not self.lines:
+            self._line_event.clear()
+            await self._line_event.wait()
+
+        data, self.line_ts = self.lines.popleft()
+        logging.info(f"Serial: {data}")
+        return data
 
     async def _raw_to_text(self, raw_input: str) -> Message:
         """
@@ -124,7 +143,7 @@ class SerialReader(FuserInput[str]):
         else:
             message = "No serial data."
 
-        return Message(timestamp=time.time(), message=message)
+        return Message(timestamp=self.line_ts or time.time(), message=message)
 
     async def raw_to_text(self, raw_input: str):
         """
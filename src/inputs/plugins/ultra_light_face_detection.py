@@ -14,6 +14,7 @@ import cv2
 
 from inputs.base import SensorConfig
 from inputs.base.loop import FuserInput
+from providers.face_tracker import FaceTracker
 from providers.io_provider import IOProvider
 
 
@@ -33,14 +34,24 @@ class UltraLightFaceDetection(FuserInput[cv2.typing.MatLike]):
     def __init__(self, config: SensorConfig = SensorConfig()):
         super().__init__(config)
         
-        self.camera_index = config.get("camera_index", 0)
-        self.poll_interval = config.get("poll_interval", 3.0)
-        self.descriptor = config.get("descriptor", "Ultra Light Face Detection")
+        self.camera_index = getattr(config, "camera_index", 0)
+        self.poll_interval = getattr(config, "poll_interval", 3.0)
+        self.descriptor = getattr(config, "descriptor", "Ultra Light Face Detection")
         
-        # Load OpenCV's built-in face cascade (no download needed)
-        self.face_cascade = cv2.CascadeClassifier(
-            cv2.data.haarcascades + 'haarcascade_frontalface_default.xml'
-        )
+        # "hybrid" runs the Haar cascade on a downscaled frame every
+        # detect_interval seconds and follows faces with optical flow in
+        # between; "detect" runs the cascade on every full frame
+        self.tracking_mode = getattr(config, "tracking_mode", "hybrid")
+        # The detector uses OpenCV's built-in face cascade (no download needed)
+        if self.tracking_mode == "hybrid":
+            self.tracker = FaceTracker(
+                detect_width=getattr(config, "detect_width", 320),
+                detect_interval=getattr(config, "detect_interval", 1.0),
+            )
+        else:
+            self.tracker = FaceTracker(detect_width=0, detect_interval=0.0)
+        self.timing_log_interval = getattr(config, "timing_log_interval", 60.0)
+        self.last_timing_log = time.time()
         
         self.cap = None
         self.io_provider = IOProvider()
@@ -80,18 +91,14 @@ class UltraLightFaceDetection(FuserInput[cv2.typing.MatLike]):
                 logging.warning("Failed to read frame from camera")
                 return None
                 
-            # Convert to grayscale for face detection
-            gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+            current_time = time.time()
             
-            # Detect faces
-            faces = self.face_cascade.detectMultiScale(
-                gray,
-                scaleFactor=1.1,
-                minNeighbors=5,
-                minSize=(30, 30)
-            )
+            # Detect or track faces
+            faces = self.tracker.update(frame, current_time)
             
-            current_time = time.time()
+            if current_time - self.last_timing_log >= self.timing_log_interval:
+                self.last_timing_log = current_time
+                self.tracker.log_timings()
             
             # If faces detected and not in cooldown
             if len(faces) > 0 and (current_time - self.last_detection_time) > self.cooldown_period:
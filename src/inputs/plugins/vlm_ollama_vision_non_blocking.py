@@ -1,12 +1,9 @@
 import asyncio
-import base64
 import logging
 import time
 from dataclasses import dataclass
 from typing import Optional
 
-import aiohttp
-
 try:
     import cv2
     import numpy as np
@@ -18,6 +15,7 @@ except ImportError as exc:  # pragma: no cover - optional dependency guard
 from inputs.base import SensorConfig
 from inputs.base.loop import FuserInput
 from providers.io_provider import IOProvider
+from providers.ollama_vision_submitter import OllamaVisionSubmitter, VisionResult
 
 
 @dataclass
@@ -55,6 +53,20 @@ class VLMOllamaVisionNonBlocking(FuserInput[np.ndarray]):
 
         self.descriptor_for_LLM = getattr(self.config, "descriptor", "Vision")
 
+        # Frames are downscaled to the model's native input size, near-identical
+        # frames are skipped and at most one request is in flight
+        self.submitter = OllamaVisionSubmitter(
+            base_url=self.base_url,
+            model=self.model,
+            prompt=self.prompt,
+            timeout=self.timeout,
+            on_result=self._on_description,
+            image_side=getattr(self.config, "image_side", None),
+            jpeg_quality=int(getattr(self.config, "jpeg_quality", 85)),
+            dedup_threshold=float(getattr(self.config, "dedup_threshold", 3.0)),
+            name="VLMOllamaVisionNonBlocking",
+        )
+
         self._last_analysis_ts = 0.0
 
     def _capture_single_frame(self) -> Optional[np.ndarray]:
@@ -98,45 +110,13 @@ class VLMOllamaVisionNonBlocking(FuserInput[np.ndarray]):
 
     async def _poll(self) -> Optional[np.ndarray]:
         await asyncio.sleep(self.poll_interval)
-        return self._capture_single_frame()
-
-    async def _describe_frame(self, frame: np.ndarray) -> Optional[str]:
-        ok, buffer = cv2.imencode(".jpg", frame)
-        if not ok:
-            logging.debug("VLMOllamaVisionNonBlocking failed to encode frame")
-            return None
-
-        image_bytes = buffer.tobytes()
-        image_b64 = base64.b64encode(image_bytes).decode("utf-8")
-
-        payload = {
-            "model": self.model,
-            "prompt": self.prompt,
-            "images": [image_b64],
-            "stream": False,
-        }
+        # Opening the camera and the retry sleeps block, keep them off the loop
+        return await asyncio.to_thread(self._capture_single_frame)
 
-        timeout = aiohttp.ClientTimeout(total=self.timeout)
-        url = f"{self.base_url}/api/generate"
-
-        try:
-            async with aiohttp.ClientSession(timeout=timeout) as session:
-                async with session.post(url, json=payload) as response:
-                    if response.status != 200:
-                        text = await response.text()
-                        logging.warning(
-                            "VLMOllamaVisionNonBlocking request failed %s: %s",
-                            response.status,
-                            text,
-                        )
-                        return None
-
-                    result = await response.json()
-        except aiohttp.ClientError as exc:
-            logging.warning("VLMOllamaVisionNonBlocking network error: %s", exc)
-            return None
-
-        return result.get("response")
+    def _on_description(self, result: VisionResult) -> None:
+        self.messages.append(
+            Message(timestamp=result.captured_at, message=result.description)
+        )
 
     async def _raw_to_text(self, raw_input: Optional[np.ndarray]) -> Optional[Message]:
         if raw_input is None:
@@ -146,12 +126,11 @@ class VLMOllamaVisionNonBlocking(FuserInput[np.ndarray]):
         if now - self._last_analysis_ts < self.analysis_interval:
             return None
 
-        description = await self._describe_frame(raw_input)
-        if not description:
-            return None
-
-        self._last_analysis_ts = now
-        return Message(timestamp=now, message=description.strip())
+        # The description arrives through _on_description once the model
+        # answers; frames submitted meanwhile replace each other
+        if self.submitter.submit(raw_input):
+            self._last_analysis_ts = now
+        return None
 
     async def raw_to_text(self, raw_input: Optional[np.ndarray]):
         pending_message = await self._raw_to_text(raw_input)
@@ -10,6 +10,7 @@ from deepface import DeepFace
 
 from inputs.base import SensorConfig
 from inputs.base.loop import FuserInput
+from providers.face_tracker import FaceTracker
 from providers.io_provider import IOProvider
 
 logger = logging.getLogger(__name__)
@@ -68,10 +69,23 @@ class FaceEmotionCapture(FuserInput[cv2.typing.MatLike]):
         # Track IO
         self.io_provider = IOProvider()
 
-        # Load face cascade classifier
-        self.face_cascade = cv2.CascadeClassifier(
-            cv2.data.haarcascades + "haarcascade_frontalface_default.xml"  # type: ignore
-        )
+        # Face detection with OpenCV's built-in Haar cascade. In "hybrid" mode
+        # the cascade runs on a downscaled frame every detect_interval seconds
+        # and faces are followed with optical flow in between; "detect" runs
+        # the cascade on every full frame
+        self.tracking_mode = getattr(config, "tracking_mode", "hybrid")
+        if self.tracking_mode == "hybrid":
+            self.tracker = FaceTracker(
+                detect_width=getattr(config, "detect_width", 320),
+                detect_interval=getattr(config, "detect_interval", 1.0),
+                reclassify_after=getattr(config, "reclassify_after", 5.0),
+            )
+        else:
+            self.tracker = FaceTracker(
+                detect_width=0, detect_interval=0.0, reclassify_after=0.0
+            )
+        self.timing_log_interval = getattr(config, "timing_log_interval", 60.0)
+        self.last_timing_log = time.time()
 
         self.have_cam = check_webcam()
 
@@ -142,28 +156,34 @@ class FaceEmotionCapture(FuserInput[cv2.typing.MatLike]):
             logger.warning("⚠️ Camera frame is empty or None - skipping emotion detection")
             return None
 
-        # Convert frame to grayscale
-        gray_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+        now = time.time()
 
-        # Convert grayscale frame to RGB format
-        rgb_frame = cv2.cvtColor(gray_frame, cv2.COLOR_GRAY2RGB)
+        # Detect or track faces in the frame
+        faces = self.tracker.update(frame, now)
 
-        # Detect faces in the frame
-        faces = self.face_cascade.detectMultiScale(
-            gray_frame, scaleFactor=1.1, minNeighbors=5, minSize=(30, 30)
-        )
+        for face in faces:
+            # Emotion analysis only runs for new faces and faces that moved,
+            # or have not been classified for a while
+            x, y, w, h = face.box
+            if w > 0 and h > 0 and self.tracker.needs_classification(face, now):
+                with self.tracker.timer.stage("classify"):
+                    # Extract the face ROI (Region of Interest)
+                    face_roi = frame[y : y + h, x : x + w]
 
-        for x, y, w, h in faces:
-            # Extract the face ROI (Region of Interest)
-            face_roi = rgb_frame[y : y + h, x : x + w]
+                    # Perform emotion analysis on the face ROI
+                    result = DeepFace.analyze(
+                        face_roi, actions=["emotion"], enforce_detection=False
+                    )
 
-            # Perform emotion analysis on the face ROI
-            result = DeepFace.analyze(
-                face_roi, actions=["emotion"], enforce_detection=False
-            )
+                # Determine the dominant emotion
+                face.set_label(result[0]["dominant_emotion"], now)
+
+            if face.label:
+                self.emotion = face.label
 
-            # Determine the dominant emotion
-            self.emotion = result[0]["dominant_emotion"]
+        if now - self.last_timing_log >= self.timing_log_interval:
+            self.last_timing_log = now
+            self.tracker.log_timings()
 
         # Only report when we actually see a person
         if self.emotion == "":
@@ -1,13 +1,17 @@
+import asyncio
 import importlib
 import inspect
+import json
 import logging
 import os
 import re
+import time
 import typing as T
 
 from pydantic import BaseModel, ConfigDict, Field
 
 from llm.function_schemas import generate_function_schemas_from_actions
+from providers.function_call_provider import FunctionGenerator
 from providers.io_provider import IOProvider
 
 R = T.TypeVar("R")
@@ -27,6 +31,15 @@ class LLMConfig(BaseModel):
         Name of the LLM model to use
     history_length : int, optional
         Number of interactions to store in the history buffer
+    function_providers : list of str, optional
+        Provider classes (e.g. "UnitreeGo2LocationProvider") whose
+        @LLMFunction methods are executed inside the LLM call instead of
+        being turned into actions
+    max_tool_rounds : int, optional
+        Maximum number of follow-up requests made with function results
+        per call
+    tool_budget : float, optional
+        Seconds per call after which no more function rounds are started
     extra_params : dict, optional
         Additional parameters for the LLM API request
     """
@@ -39,6 +52,9 @@ class LLMConfig(BaseModel):
     timeout: T.Optional[int] = 10
     agent_name: T.Optional[str] = "IRIS"
     history_length: T.Optional[int] = 0
+    function_providers: T.List[str] = Field(default_factory=list)
+    max_tool_rounds: T.Optional[int] = 2
+    tool_budget: T.Optional[float] = 3.0
     extra_params: T.Dict[str, T.Any] = Field(default_factory=dict)
 
     def __getitem__(self, item: str) -> T.Any:
@@ -112,16 +128,230 @@ class LLM(T.Generic[R]):
                 f"LLM initialized with {len(self.function_schemas)} function schemas"
             )
 
+        # Functions executed in the tool loop, by name
+        self.llm_functions: T.Dict[str, T.Callable] = {}
+        for provider_name in config.function_providers:
+            provider = load_function_provider(provider_name)
+            if provider is not None:
+                self.register_llm_functions(provider)
+
         # Set up the IO provider
         self.io_provider = IOProvider()
-    
+
+    def register_llm_functions(self, provider: T.Any) -> None:
+        """
+        Make a provider's @LLMFunction methods callable by the model.
+
+        Their schemas are added to the function schemas sent to the model,
+        and calls to them are executed by `_run_tool_loop` rather than
+        returned as actions.
+
+        Parameters
+        ----------
+        provider : Any
+            An object with methods decorated with @LLMFunction.
+        """
+        schemas = FunctionGenerator.generate_functions_from_class(provider)
+        for _, method in inspect.getmembers(provider, predicate=inspect.ismethod):
+            name = getattr(method, "_llm_name", None)
+            if (
+                not getattr(method, "_llm_function", False)
+                or name in self.llm_functions
+            ):
+                continue
+            self.llm_functions[name] = method
+            self.function_schemas.append(schemas[name])
+        logging.info(
+            f"LLM registered {len(schemas)} functions from {type(provider).__name__}"
+        )
+
+    async def _call_llm_function(self, name: str, arguments: str) -> T.Any:
+        """
+        Run one registered function in a worker thread.
+
+        Parameters
+        ----------
+        name : str
+            The function name.
+        arguments : str
+            The JSON arguments as sent by the model.
+
+        Returns
+        -------
+        Any
+            The function result, or an error dict.
+        """
+        try:
+            kwargs = json.loads(arguments) if arguments else {}
+            return await asyncio.to_thread(self.llm_functions[name], **kwargs)
+        except Exception as e:
+            logging.error(f"Error executing LLM function {name}: {e}")
+            return {"success": False, "message": f"Error executing {name}: {e}"}
+
+    async def _execute_llm_functions(
+        self, tool_calls: T.List[T.Any], timeout: float
+    ) -> T.Dict[str, T.Any]:
+        """
+        Execute registered function calls off the event loop.
+
+        Read-only functions run concurrently. Functions with side effects
+        run afterwards, one at a time in the order the model asked for
+        them. Calls still running after `timeout` are reported to the
+        model as timed out.
+
+        Parameters
+        ----------
+        tool_calls : List[Any]
+            Tool calls (with id, function.name, function.arguments) that
+            name registered functions.
+        timeout : float
+            Seconds to wait for all calls.
+
+        Returns
+        -------
+        Dict[str, Any]
+            Result per tool call id.
+        """
+        queries = [
+            tc
+            for tc in tool_calls
+            if getattr(self.llm_functions[tc.function.name], "_llm_read_only", False)
+        ]
+        commands = [tc for tc in tool_calls if tc not in queries]
+
+        async def run_all():
+            results = await asyncio.gather(
+                *(
+                    self._call_llm_function(tc.function.name, tc.function.arguments)
+                    for tc in queries
+                )
+            )
+            done = {tc.id: result for tc, result in zip(queries, results)}
+            for tc in commands:
+                done[tc.id] = await self._call_llm_function(
+                    tc.function.name, tc.function.arguments
+                )
+            return done
+
+        task = asyncio.ensure_future(run_all())
+        try:
+            return await asyncio.wait_for(asyncio.shield(task), timeout)
+        except asyncio.TimeoutError:
+            logging.warning(f"LLM functions did not finish within {timeout:.2f}s")
+            task.cancel()
+            return {}
+
+    async def _run_tool_loop(
+        self,
+        request: T.Callable[[T.List[T.Dict[str, T.Any]]], T.Awaitable[T.Any]],
+        messages: T.List[T.Dict[str, T.Any]],
+    ) -> T.List[T.Dict[str, T.Any]]:
+        """
+        Ask the model, executing registered functions until it settles.
+
+        Calls to registered functions (see `register_llm_functions`) are
+        executed concurrently, and their results are sent back to the model
+        in a single follow-up request. All other tool calls are collected as
+        actions. The loop stops when a response contains no registered
+        function calls, after `max_tool_rounds` follow-ups, or once
+        `tool_budget` seconds have passed.
+
+        Parameters
+        ----------
+        request : Callable
+            Sends OpenAI-format messages to the model and returns the
+            response message (with content and tool_calls).
+        messages : List[Dict[str, Any]]
+            The initial messages.
+
+        Returns
+        -------
+        List[Dict[str, Any]]
+            The action calls as {"function": {"name", "arguments"}} dicts,
+            ready for `convert_function_calls_to_actions`.
+        """
+        deadline = time.monotonic() + (self._config.tool_budget or 0.0)
+        max_rounds = self._config.max_tool_rounds or 0
+
+        actions: T.List[T.Dict[str, T.Any]] = []
+        seen = set()
+        messages = list(messages)
+        for round_index in range(max_rounds + 1):
+            message = await request(messages)
+            tool_calls = list(getattr(message, "tool_calls", None) or [])
+
+            functions = []
+            for tc in tool_calls:
+                if tc.function.name in self.llm_functions:
+                    functions.append(tc)
+                    continue
+                key = (tc.function.name, tc.function.arguments)
+                if key not in seen:
+                    seen.add(key)
+                    actions.append(
+                        {
+                            "function": {
+                                "name": tc.function.name,
+                                "arguments": tc.function.arguments,
+                            }
+                        }
+                    )
+
+            if not functions:
+                break
+            remaining = deadline - time.monotonic()
+            if round_index == max_rounds or remaining <= 0:
+                logging.warning(
+                    f"Skipping {len(functions)} LLM function calls: "
+                    f"tool round or time budget exhausted"
+                )
+                break
+
+            names = [tc.function.name for tc in functions]
+            logging.info(f"Executing LLM functions: {names}")
+            results = await self._execute_llm_functions(functions, remaining)
+
+            messages.append(
+                {
+                    "role": "assistant",
+                    "content": getattr(message, "content", None),
+                    "tool_calls": [
+                        {
+                            "id": tc.id,
+                            "type": "function",
+                            "function": {
+                                "name": tc.function.name,
+                                "arguments": tc.function.arguments,
+                            },
+                        }
+                        for tc in tool_calls
+                    ],
+                }
+            )
+            for tc in tool_calls:
+                if tc.function.name not in self.llm_functions:
+                    result: T.Any = {"success": True, "message": "Action queued"}
+                else:
+                    result = results.get(
+                        tc.id, {"success": False, "message": "Timed out"}
+                    )
+                messages.append(
+                    {
+                        "role": "tool",
+                        "tool_call_id": tc.id,
+                        "content": json.dumps(result, default=str),
+                    }
+                )
+
+        return actions
+
     def set_system_context(self, system_context: str) -> None:
         """
         Set the static system context (optional method for LLM implementations).
-        
+
         This allows LLMs to separate static context (system prompts, rules, actions)
         from dynamic inputs, improving efficiency by caching static content.
-        
+
         Parameters
         ----------
         system_context : str
@@ -194,6 +424,33 @@ def find_module_with_class(class_name: str) -> T.Optional[str]:
     return None
 
 
+def load_function_provider(class_name: str) -> T.Optional[T.Any]:
+    """
+    Instantiate a provider that exposes @LLMFunction methods.
+
+    The provider is looked up by class name in the module of the same name
+    in snake case, e.g. UnitreeGo2LocationProvider in
+    providers.unitree_go2_location_provider.
+
+    Parameters
+    ----------
+    class_name : str
+        The provider class name
+
+    Returns
+    -------
+    Any or None
+        The provider instance, or None if it could not be created
+    """
+    module_name = re.sub(r"(?<!^)(?=[A-Z])", "_", class_name).lower()
+    try:
+        module = importlib.import_module(f"providers.{module_name}")
+        return getattr(module, class_name)()
+    except Exception as e:
+        logging.error(f"Could not load function provider '{class_name}': {e}")
+        return None
+
+
 def load_llm(class_name: str) -> T.Type[LLM]:
     """
     Load an LLM class by its class name.
@@ -128,30 +128,26 @@ class OpenAILLM(LLM[R]):
             # Add current user prompt (only dynamic inputs now)
             formatted_messages.append({"role": "user", "content": prompt})
 
-            response = await self._client.chat.completions.create(
-                model=self._config.model or "gpt-4.1-mini",
-                messages=T.cast(T.Any, formatted_messages),
-                tools=T.cast(T.Any, self.function_schemas),
-                tool_choice="auto",
-                timeout=self._config.timeout,
+            async def request(request_messages: T.List[T.Dict[str, T.Any]]):
+                response = await self._client.chat.completions.create(
+                    model=self._config.model or "gpt-4.1-mini",
+                    messages=T.cast(T.Any, request_messages),
+                    tools=T.cast(T.Any, self.function_schemas),
+                    tool_choice="auto",
+                    timeout=self._config.timeout,
+                )
+                return response.choices[0].message
+
+            # Registered provider functions (locations, status, ...) are
+            # answered within this call; everything else becomes an action
+            function_call_data = await self._run_tool_loop(
+                request, formatted_messages
             )
-
-            message = response.choices[0].message
             self.io_provider.llm_end_time = time.time()
 
-            if message.tool_calls:
-                logging.info(f"Received {len(message.tool_calls)} function calls")
-                logging.info(f"Function calls: {message.tool_calls}")
-
-                function_call_data = [
-                    {
-                        "function": {
-                            "name": tc.function.name,
-                            "arguments": tc.function.arguments,
-                        }
-                    }
-                    for tc in message.tool_calls
-                ]
+            if function_call_data:
+                logging.info(f"Received {len(function_call_data)} function calls")
+                logging.info(f"Function calls: {function_call_data}")
 
                 actions = convert_function_calls_to_actions(function_call_data)
 
@@ -0,0 +1,672 @@
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import re
+import threading
+import time
+import unicodedata
+import zlib
+from collections import OrderedDict
+from dataclasses import asdict, dataclass, field
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import requests
+
+from llm.output_model import CortexOutputModel
+
+from .io_provider import IOProvider
+from .singleton import singleton
+
+_LANG_TAG = re.compile(r"^\s*\[LANG:[^\]]*\]\s*")
+_NON_WORD = re.compile(r"[^\w\s]")
+_WHITESPACE = re.compile(r"\s+")
+_CONTRACTIONS = re.compile(r"\b(what|where|who|how|when|that|it|there)['’]s\b")
+_FILLERS = {"um", "uh", "erm", "hmm", "hey", "so", "okay", "ok", "please", "well"}
+
+# Questions whose answer depends on who is asking, what the robot sees or
+# when it is asked; never answered from the cache
+DEFAULT_UNCACHEABLE = [
+    r"\bsee\b",
+    r"\blook(ing)?\b",
+    r"\bwearing\b",
+    r"\bmy name\b",
+    r"\bremember\b",
+    r"\bwhat time\b",
+    r"\btoday\b",
+    r"\btomorrow\b",
+    r"\bweather\b",
+]
+
+# Follow-ups whose answer depends on what was said before, such as "yes",
+# "tell me more" or "what about the other one"; never answered from the cache
+_FOLLOW_UP = [
+    re.compile(
+        r"^(yes|yeah|yep|no|nope|nah|sure|and|but|also|more|that|it|this|"
+        r"these|those|they|them|he|she|what about|how about)\b"
+    ),
+    re.compile(r"\b(tell me more|the other one|that one|the same)\b"),
+    re.compile(r"\b(it|that|this|them|those|one)$"),
+]
+# Shorter questions are too often follow-ups
+MIN_QUESTION_WORDS = 3
+
+# Turns a question into a unit vector
+Embedder = Callable[[str], Optional[np.ndarray]]
+
+
+def normalize_question(text: str) -> str:
+    """
+    Normalize a spoken question for cache lookups: the language tag of the
+    ASR input, case, punctuation, filler words and repeated whitespace are
+    dropped, and contractions such as "where's" are expanded.
+
+    Parameters
+    ----------
+    text : str
+        The transcribed question.
+
+    Returns
+    -------
+    str
+        The normalized question.
+    """
+    text = unicodedata.normalize("NFKC", _LANG_TAG.sub("", text)).casefold()
+    text = _CONTRACTIONS.sub(r"\1 is", text)
+    text = _NON_WORD.sub(" ", text.replace("'", "").replace("’", ""))
+    words = [word for word in _WHITESPACE.split(text) if word]
+    return " ".join(word for word in words if word not in _FILLERS)
+
+
+def context_fingerprint(system_context: str) -> str:
+    """
+    Hash of the system context an answer was generated with. The context
+    includes the knowledge file, so editing the knowledge file or the prompt
+    changes the fingerprint.
+    """
+    return hashlib.sha256(system_context.encode("utf-8")).hexdigest()[:16]
+
+
+class HashingEmbedder:
+    """
+    Dependency-free embedding: word unigrams, word bigrams and character
+    trigrams hashed into a fixed number of dimensions. Good at recognizing
+    rephrasings with the same words, such as "where's the restroom" and
+    "where is the restroom please", but questions that differ in the one word
+    that matters ("doctor smith", "doctor jones") score as similar too, so it
+    is never used unless passed in explicitly.
+
+    Parameters
+    ----------
+    dimensions : int
+        Size of the vectors.
+    """
+
+    def __init__(self, dimensions: int = 2048):
+        self.dimensions = dimensions
+
+    def __call__(self, text: str) -> Optional[np.ndarray]:
+        words = text.split()
+        features = words + [" ".join(pair) for pair in zip(words, words[1:])]
+        padded = f" {text} "
+        features += [padded[i : i + 3] for i in range(len(padded) - 2)]
+        if not features:
+            return None
+
+        vector = np.zeros(self.dimensions, dtype=np.float32)
+        for feature in features:
+            vector[zlib.crc32(feature.encode("utf-8")) % self.dimensions] += 1.0
+        # words count more than the character trigrams they are made of
+        for word in words:
+            vector[zlib.crc32(word.encode("utf-8")) % self.dimensions] += 1.0
+        return vector / np.linalg.norm(vector)
+
+
+class OllamaEmbedder:
+    """
+    Embeddings from an Ollama embedding model, such as nomic-embed-text.
+
+    Parameters
+    ----------
+    model : str
+        The embedding model.
+    base_url : str
+        Ollama server URL.
+    timeout : float
+        Request timeout in seconds.
+    """
+
+    def __init__(
+        self, model: str, base_url: str = "http://localhost:11434", timeout=2.0
+    ):
+        self.model = model
+        self.url = f"{base_url}/api/embeddings"
+        self.timeout = timeout
+        self.session = requests.Session()
+
+    def __call__(self, text: str) -> Optional[np.ndarray]:
+        try:
+            response = self.session.post(
+                self.url,
+                json={"model": self.model, "prompt": text},
+                timeout=self.timeout,
+            )
+            response.raise_for_status()
+            vector = np.asarray(response.json()["embedding"], dtype=np.float32)
+        except Exception as e:
+            logging.warning(f"Answer cache embedding failed: {e}")
+            return None
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm > 0 else None
+
+
+def _llm_has_history(llm) -> bool:
+    """
+    Whether the LLM sends earlier turns of the conversation with the prompt,
+    so its answer may depend on them.
+    """
+    history_manager = getattr(llm, "history_manager", None)
+    return bool(getattr(history_manager, "history", None))
+
+
+def _speaks(output: CortexOutputModel) -> bool:
+    """
+    Whether an answer says something; silent answers are not worth caching.
+    """
+    for action in output.actions:
+        if action.type != "speak":
+            continue
+        value = action.value
+        sentence = value.get("sentence", "") if isinstance(value, dict) else value
+        sentence = str(sentence or "").strip()
+        if sentence and sentence.upper() != "NO ACTIONS":
+            return True
+    return False
+
+
+@dataclass
+class CachedAnswer:
+    """
+    An LLM answer to a question.
+
+    Parameters
+    ----------
+    question : str
+        The normalized question.
+    language : str
+        Language the question was asked in.
+    mode : str
+        Mode or configuration the answer was generated in.
+    fingerprint : str
+        `context_fingerprint` of the system context of the answer.
+    output : dict
+        The dumped `CortexOutputModel`.
+    latency_s : float
+        How long the LLM took to answer.
+    created : float
+        Time the answer was generated.
+    hits : int
+        Number of times the answer was served from the cache.
+    """
+
+    question: str
+    language: str
+    mode: str
+    fingerprint: str
+    output: dict
+    latency_s: float
+    created: float
+    hits: int = 0
+    embedding: Optional[np.ndarray] = field(default=None, repr=False)
+
+    @property
+    def key(self) -> Tuple[str, str, str, str]:
+        return (self.mode, self.language, self.fingerprint, self.question)
+
+
+@dataclass
+class CacheHit:
+    """
+    A cached answer found for a question.
+
+    Parameters
+    ----------
+    answer : CachedAnswer
+        The answer.
+    confidence : float
+        1.0 for an exact match, the cosine similarity of the questions
+        otherwise.
+    """
+
+    answer: CachedAnswer
+    confidence: float
+
+
+@singleton
+class AnswerCacheProvider:
+    """
+    Cache of cortex LLM answers to repeated voice questions, such as "where is
+    the restroom" or "what are your hours".
+
+    Answers are keyed on the normalized question, its language, the active
+    mode and a fingerprint of the system context. Only exact matches are
+    served unless an embedder is given; a question without an exact match is
+    then answered by the most similar cached question of the same language,
+    mode and context when the similarity is high enough and no differently
+    answered question is nearly as similar.
+
+    Parameters
+    ----------
+    path : Optional[str]
+        JSON file the cache is persisted to; None keeps it in memory only.
+    max_entries : int
+        Least recently used answers are evicted beyond this.
+    ttl_s : float
+        Answers older than this are not served.
+    similarity_threshold : float
+        Lowest cosine similarity for serving the answer of a similar question;
+        1.0 or more only serves exact matches. Ignored without an embedder.
+    ambiguity_margin : float
+        A similar question is not used if another question with a different
+        answer is within this margin of it.
+    embedder : Optional[Embedder]
+        Embeds normalized questions for similarity lookups; only exact
+        matches are served when not given.
+    uncacheable : Optional[Sequence[str]]
+        Regular expressions of questions that are never cached.
+    """
+
+    def __init__(
+        self,
+        path: Optional[str] = "dump/answer_cache.json",
+        max_entries: int = 512,
+        ttl_s: float = 24 * 3600.0,
+        similarity_threshold: float = 1.0,
+        ambiguity_margin: float = 0.03,
+        embedder: Optional[Embedder] = None,
+        uncacheable: Optional[Sequence[str]] = None,
+    ):
+        self.path = path
+        self.max_entries = max_entries
+        self.ttl_s = ttl_s
+        self.similarity_threshold = similarity_threshold
+        self.ambiguity_margin = ambiguity_margin
+        self.embedder = embedder
+        self.uncacheable = [
+            re.compile(pattern)
+            for pattern in (DEFAULT_UNCACHEABLE if uncacheable is None else uncacheable)
+        ]
+
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Tuple[str, str, str, str], CachedAnswer]" = (
+            OrderedDict()
+        )
+        self._fingerprints: Dict[str, str] = {}
+
+        self.exact_hits = 0
+        self.similar_hits = 0
+        self.misses = 0
+        self.saved_s = 0.0
+
+        self._load()
+
+    def set_context(self, mode: str, system_context: str) -> str:
+        """
+        Register the system context of a mode, dropping the answers generated
+        with a different context.
+
+        Parameters
+        ----------
+        mode : str
+            The mode or configuration name.
+        system_context : str
+            The system context sent to the LLM in that mode.
+
+        Returns
+        -------
+        str
+            The fingerprint of the context.
+        """
+        fingerprint = context_fingerprint(system_context)
+        with self._lock:
+            self._fingerprints[mode] = fingerprint
+            stale = [
+                key
+                for key, entry in self._entries.items()
+                if entry.mode == mode and entry.fingerprint != fingerprint
+            ]
+            for key in stale:
+                del self._entries[key]
+        if stale:
+            logging.info(
+                f"Answer cache: dropped {len(stale)} answers of mode {mode} "
+                "generated with a different prompt or knowledge base"
+            )
+            self._save()
+        return fingerprint
+
+    def is_cacheable(self, question: str) -> bool:
+        """
+        Whether answers to a normalized question may be cached. Short
+        questions and follow-ups such as "what about the other one" never are.
+        """
+        if len(question.split()) < MIN_QUESTION_WORDS:
+            return False
+        return not any(p.search(question) for p in [*_FOLLOW_UP, *self.uncacheable])
+
+    def lookup(self, question: str, language: str, mode: str) -> Optional[CacheHit]:
+        """
+        Find the cached answer to a question.
+
+        Parameters
+        ----------
+        question : str
+            The normalized question.
+        language : str
+            Language the question was asked in.
+        mode : str
+            The active mode.
+
+        Returns
+        -------
+        Optional[CacheHit]
+            The answer, or None on a miss.
+        """
+        fingerprint = self._fingerprints.get(mode, "")
+        now = time.time()
+
+        with self._lock:
+            entry = self._entries.get((mode, language, fingerprint, question))
+            if entry is not None and now - entry.created <= self.ttl_s:
+                return self._hit(entry, 1.0)
+            candidates = [
+                entry
+                for entry in self._entries.values()
+                if entry.mode == mode
+                and entry.language == language
+                and entry.fingerprint == fingerprint
+                and entry.embedding is not None
+                and now - entry.created <= self.ttl_s
+            ]
+
+        hit = None
+        if candidates and self.embedder and self.similarity_threshold < 1.0:
+            hit = self._most_similar(question, candidates)
+        with self._lock:
+            if hit is None:
+                self.misses += 1
+                return None
+            return self._hit(hit.answer, hit.confidence)
+
+    def _most_similar(
+        self, question: str, candidates: List[CachedAnswer]
+    ) -> Optional[CacheHit]:
+        embedding = self.embedder(question)
+        if embedding is None:
+            return None
+
+        scores = np.stack([c.embedding for c in candidates]) @ embedding
+        order = np.argsort(scores)[::-1]
+        best = candidates[order[0]]
+        confidence = float(scores[order[0]])
+        if confidence < self.similarity_threshold:
+            return None
+
+        for index in order[1:]:
+            if confidence - float(scores[index]) > self.ambiguity_margin:
+                break
+            if candidates[index].output != best.output:
+                logging.info(
+                    f"Answer cache: '{question}' is ambiguous between "
+                    f"'{best.question}' and '{candidates[index].question}'"
+                )
+                return None
+        return CacheHit(best, confidence)
+
+    def _hit(self, entry: CachedAnswer, confidence: float) -> CacheHit:
+        if confidence >= 1.0:
+            self.exact_hits += 1
+        else:
+            self.similar_hits += 1
+        entry.hits += 1
+        self.saved_s += entry.latency_s
+        if entry.key in self._entries:
+            self._entries.move_to_end(entry.key)
+        return CacheHit(entry, confidence)
+
+    async def ask(
+        self, llm, prompt: str, question: str, language: str, mode: str
+    ) -> Optional[CortexOutputModel]:
+        """
+        Answer a prompt from the cache, or ask the LLM and cache its answer.
+
+        Parameters
+        ----------
+        llm : LLM
+            The cortex LLM.
+        prompt : str
+            The fused prompt.
+        question : str
+            The transcribed voice question, which must be the only input of
+            the prompt.
+        language : str
+            Language the question was asked in.
+        mode : str
+            The active mode.
+
+        Returns
+        -------
+        Optional[CortexOutputModel]
+            The answer, or None if the LLM did not respond.
+        """
+        question = normalize_question(question)
+        if not self.is_cacheable(question) or _llm_has_history(llm):
+            return await llm.ask(prompt)
+
+        hit = self.lookup(question, language, mode)
+        if hit is not None:
+            # the cached answer stands in for an LLM call on this prompt
+            IOProvider().set_llm_prompt(prompt)
+            stats = self.stats()
+            logging.info(
+                f"Answer cache hit ({hit.confidence:.2f}) for '{question}' as "
+                f"'{hit.answer.question}': saved {hit.answer.latency_s:.2f}s, "
+                f"hit rate {stats['hit_rate']:.0%}, {stats['saved_s']:.1f}s saved"
+            )
+            return CortexOutputModel.model_validate(hit.answer.output)
+
+        start = time.perf_counter()
+        output = await llm.ask(prompt)
+        if output is not None and _speaks(output):
+            # only the spoken answer is replayed; movements and other actions
+            # belong to the moment they were chosen in
+            spoken = CortexOutputModel(
+                actions=[a for a in output.actions if a.type == "speak"]
+            )
+            await asyncio.to_thread(
+                self.store,
+                question,
+                language,
+                mode,
+                spoken.model_dump(),
+                time.perf_counter() - start,
+            )
+        return output
+
+    def store(
+        self,
+        question: str,
+        language: str,
+        mode: str,
+        output: dict,
+        latency_s: float,
+    ) -> None:
+        """
+        Cache the LLM answer to a question.
+
+        Parameters
+        ----------
+        question : str
+            The normalized question.
+        language : str
+            Language the question was asked in.
+        mode : str
+            The active mode.
+        output : dict
+            The dumped `CortexOutputModel`.
+        latency_s : float
+            How long the LLM took to answer.
+        """
+        if not self.is_cacheable(question):
+            return
+
+        entry = CachedAnswer(
+            question=question,
+            language=language,
+            mode=mode,
+            fingerprint=self._fingerprints.get(mode, ""),
+            output=output,
+            latency_s=latency_s,
+            created=time.time(),
+            embedding=self.embedder(question) if self.embedder else None,
+        )
+        with self._lock:
+            self._entries[entry.key] = entry
+            self._entries.move_to_end(entry.key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        self._save()
+
+    def invalidate(self, mode: Optional[str] = None) -> None:
+        """
+        Drop the cached answers of a mode, or all answers.
+
+        Parameters
+        ----------
+        mode : Optional[str]
+            The mode; None drops every answer.
+        """
+        with self._lock:
+            for key in [k for k, e in self._entries.items() if mode in (None, e.mode)]:
+                del self._entries[key]
+        self._save()
+
+    def stats(self) -> Dict[str, float]:
+        """
+        Get the cache metrics.
+
+        Returns
+        -------
+        Dict[str, float]
+            Entry count, exact and similar hits, misses, hit rate and the LLM
+            time saved by hits.
+        """
+        with self._lock:
+            hits = self.exact_hits + self.similar_hits
+            lookups = hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "exact_hits": self.exact_hits,
+                "similar_hits": self.similar_hits,
+                "misses": self.misses,
+                "hit_rate": hits / lookups if lookups else 0.0,
+                "saved_s": round(self.saved_s, 3),
+            }
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _load(self) -> None:
+        if not self.path or not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                records = json.load(f)
+        except Exception as e:
+            logging.warning(f"Answer cache: could not read {self.path}: {e}")
+            return
+
+        now = time.time()
+        for record in records:
+            try:
+                entry = CachedAnswer(**record)
+            except TypeError:
+                continue
+            if now - entry.created > self.ttl_s:
+                continue
+            if self.embedder:
+                entry.embedding = self.embedder(entry.question)
+            self._entries[entry.key] = entry
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        logging.info(f"Answer cache: loaded {len(self._entries)} answers")
+
+    def _save(self) -> None:
+        if not self.path:
+            return
+        with self._lock:
+            records = []
+            for entry in self._entries.values():
+                record = asdict(entry)
+                record.pop("embedding")
+                records.append(record)
+        try:
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            tmp_path = f"{self.path}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(records, f, ensure_ascii=False)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            logging.warning(f"Answer cache: could not write {self.path}: {e}")
+
+
+def answer_cache_from_config(
+    config: Optional[Dict], mode: str, system_context: str
+) -> Optional[AnswerCacheProvider]:
+    """
+    Create the answer cache configured by the `answer_cache` section of an
+    agent configuration and register the system context of a mode with it.
+
+    Parameters
+    ----------
+    config : Optional[Dict]
+        The `answer_cache` section; the cache is disabled when it is missing
+        or `enabled` is false.
+    mode : str
+        The mode or configuration name.
+    system_context : str
+        The system context of the mode.
+
+    Returns
+    -------
+    Optional[AnswerCacheProvider]
+        The cache, or None if it is disabled.
+    """
+    if not isinstance(config, dict) or not config.get("enabled", True):
+        return None
+
+    # answers of similar questions are only served with a real embedding
+    # model; without one a question must match a cached one exactly
+    embedding_model = config.get("embedding_model")
+    embedder = (
+        OllamaEmbedder(
+            embedding_model, config.get("base_url", "http://localhost:11434")
+        )
+        if embedding_model
+        else None
+    )
+    cache = AnswerCacheProvider(
+        path=config.get("path", "dump/answer_cache.json"),
+        max_entries=config.get("max_entries", 512),
+        ttl_s=config.get("ttl_s", 24 * 3600.0),
+        similarity_threshold=(
+            config.get("similarity_threshold", 0.85) if embedder else 1.0
+        ),
+        ambiguity_margin=config.get("ambiguity_margin", 0.03),
+        embedder=embedder,
+        uncacheable=config.get("uncacheable"),
+    )
+    cache.set_context(mode, system_context)
+    return cache
@@ -0,0 +1,353 @@
+import math
+from dataclasses import dataclass
+from typing import Optional
+
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
+# curvatures closer to zero than this are treated as (nearly) straight lines
+_MIN_CURVATURE = 1e-6
+
+
+@dataclass
+class ArcPlan:
+    """
+    Result of one local planning pass.
+
+    Frames follow ROS conventions: x forward, y to the left, positive angles
+    and angular velocities turn the robot to the left (CCW).
+
+    Parameters
+    ----------
+    linear : float
+        Best linear velocity in m/s, 0.0 if no arc is admissible.
+    angular : float
+        Best angular velocity in rad/s, 0.0 if no arc is admissible.
+    admissible : bool
+        Whether any arc can be driven without entering the stopping distance
+        of an obstacle.
+    score : float
+        Score of the best arc, between 0 and 1.
+    free_length : float
+        Distance in m that can be driven along the best arc before the robot
+        footprint touches an obstacle, capped at the arc length.
+    clearance : float
+        Smallest gap in m between the robot footprint and an obstacle along
+        the best arc, capped at the planner's clearance cap.
+    end_x : float
+        Forward position of the end of the best arc in m.
+    end_y : float
+        Left position of the end of the best arc in m.
+    end_yaw : float
+        Heading change over the best arc in degrees.
+    clearance_map : NDArray
+        Free length in m of every sampled arc, shape (linear, angular).
+    linear_samples : NDArray
+        Linear velocities that index the rows of `clearance_map`.
+    angular_samples : NDArray
+        Angular velocities that index the columns of `clearance_map`.
+    """
+
+    linear: float
+    angular: float
+    admissible: bool
+    score: float
+    free_length: float
+    clearance: float
+    end_x: float
+    end_y: float
+    end_yaw: float
+    clearance_map: NDArray
+    linear_samples: NDArray
+    angular_samples: NDArray
+
+    @property
+    def turn(self) -> float:
+        """
+        Heading in degrees (CCW positive) of the chord to the end of the arc.
+        """
+        return math.degrees(math.atan2(self.end_y, self.end_x))
+
+    @property
+    def distance(self) -> float:
+        """
+        Length in m of the chord to the end of the drivable part of the arc.
+        """
+        return math.hypot(self.end_x, self.end_y)
+
+
+class ArcPlanner:
+    """
+    Dynamic-window style local planner over lidar points.
+
+    A fixed grid of constant (v, w) commands is sampled once. Each command
+    traces a circular arc over `horizon` seconds. For every scan, all arcs
+    are scored against all obstacle points in a single vectorized pass using
+    the closed-form distance between a point and a circle, so the cost is
+    O(arcs x points) with no per-arc Python loop.
+
+    Each arc is scored on
+
+    - heading: how well the final heading matches `goal_heading`
+    - clearance: the smallest gap between the footprint and an obstacle
+    - progress: how far the robot gets toward `goal_heading` before it
+      would touch an obstacle
+
+    and arcs whose free length is shorter than the stopping distance at their
+    speed are rejected.
+
+    Parameters
+    ----------
+    half_width : float
+        Half width of the robot in m; obstacles closer than this to the arc
+        are collisions.
+    max_linear : float
+        Fastest sampled linear velocity in m/s.
+    min_linear : float
+        Slowest sampled linear velocity in m/s.
+    max_angular : float
+        Fastest sampled angular velocity in rad/s, both directions.
+    linear_samples : int
+        Number of linear velocities sampled.
+    angular_samples : int
+        Number of angular velocities sampled. Use an odd number so that
+        driving straight is one of the samples.
+    horizon : float
+        Simulated time per arc in s.
+    deceleration : float
+        Braking deceleration in m/s^2 used for the stopping distance.
+    safety_margin : float
+        Extra distance in m that must stay free beyond the stopping distance.
+    clearance_cap : float
+        Gaps larger than this (m) all score the same clearance.
+    heading_weight : float
+        Weight of the heading term.
+    clearance_weight : float
+        Weight of the clearance term.
+    progress_weight : float
+        Weight of the progress term.
+    """
+
+    def __init__(
+        self,
+        half_width: float = 0.20,
+        max_linear: float = 0.5,
+        min_linear: float = 0.1,
+        max_angular: float = 1.0,
+        linear_samples: int = 9,
+        angular_samples: int = 41,
+        horizon: float = 2.0,
+        deceleration: float = 0.5,
+        safety_margin: float = 0.1,
+        clearance_cap: float = 0.5,
+        heading_weight: float = 0.1,
+        clearance_weight: float = 0.3,
+        progress_weight: float = 0.6,
+    ):
+        self.half_width = half_width
+        self.max_linear = max_linear
+        self.horizon = horizon
+        self.deceleration = deceleration
+        self.safety_margin = safety_margin
+        self.clearance_cap = clearance_cap
+
+        total = heading_weight + clearance_weight + progress_weight
+        self.weights = (
+            heading_weight / total,
+            clearance_weight / total,
+            progress_weight / total,
+        )
+
+        self.linear_samples = np.linspace(min_linear, max_linear, linear_samples)
+        self.angular_samples = np.linspace(-max_angular, max_angular, angular_samples)
+
+        v, w = np.meshgrid(self.linear_samples, self.angular_samples, indexing="ij")
+        self._v = v.ravel()
+        self._w = w.ravel()
+
+        # every arc is mirrored into a left turn with radius R, center (0, R)
+        kappa = self._w / self._v
+        self._sign = np.where(kappa < 0, -1.0, 1.0)
+        self._radius = 1.0 / np.maximum(np.abs(kappa), _MIN_CURVATURE)
+        self._sign32 = self._sign.astype(np.float32)
+        self._radius32 = self._radius.astype(np.float32)
+        self._length = self._v * horizon
+        self._lookahead = max_linear * horizon + half_width
+        self._stopping = self._v**2 / (2 * deceleration) + safety_margin
+        self._end_yaw = self._w * horizon
+
+    @property
+    def arc_count(self) -> int:
+        """
+        Number of sampled arcs.
+        """
+        return len(self._v)
+
+    def _arc_points(self, length: NDArray, i):
+        """
+        Position along arcs `i` after driving `length` m.
+        """
+        theta = length / self._radius[i]
+        x = self._radius[i] * np.sin(theta)
+        y = self._sign[i] * self._radius[i] * (1 - np.cos(theta))
+        return x, y
+
+    def evaluate(self, x: ArrayLike, y: ArrayLike):
+        """
+        Free length and clearance of every sampled arc.
+
+        Parameters
+        ----------
+        x : ArrayLike
+            Forward coordinates of the obstacle points in m.
+        y : ArrayLike
+            Left coordinates of the obstacle points in m.
+
+        Returns
+        -------
+        tuple of NDArray
+            Free length (m) and clearance (m) per arc, each of shape (arcs,).
+        """
+        px = np.asarray(x, dtype=np.float32).ravel()
+        py = np.asarray(y, dtype=np.float32).ravel()
+
+        # points this far away cannot touch or crowd any arc
+        d2 = px * px + py * py
+        near = d2 <= (self._lookahead + self.clearance_cap) ** 2
+        px, py, d2 = px[near], py[near], d2[near]
+
+        free = self._length.copy()
+        clearance = np.full(self.arc_count, self.clearance_cap)
+        if len(px) == 0:
+            return free, clearance
+
+        radius = self._radius32[:, None]
+        # mirror right turns so every arc is a left turn
+        my = py[None, :] * self._sign32[:, None]
+
+        # distance from the point to the circle, written as
+        # (|p - c|^2 - R^2) / (|p - c| + R) so that it stays accurate in
+        # float32 for the huge radii of nearly straight arcs
+        power = d2[None, :] - 2 * radius * my
+        lateral = np.abs(power) / (
+            np.sqrt(np.maximum(power + radius * radius, 0)) + radius
+        )
+
+        # how far along the arc the closest point on the circle lies
+        theta = np.arctan2(px[None, :], radius - my)
+        along = np.where(theta < 0, theta + 2 * np.pi, theta) * radius
+
+        # clearance looks the same distance ahead on every arc, so that slow
+        # arcs do not look safe just because they stop short of an obstacle
+        ahead = along <= self._lookahead
+        gap = np.where(ahead, lateral - self.half_width, np.inf)
+        clearance = np.clip(gap.min(axis=1), 0.0, self.clearance_cap)
+
+        # points alongside the drivable part of the arc, including the front
+        # of the footprint at the end of the arc
+        beside = along <= (self._length + self.half_width)[:, None]
+        hit = beside & (lateral < self.half_width)
+        # the footprint's leading edge reaches the point this far before
+        # the center line does
+        reach = np.sqrt(
+            np.maximum(
+                self.half_width**2 - np.minimum(lateral, self.half_width) ** 2, 0
+            )
+        )
+        stop_at = np.where(hit, np.maximum(along - reach, 0.0), np.inf)
+        free = np.minimum(self._length, stop_at.min(axis=1))
+
+        return free, clearance
+
+    def plan(
+        self,
+        x: ArrayLike,
+        y: ArrayLike,
+        goal_heading: float = 0.0,
+        linear: Optional[float] = None,
+        angular: Optional[float] = None,
+        linear_accel: float = 1.0,
+        angular_accel: float = 3.0,
+        dt: float = 0.25,
+    ) -> ArcPlan:
+        """
+        Pick the best arc for one scan.
+
+        Parameters
+        ----------
+        x : ArrayLike
+            Forward coordinates of the obstacle points in m.
+        y : ArrayLike
+            Left coordinates of the obstacle points in m.
+        goal_heading : float
+            Desired heading change in degrees, CCW positive.
+        linear : float, optional
+            Current linear velocity in m/s. When both `linear` and `angular`
+            are given, only arcs reachable within `dt` are considered.
+        angular : float, optional
+            Current angular velocity in rad/s.
+        linear_accel : float
+            Linear acceleration limit in m/s^2 for the dynamic window.
+        angular_accel : float
+            Angular acceleration limit in rad/s^2 for the dynamic window.
+        dt : float
+            Time until the next plan in s, typically the scan period.
+
+        Returns
+        -------
+        ArcPlan
+            The best command and the free length of every sampled arc.
+        """
+        free, clearance = self.evaluate(x, y)
+
+        goal = math.radians(goal_heading)
+        heading_error = np.abs(np.angle(np.exp(1j * (goal - self._end_yaw))))
+        heading = 1.0 - heading_error / np.pi
+        # distance made good toward the goal at the end of the free part
+        end_x, end_y = self._arc_points(free, slice(None))
+        progress = np.maximum(end_x * math.cos(goal) + end_y * math.sin(goal), 0.0)
+        progress /= self.max_linear * self.horizon
+
+        wh, wc, wp = self.weights
+        score = wh * heading + wc * clearance / self.clearance_cap + wp * progress
+
+        admissible = free >= np.minimum(self._stopping, self._length)
+        if linear is not None and angular is not None:
+            admissible &= np.abs(self._v - linear) <= linear_accel * dt + 1e-9
+            admissible &= np.abs(self._w - angular) <= angular_accel * dt + 1e-9
+
+        clearance_map = free.reshape(len(self.linear_samples), -1)
+
+        if not admissible.any():
+            return ArcPlan(
+                linear=0.0,
+                angular=0.0,
+                admissible=False,
+                score=0.0,
+                free_length=0.0,
+                clearance=0.0,
+                end_x=0.0,
+                end_y=0.0,
+                end_yaw=0.0,
+                clearance_map=clearance_map,
+                linear_samples=self.linear_samples,
+                angular_samples=self.angular_samples,
+            )
+
+        best = int(np.argmax(np.where(admissible, score, -np.inf)))
+        return ArcPlan(
+            linear=float(self._v[best]),
+            angular=float(self._w[best]),
+            admissible=True,
+            score=float(score[best]),
+            free_length=float(free[best]),
+            clearance=float(clearance[best]),
+            end_x=float(end_x[best]),
+            end_y=float(end_y[best]),
+            end_yaw=float(
+                math.degrees(free[best] / self._radius[best]) * self._sign[best]
+            ),
+            clearance_map=clearance_map,
+            linear_samples=self.linear_samples,
+            angular_samples=self.angular_samples,
+        )
@@ -12,6 +12,8 @@ import sounddevice as sd
 import numpy as np
 import cv2
 
+from .audio_session_provider import AudioSessionProvider
+
 
 class AudioInputStream:
     """
@@ -54,6 +56,9 @@ class AudioInputStream:
         self.stream = None
         self.worker_thread = None
         self.audio_callback: Optional[Callable] = None
+
+        # Frames captured while the robot speaks are not sent to ASR
+        self.audio_session = AudioSessionProvider()
         
         logging.info(f"AudioInputStream initialized: {sample_rate}Hz, {channels} channels")
     
@@ -119,6 +124,8 @@ class AudioInputStream:
             logging.warning(f"Audio input status: {status}")
         
         if self.running:
+            if self.audio_session.is_playing():
+                return
             # Convert to the expected format and add to queue
             audio_data = indata.copy()
             self.audio_queue.put(audio_data)
@@ -137,6 +144,18 @@ class AudioInputStream:
                 logging.error(f"Error in AudioInputStream worker loop: {e}")
                 time.sleep(0.1)
     
+    def on_tts_state_change(self, state: str):
+        """
+        TTS state callback for the TTS providers, reports playback to the
+        shared audio session.
+
+        Parameters
+        ----------
+        state : str
+            "processing", "completed" or "error"
+        """
+        self.audio_session.on_tts_state_change(state)
+
     def register_audio_data_callback(self, callback: Callable):
         """Alias for set_audio_callback for compatibility with ASRProvider."""
         self.set_audio_callback(callback)
@@ -0,0 +1,364 @@
+import difflib
+import logging
+import re
+import subprocess
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Callable, Deque, Dict, List, Optional, Set, Tuple
+
+from .singleton import singleton
+
+_NON_WORD = re.compile(r"[^\w\s]")
+_LANG_TAG = re.compile(r"^\[LANG:[^\]]*\]\s*")
+
+
+def _normalize(text: str) -> str:
+    text = _LANG_TAG.sub("", text or "")
+    return " ".join(_NON_WORD.sub(" ", text.lower()).split())
+
+
+@singleton
+class AudioSessionProvider:
+    """
+    Half-duplex coordinator between the speaker and the microphone.
+
+    Speak connectors wrap their playback in `playback()` and ASR inputs ask
+    `overlaps_playback()` / `is_playing()` before spending CPU on a capture, so
+    the robot does not transcribe its own voice. Sustained loud input while
+    speaking is treated as barge-in and interrupts playback through the
+    registered interrupt callbacks.
+
+    Parameters
+    ----------
+    tail_padding_s : float
+        Seconds after playback ends during which the microphone is still
+        considered to hear the speaker (room reverb, player latency).
+    barge_in_rms : float
+        Microphone RMS level that counts as the user talking over the robot;
+        0 disables barge-in. Must be above the level of the robot's own echo.
+    barge_in_min_s : float
+        Seconds of input above `barge_in_rms` needed to interrupt playback.
+    echo_similarity : float
+        Minimum similarity between a transcript and recently spoken text for
+        the transcript to be treated as an echo.
+    """
+
+    # token of playback reported through `on_tts_state_change`
+    _STREAM_TOKEN = -1
+
+    def __init__(
+        self,
+        tail_padding_s: float = 0.5,
+        barge_in_rms: float = 0.0,
+        barge_in_min_s: float = 0.3,
+        echo_similarity: float = 0.6,
+    ):
+        self.tail_padding_s = tail_padding_s
+        self.barge_in_rms = barge_in_rms
+        self.barge_in_min_s = barge_in_min_s
+        self.echo_similarity = echo_similarity
+
+        self._lock = threading.Lock()
+        self._next_token = 0
+        self._active: Dict[int, Tuple[float, str]] = {}
+        self._intervals: Deque[Tuple[float, float]] = deque(maxlen=32)
+        self._recent_text: Deque[Tuple[float, str]] = deque(maxlen=8)
+        self._loud_s = 0.0
+
+        self._interrupt_callbacks: List[Callable[[], None]] = []
+        self._processes: Set[subprocess.Popen] = set()
+        self.interrupted = threading.Event()
+
+        self.metrics = {
+            "playbacks": 0,
+            "skipped_captures": 0,
+            "skipped_inferences": 0,
+            "echo_dropped": 0,
+            "barge_ins": 0,
+        }
+
+    def begin_playback(self, text: str = "") -> int:
+        """
+        Mark the start of speaker output.
+
+        Parameters
+        ----------
+        text : str
+            The text being spoken, used to recognize its echo.
+
+        Returns
+        -------
+        int
+            Token to pass to `end_playback`.
+        """
+        now = time.time()
+        with self._lock:
+            self._next_token += 1
+            token = self._next_token
+            self._active[token] = (now, text)
+            if text:
+                self._recent_text.append((now, _normalize(text)))
+            self._loud_s = 0.0
+            self.metrics["playbacks"] += 1
+        self.interrupted.clear()
+        return token
+
+    def end_playback(self, token: int) -> None:
+        """
+        Mark the end of speaker output.
+
+        Parameters
+        ----------
+        token : int
+            The token returned by `begin_playback`.
+        """
+        with self._lock:
+            entry = self._active.pop(token, None)
+            if entry is not None:
+                self._intervals.append((entry[0], time.time()))
+
+    @contextmanager
+    def playback(self, text: str = ""):
+        """
+        Context manager around speaker output.
+
+        Parameters
+        ----------
+        text : str
+            The text being spoken.
+        """
+        token = self.begin_playback(text)
+        try:
+            yield token
+        finally:
+            self.end_playback(token)
+
+    def run_player(
+        self, cmd: List[str], text: str = "", timeout: Optional[float] = None
+    ) -> subprocess.CompletedProcess:
+        """
+        Run a command line audio player as playback. The player is terminated
+        on barge-in.
+
+        Parameters
+        ----------
+        cmd : List[str]
+            The player command.
+        text : str
+            The text being spoken.
+        timeout : Optional[float]
+            Seconds after which the player is killed.
+
+        Returns
+        -------
+        subprocess.CompletedProcess
+            The finished player process, with captured stderr.
+
+        Raises
+        ------
+        FileNotFoundError
+            If the player is not installed.
+        subprocess.TimeoutExpired
+            If the player was killed after `timeout`.
+        """
+        with self.playback(text):
+            process = subprocess.Popen(
+                cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE
+            )
+            with self._lock:
+                self._processes.add(process)
+            try:
+                _, stderr = process.communicate(timeout=timeout)
+            except subprocess.TimeoutExpired:
+                process.kill()
+                process.communicate()
+                raise
+            finally:
+                with self._lock:
+                    self._processes.discard(process)
+
+        return subprocess.CompletedProcess(cmd, process.returncode, None, stderr)
+
+    def on_tts_state_change(self, state: str) -> None:
+        """
+        Adapter for providers that report TTS state as "processing",
+        "completed" or "error".
+        """
+        if state == "processing":
+            with self._lock:
+                if self._STREAM_TOKEN in self._active:
+                    return
+                self._active[self._STREAM_TOKEN] = (time.time(), "")
+                self.metrics["playbacks"] += 1
+            self.interrupted.clear()
+        elif state in ("completed", "error"):
+            self.end_playback(self._STREAM_TOKEN)
+
+    def is_playing(self, at: Optional[float] = None) -> bool:
+        """
+        Whether the speaker is active, or was within the tail padding.
+
+        Parameters
+        ----------
+        at : Optional[float]
+            Unix time to check, now by default.
+        """
+        at = time.time() if at is None else at
+        return self.overlaps_playback(at, at)
+
+    def overlaps_playback(self, start: float, end: float) -> bool:
+        """
+        Whether a capture window overlapped speaker output, including the
+        tail padding.
+
+        Parameters
+        ----------
+        start : float
+            Unix time the capture started.
+        end : float
+            Unix time the capture ended.
+        """
+        with self._lock:
+            for began, _ in self._active.values():
+                if began <= end:
+                    return True
+            for began, ended in self._intervals:
+                if began <= end and start <= ended + self.tail_padding_s:
+                    return True
+        return False
+
+    def wait_until_quiet(self, timeout: float) -> bool:
+        """
+        Block until playback and its tail padding are over.
+
+        Parameters
+        ----------
+        timeout : float
+            Maximum seconds to wait.
+
+        Returns
+        -------
+        bool
+            True if the speaker is quiet.
+        """
+        deadline = time.time() + timeout
+        while self.is_playing():
+            if time.time() >= deadline:
+                return False
+            time.sleep(0.05)
+        return True
+
+    def is_echo(self, transcript: str, window_s: float = 30.0) -> bool:
+        """
+        Whether a transcript is most likely the robot's own recent speech.
+
+        Parameters
+        ----------
+        transcript : str
+            The ASR transcript.
+        window_s : float
+            How far back spoken text is considered.
+        """
+        heard = _normalize(transcript)
+        if not heard:
+            return False
+
+        cutoff = time.time() - window_s
+        with self._lock:
+            spoken = [text for ts, text in self._recent_text if ts >= cutoff]
+
+        for text in spoken:
+            if heard in text:
+                return True
+            ratio = difflib.SequenceMatcher(None, heard, text).ratio()
+            if ratio >= self.echo_similarity:
+                return True
+        return False
+
+    def report_input_level(self, rms: float, duration_s: float) -> bool:
+        """
+        Feed microphone levels captured during playback for barge-in
+        detection.
+
+        Parameters
+        ----------
+        rms : float
+            RMS level of the block.
+        duration_s : float
+            Duration of the block in seconds.
+
+        Returns
+        -------
+        bool
+            True if this block triggered a barge-in.
+        """
+        if self.barge_in_rms <= 0:
+            return False
+
+        with self._lock:
+            if not self._active:
+                self._loud_s = 0.0
+                return False
+            self._loud_s = self._loud_s + duration_s if rms > self.barge_in_rms else 0.0
+            triggered = self._loud_s >= self.barge_in_min_s
+            if triggered:
+                self._loud_s = 0.0
+
+        if triggered:
+            self.interrupt()
+        return triggered
+
+    def register_interrupt_callback(self, callback: Callable[[], None]) -> None:
+        """
+        Register a function that stops playback, called on barge-in.
+
+        Parameters
+        ----------
+        callback : Callable[[], None]
+            Stops the connector's current playback.
+        """
+        if callback not in self._interrupt_callbacks:
+            self._interrupt_callbacks.append(callback)
+
+    def interrupt(self) -> None:
+        """
+        Interrupt the current playback.
+        """
+        logging.info("AudioSession: barge-in, interrupting playback")
+        self.metrics["barge_ins"] += 1
+        self.interrupted.set()
+
+        with self._lock:
+            processes = list(self._processes)
+        for process in processes:
+            try:
+                process.terminate()
+            except OSError:
+                pass
+
+        for callback in self._interrupt_callbacks:
+            try:
+                callback()
+            except Exception as e:
+                logging.error(f"AudioSession: interrupt callback error: {e}")
+
+    def record_skipped_capture(self) -> None:
+        """
+        Count a capture that was not recorded because the speaker was active.
+        """
+        self.metrics["skipped_captures"] += 1
+
+    def record_skipped_inference(self) -> None:
+        """
+        Count a captured chunk that was not transcribed because it overlapped
+        playback.
+        """
+        self.metrics["skipped_inferences"] += 1
+
+    def record_echo_dropped(self) -> None:
+        """
+        Count a transcript that was dropped as an echo.
+        """
+        self.metrics["echo_dropped"] += 1
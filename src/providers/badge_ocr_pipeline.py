@@ -0,0 +1,384 @@
+import itertools
+import logging
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable, List, Optional, Tuple
+
+import cv2
+import numpy as np
+
+# (x, y, width, height) in full resolution frame pixels
+Box = Tuple[int, int, int, int]
+
+
+def detect_text_regions(
+    frame: np.ndarray,
+    detect_width: int = 640,
+    min_contrast: float = 32.0,
+    min_area_frac: float = 0.002,
+    max_area_frac: float = 0.6,
+    min_fill: float = 0.1,
+) -> Tuple[List[Box], List[float]]:
+    """
+    Find text-like regions, such as badges, on a downscaled copy of a frame.
+
+    Strong local gradients are thresholded and closed with a wide kernel, so
+    the characters of a line and the lines of a badge merge into one blob.
+
+    Parameters
+    ----------
+    frame : np.ndarray
+        BGR or grayscale frame.
+    detect_width : int
+        Width the frame is downscaled to before detection.
+    min_contrast : float
+        Gradients weaker than this never count as text edges, which keeps
+        blank frames and sensor noise from producing regions.
+    min_area_frac : float
+        Smallest region, as a fraction of the frame area.
+    max_area_frac : float
+        Largest region, as a fraction of the frame area.
+    min_fill : float
+        Smallest fraction of edge pixels inside a region.
+
+    Returns
+    -------
+    Tuple[List[Box], List[float]]
+        The regions in full resolution coordinates and the sharpness (variance
+        of the Laplacian on the downscaled frame) of each.
+    """
+    gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY) if frame.ndim == 3 else frame
+    height, width = gray.shape[:2]
+    scale = min(1.0, detect_width / float(width))
+    small = (
+        cv2.resize(gray, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA)
+        if scale < 1.0
+        else gray
+    )
+
+    gradient = cv2.morphologyEx(small, cv2.MORPH_GRADIENT, np.ones((3, 3), np.uint8))
+    otsu, _ = cv2.threshold(gradient, 0, 255, cv2.THRESH_BINARY | cv2.THRESH_OTSU)
+    edges = (gradient >= max(otsu, min_contrast)).astype(np.uint8)
+
+    small_h, small_w = small.shape[:2]
+    kernel = cv2.getStructuringElement(
+        cv2.MORPH_RECT, (max(3, small_w // 40), max(3, small_w // 70))
+    )
+    closed = cv2.morphologyEx(edges, cv2.MORPH_CLOSE, kernel)
+    contours, _ = cv2.findContours(closed, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
+
+    laplacian = cv2.Laplacian(small, cv2.CV_32F)
+    small_area = float(small_h * small_w)
+    boxes: List[Box] = []
+    sharpness: List[float] = []
+    for contour in contours:
+        x, y, w, h = cv2.boundingRect(contour)
+        area = w * h
+        if not min_area_frac * small_area <= area <= max_area_frac * small_area:
+            continue
+        if edges[y : y + h, x : x + w].mean() < min_fill:
+            continue
+
+        boxes.append(
+            (
+                int(x / scale),
+                int(y / scale),
+                min(width, int(np.ceil(w / scale))),
+                min(height, int(np.ceil(h / scale))),
+            )
+        )
+        sharpness.append(float(laplacian[y : y + h, x : x + w].var()))
+    return boxes, sharpness
+
+
+def box_iou(a: Box, b: Box) -> float:
+    """
+    Intersection over union of two boxes.
+    """
+    ix = max(0, min(a[0] + a[2], b[0] + b[2]) - max(a[0], b[0]))
+    iy = max(0, min(a[1] + a[3], b[1] + b[3]) - max(a[1], b[1]))
+    intersection = ix * iy
+    union = a[2] * a[3] + b[2] * b[3] - intersection
+    return intersection / union if union > 0 else 0.0
+
+
+@dataclass
+class RegionTrack:
+    """
+    A text region followed across frames.
+
+    Parameters
+    ----------
+    track_id : int
+        Unique id of the track.
+    box : Box
+        Region in the latest frame it was seen in.
+    sharpness : float
+        Sharpness of the region in that frame.
+    last_seen : float
+        Time the region was last seen.
+    ocr_attempts : int
+        Number of OCR runs on the region.
+    ocr_sharpness : float
+        Sharpness of the region the last time it was OCR'd.
+    value : Any
+        Parsed OCR result, cached for the lifetime of the track once set.
+    """
+
+    track_id: int
+    box: Box
+    sharpness: float
+    last_seen: float
+    ocr_attempts: int = 0
+    ocr_sharpness: float = 0.0
+    value: Any = None
+
+
+@dataclass
+class BadgeRead:
+    """
+    A parsed OCR result that became available for a track.
+
+    Parameters
+    ----------
+    track_id : int
+        The track the region belongs to.
+    box : Box
+        Region that was read.
+    value : Any
+        Value returned by the pipeline's parse function.
+    """
+
+    track_id: int
+    box: Box
+    value: Any
+
+
+@dataclass
+class _PendingRead:
+    track: RegionTrack
+    box: Box
+    future: Future = field(repr=False)
+
+
+class BadgeOCRPipeline:
+    """
+    Staged badge reading: cheap region detection on every frame, IoU tracking
+    of the regions across frames and full OCR on a worker thread only for
+    regions that are new, or sharper than when they were last read.
+
+    The OCR result of a track is parsed on the worker thread and cached for
+    as long as the region stays in view, so a badge held in front of the
+    camera is read once instead of on every frame.
+
+    Parameters
+    ----------
+    ocr : Callable[[np.ndarray], Any]
+        Runs full OCR on a BGR crop, e.g. `easyocr.Reader.readtext`.
+    parse : Callable[[Any], Any]
+        Turns the OCR output into a value; None means nothing useful was
+        read, and the region is read again when a sharper view of it arrives.
+    detect_width : int
+        Width frames are downscaled to for detection.
+    min_sharpness : float
+        Regions blurrier than this are not OCR'd.
+    resharpen_ratio : float
+        A region without a value is read again once it is this much sharper
+        than when it was last read.
+    max_ocr_attempts : int
+        Most OCR runs per track.
+    iou_threshold : float
+        Smallest overlap for a region to continue a track.
+    track_ttl : float
+        Seconds a track survives without being seen.
+    padding : float
+        Fraction of the region size added around the crop passed to OCR.
+    on_read : Optional[Callable[[BadgeRead], None]]
+        Called on the worker thread as soon as a value is read. When given,
+        `process` returns no reads.
+    """
+
+    def __init__(
+        self,
+        ocr: Callable[[np.ndarray], Any],
+        parse: Callable[[Any], Any],
+        detect_width: int = 640,
+        min_sharpness: float = 30.0,
+        resharpen_ratio: float = 1.5,
+        max_ocr_attempts: int = 3,
+        iou_threshold: float = 0.3,
+        track_ttl: float = 2.0,
+        padding: float = 0.1,
+        on_read: Optional[Callable[[BadgeRead], None]] = None,
+    ):
+        self.ocr = ocr
+        self.parse = parse
+        self.detect_width = detect_width
+        self.min_sharpness = min_sharpness
+        self.resharpen_ratio = resharpen_ratio
+        self.max_ocr_attempts = max_ocr_attempts
+        self.iou_threshold = iou_threshold
+        self.track_ttl = track_ttl
+        self.padding = padding
+        self.on_read = on_read
+
+        self.tracks: List[RegionTrack] = []
+        self.ocr_runs = 0
+        self._ids = itertools.count(1)
+        self._pending: Optional[_PendingRead] = None
+        self._executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="badge-ocr"
+        )
+
+    def process(
+        self, frame: np.ndarray, now: Optional[float] = None
+    ) -> List[BadgeRead]:
+        """
+        Feed a frame through the pipeline. Never blocks on OCR.
+
+        Parameters
+        ----------
+        frame : np.ndarray
+            BGR frame.
+        now : Optional[float]
+            Capture time of the frame; defaults to the current time.
+
+        Returns
+        -------
+        List[BadgeRead]
+            Values read since the previous call; always empty with `on_read`.
+        """
+        now = time.time() if now is None else now
+        reads = self._collect()
+
+        boxes, sharpness = detect_text_regions(frame, self.detect_width)
+        self._update_tracks(boxes, sharpness, now)
+
+        if self._pending is None:
+            track = self._next_to_read(now)
+            if track is not None:
+                self._submit(frame, track)
+        return reads
+
+    def _update_tracks(self, boxes: List[Box], sharpness: List[float], now: float):
+        pairs = sorted(
+            (
+                (box_iou(track.box, box), t, b)
+                for t, track in enumerate(self.tracks)
+                for b, box in enumerate(boxes)
+            ),
+            reverse=True,
+        )
+        matched_tracks, matched_boxes = set(), set()
+        for iou, t, b in pairs:
+            if iou < self.iou_threshold:
+                break
+            if t in matched_tracks or b in matched_boxes:
+                continue
+            matched_tracks.add(t)
+            matched_boxes.add(b)
+            track = self.tracks[t]
+            track.box, track.sharpness, track.last_seen = boxes[b], sharpness[b], now
+
+        self.tracks = [
+            track for track in self.tracks if now - track.last_seen <= self.track_ttl
+        ]
+        for b, box in enumerate(boxes):
+            if b not in matched_boxes:
+                self.tracks.append(
+                    RegionTrack(next(self._ids), box, sharpness[b], last_seen=now)
+                )
+
+    def _wants_read(self, track: RegionTrack, now: float) -> bool:
+        if track.value is not None or track.last_seen != now:
+            return False
+        if track.sharpness < self.min_sharpness:
+            return False
+        if track.ocr_attempts == 0:
+            return True
+        return (
+            track.ocr_attempts < self.max_ocr_attempts
+            and track.sharpness >= track.ocr_sharpness * self.resharpen_ratio
+        )
+
+    def _next_to_read(self, now: float) -> Optional[RegionTrack]:
+        candidates = [track for track in self.tracks if self._wants_read(track, now)]
+        if not candidates:
+            return None
+        # unread regions first, then the sharpest
+        return min(candidates, key=lambda t: (t.ocr_attempts > 0, -t.sharpness))
+
+    def _submit(self, frame: np.ndarray, track: RegionTrack):
+        x, y, w, h = track.box
+        pad_x, pad_y = int(w * self.padding), int(h * self.padding)
+        crop = frame[
+            max(0, y - pad_y) : y + h + pad_y, max(0, x - pad_x) : x + w + pad_x
+        ].copy()
+
+        track.ocr_attempts += 1
+        track.ocr_sharpness = track.sharpness
+        self.ocr_runs += 1
+        pending = _PendingRead(
+            track, track.box, self._executor.submit(self._read, crop)
+        )
+        self._pending = pending
+        if self.on_read is not None:
+            pending.future.add_done_callback(lambda _: self._deliver(pending))
+
+    def _read(self, crop: np.ndarray) -> Any:
+        return self.parse(self.ocr(crop))
+
+    def _deliver(self, pending: _PendingRead):
+        read = self._finish(pending)
+        if read is not None:
+            try:
+                self.on_read(read)
+            except Exception as e:
+                logging.error(f"Badge read callback failed: {e}")
+
+    def _collect(self) -> List[BadgeRead]:
+        pending = self._pending
+        if pending is None or not pending.future.done():
+            return []
+        self._pending = None
+        if self.on_read is not None:
+            # already delivered by _deliver
+            return []
+        read = self._finish(pending)
+        return [] if read is None else [read]
+
+    def _finish(self, pending: _PendingRead) -> Optional[BadgeRead]:
+        if pending.future.cancelled():
+            return None
+        try:
+            value = pending.future.result()
+        except Exception as e:
+            logging.error(f"Badge OCR failed: {e}")
+            return None
+
+        if value is None or all(track is not pending.track for track in self.tracks):
+            return None
+        pending.track.value = value
+        return BadgeRead(pending.track.track_id, pending.box, value)
+
+    def wait(self, timeout: Optional[float] = None) -> None:
+        """
+        Wait for the OCR run in flight, if any, to finish.
+
+        Parameters
+        ----------
+        timeout : Optional[float]
+            Most seconds to wait.
+        """
+        if self._pending is not None:
+            try:
+                self._pending.future.exception(timeout=timeout)
+            except Exception:
+                pass
+
+    def close(self) -> None:
+        """
+        Stop the OCR worker, dropping queued work.
+        """
+        self._executor.shutdown(wait=False, cancel_futures=True)
@@ -1,21 +1,113 @@
 import logging
 import math
+from typing import Optional
 
+import numpy as np
 import zenoh
+from numpy.lib import recfunctions
 
-from zenoh_msgs import open_zenoh_session, sensor_msgs
+from zenoh_msgs import decode_point_cloud, open_zenoh_session
 
 from .singleton import singleton
 
+# one row per obstacle point, in the robot frame
+OBSTACLE_DTYPE = np.dtype(
+    [
+        ("x", np.float32),
+        ("y", np.float32),
+        ("z", np.float32),
+        ("angle", np.float32),
+        ("distance", np.float32),
+    ]
+)
+
+
+def build_obstacle_array(
+    points: np.ndarray,
+    voxel_size: float = 0.0,
+    min_height: Optional[float] = None,
+    max_height: Optional[float] = None,
+) -> np.ndarray:
+    """
+    Convert an (N, 3) point cloud into an obstacle array.
+
+    Parameters
+    ----------
+    points : np.ndarray
+        The x, y, z coordinates of the points.
+    voxel_size : float
+        Edge length in meters of the voxel grid used to downsample the cloud;
+        each occupied voxel is replaced by the centroid of its points. 0
+        disables downsampling.
+    min_height : Optional[float]
+        Points with z below this are dropped, such as floor returns.
+    max_height : Optional[float]
+        Points with z above this are dropped, such as overhangs the robot
+        passes under.
+
+    Returns
+    -------
+    np.ndarray
+        A structured array of OBSTACLE_DTYPE.
+    """
+    points = np.asarray(points, dtype=np.float32).reshape(-1, 3)
+
+    keep = np.all(np.isfinite(points), axis=1)
+    if min_height is not None:
+        keep &= points[:, 2] >= min_height
+    if max_height is not None:
+        keep &= points[:, 2] <= max_height
+    points = points[keep]
+
+    if voxel_size > 0 and len(points) > 0:
+        voxels = np.floor(points / voxel_size).astype(np.int64)
+        _, inverse, counts = np.unique(
+            voxels, axis=0, return_inverse=True, return_counts=True
+        )
+        inverse = inverse.reshape(-1)
+        centroids = np.empty((len(counts), 3), dtype=np.float32)
+        for axis in range(3):
+            centroids[:, axis] = np.bincount(inverse, weights=points[:, axis]) / counts
+        points = centroids
+
+    obstacle = np.empty(len(points), dtype=OBSTACLE_DTYPE)
+    obstacle["x"] = points[:, 0]
+    obstacle["y"] = points[:, 1]
+    obstacle["z"] = points[:, 2]
+    obstacle["angle"] = np.degrees(np.arctan2(points[:, 1], points[:, 0]))
+    obstacle["distance"] = np.hypot(points[:, 0], points[:, 1])
+    return obstacle
+
 
 @singleton
 class D435Provider:
     """
     Provider for D435 camera data using Zenoh.
+
+    The latest obstacle cloud is held in `obstacle` as a structured array of
+    OBSTACLE_DTYPE, computed without per-point Python work.
+
+    Parameters
+    ----------
+    voxel_size : float
+        Voxel edge length in meters for downsampling; 0 disables it.
+    min_height : Optional[float]
+        Minimum obstacle height in meters.
+    max_height : Optional[float]
+        Maximum obstacle height in meters.
     """
 
-    def __init__(self):
-        self.obstacle = []
+    def __init__(
+        self,
+        voxel_size: float = 0.0,
+        min_height: Optional[float] = None,
+        max_height: Optional[float] = None,
+    ):
+        self.voxel_size = voxel_size
+        self.min_height = min_height
+        self.max_height = max_height
+
+        self.obstacle = np.empty(0, dtype=OBSTACLE_DTYPE)
         self.running = False
         self.session = None
 
@@ -64,21 +156,27 @@ class D435Provider:
             The sample containing the point cloud data.
         """
         try:
-            points = sensor_msgs.PointCloud.deserialize(sample.payload.to_bytes())
-
-            obstacles = []
-            for pt in points.points:  # type: ignore
-                x = pt.x
-                y = pt.y
-                z = pt.z
-                angle, distance = self.calculate_angle_and_distance(x, y)
-                obstacles.append(
-                    {"x": x, "y": y, "z": z, "angle": angle, "distance": distance}
-                )
-            self.obstacle = obstacles
+            points = decode_point_cloud(sample.payload.to_bytes())
+            self.obstacle = build_obstacle_array(
+                points.points, self.voxel_size, self.min_height, self.max_height
+            )
         except Exception as e:
             logging.error(f"Error processing obstacle info: {e}")
 
+    def get_path_points(self) -> np.ndarray:
+        """
+        Get the latest obstacles in the column layout used for path planning.
+
+        Returns
+        -------
+        np.ndarray
+            An (N, 4) float64 array of x, y, angle and distance.
+        """
+        obstacle = self.obstacle
+        return recfunctions.structured_to_unstructured(
+            obstacle[["x", "y", "angle", "distance"]], dtype=np.float64
+        )
+
     def start(self):
         """
         Start the D435 provider.
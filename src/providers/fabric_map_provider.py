@@ -2,13 +2,11 @@ import json
 import logging
 import os
 import time
-from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from typing import List, Optional
 
-import requests
-
 from .singleton import singleton
+from .uplink_provider import UplinkChannel, UplinkProvider
 
 
 @dataclass
@@ -174,6 +172,8 @@ class FabricDataSubmitter:
         api_key: Optional[str] = None,
         base_url: str = "https://api.openmind.org/api/core/fabric/submit",
         write_to_local_file: bool = False,
+        batch_size: int = 1,
+        compress: bool = False,
     ):
         """
         Initialize the FabricDataSubmitter.
@@ -185,6 +185,13 @@ class FabricDataSubmitter:
         base_url : str
             Base URL for the teleops status API. Default is
             "https://api.openmind.org/api/core/fabric/submit".
+        write_to_local_file : bool
+            If True, every payload is also appended to a local jsonl file.
+        batch_size : int
+            Maximum number of payloads per uplink request. Default is 1, which
+            keeps the single-object wire format.
+        compress : bool
+            If True, uplink requests are gzip compressed. Default is False.
         """
         self.api_key = api_key
         self.base_url = base_url
@@ -192,7 +199,18 @@ class FabricDataSubmitter:
         self.filename_base = "dump/fabric"
         self.filename_current = self.update_filename()
         self.max_file_size_bytes = 1024 * 1024
-        self.executor = ThreadPoolExecutor(max_workers=1)
+
+        self.uplink = UplinkProvider()
+        self.uplink.register_channel(
+            UplinkChannel(
+                name="fabric",
+                url=self.base_url,
+                api_key=self.api_key,
+                success_codes=(200, 201),
+                batch_size=batch_size,
+                compress=compress,
+            )
+        )
 
     def update_filename(self):
         unix_ts = time.time()
@@ -225,57 +243,33 @@ class FabricDataSubmitter:
             f.write(json_line + "\n")
             f.flush()
 
-    def _share_data_worker(self, data: FabricData):
+    def share_data(self, data: FabricData):
         """
-        Worker function to share data from the machine.
-        This function runs in a separate thread to avoid blocking the main thread.
+        Share mapping data.
+        This function queues mapping data collected by a machine on the shared
+        uplink, which persists it and delivers it in the background.
 
         Parameters
         ----------
         data : FabricData
-            The data to be shared.
+            A mapping data payload to submit.
         """
-
-        logging.info(f"_share_data_worker: {data}")
+        logging.debug(f"share data: {data}")
         try:
             json_dict = data.to_dict()
         except Exception as e:
             logging.error(f"Error converting to dict: {str(e)}")
+            return
 
         if self.write_to_local_file:
-            self.write_dict_to_file(json_dict)
-            logging.info(f"FDS wrote to {self.filename_current}")
+            try:
+                self.write_dict_to_file(json_dict)
+                logging.debug(f"FDS wrote to {self.filename_current}")
+            except Exception as e:
+                logging.error(f"Error writing fabric data to file: {str(e)}")
 
         if self.api_key is None or self.api_key == "":
             logging.error("API key missing. Cannot share data to FABRIC.")
             return
 
-        try:
-            request = requests.post(
-                self.base_url,
-                headers={"Authorization": f"Bearer {self.api_key}"},
-                json=json_dict,
-            )
-
-            if request.status_code == 201:
-                logging.debug(f"Data shared: {request.json()}")
-            else:
-                logging.error(
-                    f"Failed to share data: {request.status_code} - {request.text}"
-                )
-        except Exception as e:
-            logging.error(f"Error sharing data: {str(e)}")
-
-    def share_data(self, data: FabricData):
-        """
-        Share mapping data.
-        This function submits mapping data collected by a machine to a thread pool executor
-        to run in a separate thread.
-
-        Parameters
-        ----------
-        data : FabricData
-            A mapping data payload to submit.
-        """
-        logging.debug(f"share data: {data}")
-        self.executor.submit(self._share_data_worker, data)
+        self.uplink.enqueue("fabric", json_dict)
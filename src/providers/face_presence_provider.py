@@ -1,7 +1,9 @@
+import json
+import logging
 import threading
 import time
 from dataclasses import dataclass
-from typing import Callable, Dict, List, Optional
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
 
 import requests
 
@@ -39,17 +41,45 @@ class PresenceSnapshot:
         known = ", ".join(self.names_now) if self.names_now else "none"
         return f"present=[{known}], unknown={self.unknown_now}, ts={self.ts:.3f}"
 
+    def state_key(self) -> Tuple[Tuple[str, ...], int]:
+        """
+        Identity of the presence state, ignoring the timestamp.
+        """
+        return tuple(self.names_now), self.unknown_now
+
+    @classmethod
+    def from_json(cls, data: Dict) -> "PresenceSnapshot":
+        """
+        Map a `/who` response body to a snapshot.
+        """
+        names = list(data.get("now", []) or [])
+        unknown = int(data.get("unknown_now", 0) or 0)
+        ts = float(data.get("server_ts", time.time()))
+        return cls(ts=ts, names_now=names, unknown_now=unknown, raw=data)
+
+
+class StreamUnsupported(Exception):
+    """
+    The presence server has no streaming endpoint.
+    """
+
 
 @singleton
 class FacePresenceProvider:
     """
-    Singleton provider that polls `/who` at a fixed cadence and emits text lines.
+    Singleton provider that follows the presence server and emits text lines
+    when the set of present faces changes.
 
     Tasks
     ------------
-    - Spawns one background thread that periodically POSTs to `{base_url}/who`.
-    - Converts each JSON snapshot to a concise string via `PresenceSnapshot.to_text()`.
-    - Invokes every registered callback with that string (same polling thread).
+    - Subscribes to the server-sent event stream at `{base_url}{stream_path}`,
+      which pushes a `/who` body whenever presence changes.
+    - Falls back to conditional polling of POST `{base_url}/who` on a pooled
+      session, sending the last ETag and server timestamp so an unchanged
+      server can answer 304.
+    - Converts each snapshot to a concise string via `PresenceSnapshot.to_text()`
+      and invokes every registered callback with it, only when the present
+      names or the unknown count changed.
     """
 
     def __init__(
@@ -59,6 +89,10 @@ class FacePresenceProvider:
         recent_sec: float = 2.0,
         fps: float = 5.0,
         timeout_s: float = 2.0,
+        transport: str = "auto",
+        stream_path: str = "/who/stream",
+        stream_retry_s: float = 30.0,
+        stream_idle_s: float = 30.0,
     ) -> None:
         """
         Configure the provider (first construction establishes the singleton).
@@ -74,11 +108,26 @@ class FacePresenceProvider:
             Polling rate in events per second (e.g., 5.0 → every 0.2s).
         timeout_s : float, default 2.0
             HTTP request timeout in seconds.
+        transport : str, default "auto"
+            "stream" to only use the event stream, "poll" to only poll, or
+            "auto" to stream when the server supports it and poll otherwise.
+        stream_path : str, default "/who/stream"
+            Path of the server-sent event stream.
+        stream_retry_s : float, default 30.0
+            Seconds of polling after a stream error before streaming is
+            attempted again.
+        stream_idle_s : float, default 30.0
+            Seconds without any stream data, including keep-alive comments,
+            after which the stream is reconnected.
         """
         self.base_url = base_url.rstrip("/")
         self.recent_sec = float(recent_sec)
         self.period = 1.0 / max(1e-6, float(fps))
         self.timeout_s = float(timeout_s)
+        self.transport = transport
+        self.stream_path = stream_path
+        self.stream_retry_s = float(stream_retry_s)
+        self.stream_idle_s = float(stream_idle_s)
 
         self._stop = threading.Event()
         self._thread: Optional[threading.Thread] = None
@@ -86,6 +135,16 @@ class FacePresenceProvider:
         self._callbacks: List[Callable[[str], None]] = []
         self._cb_lock = threading.Lock()
 
+        self._session = requests.Session()
+        self._stream_response: Optional[requests.Response] = None
+        self._stream_supported = transport != "poll"
+        self._next_stream_attempt = 0.0
+
+        self._etag: Optional[str] = None
+        self._last_ts: Optional[float] = None
+        self._last_key: Optional[Tuple[Tuple[str, ...], int]] = None
+        self.latest: Optional[PresenceSnapshot] = None
+
     def register_message_callback(self, fn: Callable[[str], None]) -> None:
         """
         Subscribe a consumer to receive each emitted presence line.
@@ -127,28 +186,55 @@ class FacePresenceProvider:
     def stop(self, *, wait: bool = False) -> None:
         """Request the background thread to strop"""
         self._stop.set()
+        response = self._stream_response
+        if response is not None:
+            # unblocks a stream read
+            response.close()
         if wait and self._thread:
             self._thread.join(timeout=3.0)
 
     def _loop(self) -> None:
         """
-        Internal polling loop.
+        Internal loop.
 
         Tasks
         --------
-        - Waits until the next scheduled time (based on `fps`).
-        - Calls `_fetch_snapshot()` → formats with `to_text()` → `_emit(text)`.
+        - Follows the event stream while the server supports it.
+        - Otherwise waits until the next scheduled time (based on `fps`) and
+          calls `_fetch_snapshot()` → `_handle_snapshot()`.
         """
         next_t = time.time()
         while not self._stop.is_set():
+            if self._should_stream():
+                try:
+                    self._follow_stream()
+                except StreamUnsupported as e:
+                    logging.info(f"FacePresence: {e}, polling /who instead")
+                    self._stream_supported = self.transport == "stream"
+                    self._next_stream_attempt = time.time() + self.stream_retry_s
+                except Exception as e:
+                    if not self._stop.is_set():
+                        logging.debug(f"FacePresence stream error: {e}")
+                        self._next_stream_attempt = time.time() + (
+                            self.period
+                            if self.transport == "stream"
+                            else self.stream_retry_s
+                        )
+                next_t = time.time()
+                continue
+
+            if self.transport == "stream":
+                self._stop.wait(max(0.0, self._next_stream_attempt - time.time()))
+                continue
+
             now = time.time()
             if now < next_t:
-                time.sleep(min(0.02, next_t - now))
+                self._stop.wait(next_t - now)
                 continue
             try:
                 snap = self._fetch_snapshot()
-                text = snap.to_text()
-                self._emit(text)
+                if snap is not None:
+                    self._handle_snapshot(snap)
             except Exception:
                 pass
 
@@ -156,6 +242,87 @@ class FacePresenceProvider:
             if next_t < time.time() - self.period:
                 next_t = time.time()
 
+    def _should_stream(self) -> bool:
+        return self._stream_supported and time.time() >= self._next_stream_attempt
+
+    def _follow_stream(self) -> None:
+        """
+        Read snapshots from the event stream until it ends.
+
+        Raises
+        ------
+        StreamUnsupported
+            If the server has no event stream.
+        """
+        url = f"{self.base_url}{self.stream_path}"
+        response = self._session.get(
+            url,
+            params={"recent_sec": self.recent_sec},
+            headers={"Accept": "text/event-stream"},
+            stream=True,
+            timeout=(self.timeout_s, self.stream_idle_s),
+        )
+        try:
+            content_type = response.headers.get("Content-Type", "")
+            if response.status_code in (404, 405, 501) or (
+                response.ok and not content_type.startswith("text/event-stream")
+            ):
+                raise StreamUnsupported(f"no event stream at {url}")
+            response.raise_for_status()
+
+            self._stream_response = response
+            logging.info(f"FacePresence: subscribed to {url}")
+            for data in self._iter_events(response):
+                if self._stop.is_set():
+                    return
+                self._handle_snapshot(PresenceSnapshot.from_json(json.loads(data)))
+        finally:
+            self._stream_response = None
+            response.close()
+
+    @staticmethod
+    def _iter_events(response: requests.Response) -> Iterator[str]:
+        """
+        Yield the data of each server-sent event.
+
+        Parameters
+        ----------
+        response : requests.Response
+            A streaming response with content type text/event-stream.
+        """
+        data_lines: List[str] = []
+        # a larger chunk size would hold events back until the buffer fills;
+        # presence events are small and rare
+        for raw_line in response.iter_lines(chunk_size=1):
+            # event streams are always UTF-8, whatever the Content-Type says
+            line = raw_line.decode("utf-8", errors="replace")
+            if line == "":
+                if data_lines:
+                    yield "\n".join(data_lines)
+                    data_lines = []
+            elif line.startswith("data:"):
+                data_lines.append(line[5:].lstrip(" "))
+            # comments (":keep-alive"), "event:", "id:" and "retry:" are ignored
+        if data_lines:
+            yield "\n".join(data_lines)
+
+    def _handle_snapshot(self, snap: PresenceSnapshot) -> None:
+        """
+        Remember a snapshot and emit it if the presence state changed.
+
+        Parameters
+        ----------
+        snap : PresenceSnapshot
+            The latest snapshot from the server.
+        """
+        self.latest = snap
+        self._last_ts = snap.ts
+        key = snap.state_key()
+        if key == self._last_key:
+            return
+        self._last_key = key
+        self._emit(snap.to_text())
+
     def _emit(self, text: str) -> None:
         """
         Deliver one formatted presence line to all subscribers.
@@ -173,23 +340,30 @@ class FacePresenceProvider:
             except Exception:
                 pass
 
-    def _fetch_snapshot(self) -> PresenceSnapshot:
+    def _fetch_snapshot(self) -> Optional[PresenceSnapshot]:
         """
         POST `/who` and map the response to a `PresenceSnapshot`.
 
+        The request carries the ETag of the previous response and the last
+        server timestamp (`since`), so the server can answer 304 when nothing
+        changed.
+
         Returns
         -------
-        PresenceSnapshot
-            Structured view of the server's `/who` response.
+        Optional[PresenceSnapshot]
+            Structured view of the server's `/who` response, or None if it
+            has not changed.
         """
         body = {"recent_sec": self.recent_sec}
         url = f"{self.base_url}/who"
+        headers = {"If-None-Match": self._etag} if self._etag else {}
+        params = {"since": self._last_ts} if self._last_ts is not None else None
 
-        r = requests.post(url, json=body, timeout=self.timeout_s)  # type: ignore
+        r = self._session.post(
+            url, json=body, headers=headers, params=params, timeout=self.timeout_s
+        )
+        if r.status_code == 304:
+            return None
         r.raise_for_status()
-        data = r.json()
-
-        names = list(data.get("now", []) or [])
-        unknown = int(data.get("unknown_now", 0) or 0)
-        ts = float(data.get("server_ts", time.time()))
-        return PresenceSnapshot(ts=ts, names_now=names, unknown_now=unknown, raw=data)
+        self._etag = r.headers.get("ETag")
+        return PresenceSnapshot.from_json(r.json())
@@ -0,0 +1,403 @@
+import itertools
+import logging
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+import cv2
+import numpy as np
+
+# (x, y, width, height) in frame pixels
+Box = Tuple[int, int, int, int]
+
+# Finds faces in a downscaled grayscale frame
+FaceDetector = Callable[[np.ndarray], Sequence[Sequence[int]]]
+
+
+def box_iou(a: Sequence[float], b: Sequence[float]) -> float:
+    """
+    Intersection over union of two boxes.
+    """
+    ix = max(0.0, min(a[0] + a[2], b[0] + b[2]) - max(a[0], b[0]))
+    iy = max(0.0, min(a[1] + a[3], b[1] + b[3]) - max(a[1], b[1]))
+    intersection = ix * iy
+    union = a[2] * a[3] + b[2] * b[3] - intersection
+    return intersection / union if union > 0 else 0.0
+
+
+class HaarFaceDetector:
+    """
+    OpenCV's built-in frontal face Haar cascade.
+
+    Parameters
+    ----------
+    min_size : int
+        Smallest face, in pixels of the image passed to the detector.
+    scale_factor : float
+        Image pyramid step of `detectMultiScale`.
+    min_neighbors : int
+        Overlapping candidates needed to accept a face.
+    """
+
+    def __init__(
+        self, min_size: int = 30, scale_factor: float = 1.1, min_neighbors: int = 5
+    ):
+        self.min_size = min_size
+        self.scale_factor = scale_factor
+        self.min_neighbors = min_neighbors
+        # loaded on first use, so trackers given another detector never load it
+        self.cascade = None
+
+    def __call__(self, gray: np.ndarray) -> Sequence[Sequence[int]]:
+        if self.cascade is None:
+            self.cascade = cv2.CascadeClassifier(
+                cv2.data.haarcascades + "haarcascade_frontalface_default.xml"
+            )
+        return self.cascade.detectMultiScale(
+            gray,
+            scaleFactor=self.scale_factor,
+            minNeighbors=self.min_neighbors,
+            minSize=(self.min_size, self.min_size),
+        )
+
+
+@dataclass
+class StageStats:
+    """
+    Running timing of one pipeline stage.
+
+    Parameters
+    ----------
+    count : int
+        Number of times the stage ran.
+    total_s : float
+        Total time spent in the stage.
+    last_s : float
+        Duration of the latest run.
+    """
+
+    count: int = 0
+    total_s: float = 0.0
+    last_s: float = 0.0
+
+    @property
+    def mean_ms(self) -> float:
+        return 1000.0 * self.total_s / self.count if self.count else 0.0
+
+
+class StageTimer:
+    """
+    Accumulates the time spent in each named stage of a pipeline.
+    """
+
+    def __init__(self):
+        self.stages: Dict[str, StageStats] = {}
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """
+        Time the enclosed block as one run of a stage.
+
+        Parameters
+        ----------
+        name : str
+            Name of the stage.
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            stats = self.stages.setdefault(name, StageStats())
+            stats.last_s = time.perf_counter() - start
+            stats.total_s += stats.last_s
+            stats.count += 1
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        """
+        Get the timing of every stage.
+
+        Returns
+        -------
+        Dict[str, Dict[str, float]]
+            Run count, mean and latest duration in milliseconds per stage.
+        """
+        return {
+            name: {
+                "count": stats.count,
+                "mean_ms": round(stats.mean_ms, 3),
+                "last_ms": round(1000.0 * stats.last_s, 3),
+            }
+            for name, stats in self.stages.items()
+        }
+
+
+@dataclass
+class FaceTrack:
+    """
+    A face followed across frames.
+
+    Parameters
+    ----------
+    track_id : int
+        Unique id of the track.
+    box : Box
+        Face in the latest frame, in full resolution pixels.
+    first_seen : float
+        Time the face was first detected.
+    label : Any
+        Result of the latest classification, e.g. the dominant emotion.
+    labelled_box : Optional[Box]
+        Box the face had when it was last classified.
+    labelled_at : float
+        Time of the latest classification.
+    """
+
+    track_id: int
+    box: Box
+    first_seen: float
+    label: Any = None
+    labelled_box: Optional[Box] = None
+    labelled_at: float = 0.0
+    # optical flow features, in detection frame pixels
+    points: Optional[np.ndarray] = field(default=None, repr=False)
+
+    def set_label(self, label: Any, now: float) -> None:
+        """
+        Record a classification of the face as it is now.
+
+        Parameters
+        ----------
+        label : Any
+            The classification.
+        now : float
+            Time of the classification.
+        """
+        self.label = label
+        self.labelled_box = self.box
+        self.labelled_at = now
+
+
+class FaceTracker:
+    """
+    Hybrid face pipeline: a face detector on a downscaled frame at a low
+    cadence, with face boxes propagated between detections by sparse
+    Lucas-Kanade optical flow.
+
+    Setting `detect_interval` to 0 runs the detector on every frame, which
+    matches running the detector alone.
+
+    Parameters
+    ----------
+    detector : Optional[FaceDetector]
+        Finds faces in the downscaled grayscale frame; a `HaarFaceDetector`
+        when not given.
+    detect_width : int
+        Width frames are downscaled to. Frames that are narrower are used
+        as they are, and 0 keeps every frame at full resolution.
+    detect_interval : float
+        Seconds between detector runs while faces are tracked.
+    min_points : int
+        Faces left with fewer tracked features are dropped until the next
+        detection.
+    change_iou : float
+        A face whose box overlaps less than this with the box it was
+        classified at counts as changed.
+    reclassify_after : float
+        Seconds after which a face counts as changed even if it kept still.
+    """
+
+    def __init__(
+        self,
+        detector: Optional[FaceDetector] = None,
+        detect_width: int = 320,
+        detect_interval: float = 1.0,
+        min_points: int = 4,
+        change_iou: float = 0.5,
+        reclassify_after: float = 5.0,
+    ):
+        self.detect_width = detect_width
+        self.detector = detector or HaarFaceDetector(
+            min_size=max(12, 30 * detect_width // 640) if detect_width else 30
+        )
+        self.detect_interval = detect_interval
+        self.min_points = min_points
+        self.change_iou = change_iou
+        self.reclassify_after = reclassify_after
+
+        self.timer = StageTimer()
+        self.tracks: List[FaceTrack] = []
+        self.last_detection = float("-inf")
+        self._ids = itertools.count(1)
+        self._prev_gray: Optional[np.ndarray] = None
+        self._scale = 1.0
+
+    def update(self, frame: np.ndarray, now: Optional[float] = None) -> List[FaceTrack]:
+        """
+        Feed a frame through the pipeline.
+
+        Parameters
+        ----------
+        frame : np.ndarray
+            BGR frame.
+        now : Optional[float]
+            Capture time of the frame; defaults to the current time.
+
+        Returns
+        -------
+        List[FaceTrack]
+            The faces in the frame.
+        """
+        now = time.time() if now is None else now
+
+        with self.timer.stage("preprocess"):
+            gray = self._downscale(frame)
+
+        due = now - self.last_detection >= self.detect_interval
+        if due or not self.tracks or self._prev_gray is None:
+            with self.timer.stage("detect"):
+                self._detect(gray, frame.shape, now)
+        else:
+            with self.timer.stage("track"):
+                self._track(gray, frame.shape)
+
+        self._prev_gray = gray
+        return self.tracks
+
+    def needs_classification(self, track: FaceTrack, now: float) -> bool:
+        """
+        Whether a face is new or changed since it was last classified.
+
+        Parameters
+        ----------
+        track : FaceTrack
+            The face.
+        now : float
+            The current time.
+
+        Returns
+        -------
+        bool
+            True if the face should be classified again.
+        """
+        if track.labelled_box is None:
+            return True
+        if now - track.labelled_at >= self.reclassify_after:
+            return True
+        return box_iou(track.box, track.labelled_box) < self.change_iou
+
+    def _downscale(self, frame: np.ndarray) -> np.ndarray:
+        gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY) if frame.ndim == 3 else frame
+        width = gray.shape[1]
+        if not self.detect_width or width <= self.detect_width:
+            self._scale = 1.0
+            return gray
+        self._scale = self.detect_width / float(width)
+        return cv2.resize(
+            gray, None, fx=self._scale, fy=self._scale, interpolation=cv2.INTER_AREA
+        )
+
+    def _detect(self, gray: np.ndarray, shape: Tuple[int, ...], now: float):
+        self.last_detection = now
+        detections = [tuple(float(v) for v in box) for box in self.detector(gray)]
+        previous = [self._to_small(track.box) for track in self.tracks]
+
+        pairs = sorted(
+            (
+                (box_iou(previous[t], box), t, d)
+                for t in range(len(previous))
+                for d, box in enumerate(detections)
+            ),
+            reverse=True,
+        )
+        matched: Dict[int, FaceTrack] = {}
+        used = set()
+        for iou, t, d in pairs:
+            if iou < 0.3:
+                break
+            if t in used or d in matched:
+                continue
+            used.add(t)
+            matched[d] = self.tracks[t]
+
+        # the detector is authoritative: faces it no longer finds are dropped
+        tracks = []
+        for d, small_box in enumerate(detections):
+            track = matched.get(d)
+            box = self._to_full(small_box, shape)
+            if track is None:
+                track = FaceTrack(next(self._ids), box, first_seen=now)
+            track.box = box
+            track.points = self._features(gray, small_box)
+            tracks.append(track)
+        self.tracks = tracks
+
+    def _features(self, gray: np.ndarray, box: Sequence[float]) -> Optional[np.ndarray]:
+        x, y, w, h = (int(round(v)) for v in box)
+        mask = np.zeros_like(gray)
+        mask[max(0, y) : y + h, max(0, x) : x + w] = 255
+        return cv2.goodFeaturesToTrack(
+            gray, maxCorners=40, qualityLevel=0.01, minDistance=3, mask=mask
+        )
+
+    def _track(self, gray: np.ndarray, shape: Tuple[int, ...]):
+        # faces without trackable features keep their box until the next
+        # detection
+        kept = [track for track in self.tracks if track.points is None]
+        tracks = [track for track in self.tracks if track.points is not None]
+        if not tracks:
+            return
+
+        old = np.concatenate([track.points for track in tracks]).astype(np.float32)
+        new, status, _ = cv2.calcOpticalFlowPyrLK(
+            self._prev_gray, gray, old, None, winSize=(15, 15), maxLevel=2
+        )
+        status = status.reshape(-1).astype(bool)
+
+        start = 0
+        for track in tracks:
+            end = start + len(track.points)
+            ok = status[start:end]
+            before = old[start:end][ok].reshape(-1, 2)
+            after = new[start:end][ok].reshape(-1, 2)
+            start = end
+            if len(after) < self.min_points:
+                continue
+
+            # median motion is robust to features that slid off the face
+            dx, dy = np.median(after - before, axis=0)
+            spread_before = np.median(np.linalg.norm(before - before.mean(0), axis=1))
+            spread_after = np.median(np.linalg.norm(after - after.mean(0), axis=1))
+            scale = spread_after / spread_before if spread_before > 0 else 1.0
+            scale = float(np.clip(scale, 0.8, 1.25))
+
+            x, y, w, h = self._to_small(track.box)
+            cx, cy = x + w / 2.0 + dx, y + h / 2.0 + dy
+            w, h = w * scale, h * scale
+            track.box = self._to_full((cx - w / 2.0, cy - h / 2.0, w, h), shape)
+            track.points = after.reshape(-1, 1, 2)
+            kept.append(track)
+        self.tracks = kept
+
+    def _to_small(self, box: Box) -> Tuple[float, ...]:
+        return tuple(v * self._scale for v in box)
+
+    def _to_full(self, box: Sequence[float], shape: Tuple[int, ...]) -> Box:
+        height, width = shape[:2]
+        x, y, w, h = (v / self._scale for v in box)
+        x0, y0 = max(0, int(round(x))), max(0, int(round(y)))
+        x1 = min(width, int(round(x + w)))
+        y1 = min(height, int(round(y + h)))
+        return (x0, y0, max(0, x1 - x0), max(0, y1 - y0))
+
+    def log_timings(self) -> None:
+        """
+        Log the per-stage timing of the pipeline.
+        """
+        logging.info(
+            "Face pipeline timing (mean ms): "
+            + ", ".join(
+                f"{name}={stats['mean_ms']:.1f} x{stats['count']}"
+                for name, stats in self.timer.summary().items()
+            )
+        )
@@ -8,7 +8,9 @@ class LLMFunction:
     Decorator to mark methods as LLM-callable functions.
     """
 
-    def __init__(self, description: str, name: T.Optional[str] = None):
+    def __init__(
+        self, description: str, name: T.Optional[str] = None, read_only: bool = False
+    ):
         """
         Initialize the LLM function decorator.
         Parameters
@@ -17,14 +19,19 @@ class LLMFunction:
             Description of what the function does for the LLM.
         name : str, optional
             Custom name for the function. If None, uses the method name.
+        read_only : bool
+            Whether the function only reads state, so that it can run
+            concurrently with other calls.
         """
         self.description = description
         self.name = name
+        self.read_only = read_only
 
     def __call__(self, func):
         func._llm_function = True
         func._llm_description = self.description
         func._llm_name = self.name or func.__name__
+        func._llm_read_only = self.read_only
         return func
 
 
@@ -1,14 +1,12 @@
 import logging
 import re
-import threading
 import time
 from datetime import datetime, timezone
-from typing import List, Optional
-
-import serial
+from typing import Callable, List, Optional
 
 from providers.fabric_map_provider import RFDataRaw
 
+from .serial_reactor import LineParser, SerialReactor
 from .singleton import singleton
 
 
@@ -33,18 +31,9 @@ class GpsProvider:
 
         logging.info(f"GPS_Provider booting GPS Provider at serial: {serial_port}")
 
-        baudrate = 115200
-        timeout = 1
-
-        self.serial_connection = None
-        try:
-            self.serial_connection = serial.Serial(
-                serial_port, baudrate, timeout=timeout
-            )
-            self.serial_connection.reset_input_buffer()
-            logging.info(f"Connected to {serial_port} at {baudrate} baud")
-        except serial.SerialException as e:
-            logging.error(f"Error: {e}")
+        self.serial_port = serial_port
+        self.baudrate = 115200
+        self.reactor = SerialReactor()
 
         self._gps: Optional[dict] = None
 
@@ -56,13 +45,17 @@ class GpsProvider:
 
         self.gps_unix_ts = 0.0
 
+        # host time at which the latest serial data were read
+        self.read_ts = 0.0
+
         self.yaw_mag_0_360 = 0.0
         self.yaw_mag_cardinal = ""
 
         self.ble_scan: List[RFDataRaw] = []
 
+        self._data_callbacks: List[Callable[[dict], None]] = []
+
         self.running = False
-        self._thread: Optional[threading.Thread] = None
         self.start()
 
     def string_to_unix_timestamp(self, time_str):
@@ -74,9 +67,10 @@ class GpsProvider:
         dt = dt.replace(tzinfo=timezone.utc)
         return dt.timestamp()
 
-    def magGPSProcessor(self, data):
+    def magGPSProcessor(self, data, read_ts: Optional[float] = None):
         # Used whenever there is a connected
         # nav Arduino on serial
+        self.read_ts = read_ts if read_ts is not None else time.time()
         try:
             if data.startswith("HDG:"):
                 parts = data.split(":")
@@ -105,9 +99,9 @@ class GpsProvider:
                     heading = parts[3].split(":")[1]
                     alt = parts[4].split(":")[1]
                     sat = parts[5].split(":")[1]
-                    time = parts[6][5:]
+                    gps_time = parts[6][5:]
                     # turn 25 into full year -> 2025, for example
-                    self.gps_unix_ts = self.string_to_unix_timestamp("20" + time)
+                    self.gps_unix_ts = self.string_to_unix_timestamp("20" + gps_time)
 
                     qua = 0
                     if len(parts) > 7:
@@ -143,7 +137,7 @@ class GpsProvider:
                     logging.warning(f"Failed to parse GPS: {data} ({e})")
             elif data.startswith("BLE:"):
                 try:
-                    self.ble_scan = self.parse_ble_triang_string(data)
+                    self.ble_scan = self.parse_ble_triang_string(data, self.read_ts)
                     logging.debug(f"nRF BLE data {self.ble_scan}")
                 except Exception as e:
                     logging.warning(f"Failed to parse BLE: {data} ({e})")
@@ -160,6 +154,7 @@ class GpsProvider:
             "gps_qua": self.qua,
             "gps_unix_ts": self.gps_unix_ts,
             "ble_scan": self.ble_scan,
+            "gps_read_ts": self.read_ts,
         }
 
     def compass_heading_to_direction(self, degrees):
@@ -176,7 +171,7 @@ class GpsProvider:
         index = int((degrees + 22.5) % 360 / 45)
         return directions[index]
 
-    def parse_ble_triang_string(self, input_string):
+    def parse_ble_triang_string(self, input_string, unix_ts: Optional[float] = None):
 
         if not input_string.startswith("BLE:"):
             return []
@@ -184,7 +179,8 @@ class GpsProvider:
         data = input_string[4:].strip()
         pattern = r"([0-9A-Fa-f]{12}):([+-]?\d+):([0-9A-Fa-f]{2,})"
         matches = re.findall(pattern, data)
-        unix_ts = time.time()
+        if unix_ts is None:
+            unix_ts = time.time()
 
         devices: List[RFDataRaw] = []
 
@@ -198,40 +194,56 @@ class GpsProvider:
 
         return devices
 
+    def register_data_callback(self, callback: Callable[[dict], None]):
+        """
+        Register a callback that receives the GPS data dictionary every time
+        new serial data are processed.
+
+        Parameters
+        ----------
+        callback : Callable[[dict], None]
+            Called on the serial reactor thread; must return quickly.
+        """
+        self._data_callbacks.append(callback)
+
     def start(self):
         """
-        Starts the GPS Provider and processing thread
+        Registers the GPS serial port with the serial reactor
         if not already running.
         """
-        if self._thread and self._thread.is_alive():
+        if self.running or not self.serial_port:
             return
 
-        self.running = True
-        self._thread = threading.Thread(target=self._run, daemon=True)
-        self._thread.start()
+        self.running = self.reactor.register(
+            self.serial_port, self.baudrate, LineParser(), self._on_lines
+        )
 
-    def _run(self):
+    def _on_lines(self, lines: List[str], read_ts: float):
         """
-        Main loop for the GPS provider.
-        WARNING: this assumes that the data from the Arduino are arriving
-        relatively slowly.
+        Process the lines of one serial read.
+
+        Parameters
+        ----------
+        lines : List[str]
+            Complete lines from the nav Arduino.
+        read_ts : float
+            Host time at which the bytes were read.
         """
-        while self.running:
-            if self.serial_connection:
-                # Read a line, decode, and remove whitespace
-                data = self.serial_connection.readline().decode("utf-8").strip()
-                logging.debug(f"Serial GPS/MAG: {data}")
-                self.magGPSProcessor(data)
-            time.sleep(0.1)
+        for line in lines:
+            logging.debug(f"Serial GPS/MAG: {line}")
+            self.magGPSProcessor(line, read_ts)
+
+        for callback in self._data_callbacks:
+            callback(self._gps)
 
     def stop(self):
         """
         Stop the GPS provider.
         """
-        self.running = False
-        if self._thread:
+        if self.running:
             logging.info("Stopping GPS provider")
-            self._thread.join(timeout=5)
+            self.reactor.unregister(self.serial_port)
+        self.running = False
 
     @property
     def data(self) -> Optional[dict]:
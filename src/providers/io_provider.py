@@ -1,17 +1,21 @@
 import threading
 import time
 from contextlib import contextmanager
-from dataclasses import dataclass
-from typing import Any, Dict, Optional
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional
 
 from .singleton import singleton
 
 
-@dataclass
+@dataclass(frozen=True)
 class Input:
     """
     A dataclass representing an input with an optional timestamp.
 
+    Inputs are immutable because they are shared by every reader of a
+    snapshot.
+
     Parameters
     ----------
     input : str
@@ -24,23 +28,50 @@ class Input:
     timestamp: Optional[float] = None
 
 
+_EMPTY: Mapping = MappingProxyType({})
+
+
+@dataclass(frozen=True)
+class InputsSnapshot:
+    """
+    An immutable, consistent view of the inputs at one version.
+
+    Parameters
+    ----------
+    version : int
+        Incremented by every change to the inputs.
+    inputs : Mapping[str, Input]
+        Read-only mapping of input keys to inputs.
+    timestamps : Mapping[str, float]
+        Read-only mapping of input keys to their timestamps, including
+        timestamps recorded for keys without an input.
+    """
+
+    version: int = 0
+    inputs: Mapping[str, Input] = field(default=_EMPTY)
+    timestamps: Mapping[str, float] = field(default=_EMPTY)
+
+
 @singleton
 class IOProvider:
     """
     A thread-safe singleton class for managing inputs, timestamps, and LLM-related data.
 
-    This class provides synchronized access to input storage and various timing metrics
-    using thread locks for safe concurrent access.
+    Inputs are published as immutable, versioned snapshots (copy-on-write):
+    writers build a new snapshot under a lock and swap it in with a single
+    reference assignment, so readers get a consistent view without locking
+    or copying. The fuser and LLM prompt and timing fields are single
+    references, whose loads and stores are atomic, and need no lock either.
     """
 
     def __init__(self):
         """
         Initialize the IOProvider with thread lock and empty storage.
         """
+        # serializes writers of the snapshot and of compound fields
         self._lock: threading.Lock = threading.Lock()
 
-        self._inputs: Dict[str, str] = {}
-        self._input_timestamps: Dict[str, float] = {}
+        self._snapshot: InputsSnapshot = InputsSnapshot()
 
         self._fuser_system_prompt: Optional[str] = None
         self._fuser_inputs: Optional[str] = None
@@ -58,24 +89,47 @@ class IOProvider:
         self._variables: Dict[str, Any] = {}
 
     @property
-    def inputs(self) -> Dict[str, Input]:
+    def inputs(self) -> Mapping[str, Input]:
         """
         Get all inputs with their timestamps.
 
         Returns
         -------
-        Dict[str, Input]
-            Dictionary mapping input keys to Input objects.
+        Mapping[str, Input]
+            Read-only mapping of input keys to Input objects. It does not
+            change when inputs are added later.
         """
-        with self._lock:
-            result = {}
-            for name, value in self._inputs.items():
-                timestamp = self._input_timestamps.get(name)
-                if timestamp is not None:
-                    result[name] = Input(input=value, timestamp=timestamp)
-                else:
-                    result[name] = Input(input=value)
-            return result
+        return self._snapshot.inputs
+
+    @property
+    def inputs_version(self) -> int:
+        """
+        Get the version of the inputs, incremented by every change.
+
+        Comparing versions is a cheap way to tell whether the inputs have
+        changed since they were last read.
+        """
+        return self._snapshot.version
+
+    def inputs_snapshot(self) -> InputsSnapshot:
+        """
+        Get the inputs, timestamps and version as one consistent view.
+
+        Returns
+        -------
+        InputsSnapshot
+            The current snapshot.
+        """
+        return self._snapshot
+
+    def _publish(self, inputs: Dict[str, Input], timestamps: Dict[str, float]) -> None:
+        # called with self._lock held; a single reference store publishes
+        # the new snapshot to lock-free readers
+        self._snapshot = InputsSnapshot(
+            version=self._snapshot.version + 1,
+            inputs=MappingProxyType(inputs),
+            timestamps=MappingProxyType(timestamps),
+        )
 
     def add_input(self, key: str, value: str, timestamp: Optional[float]) -> None:
         """
@@ -90,12 +144,14 @@ class IOProvider:
         timestamp : float, optional
             The timestamp for the input.
         """
+        if timestamp is None:
+            timestamp = time.time()
         with self._lock:
-            self._inputs[key] = value
-            if timestamp is not None:
-                self._input_timestamps[key] = timestamp
-            else:
-                self._input_timestamps[key] = time.time()
+            inputs = dict(self._snapshot.inputs)
+            timestamps = dict(self._snapshot.timestamps)
+            inputs[key] = Input(input=value, timestamp=timestamp)
+            timestamps[key] = timestamp
+            self._publish(inputs, timestamps)
 
     def remove_input(self, key: str) -> None:
         """
@@ -107,8 +163,14 @@ class IOProvider:
             The input identifier to remove.
         """
         with self._lock:
-            self._inputs.pop(key, None)
-            self._input_timestamps.pop(key, None)
+            snapshot = self._snapshot
+            if key not in snapshot.inputs and key not in snapshot.timestamps:
+                return
+            inputs = dict(snapshot.inputs)
+            timestamps = dict(snapshot.timestamps)
+            inputs.pop(key, None)
+            timestamps.pop(key, None)
+            self._publish(inputs, timestamps)
 
     def add_input_timestamp(self, key: str, timestamp: float) -> None:
         """
@@ -122,7 +184,12 @@ class IOProvider:
             The timestamp to add.
         """
         with self._lock:
-            self._input_timestamps[key] = timestamp
+            inputs = dict(self._snapshot.inputs)
+            timestamps = dict(self._snapshot.timestamps)
+            timestamps[key] = timestamp
+            if key in inputs:
+                inputs[key] = Input(input=inputs[key].input, timestamp=timestamp)
+            self._publish(inputs, timestamps)
 
     def get_input_timestamp(self, key: str) -> Optional[float]:
         """
@@ -138,192 +205,167 @@ class IOProvider:
         float or None
             The timestamp if it exists, None otherwise.
         """
-        with self._lock:
-            return self._input_timestamps.get(key)
+        return self._snapshot.timestamps.get(key)
 
     @property
     def fuser_system_prompt(self) -> Optional[str]:
         """
         Get the fuser system prompt.
         """
-        with self._lock:
-            return self._fuser_system_prompt
+        return self._fuser_system_prompt
 
     @fuser_system_prompt.setter
     def fuser_system_prompt(self, value: Optional[str]) -> None:
         """
         Set the fuser system prompt.
         """
-        with self._lock:
-            self._fuser_system_prompt = value
+        self._fuser_system_prompt = value
 
     def set_fuser_system_prompt(self, value: Optional[str]) -> None:
         """
         Alternative method to set fuser system prompt.
         """
-        with self._lock:
-            self._fuser_system_prompt = value
+        self._fuser_system_prompt = value
 
     @property
     def fuser_inputs(self) -> Optional[str]:
         """
         Get the fuser inputs.
         """
-        with self._lock:
-            return self._fuser_inputs
+        return self._fuser_inputs
 
     @fuser_inputs.setter
     def fuser_inputs(self, value: Optional[str]) -> None:
         """
         Set the fuser inputs.
         """
-        with self._lock:
-            self._fuser_inputs = value
+        self._fuser_inputs = value
 
     def set_fuser_inputs(self, value: Optional[str]) -> None:
         """
         Alternative method to set fuser inputs.
         """
-        with self._lock:
-            self._fuser_inputs = value
+        self._fuser_inputs = value
 
     @property
     def fuser_available_actions(self) -> Optional[str]:
         """
         Get the fuser available actions.
         """
-        with self._lock:
-            return self._fuser_available_actions
+        return self._fuser_available_actions
 
     @fuser_available_actions.setter
     def fuser_available_actions(self, value: Optional[str]) -> None:
         """
         set the fuser available actions.
         """
-        with self._lock:
-            self._fuser_available_actions = value
+        self._fuser_available_actions = value
 
     def set_fuser_available_actions(self, value: Optional[str]) -> None:
         """
         Alternative method to set fuser available actions.
         """
-        with self._lock:
-            self._fuser_available_actions = value
+        self._fuser_available_actions = value
 
     @property
     def fuser_start_time(self) -> Optional[float]:
         """
         Get the fuser start time.
         """
-        with self._lock:
-            return self._fuser_start_time
+        return self._fuser_start_time
 
     @fuser_start_time.setter
     def fuser_start_time(self, value: Optional[float]) -> None:
         """
         Set the fuser start time.
         """
-        with self._lock:
-            self._fuser_start_time = value
+        self._fuser_start_time = value
 
     def set_fuser_start_time(self, value: Optional[float]) -> None:
         """
         Alternative method to set fuser start time.
         """
-        with self._lock:
-            self._fuser_start_time = value
+        self._fuser_start_time = value
 
     @property
     def fuser_end_time(self) -> Optional[float]:
         """
         Get the fuser end time.
         """
-        with self._lock:
-            return self._fuser_end_time
+        return self._fuser_end_time
 
     @fuser_end_time.setter
     def fuser_end_time(self, value: Optional[float]) -> None:
         """
         Set the fuser end time.
         """
-        with self._lock:
-            self._fuser_end_time = value
+        self._fuser_end_time = value
 
     def set_fuser_end_time(self, value: Optional[float]) -> None:
         """
         Alternative method to set fuser end time.
         """
-        with self._lock:
-            self._fuser_end_time = value
+        self._fuser_end_time = value
 
     @property
     def llm_prompt(self) -> Optional[str]:
         """
         Get the LLM prompt.
         """
-        with self._lock:
-            return self._llm_prompt
+        return self._llm_prompt
 
     @llm_prompt.setter
     def llm_prompt(self, value: Optional[str]) -> None:
         """
         Set the LLM prompt.
         """
-        with self._lock:
-            self._llm_prompt = value
+        self._llm_prompt = value
 
     def set_llm_prompt(self, value: Optional[str]) -> None:
         """
         Alternative method to set LLM prompt.
         """
-        with self._lock:
-            self._llm_prompt = value
+        self._llm_prompt = value
 
     def clear_llm_prompt(self) -> None:
-        """C
-        lear the LLM prompt.
         """
-        with self._lock:
-            self._llm_prompt = None
+        Clear the LLM prompt.
+        """
+        self._llm_prompt = None
 
     @property
     def llm_start_time(self) -> Optional[float]:
         """
         Get the LLM processing start time.
         """
-        with self._lock:
-            return self._llm_start_time
+        return self._llm_start_time
 
     @llm_start_time.setter
     def llm_start_time(self, value: Optional[float]) -> None:
         """
         Set the LLM processing start time.
         """
-        with self._lock:
-            self._llm_start_time = value
+        self._llm_start_time = value
 
     def set_llm_start_time(self, value: Optional[float]) -> None:
         """
         Alternative method to set LLM start time.
         """
-        with self._lock:
-            self._llm_start_time = value
+        self._llm_start_time = value
 
     @property
     def llm_end_time(self) -> Optional[float]:
         """
         Get the LLM processing end time.
         """
-        with self._lock:
-            return self._llm_end_time
+        return self._llm_end_time
 
     @llm_end_time.setter
     def llm_end_time(self, value: Optional[float]) -> None:
         """
         Set the LLM processing end time.
         """
-        with self._lock:
-            self._llm_end_time = value
+        self._llm_end_time = value
 
     def add_dynamic_variable(self, key: str, value: Any) -> None:
         """
@@ -0,0 +1,443 @@
+import json
+import logging
+import math
+import os
+import re
+import unicodedata
+from difflib import SequenceMatcher
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+
+# words ASR and people put in front of place names that are not part of them
+_LEADING_WORDS = ("the", "a", "an", "my", "our")
+
+_SOUNDEX_CODES = {
+    **dict.fromkeys("bfpv", "1"),
+    **dict.fromkeys("cgjkqsxz", "2"),
+    **dict.fromkeys("dt", "3"),
+    "l": "4",
+    **dict.fromkeys("mn", "5"),
+    "r": "6",
+}
+
+
+def normalize_name(name: str) -> str:
+    """
+    Canonical form of a location name.
+
+    Case, accents, punctuation, repeated whitespace and a leading article
+    are dropped, so "The Kitchen!" and "kitchen" are the same location.
+
+    Parameters
+    ----------
+    name : str
+        The location name.
+
+    Returns
+    -------
+    str
+        The normalized name.
+    """
+    text = unicodedata.normalize("NFKD", name.casefold())
+    text = "".join(c for c in text if not unicodedata.combining(c))
+    words = re.sub(r"[^\w\s]", " ", text).split()
+    if len(words) > 1 and words[0] in _LEADING_WORDS:
+        words = words[1:]
+    return " ".join(words)
+
+
+def phonetic_key(name: str) -> str:
+    """
+    Soundex-style key of a whole name, ignoring word breaks.
+
+    Unlike classic Soundex the code is not truncated to four characters,
+    so "conference room" and "conference rooms" still differ while
+    "kitchen" / "kitchin" and "rest room" / "restroom" collide.
+
+    Parameters
+    ----------
+    name : str
+        The (normalized) location name.
+
+    Returns
+    -------
+    str
+        The phonetic key, empty if the name has no letters.
+    """
+    letters = [c for c in normalize_name(name) if c.isalpha()]
+    if not letters:
+        return ""
+
+    key = [letters[0]]
+    previous = _SOUNDEX_CODES.get(letters[0], "")
+    for c in letters[1:]:
+        code = _SOUNDEX_CODES.get(c, "")
+        if code and code != previous:
+            key.append(code)
+        # h and w do not separate letters with the same code
+        if c not in "hw":
+            previous = code
+    return "".join(key)
+
+
+class LocationIndex:
+    """
+    Spatial and name index over saved locations.
+
+    Positions are bucketed in a uniform grid so that nearest-N and radius
+    queries only look at nearby cells. Names are indexed by their
+    normalized form and by a phonetic key, and can be resolved with a fuzzy
+    match for names mangled by speech recognition.
+
+    Parameters
+    ----------
+    cell_size : float
+        Grid cell size in m.
+    """
+
+    def __init__(self, cell_size: float = 2.0):
+        self.cell_size = cell_size
+
+        self.positions: Dict[str, Tuple[float, float]] = {}
+        self._cells: Dict[Tuple[int, int], Set[str]] = {}
+        self._normalized: Dict[str, str] = {}
+        self._phonetic: Dict[str, Set[str]] = {}
+
+    def __len__(self) -> int:
+        return len(self.positions)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.positions
+
+    def _cell(self, x: float, y: float) -> Tuple[int, int]:
+        return math.floor(x / self.cell_size), math.floor(y / self.cell_size)
+
+    def add(self, name: str, x: float, y: float) -> None:
+        """
+        Add or move a location.
+
+        Parameters
+        ----------
+        name : str
+            The location name as stored.
+        x : float
+            Map x coordinate in m.
+        y : float
+            Map y coordinate in m.
+        """
+        self.remove(name)
+
+        self.positions[name] = (x, y)
+        self._cells.setdefault(self._cell(x, y), set()).add(name)
+        self._normalized[normalize_name(name)] = name
+        self._phonetic.setdefault(phonetic_key(name), set()).add(name)
+
+    def remove(self, name: str) -> None:
+        """
+        Remove a location if it is indexed.
+
+        Parameters
+        ----------
+        name : str
+            The location name as stored.
+        """
+        position = self.positions.pop(name, None)
+        if position is None:
+            return
+
+        cell = self._cell(*position)
+        self._cells[cell].discard(name)
+        if not self._cells[cell]:
+            del self._cells[cell]
+
+        normalized = normalize_name(name)
+        if self._normalized.get(normalized) == name:
+            del self._normalized[normalized]
+
+        key = phonetic_key(name)
+        self._phonetic[key].discard(name)
+        if not self._phonetic[key]:
+            del self._phonetic[key]
+
+    def _rings(self, x: float, y: float) -> Iterator[Tuple[int, List[str]]]:
+        """
+        Yield (ring, names) for square rings of cells around (x, y).
+        """
+        cx, cy = self._cell(x, y)
+        if not self._cells:
+            return
+        reach = max(max(abs(ix - cx), abs(iy - cy)) for ix, iy in self._cells.keys())
+        yield 0, list(self._cells.get((cx, cy), ()))
+        for ring in range(1, reach + 1):
+            names: List[str] = []
+            for ix in range(cx - ring, cx + ring + 1):
+                for iy in (cy - ring, cy + ring):
+                    names.extend(self._cells.get((ix, iy), ()))
+            for iy in range(cy - ring + 1, cy + ring):
+                for ix in (cx - ring, cx + ring):
+                    names.extend(self._cells.get((ix, iy), ()))
+            yield ring, names
+
+    def nearest(
+        self, x: float, y: float, count: int = 1, max_distance: Optional[float] = None
+    ) -> List[Tuple[str, float]]:
+        """
+        The closest locations to a point.
+
+        Parameters
+        ----------
+        x : float
+            Map x coordinate in m.
+        y : float
+            Map y coordinate in m.
+        count : int
+            Maximum number of locations to return.
+        max_distance : float, optional
+            Ignore locations farther away than this, in m.
+
+        Returns
+        -------
+        List[Tuple[str, float]]
+            (name, distance in m) pairs, closest first.
+        """
+        found: List[Tuple[float, str]] = []
+        for ring, names in self._rings(x, y):
+            # everything in rings further out is at least this far away
+            bound = (ring - 1) * self.cell_size
+            if len(found) >= count and bound > found[count - 1][0]:
+                break
+            if max_distance is not None and bound > max_distance:
+                break
+            for name in names:
+                px, py = self.positions[name]
+                found.append((math.hypot(px - x, py - y), name))
+            found.sort()
+
+        return [
+            (name, distance)
+            for distance, name in found[:count]
+            if max_distance is None or distance <= max_distance
+        ]
+
+    def within(self, x: float, y: float, radius: float) -> List[Tuple[str, float]]:
+        """
+        All locations within a radius of a point.
+
+        Parameters
+        ----------
+        x : float
+            Map x coordinate in m.
+        y : float
+            Map y coordinate in m.
+        radius : float
+            Search radius in m.
+
+        Returns
+        -------
+        List[Tuple[str, float]]
+            (name, distance in m) pairs, closest first.
+        """
+        x0, y0 = self._cell(x - radius, y - radius)
+        x1, y1 = self._cell(x + radius, y + radius)
+        found = []
+        for ix in range(x0, x1 + 1):
+            for iy in range(y0, y1 + 1):
+                for name in self._cells.get((ix, iy), ()):
+                    px, py = self.positions[name]
+                    distance = math.hypot(px - x, py - y)
+                    if distance <= radius:
+                        found.append((distance, name))
+        return [(name, distance) for distance, name in sorted(found)]
+
+    def lookup(self, name: str) -> Optional[str]:
+        """
+        The saved name with the same normalized form, if any.
+
+        Parameters
+        ----------
+        name : str
+            The name as given.
+
+        Returns
+        -------
+        Optional[str]
+            The name as stored, or None.
+        """
+        return self._normalized.get(normalize_name(name))
+
+    def search(self, query: str, limit: int = 5) -> List[Tuple[str, float]]:
+        """
+        Rank saved names by similarity to a (possibly misheard) query.
+
+        Parameters
+        ----------
+        query : str
+            The name as heard.
+        limit : int
+            Maximum number of candidates.
+
+        Returns
+        -------
+        List[Tuple[str, float]]
+            (name, score) pairs, best first. An exact match scores 1.0; a
+            phonetic match scores at least 0.8.
+        """
+        normalized = normalize_name(query)
+        if not normalized:
+            return []
+
+        exact = self._normalized.get(normalized)
+        sounds_alike = self._phonetic.get(phonetic_key(normalized), set())
+
+        scored = []
+        matcher = SequenceMatcher(b=normalized, autojunk=False)
+        for candidate, name in self._normalized.items():
+            if name == exact:
+                score = 1.0
+            else:
+                matcher.set_seq1(candidate)
+                score = matcher.ratio()
+                if name in sounds_alike:
+                    score = max(score, 0.8 + 0.19 * score)
+            scored.append((score, name))
+
+        scored.sort(key=lambda item: (-item[0], item[1]))
+        return [(name, round(score, 3)) for score, name in scored[:limit]]
+
+    def resolve(
+        self, query: str, min_score: float = 0.75, margin: float = 0.05
+    ) -> Tuple[Optional[str], List[Tuple[str, float]]]:
+        """
+        Resolve a spoken name to a single saved location.
+
+        Parameters
+        ----------
+        query : str
+            The name as heard.
+        min_score : float
+            Lowest acceptable similarity for a fuzzy match.
+        margin : float
+            A fuzzy match must beat the runner-up by at least this much.
+
+        Returns
+        -------
+        Tuple[Optional[str], List[Tuple[str, float]]]
+            The matched name (or None if there is no unambiguous match) and
+            the ranked candidates.
+        """
+        candidates = self.search(query, limit=3)
+        if not candidates:
+            return None, candidates
+
+        best, score = candidates[0]
+        if score == 1.0:
+            return best, candidates
+        if score < min_score:
+            return None, candidates
+        if len(candidates) > 1 and score - candidates[1][1] < margin:
+            return None, candidates
+        return best, candidates
+
+
+class LocationJournal:
+    """
+    Append-only persistence for saved locations.
+
+    Each change is appended as one JSON line to `<snapshot>.journal`, so a
+    change costs one small write instead of rewriting every location. The
+    journal is replayed over the snapshot on load and folded back into the
+    snapshot once it holds `compact_after` entries. A torn last line from a
+    crash is skipped.
+
+    Parameters
+    ----------
+    snapshot_file : str
+        Path of the JSON snapshot (the classic locations.json).
+    compact_after : int
+        Number of journal entries that triggers a compaction.
+    """
+
+    def __init__(self, snapshot_file: str, compact_after: int = 200):
+        self.snapshot_file = snapshot_file
+        self.journal_file = f"{snapshot_file}.journal"
+        self.compact_after = compact_after
+        self.entries = 0
+
+    def load(self) -> Dict[str, Dict]:
+        """
+        Read the snapshot and replay the journal over it.
+
+        Returns
+        -------
+        Dict[str, Dict]
+            The saved locations by name.
+        """
+        locations: Dict[str, Dict] = {}
+        if os.path.exists(self.snapshot_file):
+            try:
+                with open(self.snapshot_file, "r") as f:
+                    locations = json.load(f)
+            except Exception as e:
+                logging.error(f"Error loading locations file: {e}")
+
+        self.entries = 0
+        if os.path.exists(self.journal_file):
+            with open(self.journal_file, "r") as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except json.JSONDecodeError:
+                        logging.warning(f"Skipping torn entry in {self.journal_file}")
+                        continue
+                    if entry.get("op") == "put":
+                        locations[entry["name"]] = entry["data"]
+                    elif entry.get("op") == "delete":
+                        locations.pop(entry["name"], None)
+                    self.entries += 1
+
+        return locations
+
+    def append(self, op: str, name: str, data: Optional[Dict] = None) -> None:
+        """
+        Record one change.
+
+        Parameters
+        ----------
+        op : str
+            "put" to add or replace a location, "delete" to remove it.
+        name : str
+            The location name.
+        data : Dict, optional
+            The full location record for "put".
+        """
+        entry = {"op": op, "name": name}
+        if data is not None:
+            entry["data"] = data
+        with open(self.journal_file, "a") as f:
+            f.write(json.dumps(entry) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        self.entries += 1
+
+    def compact(self, locations: Dict[str, Dict]) -> None:
+        """
+        Write a fresh snapshot and empty the journal.
+
+        Parameters
+        ----------
+        locations : Dict[str, Dict]
+            The current saved locations.
+        """
+        tmp = f"{self.snapshot_file}.tmp"
+        with open(tmp, "w") as f:
+            json.dump(locations, f, indent=2)
+        os.replace(tmp, self.snapshot_file)
+        if os.path.exists(self.journal_file):
+            os.remove(self.journal_file)
+        self.entries = 0
+        logging.info(f"Compacted {len(locations)} locations to {self.snapshot_file}")
+
+    def needs_compaction(self) -> bool:
+        """
+        Whether the journal has grown past `compact_after` entries.
+        """
+        return self.entries >= self.compact_after
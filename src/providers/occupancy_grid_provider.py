@@ -0,0 +1,470 @@
+import logging
+import math
+import threading
+import time
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
+from .singleton import singleton
+
+# Cell keys pack signed (ix, iy) cell indices into a single int64 so that
+# numpy set operations can deduplicate cells across the whole scan.
+_KEY_OFFSET = 1 << 30
+_KEY_SHIFT = 31
+
+
+def _encode(ix: NDArray, iy: NDArray) -> NDArray:
+    return ((ix + _KEY_OFFSET) << _KEY_SHIFT) | (iy + _KEY_OFFSET)
+
+
+def _decode(keys: NDArray) -> Tuple[NDArray, NDArray]:
+    return (keys >> _KEY_SHIFT) - _KEY_OFFSET, (
+        keys & ((1 << _KEY_SHIFT) - 1)
+    ) - _KEY_OFFSET
+
+
+class OccupancyGrid:
+    """
+    Memory-bounded, tiled log-odds occupancy grid in the odometry frame.
+
+    The grid is stored as a dictionary of square numpy tiles that are created
+    on demand as the robot explores. When more than `max_tiles` tiles exist,
+    the tiles farthest from the robot are evicted.
+
+    Parameters
+    ----------
+    resolution : float
+        Cell size in m.
+    tile_size : int
+        Number of cells per tile side. Must be a power of two.
+    max_tiles : int
+        Maximum number of tiles kept in memory.
+    l_occ : float
+        Log-odds added to a cell that contains a lidar return.
+    l_free : float
+        Log-odds added to a cell a lidar beam passed through.
+    l_min : float
+        Lower clamp of the log-odds.
+    l_max : float
+        Upper clamp of the log-odds.
+    occupied_threshold : float
+        Probability above which a cell is considered occupied.
+    """
+
+    def __init__(
+        self,
+        resolution: float = 0.05,
+        tile_size: int = 64,
+        max_tiles: int = 400,
+        l_occ: float = 0.85,
+        l_free: float = -0.4,
+        l_min: float = -2.0,
+        l_max: float = 3.5,
+        occupied_threshold: float = 0.65,
+    ):
+        if tile_size & (tile_size - 1):
+            raise ValueError("tile_size must be a power of two")
+
+        self.resolution = resolution
+        self.tile_size = tile_size
+        self.max_tiles = max_tiles
+        self.l_occ = l_occ
+        self.l_free = l_free
+        self.l_min = l_min
+        self.l_max = l_max
+        self.occupied_logodds = math.log(occupied_threshold / (1 - occupied_threshold))
+
+        self._tile_shift = tile_size.bit_length() - 1
+        self._tile_mask = tile_size - 1
+        self.tiles: Dict[Tuple[int, int], NDArray] = {}
+        self._lock = threading.Lock()
+
+    def world_to_cell(self, x: ArrayLike, y: ArrayLike) -> Tuple[NDArray, NDArray]:
+        """
+        Convert world coordinates (m) to integer cell indices.
+        """
+        ix = np.floor(np.asarray(x, dtype=np.float64) / self.resolution)
+        iy = np.floor(np.asarray(y, dtype=np.float64) / self.resolution)
+        return ix.astype(np.int64), iy.astype(np.int64)
+
+    def cell_to_world(self, ix: ArrayLike, iy: ArrayLike) -> Tuple[NDArray, NDArray]:
+        """
+        Convert integer cell indices to the world coordinates of the cell centers.
+        """
+        x = (np.asarray(ix, dtype=np.float64) + 0.5) * self.resolution
+        y = (np.asarray(iy, dtype=np.float64) + 0.5) * self.resolution
+        return x, y
+
+    def _group_by_tile(self, keys: NDArray):
+        """
+        Yield (tile key, local x, local y, selection) for each tile touched by keys.
+        """
+        ix, iy = _decode(keys)
+        tx = ix >> self._tile_shift
+        ty = iy >> self._tile_shift
+        tile_ids, inverse = np.unique(_encode(tx, ty), return_inverse=True)
+        order = np.argsort(inverse, kind="stable")
+        bounds = np.searchsorted(inverse[order], np.arange(len(tile_ids) + 1))
+        lx = ix & self._tile_mask
+        ly = iy & self._tile_mask
+        for i, tile_id in enumerate(tile_ids):
+            sel = order[bounds[i] : bounds[i + 1]]
+            ttx, tty = _decode(np.array([tile_id]))
+            yield (int(ttx[0]), int(tty[0])), lx[sel], ly[sel], sel
+
+    def _update(self, keys: NDArray, delta: float) -> None:
+        for tile_key, lx, ly, _ in self._group_by_tile(keys):
+            tile = self.tiles.get(tile_key)
+            if tile is None:
+                tile = np.zeros((self.tile_size, self.tile_size), dtype=np.float32)
+                self.tiles[tile_key] = tile
+            values = tile[lx, ly] + delta
+            tile[lx, ly] = np.clip(values, self.l_min, self.l_max)
+
+    def _lookup(self, ix: NDArray, iy: NDArray) -> NDArray:
+        """
+        Vectorized log-odds lookup. Unknown cells return 0.
+        """
+        keys = _encode(np.ravel(ix), np.ravel(iy))
+        result = np.zeros(len(keys), dtype=np.float32)
+        if len(keys) == 0:
+            return result.reshape(np.shape(ix))
+        for tile_key, lx, ly, sel in self._group_by_tile(keys):
+            tile = self.tiles.get(tile_key)
+            if tile is not None:
+                result[sel] = tile[lx, ly]
+        return result.reshape(np.shape(ix))
+
+    def integrate_scan(
+        self,
+        pose: Tuple[float, float, float],
+        bearings: NDArray,
+        ranges: NDArray,
+        max_range: float = 8.0,
+        max_free_range: float = 4.0,
+        min_range: float = 0.05,
+    ) -> int:
+        """
+        Fuse one lidar scan into the grid using vectorized ray casting.
+
+        Parameters
+        ----------
+        pose : Tuple[float, float, float]
+            Robot pose (x, y, yaw) at scan time, yaw in radians.
+        bearings : NDArray
+            Beam bearings in radians relative to the robot heading, counter-clockwise.
+        ranges : NDArray
+            Beam ranges in m. Infinite ranges mean no return within range.
+        max_range : float
+            Returns beyond this range are not marked as obstacles.
+        max_free_range : float
+            Free space is only traced up to this range, which bounds the cost
+            of each scan.
+        min_range : float
+            Returns closer than this are ignored.
+
+        Returns
+        -------
+        int
+            Number of cells updated.
+        """
+        x0, y0, yaw = pose
+        bearings = np.asarray(bearings, dtype=np.float64)
+        ranges = np.asarray(ranges, dtype=np.float64)
+
+        no_return = np.isinf(ranges) & (ranges > 0)
+        valid = (np.isfinite(ranges) & (ranges > min_range)) | no_return
+        bearings = bearings[valid]
+        ranges = np.where(no_return[valid], max_range, ranges[valid])
+        if len(ranges) == 0:
+            return 0
+
+        angles = yaw + bearings
+        cos_a = np.cos(angles)
+        sin_a = np.sin(angles)
+
+        hit = ranges < max_range
+        hx, hy = self.world_to_cell(
+            x0 + ranges[hit] * cos_a[hit], y0 + ranges[hit] * sin_a[hit]
+        )
+        hit_keys = np.unique(_encode(hx, hy))
+
+        # sample every beam at sub-cell spacing up to its (capped) free length
+        step = 0.7 * self.resolution
+        samples = np.arange(0.0, max_free_range, step)
+        free_len = np.minimum(ranges - self.resolution, max_free_range)
+        mask = samples[None, :] < free_len[:, None]
+        dist = np.broadcast_to(samples, mask.shape)[mask]
+        beam = np.nonzero(mask)[0]
+        fx, fy = self.world_to_cell(x0 + dist * cos_a[beam], y0 + dist * sin_a[beam])
+        free_keys = np.setdiff1d(
+            np.unique(_encode(fx, fy)), hit_keys, assume_unique=True
+        )
+
+        with self._lock:
+            self._update(free_keys, self.l_free)
+            self._update(hit_keys, self.l_occ)
+            self._evict(x0, y0)
+
+        return len(free_keys) + len(hit_keys)
+
+    def _evict(self, x: float, y: float) -> None:
+        """
+        Drop the tiles farthest from (x, y) beyond the tile budget.
+        """
+        excess = len(self.tiles) - self.max_tiles
+        if excess <= 0:
+            return
+        tile_m = self.tile_size * self.resolution
+        keys = list(self.tiles.keys())
+        centers = (np.array(keys, dtype=np.float64) + 0.5) * tile_m
+        dist = np.hypot(centers[:, 0] - x, centers[:, 1] - y)
+        for i in np.argsort(dist)[-excess:]:
+            del self.tiles[keys[i]]
+
+    def probability(self, x: ArrayLike, y: ArrayLike) -> NDArray:
+        """
+        Occupancy probability at world coordinates. Unknown cells are 0.5.
+        """
+        ix, iy = self.world_to_cell(x, y)
+        with self._lock:
+            logodds = self._lookup(ix, iy)
+        return 1.0 - 1.0 / (1.0 + np.exp(logodds))
+
+    def is_free_along(
+        self,
+        x0: float,
+        y0: float,
+        x1: float,
+        y1: float,
+        half_width: float = 0.0,
+        unknown_is_free: bool = True,
+    ) -> bool:
+        """
+        Check whether a straight corridor is free of mapped obstacles.
+
+        Parameters
+        ----------
+        x0, y0 : float
+            Start of the path in world coordinates (m).
+        x1, y1 : float
+            End of the path in world coordinates (m).
+        half_width : float
+            Half width of the corridor (m), e.g. the half width of the robot.
+        unknown_is_free : bool
+            Whether never-observed cells count as free.
+
+        Returns
+        -------
+        bool
+            True if no cell in the corridor is occupied.
+        """
+        length = math.hypot(x1 - x0, y1 - y0)
+        n = max(2, int(math.ceil(length / (0.5 * self.resolution))) + 1)
+        t = np.linspace(0.0, 1.0, n)
+        px = x0 + t * (x1 - x0)
+        py = y0 + t * (y1 - y0)
+
+        if half_width > 0 and length > 0:
+            nx, ny = -(y1 - y0) / length, (x1 - x0) / length
+            offsets = np.arange(-half_width, half_width + 1e-9, 0.5 * self.resolution)
+            px = (px[None, :] + offsets[:, None] * nx).ravel()
+            py = (py[None, :] + offsets[:, None] * ny).ravel()
+
+        ix, iy = self.world_to_cell(px, py)
+        with self._lock:
+            logodds = self._lookup(ix, iy)
+        if not unknown_is_free and np.any(logodds == 0):
+            return False
+        return not bool(np.any(logodds > self.occupied_logodds))
+
+    def local_costmap(
+        self, x: float, y: float, size_m: float = 4.0
+    ) -> Tuple[NDArray, Tuple[float, float]]:
+        """
+        Crop a square, world-aligned probability map centered on (x, y).
+
+        Parameters
+        ----------
+        x, y : float
+            Center of the crop in world coordinates (m).
+        size_m : float
+            Side length of the crop (m).
+
+        Returns
+        -------
+        Tuple[NDArray, Tuple[float, float]]
+            Probability grid indexed [ix, iy] and the world coordinates of the
+            lower-left corner of cell [0, 0]. Unknown cells are 0.5.
+        """
+        n = max(1, int(round(size_m / self.resolution)))
+        cx, cy = self.world_to_cell(x, y)
+        ix0 = int(cx) - n // 2
+        iy0 = int(cy) - n // 2
+        ix, iy = np.meshgrid(
+            np.arange(ix0, ix0 + n), np.arange(iy0, iy0 + n), indexing="ij"
+        )
+        with self._lock:
+            logodds = self._lookup(ix, iy)
+        probs = 1.0 - 1.0 / (1.0 + np.exp(logodds))
+        return probs, (ix0 * self.resolution, iy0 * self.resolution)
+
+    def nearest_obstacle(
+        self, x: float, y: float, max_radius: float = 3.0
+    ) -> Optional[Tuple[float, float, float]]:
+        """
+        Find the closest occupied cell within a radius.
+
+        Returns
+        -------
+        Optional[Tuple[float, float, float]]
+            (distance, obstacle x, obstacle y) or None if nothing is mapped
+            within the radius.
+        """
+        probs, (ox, oy) = self.local_costmap(x, y, 2.0 * max_radius)
+        occupied = np.argwhere(
+            probs > 1.0 - 1.0 / (1.0 + math.exp(self.occupied_logodds))
+        )
+        if len(occupied) == 0:
+            return None
+        cx = ox + (occupied[:, 0] + 0.5) * self.resolution
+        cy = oy + (occupied[:, 1] + 0.5) * self.resolution
+        dist = np.hypot(cx - x, cy - y)
+        i = int(np.argmin(dist))
+        if dist[i] > max_radius:
+            return None
+        return float(dist[i]), float(cx[i]), float(cy[i])
+
+    @property
+    def memory_bytes(self) -> int:
+        """
+        Memory used by the tiles.
+        """
+        return sum(tile.nbytes for tile in self.tiles.values())
+
+
+@singleton
+class OccupancyGridProvider:
+    """
+    Occupancy Grid Provider.
+
+    This class implements a singleton pattern to share a single persistent
+    occupancy grid between the mapping background and its consumers.
+
+    Parameters
+    ----------
+    resolution : float
+        Cell size in m.
+    tile_size : int
+        Number of cells per tile side.
+    max_tiles : int
+        Maximum number of tiles kept in memory.
+    """
+
+    def __init__(
+        self, resolution: float = 0.05, tile_size: int = 64, max_tiles: int = 400
+    ):
+        logging.info("Booting Occupancy Grid Provider")
+
+        self.grid = OccupancyGrid(
+            resolution=resolution, tile_size=tile_size, max_tiles=max_tiles
+        )
+        self.pose: Optional[Tuple[float, float, float]] = None
+        self.scans_integrated = 0
+        self.last_update_ts = 0.0
+        self.last_integration_ms = 0.0
+
+    def integrate_scan(
+        self,
+        pose: Tuple[float, float, float],
+        bearings: NDArray,
+        ranges: NDArray,
+        max_range: float = 8.0,
+        max_free_range: float = 4.0,
+    ) -> None:
+        """
+        Fuse a scan taken at `pose` into the grid and record timing.
+        """
+        start = time.perf_counter()
+        self.grid.integrate_scan(pose, bearings, ranges, max_range, max_free_range)
+        self.last_integration_ms = (time.perf_counter() - start) * 1000.0
+        self.pose = pose
+        self.scans_integrated += 1
+        self.last_update_ts = time.time()
+
+    def is_free_along(
+        self, distance: float, bearing_deg: float = 0.0, half_width: float = 0.2
+    ) -> bool:
+        """
+        Check whether a straight robot-relative path is free in the map.
+
+        Parameters
+        ----------
+        distance : float
+            Path length in m.
+        bearing_deg : float
+            Path direction relative to the robot heading, counter-clockwise
+            positive, in degrees.
+        half_width : float
+            Half width of the robot in m.
+
+        Returns
+        -------
+        bool
+            True if the map has no obstacle along the path (or no pose yet).
+        """
+        if self.pose is None:
+            return True
+        x, y, yaw = self.pose
+        a = yaw + math.radians(bearing_deg)
+        return self.grid.is_free_along(
+            x, y, x + distance * math.cos(a), y + distance * math.sin(a), half_width
+        )
+
+    def nearest_obstacle(
+        self, max_radius: float = 3.0
+    ) -> Optional[Tuple[float, float]]:
+        """
+        Distance (m) and robot-relative bearing (deg, counter-clockwise) of the
+        closest mapped obstacle, or None.
+        """
+        if self.pose is None:
+            return None
+        x, y, yaw = self.pose
+        hit = self.grid.nearest_obstacle(x, y, max_radius)
+        if hit is None:
+            return None
+        dist, ox, oy = hit
+        bearing = math.atan2(oy - y, ox - x) - yaw
+        bearing = (bearing + math.pi) % (2.0 * math.pi) - math.pi
+        return dist, math.degrees(bearing)
+
+    def local_costmap(self, size_m: float = 4.0) -> Optional[NDArray]:
+        """
+        World-aligned probability crop centered on the robot, or None.
+        """
+        if self.pose is None:
+            return None
+        probs, _ = self.grid.local_costmap(self.pose[0], self.pose[1], size_m)
+        return probs
+
+    @property
+    def obstacle_string(self) -> Optional[str]:
+        """
+        Natural language summary of the closest mapped obstacle for the LLM.
+        """
+        nearest = self.nearest_obstacle()
+        if nearest is None:
+            return None
+        dist, bearing = nearest
+        if abs(bearing) < 20:
+            side = "ahead of you"
+        elif abs(bearing) > 160:
+            side = "behind you"
+        elif bearing > 0:
+            side = "to your left"
+        else:
+            side = "to your right"
+        return f"The closest mapped obstacle is {round(dist, 1)} meters {side}."
@@ -24,12 +24,12 @@ except ImportError:
 
 from zenoh_msgs import (
     Odometry,
-    PoseStamped,
     PoseWithCovarianceStamped,
     nav_msgs,
     open_zenoh_session,
 )
 
+from .pose_history import PoseHistory
 from .singleton import singleton
 
 rad_to_deg = 57.2958
@@ -50,7 +50,8 @@ def odom_processor(
     """
     Process function for the Odom Provider.
     This function runs in a separate process to periodically retrieve the odometry
-    and pose data from the robot and put it into a multiprocessing queue.
+    and pose data from the robot and put it into a multiprocessing queue, together
+    with the local unix timestamp at which the message was received.
 
     Parameters
     ----------
@@ -82,7 +83,10 @@ def odom_processor(
         logging.debug(f"Zenoh odom handler: {odom}")
 
         data_queue.put(
-            PoseWithCovarianceStamped(header=odom.header, pose=odom.pose.pose)  # type: ignore
+            (
+                PoseWithCovarianceStamped(header=odom.header, pose=odom.pose.pose),  # type: ignore
+                time.time(),
+            )
         )
 
     def pose_message_handler(data: PoseStamped_):
@@ -95,7 +99,7 @@ def odom_processor(
             The PoseStamped message containing the pose data.
         """
         logging.debug(f"Pose message handler: {data}")
-        data_queue.put(data)
+        data_queue.put((data, time.time()))
 
     if use_zenoh:
         # typically, TurtleBot4
@@ -152,10 +156,16 @@ class OdomProvider:
     channel: str = ""
         The channel to connect to the robot, used for CycloneDDS (e.g., Unitree Go2).
         If not specified, it will raise an error when starting the provider.
+    history_size: int = 512
+        Number of timestamped poses kept for `pose_at` queries.
     """
 
     def __init__(
-        self, URID: str = "", use_zenoh: bool = False, channel: Optional[str] = ""
+        self,
+        URID: str = "",
+        use_zenoh: bool = False,
+        channel: Optional[str] = "",
+        history_size: int = 512,
     ):
         """
         Robot and sensor configuration
@@ -167,7 +177,7 @@ class OdomProvider:
         self.URID = URID
         self.channel = channel
 
-        self.data_queue: mp.Queue[PoseStamped] = mp.Queue()
+        self.data_queue: mp.Queue = mp.Queue()
         self._odom_reader_thread: Optional[mp.Process] = None
         self._odom_processor_thread: Optional[threading.Thread] = None
 
@@ -190,6 +200,9 @@ class OdomProvider:
         self.odom_rockchip_ts = 0.0
         self.odom_subscriber_ts = 0.0
 
+        # Timestamped pose history, indexed by local receive time
+        self.pose_history = PoseHistory(history_size)
+
         self.start()
 
     def start(self) -> None:
@@ -281,7 +294,7 @@ class OdomProvider:
         """
         while True:
             try:
-                pose_data = self.data_queue.get()
+                pose_data, received_ts = self.data_queue.get()
             except Exception as e:
                 logging.error(f"Error getting pose from queue: {e}")
                 time.sleep(1)
@@ -294,8 +307,8 @@ class OdomProvider:
             # UTC
             self.odom_rockchip_ts = header.stamp.sec + header.stamp.nanosec * 1e-9
 
-            # The local timestamp
-            self.odom_subscriber_ts = time.time()
+            # The local timestamp at which the message was received
+            self.odom_subscriber_ts = received_ts
 
             if self.channel and not self.use_zenoh:
                 # only relevant to Unitree Go2
@@ -353,6 +366,11 @@ class OdomProvider:
             # current position in world frame
             self.x = round(pose.position.x, 4)
             self.y = round(pose.position.y, 4)
+
+            self.pose_history.append(
+                received_ts, pose.position.x, pose.position.y, angles[2]
+            )
+
             logging.debug(
                 f"odom: X:{self.x} Y:{self.y} W:{self.odom_yaw_m180_p180} H:{self.odom_yaw_0_360} T:{self.odom_rockchip_ts}"
             )
@@ -388,3 +406,41 @@ class OdomProvider:
             "odom_rockchip_ts": self.odom_rockchip_ts,
             "odom_subscriber_ts": self.odom_subscriber_ts,
         }
+
+    def pose_at(
+        self, timestamp: float, max_extrapolation_s: float = 0.1
+    ) -> Optional[dict]:
+        """
+        Get the interpolated robot pose at a given local unix timestamp.
+
+        Parameters
+        ----------
+        timestamp : float
+            The local unix timestamp (same clock as `odom_subscriber_ts`).
+        max_extrapolation_s : float
+            How far past the newest odometry sample the timestamp may lie.
+
+        Returns
+        -------
+        Optional[dict]
+            A dictionary with odom_x, odom_y, odom_yaw_m180_p180, odom_yaw_0_360
+            and odom_subscriber_ts, or None if the timestamp is outside the
+            buffered history.
+        """
+        pose = self.pose_history.pose_at(timestamp, max_extrapolation_s)
+        if pose is None:
+            return None
+
+        x, y, yaw = pose
+        yaw_m180_p180 = round(yaw * rad_to_deg, 4)
+        flip = -1.0 * yaw_m180_p180
+        if flip < 0.0:
+            flip = flip + 360.0
+
+        return {
+            "odom_x": round(x, 4),
+            "odom_y": round(y, 4),
+            "odom_yaw_m180_p180": yaw_m180_p180,
+            "odom_yaw_0_360": round(flip, 4),
+            "odom_subscriber_ts": timestamp,
+        }
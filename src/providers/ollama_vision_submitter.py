@@ -0,0 +1,295 @@
+import asyncio
+import base64
+import logging
+import time
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+import aiohttp
+import cv2
+import numpy as np
+
+# Longest image side the vision encoders of common Ollama models work at;
+# larger images only cost encode, upload and image-token time
+NATIVE_IMAGE_SIDE = {
+    "llava": 672,
+    "llava-llama3": 336,
+    "llava-phi3": 336,
+    "bakllava": 336,
+    "moondream": 378,
+    "minicpm-v": 448,
+    "llama3.2-vision": 560,
+}
+DEFAULT_IMAGE_SIDE = 672
+
+
+def native_image_side(model: str) -> int:
+    """
+    Get the image size a model's vision encoder works at.
+
+    Parameters
+    ----------
+    model : str
+        Ollama model name, optionally with a tag, e.g. "llava-llama3:8b".
+
+    Returns
+    -------
+    int
+        Longest image side in pixels.
+    """
+    name = model.split(":", 1)[0].rsplit("/", 1)[-1]
+    return NATIVE_IMAGE_SIDE.get(name, DEFAULT_IMAGE_SIDE)
+
+
+def resize_to_side(frame: np.ndarray, max_side: int) -> np.ndarray:
+    """
+    Downscale a frame so its longest side is at most `max_side`.
+    """
+    height, width = frame.shape[:2]
+    scale = max_side / float(max(height, width))
+    if scale >= 1.0:
+        return frame
+    return cv2.resize(
+        frame,
+        (max(1, round(width * scale)), max(1, round(height * scale))),
+        interpolation=cv2.INTER_AREA,
+    )
+
+
+def frame_signature(frame: np.ndarray) -> np.ndarray:
+    """
+    A 16x16 grayscale thumbnail used to recognize near-identical frames.
+    """
+    gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY) if frame.ndim == 3 else frame
+    return cv2.resize(gray, (16, 16), interpolation=cv2.INTER_AREA).astype(np.float32)
+
+
+@dataclass
+class SubmissionTiming:
+    """
+    Where the time of one request went.
+
+    Parameters
+    ----------
+    encode_s : float
+        JPEG and base64 encoding of the downscaled frame.
+    upload_s : float
+        Round trip minus the time Ollama reports for the request, i.e.
+        payload transfer and queueing.
+    inference_s : float
+        Time Ollama reports for the request, including model loading.
+    """
+
+    encode_s: float
+    upload_s: float
+    inference_s: float
+
+    def __str__(self) -> str:
+        return (
+            f"encode {self.encode_s * 1000:.0f} ms, upload {self.upload_s * 1000:.0f}"
+            f" ms, inference {self.inference_s * 1000:.0f} ms"
+        )
+
+
+@dataclass
+class VisionResult:
+    """
+    A description of a submitted frame.
+
+    Parameters
+    ----------
+    description : str
+        The model's response.
+    captured_at : float
+        Time the frame was submitted.
+    timing : SubmissionTiming
+        Timing of the request.
+    """
+
+    description: str
+    captured_at: float
+    timing: SubmissionTiming
+
+
+class OllamaVisionSubmitter:
+    """
+    Submits camera frames to an Ollama vision model.
+
+    Frames are downscaled to the model's native input size, frames that are
+    near-identical to the last submitted one are skipped, and at most one
+    request is in flight. Frames submitted while a request runs replace each
+    other, so the next request always describes the latest frame.
+
+    Parameters
+    ----------
+    base_url : str
+        Ollama server URL.
+    model : str
+        Vision model name.
+    prompt : str
+        Prompt sent with every frame.
+    timeout : float
+        Request timeout in seconds.
+    on_result : Callable[[VisionResult], None]
+        Called on the event loop with every description.
+    image_side : Optional[int]
+        Longest image side sent to the model; by default the native size of
+        the model.
+    jpeg_quality : int
+        JPEG quality of the uploaded frame.
+    dedup_threshold : float
+        Frames whose mean absolute difference to the last submitted frame,
+        in gray levels of a 16x16 thumbnail, is below this are skipped; 0
+        submits every frame.
+    name : str
+        Used in log messages.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        model: str,
+        prompt: str,
+        timeout: float,
+        on_result: Callable[[VisionResult], None],
+        image_side: Optional[int] = None,
+        jpeg_quality: int = 85,
+        dedup_threshold: float = 3.0,
+        name: str = "OllamaVision",
+    ):
+        self.url = f"{base_url}/api/generate"
+        self.model = model
+        self.prompt = prompt
+        self.timeout = timeout
+        self.on_result = on_result
+        self.image_side = image_side or native_image_side(model)
+        self.jpeg_quality = jpeg_quality
+        self.dedup_threshold = dedup_threshold
+        self.name = name
+
+        self.skipped_duplicates = 0
+        self.superseded = 0
+        self.last_timing: Optional[SubmissionTiming] = None
+
+        self._latest: Optional[np.ndarray] = None
+        self._latest_signature: Optional[np.ndarray] = None
+        self._latest_ts = 0.0
+        self._last_signature: Optional[np.ndarray] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._session: Optional[aiohttp.ClientSession] = None
+
+    @property
+    def busy(self) -> bool:
+        """
+        Whether a request is in flight.
+        """
+        return self._worker is not None and not self._worker.done()
+
+    def submit(self, frame: np.ndarray) -> bool:
+        """
+        Queue a frame for description. Must be called on the event loop.
+
+        Parameters
+        ----------
+        frame : np.ndarray
+            BGR frame.
+
+        Returns
+        -------
+        bool
+            False if the frame was skipped as a duplicate of the last
+            submitted frame.
+        """
+        frame = resize_to_side(frame, self.image_side)
+        signature = frame_signature(frame)
+        if self._is_duplicate(signature):
+            self.skipped_duplicates += 1
+            return False
+
+        if self._latest is not None:
+            self.superseded += 1
+        self._latest, self._latest_signature = frame, signature
+        self._latest_ts = time.time()
+
+        if not self.busy:
+            self._worker = asyncio.get_running_loop().create_task(self._drain())
+        return True
+
+    def _is_duplicate(self, signature: np.ndarray) -> bool:
+        if self.dedup_threshold <= 0 or self._last_signature is None:
+            return False
+        difference = float(np.abs(signature - self._last_signature).mean())
+        return difference < self.dedup_threshold
+
+    async def _drain(self):
+        while self._latest is not None:
+            frame, captured_at = self._latest, self._latest_ts
+            self._last_signature = self._latest_signature
+            self._latest = None
+            try:
+                result = await self._describe(frame, captured_at)
+            except Exception as e:
+                logging.warning(f"{self.name} request error: {e}")
+                continue
+            if result is not None:
+                self.on_result(result)
+
+    async def _describe(
+        self, frame: np.ndarray, captured_at: float
+    ) -> Optional[VisionResult]:
+        start = time.perf_counter()
+        ok, buffer = cv2.imencode(
+            ".jpg", frame, [cv2.IMWRITE_JPEG_QUALITY, self.jpeg_quality]
+        )
+        if not ok:
+            logging.debug(f"{self.name} failed to encode frame")
+            return None
+        payload = {
+            "model": self.model,
+            "prompt": self.prompt,
+            "images": [base64.b64encode(buffer.tobytes()).decode("utf-8")],
+            "stream": False,
+        }
+        encoded = time.perf_counter()
+
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                timeout=aiohttp.ClientTimeout(total=self.timeout)
+            )
+        try:
+            async with self._session.post(self.url, json=payload) as response:
+                if response.status != 200:
+                    text = await response.text()
+                    logging.warning(
+                        f"{self.name} request failed {response.status}: {text}"
+                    )
+                    return None
+                result = await response.json()
+        except aiohttp.ClientError as exc:
+            logging.warning(f"{self.name} network error: {exc}")
+            return None
+        finished = time.perf_counter()
+
+        round_trip = finished - encoded
+        inference = min(round_trip, result.get("total_duration", 0) / 1e9)
+        timing = SubmissionTiming(
+            encode_s=encoded - start,
+            upload_s=round_trip - inference,
+            inference_s=inference,
+        )
+        self.last_timing = timing
+        logging.info(f"{self.name} {frame.shape[1]}x{frame.shape[0]} frame: {timing}")
+
+        description = (result.get("response") or "").strip()
+        if not description:
+            return None
+        return VisionResult(description, captured_at, timing)
+
+    async def close(self) -> None:
+        """
+        Cancel the request in flight and close the HTTP session.
+        """
+        if self._worker is not None:
+            self._worker.cancel()
+        if self._session is not None:
+            await self._session.close()
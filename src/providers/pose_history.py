@@ -0,0 +1,200 @@
+import math
+from typing import Optional, Tuple
+
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
+
+def wrap_angle(angle: NDArray) -> NDArray:
+    """
+    Wrap angles in radians into the range [-pi, pi).
+
+    Parameters
+    ----------
+    angle : NDArray
+        Angles in radians.
+
+    Returns
+    -------
+    NDArray
+        The wrapped angles.
+    """
+    return (angle + np.pi) % (2.0 * np.pi) - np.pi
+
+
+class PoseHistory:
+    """
+    Fixed-size, array-backed ring buffer of timestamped 2D poses.
+
+    The buffer has a single writer (the odometry thread) and any number of
+    readers. Readers never take a lock: they copy the ring and discard the
+    slots the writer may have overwritten while the copy was taken.
+
+    Yaw is stored unwrapped so that it can be linearly interpolated across
+    the -180/+180 degree seam.
+
+    Parameters
+    ----------
+    capacity : int
+        Number of poses kept. At 50 Hz odometry, 512 entries cover ~10 s.
+    """
+
+    T, X, Y, YAW = 0, 1, 2, 3
+
+    def __init__(self, capacity: int = 512):
+        if capacity < 2:
+            raise ValueError("PoseHistory capacity must be at least 2")
+
+        self.capacity = capacity
+        self._data: NDArray = np.zeros((capacity, 4), dtype=np.float64)
+        self._count = 0
+
+        self._last_raw_yaw: Optional[float] = None
+        self._last_unwrapped_yaw = 0.0
+
+    def __len__(self) -> int:
+        return min(self._count, self.capacity)
+
+    def append(self, timestamp: float, x: float, y: float, yaw: float) -> bool:
+        """
+        Add a pose. Must only be called from a single writer thread.
+
+        Parameters
+        ----------
+        timestamp : float
+            Unix timestamp of the pose.
+        x : float
+            X position in the odometry frame, in m.
+        y : float
+            Y position in the odometry frame, in m.
+        yaw : float
+            Heading in radians (counter-clockwise positive).
+
+        Returns
+        -------
+        bool
+            False if the pose was rejected because it is not newer than the
+            most recent one.
+        """
+        if self._count:
+            last_t = self._data[(self._count - 1) % self.capacity, self.T]
+            if timestamp <= last_t:
+                return False
+
+        if self._last_raw_yaw is None:
+            unwrapped = yaw
+        else:
+            delta = yaw - self._last_raw_yaw
+            delta = (delta + math.pi) % (2.0 * math.pi) - math.pi
+            unwrapped = self._last_unwrapped_yaw + delta
+        self._last_raw_yaw = yaw
+        self._last_unwrapped_yaw = unwrapped
+
+        self._data[self._count % self.capacity] = (timestamp, x, y, unwrapped)
+        # Publishing the new count makes the slot visible to readers
+        self._count += 1
+        return True
+
+    def snapshot(self) -> NDArray:
+        """
+        Get a consistent, time-ordered copy of the buffered poses.
+
+        Returns
+        -------
+        NDArray
+            Array of shape (n, 4) with columns timestamp, x, y and unwrapped
+            yaw, oldest first.
+        """
+        count = self._count
+        n = min(count, self.capacity)
+        if count <= self.capacity:
+            data = self._data[:n].copy()
+        else:
+            start = count % self.capacity
+            data = np.concatenate((self._data[start:], self._data[:start]))
+
+        # Drop the oldest slots that concurrent writes may have overwritten,
+        # including one write that may still be in progress.
+        written = self._count - count
+        torn = n + written + 1 - self.capacity
+        if torn > 0:
+            data = data[torn:]
+        return data
+
+    def latest(self) -> Optional[Tuple[float, float, float, float]]:
+        """
+        Get the most recent pose.
+
+        Returns
+        -------
+        Optional[Tuple[float, float, float, float]]
+            (timestamp, x, y, yaw) with yaw wrapped to [-pi, pi), or None if
+            the buffer is empty.
+        """
+        data = self.snapshot()
+        if len(data) == 0:
+            return None
+        t, x, y, yaw = data[-1]
+        return float(t), float(x), float(y), float(wrap_angle(yaw))
+
+    def interpolate(
+        self, timestamps: ArrayLike, max_extrapolation_s: float = 0.1
+    ) -> Tuple[NDArray, NDArray]:
+        """
+        Interpolate the pose at arbitrary timestamps in one vectorized pass.
+
+        Parameters
+        ----------
+        timestamps : ArrayLike
+            Scalar or array of unix timestamps.
+        max_extrapolation_s : float
+            How far past the newest pose a timestamp may lie and still be
+            considered valid. Such timestamps get the newest pose.
+
+        Returns
+        -------
+        Tuple[NDArray, NDArray]
+            Poses of shape (n, 3) with columns x, y and yaw (radians, wrapped
+            to [-pi, pi)), and a boolean mask of shape (n,) that is False for
+            timestamps outside the buffered window. Out-of-window poses are
+            clamped to the nearest buffered pose.
+        """
+        ts = np.atleast_1d(np.asarray(timestamps, dtype=np.float64))
+        data = self.snapshot()
+
+        if len(data) == 0:
+            return np.full((len(ts), 3), np.nan), np.zeros(len(ts), dtype=bool)
+
+        t = data[:, self.T]
+        poses = np.empty((len(ts), 3), dtype=np.float64)
+        poses[:, 0] = np.interp(ts, t, data[:, self.X])
+        poses[:, 1] = np.interp(ts, t, data[:, self.Y])
+        poses[:, 2] = wrap_angle(np.interp(ts, t, data[:, self.YAW]))
+
+        valid = (ts >= t[0]) & (ts <= t[-1] + max_extrapolation_s)
+        return poses, valid
+
+    def pose_at(
+        self, timestamp: float, max_extrapolation_s: float = 0.1
+    ) -> Optional[Tuple[float, float, float]]:
+        """
+        Interpolate the pose at a single timestamp.
+
+        Parameters
+        ----------
+        timestamp : float
+            Unix timestamp.
+        max_extrapolation_s : float
+            How far past the newest pose the timestamp may lie.
+
+        Returns
+        -------
+        Optional[Tuple[float, float, float]]
+            (x, y, yaw) with yaw in radians, or None if the timestamp is
+            outside the buffered window.
+        """
+        poses, valid = self.interpolate(timestamp, max_extrapolation_s)
+        if not valid[0]:
+            return None
+        x, y, yaw = poses[0]
+        return float(x), float(y), float(yaw)
@@ -15,8 +15,9 @@ from numpy.typing import NDArray
 
 from providers.odom_provider import OdomProvider
 from runtime.logging import LoggingConfig, get_logging_config, setup_logging
-from zenoh_msgs import LaserScan, open_zenoh_session, sensor_msgs
+from zenoh_msgs import LaserScanArrays, decode_laser_scan, open_zenoh_session
 
+from .arc_planner import ArcPlan, ArcPlanner
 from .d435_provider import D435Provider
 from .rplidar_driver import RPDriver
 from .singleton import singleton
@@ -105,12 +106,14 @@ def rplidar_processor(
                 except Empty:
                     pass
 
+                # stamp the scan at read time for odometry synchronization
+                scan_item = (time.time(), scan_data)
                 try:
-                    data_queue.put_nowait(scan_data)
+                    data_queue.put_nowait(scan_item)
                 except Full:
                     try:
                         data_queue.get_nowait()
-                        data_queue.put_nowait(scan_data)
+                        data_queue.put_nowait(scan_item)
                     except Empty:
                         pass
 
@@ -153,6 +156,8 @@ class RPLidarProvider:
         Whether to use Zenoh for communication
     simple_paths: bool = False
         Whether to use simple paths for path planning
+    local_planner: bool = False
+        Whether to also score arc trajectories with the ArcPlanner on every scan
     rplidar_config: RPLidarConfig = RPLidarConfig()
         Configuration for the RPLidar sensor
     log_file: bool = False
@@ -181,6 +186,7 @@ class RPLidarProvider:
         machine_type: str = "go2",
         use_zenoh: bool = False,
         simple_paths: bool = False,
+        local_planner: bool = False,
         rplidar_config: RPLidarConfig = RPLidarConfig(),
         log_file: bool = False,
     ):
@@ -211,6 +217,7 @@ class RPLidarProvider:
         self._raw_scan: Optional[NDArray] = None
         self._valid_paths: Optional[list] = None
         self._lidar_string: Optional[str] = None
+        self._scan_record: Optional[tuple] = None
 
         self.angles = None
         self.angles_final = None
@@ -221,6 +228,7 @@ class RPLidarProvider:
         self.odom_y = 0.0
         self.odom_yaw_m180_p180 = 0.0
         self.odom_yaw_0_360 = 0.0
+        self.scan_ts = 0.0
         self.odom = OdomProvider()
         logging.info(f"Mapper Odom Provider: {self.odom}")
 
@@ -242,6 +250,12 @@ class RPLidarProvider:
         self.path_angles = [-60, -45, -30, -15, 0, 15, 30, 45, 60, 180]
         self.paths = self._initialize_paths()
 
+        # Arc trajectories for weaving between obstacles, see ArcPlanner
+        self.planner: Optional[ArcPlanner] = None
+        if local_planner:
+            self.planner = ArcPlanner(half_width=half_width_robot)
+        self._arc_plan: Optional[ArcPlan] = None
+
         self.pp = []
         for path in self.paths:
             pairs = list(zip(path[0], path[1]))
@@ -328,9 +342,11 @@ class RPLidarProvider:
         data : zenoh.Sample
             The Zenoh sample containing the scan data.
         """
-        self.scans = sensor_msgs.LaserScan.deserialize(data.payload.to_bytes())
-        logging.debug(f"Zenoh Laserscan data: {self.scans}")
+        scan_ts = time.time()
+        self.scans = decode_laser_scan(data.payload.to_bytes())
+        logging.debug(f"Zenoh Laserscan data: {len(self.scans.ranges)} ranges")
 
+        self._update_scan_pose(scan_ts)
         self._zenoh_processor(self.scans)
 
     def start(self):
@@ -371,13 +387,13 @@ class RPLidarProvider:
             self._serial_processor_thread.start()
             logging.info("RPLidar processing thread started")
 
-    def _zenoh_processor(self, scan: Optional[LaserScan]):
+    def _zenoh_processor(self, scan: Optional[LaserScanArrays]):
         """
         Preprocess Zenoh LaserScan data.
 
         Parameters
         ----------
-        scan : Optional[LaserScan]
+        scan : Optional[LaserScanArrays]
             The Zenoh LaserScan data to preprocess.
             If None, it indicates no data is available.
         """
@@ -390,21 +406,21 @@ class RPLidarProvider:
             # logging.debug(f"_preprocess_zenoh: {scan}")
             # angle_min=-3.1241390705108643, angle_max=3.1415927410125732
 
-            if not self.angles:
-                self.angles = list(
-                    map(
-                        lambda x: 360.0 * (x + math.pi) / (2 * math.pi),
-                        np.arange(scan.angle_min, scan.angle_max, scan.angle_increment),
+            if self.angles is None:
+                self.angles = (
+                    360.0
+                    * (
+                        np.arange(scan.angle_min, scan.angle_max, scan.angle_increment)
+                        + math.pi
                     )
+                    / (2 * math.pi)
                 )
                 self.angles_final = np.flip(self.angles)
 
             # angles now run from 360.0 to 0 degress
-            if self.angles_final is not None:
-                data = list(zip(self.angles_final, scan.ranges))
-            else:
-                data = []
-            array_ready = np.array(data)
+            ranges = np.asarray(scan.ranges, dtype=np.float64)
+            count = min(len(self.angles_final), len(ranges))
+            array_ready = np.column_stack((self.angles_final[:count], ranges[:count]))
             self._path_processor(array_ready)
 
     def _path_processor(self, data: NDArray):
@@ -468,27 +484,22 @@ class RPLidarProvider:
             # the final data ready to use for path planning
             complexes.append([x, y, angle, d_m])
 
+        array = np.array(complexes)
+        raw_array = np.array(raw)
+
         # Append the D435 provider's obstacle data if available
         if self.d435_provider.running and len(self.d435_provider.obstacle) > 50:
             logging.debug("Appending D435 provider obstacle data to RPLidar data")
-            for obstacle in self.d435_provider.obstacle:
-                complexes.append(
-                    [
-                        obstacle["x"],
-                        obstacle["y"],
-                        obstacle["angle"],
-                        obstacle["distance"],
-                    ]
-                )
-
-        array = np.array(complexes)
-        raw_array = np.array(raw)
+            array = np.vstack(
+                (array.reshape(-1, 4), self.d435_provider.get_path_points())
+            )
 
         # save_timestamp = time.time()
         if self.write_to_local_file:
             try:
                 json_line = json.dumps(
                     {
+                        "scan_ts": self.scan_ts,
                         "odom_rockchip_ts": self.odom_rockchip_ts,
                         "odom_subscriber_ts": self.odom_subscriber_ts,
                         "odom_x": self.odom_x,
@@ -527,43 +538,20 @@ class RPLidarProvider:
 
             X = array[:, 0]
             Y = array[:, 1]
-            # A = array[:, 2]
-            D = array[:, 3]
 
             # all the possible conflicting points
-            for x, y, d in list(zip(X, Y, D)):
-                for apath in possible_paths:
-                    path_points = self.paths[apath]
-                    start_x, start_y = (
-                        path_points[0][0],
-                        path_points[1][0],
-                    )
-                    end_x, end_y = path_points[0][-1], path_points[1][-1]
-
-                    if apath == 9:
-                        # For going back, only consider obstacles that are:
-                        # 1. Behind the robot (negative y in robot frame)
-                        # 2. Within a certain distance threshold
-
-                        # Assuming robot faces positive y direction
-                        # Only check obstacles behind the robot
-                        if y >= 0:  # Skip obstacles in front of or beside the robot
-                            continue
-
-                    dist_to_line = self.distance_point_to_line_segment(
-                        x, y, start_x, start_y, end_x, end_y
-                    )
-
-                    if dist_to_line < self.half_width_robot:
-                        # too close - this path will not work
-                        # logging.info(f"removing path: {apath}")
-                        path_to_remove = np.array([apath])
-                        possible_paths = np.setdiff1d(possible_paths, path_to_remove)
-                        logging.debug(f"remaining paths: {possible_paths}")
-                        break  # no need to check other paths
+            blocked = [
+                apath for apath in possible_paths if self._path_blocked(apath, X, Y)
+            ]
+            if blocked:
+                possible_paths = np.setdiff1d(possible_paths, blocked)
+                logging.debug(f"remaining paths: {possible_paths}")
 
         logging.info(f"possible_paths RP Lidar: {possible_paths}")
 
+        if self.planner is not None:
+            self._arc_plan = self._plan_on(array)
+
         self.turn_left = []
         self.turn_right = []
         self.advance = []
@@ -587,6 +575,11 @@ class RPLidarProvider:
         self._raw_scan = array
         self._lidar_string = return_string
         self._valid_paths = ppl
+        self._scan_record = (
+            self.scan_ts,
+            raw_array,
+            (self.odom_x, self.odom_y, self.odom_yaw_m180_p180),
+        )
 
         logging.debug(
             f"RPLidar Provider string: {self._lidar_string}\nValid paths: {self._valid_paths}"
@@ -600,7 +593,8 @@ class RPLidarProvider:
         """
         while self.running:
             try:
-                scan = self.data_queue.get_nowait()
+                scan_ts, scan = self.data_queue.get_nowait()
+                self._update_scan_pose(scan_ts)
                 scan_array = np.array(scan)
                 logging.debug(f"_serial_processor: {scan_array.ndim}")
 
@@ -620,23 +614,40 @@ class RPLidarProvider:
                 array_ready = np.array(data)
                 self._path_processor(array_ready)
 
-                try:
-                    o = self.odom.position
-                    logging.debug(f"Odom data: {o}")
-                    if o:
-                        self.odom_x = o["odom_x"]
-                        self.odom_y = o["odom_y"]
-                        self.odom_rockchip_ts = o["odom_rockchip_ts"]
-                        self.odom_subscriber_ts = o["odom_subscriber_ts"]
-                        self.odom_yaw_m180_p180 = o["odom_yaw_m180_p180"]
-                        self.odom_yaw_0_360 = o["odom_yaw_0_360"]
-                except Exception as e:
-                    logging.error(f"Error parsing Odom: {e}")
-
             except Empty:
                 time.sleep(0.1)
                 continue
 
+    def _update_scan_pose(self, scan_ts: float):
+        """
+        Look up the robot pose at the time the scan was received.
+
+        Falls back to the latest odometry if the scan time is outside the
+        odometry history (e.g. odometry is not running).
+
+        Parameters
+        ----------
+        scan_ts : float
+            Local unix timestamp at which the scan was read.
+        """
+        self.scan_ts = scan_ts
+        try:
+            o = self.odom.pose_at(scan_ts)
+            if o is None:
+                o = self.odom.position
+            else:
+                o["odom_rockchip_ts"] = self.odom.odom_rockchip_ts
+            logging.debug(f"Odom data: {o}")
+            if o:
+                self.odom_x = o["odom_x"]
+                self.odom_y = o["odom_y"]
+                self.odom_rockchip_ts = o["odom_rockchip_ts"]
+                self.odom_subscriber_ts = o["odom_subscriber_ts"]
+                self.odom_yaw_m180_p180 = o["odom_yaw_m180_p180"]
+                self.odom_yaw_0_360 = o["odom_yaw_0_360"]
+        except Exception as e:
+            logging.error(f"Error parsing Odom: {e}")
+
     def stop(self):
         """
         Stop the RPLidar provider.
@@ -668,6 +679,68 @@ class RPLidarProvider:
         """
         return self._valid_paths
 
+    @property
+    def arc_plan(self) -> Optional[ArcPlan]:
+        """
+        Get the best straight-ahead arc for the latest scan.
+
+        Returns
+        -------
+        Optional[ArcPlan]
+            The arc plan, or None if the local planner is disabled or no
+            scan has been processed yet.
+        """
+        return self._arc_plan
+
+    def plan_arc(self, goal_heading: float = 0.0) -> Optional[ArcPlan]:
+        """
+        Plan an arc towards a heading over the latest scan.
+
+        Parameters
+        ----------
+        goal_heading : float
+            Desired heading change in degrees, positive to the left.
+
+        Returns
+        -------
+        Optional[ArcPlan]
+            The arc plan, or None if the local planner is disabled or no
+            scan has been processed yet.
+        """
+        if self.planner is None or self._raw_scan is None:
+            return None
+        if goal_heading == 0.0:
+            return self._arc_plan
+        return self._plan_on(self._raw_scan, goal_heading)
+
+    def _plan_on(self, array: NDArray, goal_heading: float = 0.0) -> ArcPlan:
+        """
+        Run the local planner over processed scan points.
+
+        Parameters
+        ----------
+        array : NDArray
+            Scan points as rows of [x, y, angle, distance], x to the right
+            and y forwards.
+        goal_heading : float
+            Desired heading change in degrees, positive to the left.
+
+        Returns
+        -------
+        ArcPlan
+            The best arc and the clearance map.
+        """
+        assert self.planner is not None
+        start = time.perf_counter()
+        points = array.reshape(-1, 4) if array.size else np.empty((0, 4))
+        # the planner uses x forwards and y to the left
+        plan = self.planner.plan(points[:, 1], -points[:, 0], goal_heading)
+        logging.debug(
+            f"Arc plan in {(time.perf_counter() - start) * 1000:.1f} ms: "
+            f"v={plan.linear:.2f} w={plan.angular:.2f} turn={plan.turn:.1f}"
+        )
+        return plan
+
     @property
     def raw_scan(self) -> Optional[NDArray]:
         """
@@ -681,6 +754,21 @@ class RPLidarProvider:
         """
         return self._raw_scan
 
+    @property
+    def scan_record(self) -> Optional[tuple]:
+        """
+        Get the latest full scan together with the pose at which it was taken.
+
+        Returns
+        -------
+        Optional[tuple]
+            (scan_ts, scan, pose) where scan is an (n, 2) array of sensor angles
+            corrected for the mounting angle (deg, 0 to 360) and distances (m),
+            and pose is (odom_x, odom_y, odom_yaw_m180_p180) at scan time.
+            None if no scan has been processed yet.
+        """
+        return self._scan_record
+
     @property
     def lidar_string(self) -> Optional[str]:
         """
@@ -804,6 +892,50 @@ class RPLidarProvider:
 
         return math.sqrt((px - closest_x) ** 2 + (py - closest_y) ** 2)
 
+    def _path_blocked(self, apath: int, X: NDArray, Y: NDArray) -> bool:
+        """
+        Check whether any obstacle point is too close to a path.
+
+        Parameters
+        ----------
+        apath : int
+            The index of the path in `self.paths`.
+        X : NDArray
+            The x-coordinates of the obstacle points.
+        Y : NDArray
+            The y-coordinates of the obstacle points.
+
+        Returns
+        -------
+        bool
+            True if a point is closer than half the robot width to the path.
+        """
+        path_points = self.paths[apath]
+        start_x, start_y = path_points[0][0], path_points[1][0]
+        end_x, end_y = path_points[0][-1], path_points[1][-1]
+
+        if apath == 9:
+            # For going back, only consider obstacles behind the robot
+            behind = Y < 0
+            X = X[behind]
+            Y = Y[behind]
+
+        if len(X) == 0:
+            return False
+
+        dx = end_x - start_x
+        dy = end_y - start_y
+        length_sq = dx * dx + dy * dy
+
+        # same projection as distance_point_to_line_segment, for all points
+        if length_sq == 0:
+            t = 0.0
+        else:
+            t = np.clip(((X - start_x) * dx + (Y - start_y) * dy) / length_sq, 0, 1)
+
+        dist_to_line = np.hypot(X - (start_x + t * dx), Y - (start_y + t * dy))
+        return bool(np.any(dist_to_line < self.half_width_robot))
+
     def _generate_movement_string(self, valid_paths: list) -> str:
         """
         Generate movement direction string based on valid paths.
@@ -1,13 +1,10 @@
 import datetime as datetime
 import logging
-import re
-import threading
-import time
-from typing import Optional
+from typing import Callable, List, Optional
 
-import serial
 from pynmeagps import NMEAReader
 
+from .serial_reactor import NMEAParser, SerialReactor
 from .singleton import singleton
 
 
@@ -31,18 +28,9 @@ class RtkProvider:
 
         logging.info("Booting RTK Provider")
 
-        baudrate = 115200
-        timeout = 0.2  # seconds
-
-        self.serial_connection = None
-        try:
-            self.serial_connection = serial.Serial(
-                serial_port, baudrate, timeout=timeout
-            )
-            self.serial_connection.reset_input_buffer()
-            logging.info(f"Connected to {serial_port} at {baudrate} baud")
-        except serial.SerialException as e:
-            logging.error(f"Error: {e}")
+        self.serial_port = serial_port
+        self.baudrate = 115200
+        self.reactor = SerialReactor()
 
         self._rtk: Optional[dict] = None
 
@@ -53,8 +41,12 @@ class RtkProvider:
         self.qua = 0
         self.unix_ts = 0.0
 
+        # host time at which the latest GGA sentence was read
+        self.read_ts = 0.0
+
+        self._data_callbacks: List[Callable[[dict], None]] = []
+
         self.running = False
-        self._thread: Optional[threading.Thread] = None
         self.start()
 
     def utc_time_obj_to_unix(self, utc_time_obj):
@@ -76,32 +68,24 @@ class RtkProvider:
         # Convert to Unix timestamp
         return dt.timestamp()
 
-    def get_latest_gngga_message(self, nmea_data):
-
-        pattern = re.compile(
-            r"(\$GNGGA,(?P<time>\d{6}(?:\.\d+)?),[^*]*\*[0-9A-Fa-f]{2})", re.MULTILINE
-        )
-
-        gngga_entries = []
-
-        matches = pattern.finditer(nmea_data)
+    def get_latest_gga_sentence(self, sentences: List[str]) -> Optional[str]:
+        """
+        Pick the newest GGA fix from sentences in arrival order.
 
-        for match in matches:
-            # logging.info(f"matches: {match}")
-            full_msg = match.group(1)
-            time_str = match.group("time")
-            try:
-                time_val = float(time_str)
-                gngga_entries.append((time_val, full_msg))
-            except ValueError:
-                continue  # Skip if time field is malformed
+        Parameters
+        ----------
+        sentences : List[str]
+            Checksum-validated NMEA sentences.
 
-        # Sort by time and return the latest message
-        if gngga_entries:
-            most_recent = max(gngga_entries, key=lambda x: x[0])
-            # "most_recent" is a time and the message,
-            # the [1] just returns the message
-            return most_recent[1]
+        Returns
+        -------
+        Optional[str]
+            The last GGA sentence, or None if there is none.
+        """
+        for sentence in reversed(sentences):
+            if sentence[3:6] == "GGA":
+                return sentence
+        return None
 
     def magRTKProcessor(self, msg):
 
@@ -147,48 +131,72 @@ class RtkProvider:
             "rtk_sat": self.sat,
             "rtk_qua": self.qua,
             "rtk_unix_ts": self.unix_ts,
+            "rtk_read_ts": self.read_ts,
         }
 
+    def register_data_callback(self, callback: Callable[[dict], None]):
+        """
+        Register a callback that receives the RTK data dictionary for every
+        new GGA fix.
+
+        Parameters
+        ----------
+        callback : Callable[[dict], None]
+            Called on the serial reactor thread; must return quickly.
+        """
+        self._data_callbacks.append(callback)
+
     def start(self):
         """
-        Starts the RTK Provider and processing thread
+        Registers the RTK serial port with the serial reactor
         if not already running.
         """
-        if self._thread and self._thread.is_alive():
+        if self.running or not self.serial_port:
             return
 
-        self.running = True
-        self._thread = threading.Thread(target=self._run, daemon=True)
-        self._thread.start()
+        self.running = self.reactor.register(
+            self.serial_port,
+            self.baudrate,
+            NMEAParser(sentence_types=["GGA"]),
+            self._on_sentences,
+        )
 
-    def _run(self):
+    def _on_sentences(self, sentences: List[str], read_ts: float):
         """
-        Main loop for the RTK provider.
+        Process the GGA sentences of one serial read. Only the newest fix is
+        parsed, older ones from the same read are already stale.
+
+        Parameters
+        ----------
+        sentences : List[str]
+            Checksum-validated GGA sentences.
+        read_ts : float
+            Host time at which the bytes were read.
         """
-        while self.running:
+        latest_gga = self.get_latest_gga_sentence(sentences)
+        if latest_gga is None:
+            return
 
-            if self.serial_connection:
-                bytes_waiting = self.serial_connection.in_waiting
-                while bytes_waiting > 0:
-                    data = self.serial_connection.read(size=bytes_waiting)
-                    if data:
-                        data = data.decode("utf-8", errors="ignore")
-                        latest_GNGGA = self.get_latest_gngga_message(data)
-                        if latest_GNGGA:
-                            parsed_nema = NMEAReader.parse(latest_GNGGA)
-                            self.magRTKProcessor(parsed_nema)
-                    bytes_waiting = self.serial_connection.in_waiting
+        try:
+            parsed_nmea = NMEAReader.parse(latest_gga)
+        except Exception as e:
+            logging.warning(f"Failed to parse NMEA sentence: {latest_gga} ({e})")
+            return
 
-            time.sleep(0.1)
+        self.read_ts = read_ts
+        self.magRTKProcessor(parsed_nmea)
+
+        for callback in self._data_callbacks:
+            callback(self._rtk)
 
     def stop(self):
         """
         Stop the RTK provider.
         """
-        self.running = False
-        if self._thread:
+        if self.running:
             logging.info("Stopping RTK provider")
-            self._thread.join(timeout=5)
+            self.reactor.unregister(self.serial_port)
+        self.running = False
 
     @property
     def data(self) -> Optional[dict]:
@@ -0,0 +1,438 @@
+import logging
+import os
+import selectors
+import threading
+import time
+from typing import Callable, Dict, List, Optional
+
+import serial
+
+from .singleton import singleton
+
+# Callback invoked with every item parsed from one read and the time the
+# bytes were read from the port
+SerialCallback = Callable[[List, float], None]
+
+
+class LineParser:
+    """
+    Incremental line splitter for newline terminated serial protocols, such as
+    the mag/GPS/BLE strings written by the navigation Arduino.
+
+    Parameters
+    ----------
+    max_line_length : int
+        Partial lines longer than this are discarded, which resynchronizes the
+        parser after line noise.
+    encoding : str
+        Text encoding of the stream.
+    """
+
+    def __init__(self, max_line_length: int = 4096, encoding: str = "utf-8"):
+        self.max_line_length = max_line_length
+        self.encoding = encoding
+        self._buffer = bytearray()
+
+    def feed(self, data: bytes) -> List[str]:
+        """
+        Add bytes to the parser and return all lines completed by them.
+
+        Parameters
+        ----------
+        data : bytes
+            Bytes read from the port.
+
+        Returns
+        -------
+        List[str]
+            Complete, stripped, non-empty lines in arrival order.
+        """
+        self._buffer.extend(data)
+
+        end = self._buffer.rfind(b"\n")
+        if end < 0:
+            if len(self._buffer) > self.max_line_length:
+                self._buffer.clear()
+            return []
+
+        complete = bytes(self._buffer[:end])
+        del self._buffer[: end + 1]
+
+        lines = []
+        for raw in complete.split(b"\n"):
+            line = self._accept(raw.decode(self.encoding, errors="ignore").strip())
+            if line:
+                lines.append(line)
+        return lines
+
+    def _accept(self, line: str) -> Optional[str]:
+        return line
+
+
+def nmea_checksum(body: str) -> int:
+    """
+    XOR checksum of the characters between '$' and '*' of an NMEA sentence.
+    """
+    checksum = 0
+    for char in body.encode("ascii", errors="ignore"):
+        checksum ^= char
+    return checksum
+
+
+class NMEAParser(LineParser):
+    """
+    Incremental NMEA 0183 parser. Yields only complete sentences whose
+    checksum is valid, starting at their '$', so partial sentences at the start
+    of a stream and corrupted sentences are dropped.
+
+    Parameters
+    ----------
+    sentence_types : Optional[List[str]]
+        Message IDs to keep, such as ["GGA"], regardless of talker. All valid
+        sentences are kept when None.
+    """
+
+    def __init__(self, sentence_types: Optional[List[str]] = None):
+        super().__init__(max_line_length=1024, encoding="ascii")
+        self.sentence_types = set(sentence_types) if sentence_types else None
+        self.checksum_errors = 0
+
+    def _accept(self, line: str) -> Optional[str]:
+        start = line.rfind("$")
+        star = line.rfind("*")
+        if start < 0 or star < start or len(line) < star + 3:
+            return None
+
+        sentence = line[start : star + 3]
+        if self.sentence_types is not None and (
+            sentence[3:6] not in self.sentence_types
+        ):
+            return None
+
+        try:
+            valid = int(sentence[star - start + 1 :], 16) == nmea_checksum(
+                sentence[1 : star - start]
+            )
+        except ValueError:
+            valid = False
+        if not valid:
+            self.checksum_errors += 1
+            return None
+        return sentence
+
+
+def crsf_crc8(data: bytes) -> int:
+    """
+    CRC-8/DVB-S2 used by CRSF frames, computed over type and payload.
+    """
+    crc = 0
+    for byte in data:
+        crc ^= byte
+        for _ in range(8):
+            crc = ((crc << 1) ^ 0xD5) & 0xFF if crc & 0x80 else (crc << 1) & 0xFF
+    return crc
+
+
+class CRSFParser:
+    """
+    Incremental parser for TBS Crossfire (CRSF) frames,
+    [sync, length, type, payload..., crc].
+
+    Unlike discarding the whole buffer on a bad length, the parser skips a
+    single byte and searches for the next sync byte, so one corrupted frame
+    does not cost the frames queued behind it.
+    """
+
+    SYNC_BYTES = (0xC8, 0xEA, 0xEE)
+    MAX_FRAME_LENGTH = 64
+
+    def __init__(self):
+        self._buffer = bytearray()
+        self.crc_errors = 0
+
+    def feed(self, data: bytes) -> List[bytes]:
+        """
+        Add bytes to the parser and return all complete, valid frames.
+
+        Parameters
+        ----------
+        data : bytes
+            Bytes read from the port.
+
+        Returns
+        -------
+        List[bytes]
+            Whole frames, including sync byte and CRC.
+        """
+        self._buffer.extend(data)
+        frames = []
+        buffer = self._buffer
+
+        while len(buffer) > 2:
+            if buffer[0] not in self.SYNC_BYTES:
+                del buffer[0]
+                continue
+
+            frame_length = buffer[1] + 2
+            if frame_length < 4 or frame_length > self.MAX_FRAME_LENGTH:
+                del buffer[0]
+                continue
+            if len(buffer) < frame_length:
+                break
+
+            frame = bytes(buffer[:frame_length])
+            if crsf_crc8(frame[2:-1]) == frame[-1]:
+                frames.append(frame)
+                del buffer[:frame_length]
+            else:
+                self.crc_errors += 1
+                del buffer[0]
+
+        return frames
+
+
+class _SerialPort:
+    """
+    A port registered with the reactor.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        connection: serial.Serial,
+        parser,
+        callback: SerialCallback,
+    ):
+        self.name = name
+        self.connection = connection
+        self.parser = parser
+        self.callback = callback
+        self.bytes_read = 0
+        self.items_parsed = 0
+        self.last_read_ts = 0.0
+
+
+@singleton
+class SerialReactor:
+    """
+    Multiplexes every serial port of the robot on a single selector thread.
+
+    Ports are opened non-blocking, read in bulk as soon as data arrives and fed
+    to an incremental parser. The registered callback receives all items
+    parsed from one read together with the time the bytes were read, so
+    consumers get fresh fixes without polling.
+
+    Callbacks run on the reactor thread and must return quickly.
+    """
+
+    def __init__(self):
+        self._selector = selectors.DefaultSelector()
+        self._lock = threading.Lock()
+        self._ports: Dict[str, _SerialPort] = {}
+        self._pending: List[tuple] = []
+
+        self._wake_r, self._wake_w = os.pipe()
+        os.set_blocking(self._wake_r, False)
+        self._selector.register(self._wake_r, selectors.EVENT_READ, None)
+
+        self.running = False
+        self._thread: Optional[threading.Thread] = None
+
+    def register(
+        self,
+        port: str,
+        baudrate: int,
+        parser,
+        callback: SerialCallback,
+    ) -> bool:
+        """
+        Open a serial port and start delivering its parsed data.
+
+        Parameters
+        ----------
+        port : str
+            The serial device, such as /dev/ttyUSB0.
+        baudrate : int
+            The baud rate.
+        parser :
+            An object with a `feed(bytes) -> list` method, such as
+            LineParser, NMEAParser or CRSFParser.
+        callback : SerialCallback
+            Called with the items parsed from one read and the read time.
+
+        Returns
+        -------
+        bool
+            True if the port was opened.
+        """
+        try:
+            connection = serial.Serial(port, baudrate, timeout=0)
+            connection.reset_input_buffer()
+        except (serial.SerialException, ValueError) as e:
+            logging.error(f"SerialReactor: unable to open {port}: {e}")
+            return False
+
+        logging.info(f"SerialReactor: connected to {port} at {baudrate} baud")
+        entry = _SerialPort(port, connection, parser, callback)
+        with self._lock:
+            previous = self._ports.get(port)
+            self._ports[port] = entry
+            if previous is not None:
+                self._pending.append(("remove", previous))
+            self._pending.append(("add", entry))
+        self._wake()
+        self.start()
+        return True
+
+    def unregister(self, port: str) -> None:
+        """
+        Stop reading a port and close it.
+
+        Parameters
+        ----------
+        port : str
+            The serial device passed to `register`.
+        """
+        with self._lock:
+            entry = self._ports.pop(port, None)
+            if entry is not None:
+                self._pending.append(("remove", entry))
+        self._wake()
+
+    def write(self, port: str, data: bytes) -> bool:
+        """
+        Write to a registered port.
+
+        Parameters
+        ----------
+        port : str
+            The serial device passed to `register`.
+        data : bytes
+            The bytes to send.
+
+        Returns
+        -------
+        bool
+            True if the data was written.
+        """
+        entry = self._ports.get(port)
+        if entry is None:
+            return False
+        try:
+            entry.connection.write(data)
+            return True
+        except (serial.SerialException, OSError) as e:
+            logging.error(f"SerialReactor: error writing to {port}: {e}")
+            return False
+
+    def stats(self) -> Dict[str, dict]:
+        """
+        Per-port read statistics.
+        """
+        return {
+            name: {
+                "bytes_read": entry.bytes_read,
+                "items_parsed": entry.items_parsed,
+                "last_read_ts": entry.last_read_ts,
+            }
+            for name, entry in list(self._ports.items())
+        }
+
+    def start(self):
+        """
+        Start the reactor thread if it is not already running.
+        """
+        if self._thread and self._thread.is_alive():
+            return
+
+        self.running = True
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def _wake(self):
+        try:
+            os.write(self._wake_w, b"\0")
+        except OSError:
+            pass
+
+    def _apply_pending(self):
+        with self._lock:
+            pending, self._pending = self._pending, []
+
+        for action, entry in pending:
+            if action == "add":
+                self._selector.register(
+                    entry.connection.fileno(), selectors.EVENT_READ, entry
+                )
+            else:
+                self._close(entry)
+
+    def _close(self, entry: _SerialPort):
+        try:
+            self._selector.unregister(entry.connection.fileno())
+        except (KeyError, ValueError, OSError):
+            pass
+        try:
+            entry.connection.close()
+        except Exception:
+            pass
+
+    def _read(self, entry: _SerialPort):
+        try:
+            data = entry.connection.read(max(entry.connection.in_waiting, 1))
+        except (serial.SerialException, OSError) as e:
+            logging.error(f"SerialReactor: lost {entry.name}: {e}")
+            with self._lock:
+                if self._ports.get(entry.name) is entry:
+                    del self._ports[entry.name]
+            self._close(entry)
+            return
+
+        read_ts = time.time()
+        if not data:
+            return
+
+        entry.bytes_read += len(data)
+        entry.last_read_ts = read_ts
+
+        items = entry.parser.feed(data)
+        if not items:
+            return
+
+        entry.items_parsed += len(items)
+        try:
+            entry.callback(items, read_ts)
+        except Exception as e:
+            logging.error(f"SerialReactor: callback error for {entry.name}: {e}")
+
+    def _run(self):
+        """
+        Main loop of the reactor.
+        """
+        while self.running:
+            self._apply_pending()
+            for key, _ in self._selector.select(timeout=1.0):
+                if key.data is None:
+                    try:
+                        while os.read(self._wake_r, 512):
+                            pass
+                    except BlockingIOError:
+                        pass
+                    continue
+                self._read(key.data)
+
+    def stop(self):
+        """
+        Stop the reactor and close every port.
+        """
+        self.running = False
+        self._wake()
+        if self._thread:
+            logging.info("Stopping serial reactor")
+            self._thread.join(timeout=5)
+        with self._lock:
+            entries = list(self._ports.values())
+            self._ports.clear()
+            self._pending = []
+        for entry in entries:
+            self._close(entry)
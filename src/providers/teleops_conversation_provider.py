@@ -1,13 +1,11 @@
 import logging
 import time
-from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from enum import Enum
 from typing import Optional
 
-import requests
-
 from .singleton import singleton
+from .uplink_provider import UplinkChannel, UplinkProvider
 
 
 class MessageType(Enum):
@@ -47,7 +45,16 @@ class TeleopsConversationProvider:
     ):
         self.api_key = api_key
         self.base_url = base_url
-        self.executor = ThreadPoolExecutor(max_workers=1)
+
+        self.uplink = UplinkProvider()
+        self.uplink.register_channel(
+            UplinkChannel(
+                name="teleops_conversation",
+                url=self.base_url,
+                api_key=self.api_key,
+                success_codes=(200,),
+            )
+        )
 
     def store_user_message(self, content: str) -> None:
         message = ConversationMessage(
@@ -65,7 +72,7 @@ class TeleopsConversationProvider:
         )
         self._store_message(message)
 
-    def _store_message_worker(self, message: ConversationMessage) -> None:
+    def _store_message(self, message: ConversationMessage) -> None:
         if self.api_key is None or self.api_key == "":
             logging.debug("API key is missing. Cannot store conversation message.")
             return
@@ -74,29 +81,7 @@ class TeleopsConversationProvider:
             logging.debug("Empty content, skipping conversation storage")
             return
 
-        try:
-            request = requests.post(
-                self.base_url,
-                headers={"Authorization": f"Bearer {self.api_key}"},
-                json=message.to_dict(),
-                timeout=2,
-            )
-
-            if request.status_code == 200:
-                logging.debug(
-                    f"Successfully stored {message.message_type.value} message to conversation"
-                )
-            else:
-                logging.debug(
-                    f"Failed to store {message.message_type.value} message: {request.status_code} - {request.text}"
-                )
-        except Exception as e:
-            logging.debug(
-                f"Error storing {message.message_type.value} conversation message: {str(e)}"
-            )
-
-    def _store_message(self, message: ConversationMessage) -> None:
-        self.executor.submit(self._store_message_worker, message)
+        self.uplink.enqueue("teleops_conversation", message.to_dict())
 
     def is_enabled(self) -> bool:
         return self.api_key is not None and self.api_key != ""
@@ -1,13 +1,11 @@
 import logging
 import time
-from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import Optional
 
-import requests
-
 from .singleton import singleton
+from .uplink_provider import UplinkChannel, UplinkProvider
 
 
 @dataclass
@@ -226,7 +224,18 @@ class TeleopsStatusProvider:
         """
         self.api_key = api_key
         self.base_url = base_url
-        self.executor = ThreadPoolExecutor(max_workers=1)
+
+        # Only the most recent status is worth delivering after an outage
+        self.uplink = UplinkProvider()
+        self.uplink.register_channel(
+            UplinkChannel(
+                name="teleops_status",
+                url=self.base_url,
+                api_key=self.api_key,
+                success_codes=(200,),
+                coalesce=True,
+            )
+        )
 
     def get_status(self) -> dict:
         """
@@ -237,9 +246,10 @@ class TeleopsStatusProvider:
             return {}
 
         api_key_id = self.api_key[9:25] if len(self.api_key) > 25 else self.api_key
-        request = requests.get(
+        request = self.uplink.session.get(
             f"{self.base_url}/{api_key_id}",
             headers={"Authorization": f"Bearer {self.api_key}"},
+            timeout=self.uplink.timeout,
         )
         if request.status_code == 200:
             return request.json()
@@ -249,10 +259,11 @@ class TeleopsStatusProvider:
             )
             return {}
 
-    def _share_status_worker(self, status: TeleopsStatus):
+    def share_status(self, status: TeleopsStatus):
         """
-        Worker function to share the status of the machine.
-        This function runs in a separate thread to avoid blocking the main thread.
+        Share the status of the machine.
+        This function queues the status on the shared uplink, which delivers
+        it in the background. Pending statuses are replaced by newer ones.
 
         Parameters
         ----------
@@ -263,31 +274,4 @@ class TeleopsStatusProvider:
             logging.error("API key is missing. Cannot share status.")
             return
 
-        try:
-            request = requests.post(
-                self.base_url,
-                headers={"Authorization": f"Bearer {self.api_key}"},
-                json=status.to_dict(),
-            )
-
-            if request.status_code == 200:
-                logging.debug(f"Status shared successfully: {request.json()}")
-            else:
-                logging.error(
-                    f"Failed to share status: {request.status_code} - {request.text}"
-                )
-        except Exception as e:
-            logging.error(f"Error sharing status: {str(e)}")
-
-    def share_status(self, status: TeleopsStatus):
-        """
-        Share the status of the machine.
-        This function submits the status sharing task to a thread pool executor
-        to run in a separate thread.
-
-        Parameters
-        ----------
-        status : TeleopsStatus
-            The status of the machine to be shared.
-        """
-        self.executor.submit(self._share_status_worker, status)
+        self.uplink.enqueue("teleops_status", status.to_dict())
@@ -0,0 +1,414 @@
+import hashlib
+import json
+import logging
+import os
+import re
+import shutil
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+from typing import Callable, Dict, Iterable, Optional, Tuple
+
+import numpy as np
+
+from .singleton import singleton
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_tts_text(text: str) -> str:
+    """
+    Normalize text for cache lookups. Unicode is NFC normalized and runs of
+    whitespace are collapsed, which never changes how the text is spoken.
+
+    Parameters
+    ----------
+    text : str
+        The text to be spoken.
+
+    Returns
+    -------
+    str
+        The normalized text.
+    """
+    return _WHITESPACE.sub(" ", unicodedata.normalize("NFC", text)).strip()
+
+
+def tts_cache_key(
+    engine: str,
+    text: str,
+    voice: str = "",
+    language: str = "",
+    **params,
+) -> str:
+    """
+    Content address of a synthesized utterance.
+
+    Parameters
+    ----------
+    engine : str
+        The synthesis engine, such as "piper" or "elevenlabs".
+    text : str
+        The text to be spoken.
+    voice : str
+        The voice or model identifier.
+    language : str
+        The language code.
+    **params
+        Any other synthesis parameters that change the audio.
+
+    Returns
+    -------
+    str
+        A hex digest identifying the audio.
+    """
+    identity = json.dumps(
+        [engine, voice or "", language or "", params, normalize_tts_text(text)],
+        sort_keys=True,
+        default=str,
+        ensure_ascii=False,
+    )
+    return hashlib.sha256(identity.encode("utf-8")).hexdigest()
+
+
+@singleton
+class TTSCacheProvider:
+    """
+    Content-addressed cache of synthesized speech shared by all speak
+    connectors.
+
+    Encoded audio files are kept in a size-capped on-disk store and decoded
+    PCM of recently used entries is kept in an in-memory LRU, so a repeated
+    utterance can be played without synthesis, network calls or decoding.
+
+    Parameters
+    ----------
+    cache_dir : str
+        Directory of the on-disk store.
+    max_disk_mb : float
+        Size cap of the on-disk store; least recently used files are evicted.
+    max_memory_mb : float
+        Size cap of the decoded PCM kept in memory.
+    """
+
+    def __init__(
+        self,
+        cache_dir: str = "dump/tts_cache",
+        max_disk_mb: float = 256.0,
+        max_memory_mb: float = 64.0,
+    ):
+        self.cache_dir = os.path.abspath(cache_dir)
+        self.max_disk_bytes = int(max_disk_mb * 1024 * 1024)
+        self.max_memory_bytes = int(max_memory_mb * 1024 * 1024)
+
+        self._lock = threading.Lock()
+        self._disk: "OrderedDict[str, Tuple[str, int]]" = OrderedDict()
+        self._disk_bytes = 0
+        self._memory: "OrderedDict[str, Tuple[np.ndarray, int]]" = OrderedDict()
+        self._memory_bytes = 0
+
+        self.hits = 0
+        self.misses = 0
+
+        os.makedirs(self.cache_dir, exist_ok=True)
+        self._load_index()
+
+        logging.info(
+            f"TTS cache at {self.cache_dir} with {len(self._disk)} entries "
+            f"({round(self._disk_bytes / 1e6, 1)} MB)"
+        )
+
+    def _load_index(self):
+        """
+        Rebuild the disk index from the cache directory, oldest first.
+        """
+        entries = []
+        for name in os.listdir(self.cache_dir):
+            key, _, ext = name.partition(".")
+            path = os.path.join(self.cache_dir, name)
+            if not ext or ext.endswith("tmp") or not os.path.isfile(path):
+                continue
+            stat = os.stat(path)
+            entries.append((stat.st_mtime, key, path, stat.st_size))
+
+        for _, key, path, size in sorted(entries):
+            self._disk[key] = (path, size)
+            self._disk_bytes += size
+
+        self._evict_disk()
+
+    def get_path(self, key: str) -> Optional[str]:
+        """
+        Get the cached audio file for a key.
+
+        Parameters
+        ----------
+        key : str
+            Key from `tts_cache_key`.
+
+        Returns
+        -------
+        Optional[str]
+            Path of the audio file, or None on a miss. The file is owned by the
+            cache and must not be deleted by the caller.
+        """
+        with self._lock:
+            entry = self._disk.get(key)
+            if entry is None or not os.path.exists(entry[0]):
+                if entry is not None:
+                    self._drop_disk(key)
+                self.misses += 1
+                return None
+            self._disk.move_to_end(key)
+            self.hits += 1
+
+        try:
+            os.utime(entry[0])
+        except OSError:
+            pass
+        return entry[0]
+
+    def get_bytes(self, key: str) -> Optional[bytes]:
+        """
+        Get the cached encoded audio for a key.
+
+        Parameters
+        ----------
+        key : str
+            Key from `tts_cache_key`.
+
+        Returns
+        -------
+        Optional[bytes]
+            The encoded audio, or None on a miss.
+        """
+        path = self.get_path(key)
+        if path is None:
+            return None
+        try:
+            with open(path, "rb") as f:
+                return f.read()
+        except OSError as e:
+            logging.warning(f"TTS cache read error for {path}: {e}")
+            return None
+
+    def get_pcm(self, key: str) -> Optional[Tuple[np.ndarray, int]]:
+        """
+        Get the decoded audio for a key, decoding and memoizing it on first
+        use.
+
+        Parameters
+        ----------
+        key : str
+            Key from `tts_cache_key`.
+
+        Returns
+        -------
+        Optional[Tuple[np.ndarray, int]]
+            The samples and the sample rate, or None on a miss or if the audio
+            cannot be decoded.
+        """
+        with self._lock:
+            pcm = self._memory.get(key)
+            if pcm is not None:
+                self._memory.move_to_end(key)
+                self.hits += 1
+                return pcm
+
+        path = self.get_path(key)
+        if path is None:
+            return None
+
+        try:
+            import soundfile as sf
+
+            samples, sample_rate = sf.read(path, dtype="float32")
+        except Exception as e:
+            logging.warning(f"TTS cache unable to decode {path}: {e}")
+            return None
+
+        pcm = (samples, int(sample_rate))
+        with self._lock:
+            if key not in self._memory:
+                self._memory[key] = pcm
+                self._memory_bytes += samples.nbytes
+            self._evict_memory()
+        return pcm
+
+    def put_bytes(self, key: str, data: bytes, ext: str = "wav") -> Optional[str]:
+        """
+        Store encoded audio.
+
+        Parameters
+        ----------
+        key : str
+            Key from `tts_cache_key`.
+        data : bytes
+            The encoded audio.
+        ext : str
+            File extension of the audio format, such as "wav" or "mp3".
+
+        Returns
+        -------
+        Optional[str]
+            Path of the cached file, or None if it could not be stored.
+        """
+        path = os.path.join(self.cache_dir, f"{key}.{ext}")
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        try:
+            with open(tmp_path, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logging.error(f"TTS cache write error for {path}: {e}")
+            return None
+
+        self._add_disk(key, path, len(data))
+        return path
+
+    def put_file(self, key: str, source_path: str) -> Optional[str]:
+        """
+        Move a freshly synthesized audio file into the cache.
+
+        Parameters
+        ----------
+        key : str
+            Key from `tts_cache_key`.
+        source_path : str
+            The audio file. It is moved, so the caller must not use or delete
+            it afterwards.
+
+        Returns
+        -------
+        Optional[str]
+            Path of the cached file, or None if it could not be stored.
+        """
+        ext = os.path.splitext(source_path)[1].lstrip(".") or "wav"
+        path = os.path.join(self.cache_dir, f"{key}.{ext}")
+        try:
+            size = os.path.getsize(source_path)
+            tmp_path = f"{path}.{threading.get_ident()}.tmp"
+            shutil.move(source_path, tmp_path)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logging.error(f"TTS cache unable to store {source_path}: {e}")
+            return None
+
+        self._add_disk(key, path, size)
+        return path
+
+    def contains(self, key: str) -> bool:
+        """
+        Check for a key without counting a hit or a miss.
+        """
+        with self._lock:
+            return key in self._disk
+
+    def owns(self, path: str) -> bool:
+        """
+        Whether a path is a file of the cache, which callers must not delete.
+        """
+        return os.path.dirname(os.path.abspath(path)) == self.cache_dir
+
+    def warm_up(
+        self,
+        phrases: Iterable[str],
+        render: Callable[[str], None],
+        background: bool = True,
+    ) -> Optional[threading.Thread]:
+        """
+        Pre-render phrases at boot so their first use is already a hit.
+
+        Parameters
+        ----------
+        phrases : Iterable[str]
+            The phrases to render.
+        render : Callable[[str], None]
+            Connector specific function that synthesizes a phrase and stores
+            it in the cache if it is missing.
+        background : bool
+            Run the warm-up on a daemon thread.
+
+        Returns
+        -------
+        Optional[threading.Thread]
+            The warm-up thread, if run in the background.
+        """
+        phrases = [phrase for phrase in phrases if phrase and phrase.strip()]
+        if not phrases:
+            return None
+
+        def run():
+            start = time.time()
+            for phrase in phrases:
+                try:
+                    render(phrase)
+                except Exception as e:
+                    logging.warning(f"TTS cache warm-up failed for '{phrase}': {e}")
+            logging.info(
+                f"TTS cache warmed up {len(phrases)} phrases "
+                f"in {round(time.time() - start, 2)} s"
+            )
+
+        if not background:
+            run()
+            return None
+
+        thread = threading.Thread(target=run, daemon=True)
+        thread.start()
+        return thread
+
+    def stats(self) -> Dict[str, float]:
+        """
+        Cache statistics.
+        """
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "disk_entries": len(self._disk),
+                "disk_bytes": self._disk_bytes,
+                "memory_entries": len(self._memory),
+                "memory_bytes": self._memory_bytes,
+            }
+
+    def _add_disk(self, key: str, path: str, size: int):
+        with self._lock:
+            previous = self._disk.pop(key, None)
+            if previous is not None:
+                self._disk_bytes -= previous[1]
+                if previous[0] != path:
+                    self._remove_file(previous[0])
+            self._disk[key] = (path, size)
+            self._disk_bytes += size
+
+            pcm = self._memory.pop(key, None)
+            if pcm is not None:
+                self._memory_bytes -= pcm[0].nbytes
+
+            self._evict_disk()
+
+    def _drop_disk(self, key: str):
+        path, size = self._disk.pop(key)
+        self._disk_bytes -= size
+        self._remove_file(path)
+        pcm = self._memory.pop(key, None)
+        if pcm is not None:
+            self._memory_bytes -= pcm[0].nbytes
+
+    def _evict_disk(self):
+        while self._disk_bytes > self.max_disk_bytes and len(self._disk) > 1:
+            self._drop_disk(next(iter(self._disk)))
+
+    def _evict_memory(self):
+        while self._memory_bytes > self.max_memory_bytes and self._memory:
+            _, (samples, _) = self._memory.popitem(last=False)
+            self._memory_bytes -= samples.nbytes
+
+    @staticmethod
+    def _remove_file(path: str):
+        try:
+            os.unlink(path)
+        except OSError:
+            pass
@@ -1,13 +1,13 @@
 import inspect
-import json
 import logging
 import os
 from datetime import datetime
-from typing import Dict, Optional
+from typing import Dict, List, Optional, Tuple
 
 from zenoh_msgs import Header, Point, Pose, PoseStamped, Quaternion, Time
 
 from .function_call_provider import FunctionGenerator, LLMFunction
+from .location_index import LocationIndex, LocationJournal, normalize_name
 from .singleton import singleton
 from .unitree_go2_amcl_provider import UnitreeGo2AMCLProvider
 from .unitree_go2_navigation_provider import UnitreeGo2NavigationProvider
@@ -19,12 +19,17 @@ class UnitreeGo2LocationProvider:
     Location Provider for Unitree Go2 robot that can be used as function calls for LLM.
     Provides functionality to record, retrieve, and navigate to saved locations.
     Uses existing NavigationProvider and AMCLProvider for core functionality.
+
+    Locations are indexed by position for nearest and radius queries and by
+    name for fuzzy and phonetic lookups, and persisted as an append-only
+    journal next to the locations file.
     """
 
     def __init__(
         self,
         locations_folder_path: str = "locations",
         locations_file_name: str = "locations.json",
+        compact_after: int = 200,
     ):
         """
         Initialize the Unitree Go2 Location Provider.
@@ -35,6 +40,9 @@ class UnitreeGo2LocationProvider:
             The directory to store the locations file (default is "locations").
         locations_file_name : str, optional
             The file to store saved locations (default is "locations.json").
+        compact_after : int, optional
+            Number of journal entries after which the journal is folded back
+            into the locations file (default is 200).
         """
         self.navigation_provider = UnitreeGo2NavigationProvider()
         self.amcl_provider = UnitreeGo2AMCLProvider()
@@ -47,10 +55,13 @@ class UnitreeGo2LocationProvider:
             self.locations_folder_path, locations_file_name
         )
 
+        self.journal = LocationJournal(self.locations_file, compact_after)
+        self.index = LocationIndex()
+
         self.locations: Dict[str, Dict] = self._load_locations()
         if self.locations:
             logging.info(
-                f"Loaded {self.locations_file} with {self.locations} saved locations"
+                f"Loaded {self.locations_file} with {len(self.locations)} saved locations"
             )
 
         self.running: bool = False
@@ -59,31 +70,95 @@ class UnitreeGo2LocationProvider:
 
     def _load_locations(self) -> Dict[str, Dict]:
         """
-        Load saved locations from file.
+        Load saved locations from file and replay the journal.
         Returns
         -------
         Dict[str, Dict]
             Dictionary containing saved locations.
         """
-        if os.path.exists(self.locations_file):
-            try:
-                with open(self.locations_file, "r") as f:
-                    return json.load(f)
-            except Exception as e:
-                logging.error(f"Error loading locations file: {e}")
-                return {}
-        return {}
+        locations = self.journal.load()
+        for name, location in locations.items():
+            self._index_location(name, location)
+        if self.journal.entries:
+            self._compact(locations)
+        return locations
+
+    def _index_location(self, name: str, location: Dict):
+        """
+        Add a location to the spatial and name index.
+        """
+        try:
+            position = location["pose"]["position"]
+            self.index.add(name, float(position["x"]), float(position["y"]))
+        except (KeyError, TypeError, ValueError) as e:
+            logging.error(f"Location '{name}' has no valid position: {e}")
 
-    def _save_locations(self):
+    def _compact(self, locations: Dict[str, Dict]):
         """
-        Save locations to file.
+        Fold the journal back into the locations file.
         """
         try:
-            with open(self.locations_file, "w") as f:
-                json.dump(self.locations, f, indent=2)
-            logging.info(f"Saved locations to {self.locations_file}")
+            self.journal.compact(locations)
+        except Exception as e:
+            logging.error(f"Error compacting locations file: {e}")
+
+    def _save_location(self, location_name: str):
+        """
+        Persist one added, changed or deleted location.
+
+        Parameters
+        ----------
+        location_name : str
+            The location that changed. It is journaled as deleted if it is
+            no longer in `self.locations`.
+        """
+        try:
+            if location_name in self.locations:
+                self.journal.append("put", location_name, self.locations[location_name])
+            else:
+                self.journal.append("delete", location_name)
+            logging.info(
+                f"Saved location '{location_name}' to {self.journal.journal_file}"
+            )
         except Exception as e:
             logging.error(f"Error saving locations file: {e}")
+            return
+
+        if self.journal.needs_compaction():
+            self._compact(self.locations)
+
+    def _resolve(self, location_name: str) -> Tuple[Optional[str], List]:
+        """
+        Resolve a possibly misheard location name to a saved location.
+
+        Parameters
+        ----------
+        location_name : str
+            The name as given.
+
+        Returns
+        -------
+        Tuple[Optional[str], List]
+            The saved name, or None, and the closest candidates.
+        """
+        name, candidates = self.index.resolve(location_name)
+        if name is not None and normalize_name(location_name) != name:
+            logging.info(f"Resolved location '{location_name}' to '{name}'")
+        return name, candidates
+
+    def _not_found(self, location_name: str, candidates: List) -> Dict:
+        """
+        Failure response that suggests the closest saved names.
+        """
+        message = f"Location '{location_name}' not found"
+        suggestions = [name for name, score in candidates if score >= 0.5]
+        if suggestions:
+            message += f". Did you mean: {', '.join(suggestions)}?"
+        return {
+            "success": False,
+            "message": message,
+            "suggestions": suggestions,
+        }
 
     def start(self):
         """
@@ -108,7 +183,7 @@ class UnitreeGo2LocationProvider:
         Dict
             Dictionary containing function schemas for LLM.
         """
-        return FunctionGenerator.generate_functions_from_class(self.__class__)
+        return FunctionGenerator.generate_functions_from_class(self)
 
     def get_llm_function_mapping(self) -> Dict:
         """
@@ -126,7 +201,9 @@ class UnitreeGo2LocationProvider:
                 mapping[getattr(method, "_llm_name")] = method
         return mapping
 
-    @LLMFunction("Get the robot's current location and localization status")
+    @LLMFunction(
+        "Get the robot's current location and localization status", read_only=True
+    )
     def get_current_location(self) -> Dict:
         """
         Get the current location of the robot.
@@ -190,7 +267,12 @@ class UnitreeGo2LocationProvider:
         Dict
             Dictionary containing success status and message.
         """
-        location_name = location_name.strip().lower()
+        location_name = normalize_name(location_name)
+        if not location_name:
+            return {
+                "success": False,
+                "message": "Cannot record location: Location name is empty",
+            }
 
         if not self.amcl_provider.is_localized:
             return {
@@ -225,7 +307,8 @@ class UnitreeGo2LocationProvider:
         }
 
         self.locations[location_name] = location_data
-        self._save_locations()
+        self._index_location(location_name, location_data)
+        self._save_location(location_name)
 
         return {
             "success": True,
@@ -233,7 +316,7 @@ class UnitreeGo2LocationProvider:
             "location_data": location_data,
         }
 
-    @LLMFunction("Get all saved locations")
+    @LLMFunction("Get all saved locations", read_only=True)
     def get_saved_locations(self) -> Dict:
         """
         Get all saved locations.
@@ -248,7 +331,9 @@ class UnitreeGo2LocationProvider:
             "locations": self.locations,
         }
 
-    @LLMFunction("Get detailed information about a specific saved location")
+    @LLMFunction(
+        "Get detailed information about a specific saved location", read_only=True
+    )
     def get_location_info(self, location_name: str) -> Dict:
         """
         Get information about a specific saved location.
@@ -261,13 +346,10 @@ class UnitreeGo2LocationProvider:
         Dict
             Dictionary containing location information.
         """
-        location_name = location_name.strip().lower()
-
-        if location_name not in self.locations:
-            return {
-                "success": False,
-                "message": f"Location '{location_name}' not found",
-            }
+        name, candidates = self._resolve(location_name)
+        if name is None:
+            return self._not_found(location_name, candidates)
+        location_name = name
 
         return {
             "success": True,
@@ -288,13 +370,10 @@ class UnitreeGo2LocationProvider:
         Dict
             Dictionary containing navigation command status.
         """
-        location_name = location_name.strip().lower()
-
-        if location_name not in self.locations:
-            return {
-                "success": False,
-                "message": f"Location '{location_name}' not found",
-            }
+        name, candidates = self._resolve(location_name)
+        if name is None:
+            return self._not_found(location_name, candidates)
+        location_name = name
 
         location_data = self.locations[location_name]
         pose_data = location_data["pose"]
@@ -349,16 +428,16 @@ class UnitreeGo2LocationProvider:
         Dict
             Dictionary containing deletion status.
         """
-        location_name = location_name.strip().lower()
-
-        if location_name not in self.locations:
-            return {
-                "success": False,
-                "message": f"Location '{location_name}' not found",
-            }
+        # deleting is never done on a fuzzy match
+        name = self.index.lookup(location_name)
+        if name is None or name not in self.locations:
+            _, candidates = self._resolve(location_name)
+            return self._not_found(location_name, candidates)
+        location_name = name
 
         deleted_location = self.locations.pop(location_name)
-        self._save_locations()
+        self.index.remove(location_name)
+        self._save_location(location_name)
 
         return {
             "success": True,
@@ -366,7 +445,7 @@ class UnitreeGo2LocationProvider:
             "deleted_location": deleted_location,
         }
 
-    @LLMFunction("Get current navigation and localization status")
+    @LLMFunction("Get current navigation and localization status", read_only=True)
     def get_navigation_status(self) -> Dict:
         """
         Get current navigation status.
@@ -382,7 +461,7 @@ class UnitreeGo2LocationProvider:
             "localization_status": self.amcl_provider.is_localized,
         }
 
-    @LLMFunction("Get a list of all saved location names")
+    @LLMFunction("Get a list of all saved location names", read_only=True)
     def list_location_names(self) -> Dict:
         """
         Get a list of all saved location names.
@@ -398,7 +477,10 @@ class UnitreeGo2LocationProvider:
             "location_names": location_names,
         }
 
-    @LLMFunction("Calculate the distance from current position to a saved location")
+    @LLMFunction(
+        "Calculate the distance from current position to a saved location",
+        read_only=True,
+    )
     def get_distance_to_location(self, location_name: str) -> Dict:
         """
         Calculate approximate distance to a saved location.
@@ -411,13 +493,10 @@ class UnitreeGo2LocationProvider:
         Dict
             Dictionary containing distance information.
         """
-        location_name = location_name.strip().lower()
-
-        if location_name not in self.locations:
-            return {
-                "success": False,
-                "message": f"Location '{location_name}' not found",
-            }
+        name, candidates = self._resolve(location_name)
+        if name is None:
+            return self._not_found(location_name, candidates)
+        location_name = name
 
         if not self.amcl_provider.is_localized:
             return {
@@ -452,6 +531,109 @@ class UnitreeGo2LocationProvider:
             },
         }
 
+    def _current_xy(self) -> Optional[Tuple[float, float]]:
+        """
+        The robot's map position, or None if it is not localized.
+        """
+        if not self.amcl_provider.is_localized:
+            return None
+        current_pose = self.amcl_provider.pose
+        if current_pose is None:
+            return None
+        return current_pose.position.x, current_pose.position.y
+
+    @LLMFunction(
+        "Find the saved locations closest to the robot's current position",
+        read_only=True,
+    )
+    def find_nearest_locations(self, count: int = 3) -> Dict:
+        """
+        Find the saved locations nearest to the current position.
+        Parameters
+        ----------
+        count : int
+            Maximum number of locations to return.
+        Returns
+        -------
+        Dict
+            Dictionary containing the nearest locations and their distances.
+        """
+        position = self._current_xy()
+        if position is None:
+            return {
+                "success": False,
+                "message": "Cannot find nearby locations: Robot is not properly localized",
+            }
+
+        nearest = self.index.nearest(*position, count=max(1, int(count)))
+        return {
+            "success": True,
+            "message": f"Found {len(nearest)} nearest locations",
+            "locations": [
+                {"name": name, "distance_meters": round(distance, 2)}
+                for name, distance in nearest
+            ],
+        }
+
+    @LLMFunction(
+        "Find all saved locations within a radius of the robot", read_only=True
+    )
+    def find_locations_within(self, radius_meters: float) -> Dict:
+        """
+        Find the saved locations within a radius of the current position.
+        Parameters
+        ----------
+        radius_meters : float
+            Search radius in meters.
+        Returns
+        -------
+        Dict
+            Dictionary containing the locations in range and their distances.
+        """
+        position = self._current_xy()
+        if position is None:
+            return {
+                "success": False,
+                "message": "Cannot find nearby locations: Robot is not properly localized",
+            }
+
+        found = self.index.within(*position, float(radius_meters))
+        return {
+            "success": True,
+            "message": f"Found {len(found)} locations within {radius_meters} meters",
+            "locations": [
+                {"name": name, "distance_meters": round(distance, 2)}
+                for name, distance in found
+            ],
+        }
+
+    @LLMFunction(
+        "Search saved location names that sound like or are spelled like a name",
+        read_only=True,
+    )
+    def search_location_names(self, query: str) -> Dict:
+        """
+        Search saved location names, tolerating misheard or misspelled names.
+        Parameters
+        ----------
+        query : str
+            The name to look for.
+        Returns
+        -------
+        Dict
+            Dictionary containing the best matching names and their scores.
+        """
+        matches = [
+            {"name": name, "score": score}
+            for name, score in self.index.search(query)
+            if score >= 0.5
+        ]
+        return {
+            "success": True,
+            "message": f"Found {len(matches)} locations matching '{query}'",
+            "matches": matches,
+        }
+
     @LLMFunction("Update the description of a saved location")
     def update_location_description(
         self, location_name: str, new_description: str
@@ -469,18 +651,15 @@ class UnitreeGo2LocationProvider:
         Dict
             Dictionary containing update status.
         """
-        location_name = location_name.strip().lower()
-
-        if location_name not in self.locations:
-            return {
-                "success": False,
-                "message": f"Location '{location_name}' not found",
-            }
+        name, candidates = self._resolve(location_name)
+        if name is None:
+            return self._not_found(location_name, candidates)
+        location_name = name
 
         old_description = self.locations[location_name]["description"]
         self.locations[location_name]["description"] = new_description
         self.locations[location_name]["last_updated"] = datetime.now().isoformat()
-        self._save_locations()
+        self._save_location(location_name)
 
         return {
             "success": True,
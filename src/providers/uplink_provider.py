@@ -0,0 +1,524 @@
+import gzip
+import json
+import logging
+import os
+import random
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from .singleton import singleton
+
+
+@dataclass
+class UplinkChannel:
+    """
+    Configuration of a single uplink destination.
+
+    Parameters
+    ----------
+    name : str
+        Unique name of the channel (e.g. "fabric", "teleops_status").
+    url : str
+        Endpoint the payloads are POSTed to.
+    api_key : Optional[str]
+        Bearer token used for the Authorization header.
+    success_codes : Tuple[int, ...]
+        HTTP status codes that acknowledge a delivery.
+    batch_size : int
+        Maximum number of payloads per request. A value of 1 keeps the
+        single-object wire format; larger values send a JSON list.
+    linger_s : float
+        How long a partial batch may wait for more payloads before it is sent.
+    compress : bool
+        If True, request bodies are gzip compressed.
+    coalesce : bool
+        If True, only the latest pending payload is kept (status-style data).
+    max_queue : int
+        Maximum number of pending payloads before the oldest are dropped.
+    max_attempts : int
+        Number of server-side failures (5xx/429) tolerated per batch before it
+        is discarded. Connection errors never count against this limit, so
+        payloads survive arbitrarily long outages.
+    """
+
+    name: str
+    url: str
+    api_key: Optional[str] = None
+    success_codes: Tuple[int, ...] = (200, 201)
+    batch_size: int = 1
+    linger_s: float = 0.5
+    compress: bool = False
+    coalesce: bool = False
+    max_queue: int = 10000
+    max_attempts: int = 5
+
+
+@dataclass
+class UplinkMetrics:
+    """
+    Delivery and backpressure counters for a single channel.
+    """
+
+    enqueued: int = 0
+    sent: int = 0
+    dropped: int = 0
+    failed_attempts: int = 0
+    requests: int = 0
+    bytes_sent: int = 0
+    queue_depth: int = 0
+    backoff_s: float = 0.0
+    last_latency_s: float = 0.0
+    last_error: Optional[str] = None
+    last_success_ts: float = 0.0
+
+    def to_dict(self) -> dict:
+        """
+        Convert the UplinkMetrics object to a dictionary.
+
+        Returns
+        -------
+        dict
+            Dictionary representation of the UplinkMetrics object.
+        """
+        return {
+            "enqueued": self.enqueued,
+            "sent": self.sent,
+            "dropped": self.dropped,
+            "failed_attempts": self.failed_attempts,
+            "requests": self.requests,
+            "bytes_sent": self.bytes_sent,
+            "queue_depth": self.queue_depth,
+            "backoff_s": self.backoff_s,
+            "last_latency_s": self.last_latency_s,
+            "last_error": self.last_error,
+            "last_success_ts": self.last_success_ts,
+        }
+
+
+class UplinkQueue:
+    """
+    Durable, SQLite backed FIFO of pending uplink payloads.
+
+    Parameters
+    ----------
+    path : str
+        Path of the SQLite database file. Use ":memory:" for a volatile queue.
+    """
+
+    def __init__(self, path: str = ":memory:"):
+        if path != ":memory:":
+            directory = os.path.dirname(path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS uplink (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                channel TEXT NOT NULL,
+                payload TEXT NOT NULL,
+                created REAL NOT NULL,
+                attempts INTEGER NOT NULL DEFAULT 0
+            )
+            """
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS uplink_channel ON uplink (channel, id)"
+        )
+        self._conn.commit()
+
+    def put(self, channel: str, payload: dict, coalesce: bool = False) -> None:
+        """
+        Append a payload to a channel.
+
+        Parameters
+        ----------
+        channel : str
+            The channel name.
+        payload : dict
+            JSON serializable payload.
+        coalesce : bool
+            If True, pending payloads of the channel are replaced.
+        """
+        data = json.dumps(payload, separators=(",", ":"))
+        with self._lock, self._conn:
+            if coalesce:
+                self._conn.execute("DELETE FROM uplink WHERE channel = ?", (channel,))
+            self._conn.execute(
+                "INSERT INTO uplink (channel, payload, created) VALUES (?, ?, ?)",
+                (channel, data, time.time()),
+            )
+
+    def peek(self, channel: str, limit: int) -> List[Tuple[int, str, float, int]]:
+        """
+        Return the oldest pending payloads of a channel without removing them.
+
+        Parameters
+        ----------
+        channel : str
+            The channel name.
+        limit : int
+            Maximum number of payloads to return.
+
+        Returns
+        -------
+        List[Tuple[int, str, float, int]]
+            Rows of (id, serialized payload, created timestamp, attempts).
+        """
+        with self._lock:
+            cursor = self._conn.execute(
+                "SELECT id, payload, created, attempts FROM uplink "
+                "WHERE channel = ? ORDER BY id LIMIT ?",
+                (channel, limit),
+            )
+            return cursor.fetchall()
+
+    def ack(self, ids: List[int]) -> None:
+        """
+        Remove delivered (or discarded) payloads.
+
+        Parameters
+        ----------
+        ids : List[int]
+            Row ids returned by `peek`.
+        """
+        if not ids:
+            return
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "DELETE FROM uplink WHERE id = ?", [(i,) for i in ids]
+            )
+
+    def increment_attempts(self, ids: List[int]) -> None:
+        """
+        Record a failed delivery attempt for the given payloads.
+
+        Parameters
+        ----------
+        ids : List[int]
+            Row ids returned by `peek`.
+        """
+        if not ids:
+            return
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "UPDATE uplink SET attempts = attempts + 1 WHERE id = ?",
+                [(i,) for i in ids],
+            )
+
+    def depth(self, channel: str) -> int:
+        """
+        Number of pending payloads of a channel.
+        """
+        with self._lock:
+            cursor = self._conn.execute(
+                "SELECT COUNT(*) FROM uplink WHERE channel = ?", (channel,)
+            )
+            return cursor.fetchone()[0]
+
+    def trim(self, channel: str, max_items: int) -> int:
+        """
+        Drop the oldest payloads of a channel beyond `max_items`.
+
+        Returns
+        -------
+        int
+            Number of dropped payloads.
+        """
+        with self._lock, self._conn:
+            cursor = self._conn.execute(
+                "DELETE FROM uplink WHERE id IN ("
+                "SELECT id FROM uplink WHERE channel = ? ORDER BY id DESC "
+                "LIMIT -1 OFFSET ?)",
+                (channel, max_items),
+            )
+            return cursor.rowcount
+
+    def close(self) -> None:
+        """
+        Close the underlying database connection.
+        """
+        with self._lock:
+            self._conn.close()
+
+
+@singleton
+class UplinkProvider:
+    """
+    Store-and-forward uplink shared by all telemetry producers.
+
+    Payloads are persisted in an `UplinkQueue` and delivered by a single worker
+    thread over a pooled keep-alive `requests.Session`. Payloads are batched and
+    optionally gzip compressed per channel, and failed deliveries are retried
+    with exponential backoff so that nothing is lost while connectivity is down.
+
+    Parameters
+    ----------
+    db_path : str
+        Location of the durable queue. Default is "dump/uplink.sqlite".
+    timeout : Tuple[float, float]
+        Connect and read timeout for every request.
+    backoff_base_s : float
+        Initial retry delay after a failed delivery.
+    backoff_max_s : float
+        Upper bound of the retry delay.
+    """
+
+    def __init__(
+        self,
+        db_path: str = "dump/uplink.sqlite",
+        timeout: Tuple[float, float] = (3.05, 10.0),
+        backoff_base_s: float = 0.5,
+        backoff_max_s: float = 60.0,
+    ):
+        self.queue = UplinkQueue(db_path)
+        self.timeout = timeout
+        self.backoff_base_s = backoff_base_s
+        self.backoff_max_s = backoff_max_s
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=4)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+        self._channels: Dict[str, UplinkChannel] = {}
+        self._metrics: Dict[str, UplinkMetrics] = {}
+        self._next_attempt: Dict[str, float] = {}
+        self._failures: Dict[str, int] = {}
+
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._running = False
+        self._thread: Optional[threading.Thread] = None
+
+    def register_channel(self, channel: UplinkChannel) -> None:
+        """
+        Register (or update) an uplink channel and make sure the worker runs.
+
+        Parameters
+        ----------
+        channel : UplinkChannel
+            The channel configuration.
+        """
+        with self._lock:
+            self._channels[channel.name] = channel
+            self._metrics.setdefault(channel.name, UplinkMetrics())
+            self._next_attempt.setdefault(channel.name, 0.0)
+            self._failures.setdefault(channel.name, 0)
+        self.start()
+        self._wakeup.set()
+
+    def enqueue(self, channel_name: str, payload: dict) -> None:
+        """
+        Queue a payload for delivery. Never blocks on the network.
+
+        Parameters
+        ----------
+        channel_name : str
+            Name of a registered channel.
+        payload : dict
+            JSON serializable payload.
+        """
+        channel = self._channels.get(channel_name)
+        if channel is None:
+            logging.error(f"Uplink channel {channel_name} is not registered")
+            return
+
+        try:
+            self.queue.put(channel.name, payload, coalesce=channel.coalesce)
+        except Exception as e:
+            logging.error(f"Error queueing uplink payload for {channel.name}: {e}")
+            return
+
+        metrics = self._metrics[channel.name]
+        metrics.enqueued += 1
+
+        dropped = self.queue.trim(channel.name, channel.max_queue)
+        if dropped:
+            metrics.dropped += dropped
+            logging.warning(
+                f"Uplink {channel.name} backlog full, dropped {dropped} oldest payloads"
+            )
+
+        self._wakeup.set()
+
+    def metrics(self) -> Dict[str, dict]:
+        """
+        Get delivery and backpressure metrics for all channels.
+
+        Returns
+        -------
+        Dict[str, dict]
+            Mapping of channel name to its metrics.
+        """
+        result = {}
+        for name, metrics in list(self._metrics.items()):
+            metrics.queue_depth = self.queue.depth(name)
+            metrics.backoff_s = max(0.0, self._next_attempt[name] - time.time())
+            result[name] = metrics.to_dict()
+        return result
+
+    def start(self) -> None:
+        """
+        Start the delivery worker thread.
+        """
+        if self._thread and self._thread.is_alive():
+            return
+
+        self._running = True
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """
+        Stop the delivery worker thread. Pending payloads stay queued on disk.
+        """
+        self._running = False
+        self._wakeup.set()
+        if self._thread:
+            self._thread.join(timeout=timeout)
+            self._thread = None
+
+    def flush(self, timeout: float = 10.0) -> bool:
+        """
+        Block until all queues are empty or the timeout expires.
+
+        Returns
+        -------
+        bool
+            True if every queue was drained.
+        """
+        deadline = time.time() + timeout
+        while time.time() < deadline:
+            if all(self.queue.depth(name) == 0 for name in list(self._channels)):
+                return True
+            self._wakeup.set()
+            time.sleep(0.05)
+        return False
+
+    def _run(self) -> None:
+        """
+        Worker loop delivering queued payloads for every channel.
+        """
+        while self._running:
+            self._wakeup.clear()
+            wait_s = 1.0
+            for channel in list(self._channels.values()):
+                try:
+                    channel_wait = self._service_channel(channel)
+                except Exception as e:
+                    logging.error(f"Uplink {channel.name} worker error: {e}")
+                    channel_wait = 1.0
+                wait_s = min(wait_s, channel_wait)
+            if wait_s > 0:
+                self._wakeup.wait(wait_s)
+
+    def _service_channel(self, channel: UplinkChannel) -> float:
+        """
+        Deliver at most one batch for a channel.
+
+        Returns
+        -------
+        float
+            Seconds until the channel needs attention again.
+        """
+        now = time.time()
+        next_attempt = self._next_attempt[channel.name]
+        if now < next_attempt:
+            return next_attempt - now
+
+        rows = self.queue.peek(channel.name, channel.batch_size)
+        if not rows:
+            return 1.0
+
+        oldest_age = now - rows[0][2]
+        if len(rows) < channel.batch_size and oldest_age < channel.linger_s:
+            return channel.linger_s - oldest_age
+
+        ids = [row[0] for row in rows]
+        payloads = [row[1] for row in rows]
+        if channel.batch_size == 1:
+            body = payloads[0].encode("utf-8")
+        else:
+            body = ("[" + ",".join(payloads) + "]").encode("utf-8")
+
+        headers = {"Content-Type": "application/json"}
+        if channel.api_key:
+            headers["Authorization"] = f"Bearer {channel.api_key}"
+        if channel.compress:
+            body = gzip.compress(body)
+            headers["Content-Encoding"] = "gzip"
+
+        metrics = self._metrics[channel.name]
+        metrics.requests += 1
+        start = time.time()
+        try:
+            response = self.session.post(
+                channel.url, data=body, headers=headers, timeout=self.timeout
+            )
+        except requests.RequestException as e:
+            # Network is down; keep everything and retry later.
+            metrics.failed_attempts += 1
+            metrics.last_error = str(e)
+            logging.debug(f"Uplink {channel.name} connection error: {e}")
+            return self._schedule_retry(channel)
+
+        metrics.last_latency_s = time.time() - start
+
+        if response.status_code in channel.success_codes:
+            self.queue.ack(ids)
+            metrics.sent += len(ids)
+            metrics.bytes_sent += len(body)
+            metrics.last_success_ts = time.time()
+            self._failures[channel.name] = 0
+            self._next_attempt[channel.name] = 0.0
+            logging.debug(f"Uplink {channel.name} delivered {len(ids)} payloads")
+            return 0.0
+
+        metrics.failed_attempts += 1
+        metrics.last_error = f"{response.status_code} - {response.text[:200]}"
+
+        if response.status_code == 429 or response.status_code >= 500:
+            self.queue.increment_attempts(ids)
+            expired = [row[0] for row in rows if row[3] + 1 >= channel.max_attempts]
+            if expired:
+                self.queue.ack(expired)
+                metrics.dropped += len(expired)
+                logging.error(
+                    f"Uplink {channel.name} giving up on {len(expired)} payloads: {metrics.last_error}"
+                )
+            return self._schedule_retry(channel)
+
+        # Any other status means the payload itself was rejected.
+        self.queue.ack(ids)
+        metrics.dropped += len(ids)
+        logging.error(f"Uplink {channel.name} rejected payload: {metrics.last_error}")
+        return 0.0
+
+    def _schedule_retry(self, channel: UplinkChannel) -> float:
+        """
+        Compute the next retry time using exponential backoff with jitter.
+
+        Returns
+        -------
+        float
+            Seconds until the next attempt.
+        """
+        failures = self._failures[channel.name] + 1
+        self._failures[channel.name] = failures
+        # the exponent is clamped so a long outage cannot overflow the float
+        exponent = min(failures - 1, 20)
+        delay = min(self.backoff_max_s, self.backoff_base_s * (2**exponent))
+        delay *= random.uniform(0.8, 1.2)
+        self._next_attempt[channel.name] = time.time() + delay
+        return delay
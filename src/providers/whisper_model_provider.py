@@ -0,0 +1,346 @@
+import logging
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+from .singleton import singleton
+
+# (model_size, device, compute_type)
+ModelKey = Tuple[str, str, str]
+
+
+def _load_whisper_model(
+    model_size: str, device: str, compute_type: str, **kwargs
+) -> Any:
+    """
+    Load a Faster-Whisper model.
+
+    Parameters
+    ----------
+    model_size : str
+        Model name such as "tiny.en", or a path to a converted model.
+    device : str
+        "cpu", "cuda" or "auto".
+    compute_type : str
+        CTranslate2 compute type such as "int8".
+    **kwargs
+        Other WhisperModel arguments, e.g. cpu_threads.
+
+    Returns
+    -------
+    faster_whisper.WhisperModel
+        The loaded model.
+    """
+    from faster_whisper import WhisperModel
+
+    return WhisperModel(model_size, device=device, compute_type=compute_type, **kwargs)
+
+
+@dataclass
+class _ModelEntry:
+    key: ModelKey
+    lock: threading.Lock = field(default_factory=threading.Lock)
+    model: Any = None
+    refs: int = 0
+    pinned: bool = False
+    released_at: float = 0.0
+    load_s: float = 0.0
+
+
+class WhisperModelHandle:
+    """
+    A shared reference to a loaded Whisper model.
+
+    Release the handle when the model is no longer needed; it can also be
+    used as a context manager. Releasing twice is harmless.
+
+    Parameters
+    ----------
+    provider : WhisperModelProvider
+        The registry that owns the model.
+    key : ModelKey
+        (model_size, device, compute_type) of the model.
+    model : faster_whisper.WhisperModel
+        The shared model.
+    """
+
+    def __init__(self, provider: "WhisperModelProvider", key: ModelKey, model: Any):
+        self.provider = provider
+        self.key = key
+        self.model = model
+        self.released = False
+
+    def release(self) -> None:
+        """
+        Give the reference back to the registry.
+        """
+        if self.released:
+            return
+        self.released = True
+        self.provider._release(self.key)
+
+    def __enter__(self) -> Any:
+        return self.model
+
+    def __exit__(self, *exc) -> None:
+        self.release()
+
+
+@singleton
+class WhisperModelProvider:
+    """
+    Process-wide registry of Faster-Whisper models.
+
+    Each (model_size, device, compute_type) is loaded once and shared by all
+    ASR inputs, including the inputs rebuilt on every mode switch. Models
+    are reference counted; a model nobody holds is unloaded after
+    `idle_timeout` seconds unless it was preloaded at boot.
+
+    Parameters
+    ----------
+    idle_timeout : float
+        Seconds an unreferenced model stays loaded; 0 or less keeps models
+        until `evict_idle` is called with `force=True`.
+    """
+
+    def __init__(self, idle_timeout: float = 300.0):
+        self.idle_timeout = idle_timeout
+
+        self._entries: Dict[ModelKey, _ModelEntry] = {}
+        self._lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._timer: Optional[threading.Timer] = None
+
+    @staticmethod
+    def key(
+        model_size: str, device: str = "cpu", compute_type: str = "int8"
+    ) -> ModelKey:
+        return (model_size, device, compute_type)
+
+    def _entry(
+        self, key: ModelKey, ref: bool = False, pin: bool = False
+    ) -> _ModelEntry:
+        # looked up and referenced under one lock, so eviction cannot drop
+        # an entry that is about to be used
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                entry = self._entries[key] = _ModelEntry(key)
+            entry.refs += int(ref)
+            entry.pinned = entry.pinned or pin
+            return entry
+
+    def _ensure_loaded(self, entry: _ModelEntry, **kwargs) -> Any:
+        # the per-model lock makes concurrent acquires wait for one load
+        with entry.lock:
+            if entry.model is None:
+                started = time.time()
+                logging.info(f"Loading Faster-Whisper model {entry.key}")
+                entry.model = _load_whisper_model(*entry.key, **kwargs)
+                entry.load_s = time.time() - started
+                logging.info(
+                    f"Loaded Faster-Whisper model {entry.key} in {entry.load_s:.2f}s"
+                )
+            return entry.model
+
+    def acquire(
+        self,
+        model_size: str,
+        device: str = "cpu",
+        compute_type: str = "int8",
+        **kwargs,
+    ) -> WhisperModelHandle:
+        """
+        Get a shared model, loading it if needed.
+
+        Blocks while the model is being loaded, including a load started
+        by `preload`.
+
+        Parameters
+        ----------
+        model_size : str
+            Model name such as "tiny.en".
+        device : str
+            "cpu", "cuda" or "auto".
+        compute_type : str
+            CTranslate2 compute type.
+        **kwargs
+            Other WhisperModel arguments, only used by the first load.
+
+        Returns
+        -------
+        WhisperModelHandle
+            The handle to release when done.
+        """
+        key = self.key(model_size, device, compute_type)
+        entry = self._entry(key, ref=True)
+        try:
+            model = self._ensure_loaded(entry, **kwargs)
+        except Exception:
+            with self._lock:
+                entry.refs -= 1
+            raise
+        return WhisperModelHandle(self, key, model)
+
+    def _release(self, key: ModelKey) -> None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry.refs == 0:
+                return
+            entry.refs -= 1
+            if entry.refs == 0:
+                entry.released_at = time.monotonic()
+                self._schedule_eviction()
+
+    def _schedule_eviction(self) -> None:
+        # called with self._lock held
+        if self.idle_timeout <= 0 or (self._timer and self._timer.is_alive()):
+            return
+        self._timer = threading.Timer(self.idle_timeout, self._evict_and_reschedule)
+        self._timer.daemon = True
+        self._timer.start()
+
+    def _evict_and_reschedule(self) -> None:
+        self.evict_idle()
+        with self._lock:
+            self._timer = None
+            if any(
+                e.model is not None and e.refs == 0 and not e.pinned
+                for e in self._entries.values()
+            ):
+                self._schedule_eviction()
+
+    def evict_idle(self, force: bool = False) -> List[ModelKey]:
+        """
+        Unload models that nobody holds.
+
+        Parameters
+        ----------
+        force : bool
+            Also unload preloaded models and models released less than
+            `idle_timeout` seconds ago.
+
+        Returns
+        -------
+        List[ModelKey]
+            The unloaded models.
+        """
+        now = time.monotonic()
+        evicted = []
+        with self._lock:
+            for key, entry in list(self._entries.items()):
+                if entry.refs > 0 or entry.model is None:
+                    continue
+                if not force and (
+                    entry.pinned or now - entry.released_at < self.idle_timeout
+                ):
+                    continue
+                del self._entries[key]
+                evicted.append(key)
+        for key in evicted:
+            logging.info(f"Unloaded idle Faster-Whisper model {key}")
+        return evicted
+
+    def preload(
+        self,
+        model_size: str,
+        device: str = "cpu",
+        compute_type: str = "int8",
+        **kwargs,
+    ) -> Future:
+        """
+        Start loading a model in the background and keep it loaded.
+
+        An ASR input that acquires the model while it is loading waits for
+        this load instead of starting its own.
+
+        Parameters
+        ----------
+        model_size : str
+            Model name such as "tiny.en".
+        device : str
+            "cpu", "cuda" or "auto".
+        compute_type : str
+            CTranslate2 compute type.
+        **kwargs
+            Other WhisperModel arguments.
+
+        Returns
+        -------
+        Future
+            Resolves to the model, or to the load error.
+        """
+        entry = self._entry(self.key(model_size, device, compute_type), pin=True)
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=2, thread_name_prefix="whisper_preload"
+                )
+        return self._executor.submit(self._preload, entry, **kwargs)
+
+    def _preload(self, entry: _ModelEntry, **kwargs) -> Any:
+        try:
+            return self._ensure_loaded(entry, **kwargs)
+        except Exception as e:
+            logging.error(f"Could not preload Faster-Whisper model {entry.key}: {e}")
+            raise
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Loaded models with their reference counts and load times.
+
+        Returns
+        -------
+        Dict[str, Dict[str, Any]]
+            "model_size/device/compute_type" to refs, pinned and load_s.
+        """
+        with self._lock:
+            return {
+                "/".join(key): {
+                    "refs": entry.refs,
+                    "pinned": entry.pinned,
+                    "load_s": round(entry.load_s, 3),
+                }
+                for key, entry in self._entries.items()
+                if entry.model is not None
+            }
+
+
+def whisper_models_in_config(raw_config: dict) -> List[Dict[str, Any]]:
+    """
+    The Faster-Whisper models used by the ASR inputs of a configuration.
+
+    Inputs of every mode are included, so that switching modes does not
+    load a model. Inputs that do not set `model_size` are skipped: the
+    default differs between ASR input classes, and preloading the wrong
+    one would pin a model nobody uses.
+
+    Parameters
+    ----------
+    raw_config : dict
+        The parsed configuration file.
+
+    Returns
+    -------
+    List[Dict[str, Any]]
+        Unique model_size, device and compute_type settings.
+    """
+    input_configs = list(raw_config.get("agent_inputs", []))
+    for mode in (raw_config.get("modes") or {}).values():
+        input_configs += mode.get("agent_inputs", [])
+
+    models = []
+    for input_cfg in input_configs:
+        config = input_cfg.get("config") or {}
+        if config.get("engine") != "faster-whisper" or not config.get("model_size"):
+            continue
+        spec = {
+            "model_size": config["model_size"],
+            "device": config.get("device", "cpu"),
+            "compute_type": config.get("compute_type", "int8"),
+        }
+        if spec not in models:
+            models.append(spec)
+    return models
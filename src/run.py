@@ -9,11 +9,21 @@ import dotenv
 import json5
 import typer
 
+from providers.whisper_model_provider import (
+    WhisperModelProvider,
+    whisper_models_in_config,
+)
 from runtime.logging import setup_logging
 from runtime.multi_mode.config import load_mode_config
 from runtime.multi_mode.cortex import ModeCortexRuntime
 from runtime.single_mode.config import load_config
 from runtime.single_mode.cortex import CortexRuntime
+from runtime.startup import (
+    PreflightCache,
+    PreflightProbe,
+    StartupOrchestrator,
+    startup_timer,
+)
 from utils.audio_validation import validate_audio_before_start, log_audio_troubleshooting_tips
 from utils.llm_validation import validate_llm_before_start, log_llm_troubleshooting_tips
 
@@ -45,6 +55,72 @@ def find_config_file(config_name: str) -> Optional[str]:
     return None
 
 
+def build_preflight_probes(raw_config: dict) -> list:
+    """
+    Build the pre-flight probes for a configuration.
+
+    The probes can be disabled with SKIP_LLM_VALIDATION and
+    SKIP_AUDIO_VALIDATION, and SKIP_AUDIO_TEST skips the live recording.
+
+    Parameters
+    ----------
+    raw_config : dict
+        The parsed configuration file.
+
+    Returns
+    -------
+    list
+        The PreflightProbe instances to run.
+    """
+    probes = []
+
+    if os.getenv("SKIP_LLM_VALIDATION", "false").lower() == "true":
+        logging.info("ℹ️  LLM validation skipped (SKIP_LLM_VALIDATION=true)")
+    else:
+        llm_config = (raw_config.get("cortex_llm") or {}).get("config") or {}
+        model_name = llm_config.get("model", "llama3.1:8b")
+
+        probes.append(
+            PreflightProbe(
+                name="llm",
+                check=lambda: validate_llm_before_start(model=model_name, timeout=20),
+                cache_key=model_name,
+                on_failure=log_llm_troubleshooting_tips,
+            )
+        )
+
+    if os.getenv("SKIP_AUDIO_VALIDATION", "false").lower() == "true":
+        logging.info("ℹ️  Audio validation skipped (SKIP_AUDIO_VALIDATION=true)")
+    else:
+        # Extract device index from the first ASR input, including those of the default mode
+        input_configs = list(raw_config.get("agent_inputs", []))
+        default_mode = raw_config.get("modes", {}).get(raw_config.get("default_mode"), {})
+        input_configs += default_mode.get("agent_inputs", [])
+
+        device_index = None
+        for input_cfg in input_configs:
+            if "ASR" in input_cfg.get("type", ""):
+                device_index = (input_cfg.get("config") or {}).get("input_device")
+                break
+
+        # Run validation (skip actual test if in headless/CI environment)
+        skip_recording_test = os.getenv("SKIP_AUDIO_TEST", "false").lower() == "true"
+        probes.append(
+            PreflightProbe(
+                name="audio",
+                check=lambda: validate_audio_before_start(
+                    device_index=device_index, skip_test=skip_recording_test
+                ),
+                cache_key=f"{device_index}:{skip_recording_test}",
+                on_failure=log_audio_troubleshooting_tips,
+                # the recording test and the ASR input both open the microphone
+                exclusive=True,
+            )
+        )
+
+    return probes
+
+
 app = typer.Typer()
 
 
@@ -62,6 +138,7 @@ def start(config_name: str, log_level: str = "INFO", log_to_file: bool = False)
     log_to_file : bool, optional
         Whether to log output to a file (default is False).
     """
+    startup_timer.reset()
     setup_logging(config_name, log_level, log_to_file)
 
     # Find config file in organized directory structure
@@ -70,77 +147,54 @@ def start(config_name: str, log_level: str = "INFO", log_to_file: bool = False)
         raise FileNotFoundError(f"Configuration '{config_name}' not found in config directory or subdirectories")
 
     try:
-        with open(config_path, "r") as f:
-            raw_config = json5.load(f)
+        with startup_timer.phase("parse_config"):
+            with open(config_path, "r") as f:
+                raw_config = json5.load(f)
+
+        # Pre-flight probes run in the background while the components are built.
+        # Recent successes are cached so a service restart skips them.
+        preflight = StartupOrchestrator(
+            build_preflight_probes(raw_config),
+            cache=PreflightCache(
+                ttl_s=float(os.getenv("PREFLIGHT_CACHE_TTL", "300"))
+            ),
+        )
+        preflight.start()
+
+        # Whisper models load in the background and stay loaded across mode
+        # switches; ASR inputs wait for the load instead of repeating it.
+        if os.getenv("PRELOAD_WHISPER", "true").lower() == "true":
+            whisper_models = WhisperModelProvider()
+            for model in whisper_models_in_config(raw_config):
+                whisper_models.preload(**model)
+
+        preflight.wait_for_exclusive()
 
         # Load configuration
-        if "modes" in raw_config and "default_mode" in raw_config:
-            mode_config = load_mode_config(config_name)
-            config_obj = mode_config
-            runtime = ModeCortexRuntime(mode_config)
-            logging.info(f"Starting OM1 with mode-aware configuration: {config_name}")
-            logging.info(f"Available modes: {list(mode_config.modes.keys())}")
-            logging.info(f"Default mode: {mode_config.default_mode}")
-        else:
-            config = load_config(config_name)
-            config_obj = config
-            runtime = CortexRuntime(config)
-            logging.info(f"Starting OM1 with standard configuration: {config_name}")
-
-        # LLM validation before starting (can be disabled with env var)
-        skip_llm_validation = os.getenv("SKIP_LLM_VALIDATION", "false").lower() == "true"
-        
-        if not skip_llm_validation:
-            # Extract model name from config
-            model_name = "llama3.1:8b"  # Default
-            try:
-                llm_config = config_obj.cortex_llm
-                if hasattr(llm_config, 'config') and hasattr(llm_config.config, 'model'):
-                    model_name = llm_config.config.model
-                elif hasattr(llm_config, 'model'):
-                    model_name = llm_config.model
-            except Exception:
-                pass  # Use default
-            
-            # Run LLM validation
-            llm_ok = validate_llm_before_start(model=model_name, timeout=20)
-            
-            if not llm_ok:
-                log_llm_troubleshooting_tips()
-                logging.error("❌ LLM validation failed - cannot start agent")
-                logging.error("   Set SKIP_LLM_VALIDATION=true to bypass this check")
-                raise typer.Exit(2)
-        else:
-            logging.info("ℹ️  LLM validation skipped (SKIP_LLM_VALIDATION=true)")
-
-        # Audio validation before starting (optional, can be disabled with env var)
-        skip_audio_validation = os.getenv("SKIP_AUDIO_VALIDATION", "false").lower() == "true"
-        
-        if not skip_audio_validation:
-            # Extract device index from config if LocalASRInput is configured
-            device_index = None
-            try:
-                for input_cfg in config_obj.agent_inputs:
-                    if hasattr(input_cfg, 'type') and 'ASR' in input_cfg.type:
-                        device_index = getattr(input_cfg.config, 'input_device', None)
-                        break
-            except Exception:
-                pass  # Ignore errors, use default device
-            
-            # Run validation (skip actual test if in headless/CI environment)
-            skip_recording_test = os.getenv("SKIP_AUDIO_TEST", "false").lower() == "true"
-            audio_ok = validate_audio_before_start(
-                device_index=device_index,
-                skip_test=skip_recording_test
-            )
-            
-            if not audio_ok:
-                log_audio_troubleshooting_tips()
-                logging.error("❌ Audio validation failed - cannot start agent")
-                logging.error("   Set SKIP_AUDIO_VALIDATION=true to bypass this check")
-                raise typer.Exit(2)
-        else:
-            logging.info("ℹ️  Audio validation skipped (SKIP_AUDIO_VALIDATION=true)")
+        with startup_timer.phase("build_components"):
+            if "modes" in raw_config and "default_mode" in raw_config:
+                mode_config = load_mode_config(config_name, raw_config=raw_config)
+                runtime = ModeCortexRuntime(mode_config)
+                logging.info(f"Starting OM1 with mode-aware configuration: {config_name}")
+                logging.info(f"Available modes: {list(mode_config.modes.keys())}")
+                logging.info(f"Default mode: {mode_config.default_mode}")
+            else:
+                config = load_config(config_name, raw_config=raw_config)
+                runtime = CortexRuntime(config)
+                logging.info(f"Starting OM1 with standard configuration: {config_name}")
+
+        with startup_timer.phase("preflight_wait"):
+            results = preflight.wait()
+
+        if not results.get("llm", True):
+            logging.error("❌ LLM validation failed - cannot start agent")
+            logging.error("   Set SKIP_LLM_VALIDATION=true to bypass this check")
+            raise typer.Exit(2)
+
+        if not results.get("audio", True):
+            logging.error("❌ Audio validation failed - cannot start agent")
+            logging.error("   Set SKIP_AUDIO_VALIDATION=true to bypass this check")
+            raise typer.Exit(2)
 
         asyncio.run(runtime.run())
 
@@ -0,0 +1,406 @@
+import difflib
+import logging
+import time
+import typing as T
+import unicodedata
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from actions.base import AgentAction
+from llm.output_model import Action
+from providers.answer_cache_provider import normalize_question
+
+
+@dataclass
+class IntentRule:
+    """
+    A spoken command that maps to a fixed action.
+
+    Parameters
+    ----------
+    name : str
+        Name of the intent, e.g. "stop".
+    phrases : Dict[str, List[str]]
+        The phrasings of the command per language.
+    values : List[str]
+        Action values that carry out the command, in order of preference;
+        the first one a configured action accepts is used.
+    acknowledgements : Dict[str, str]
+        What to say per language when the command is carried out.
+    """
+
+    name: str
+    phrases: Dict[str, List[str]]
+    values: List[str]
+    acknowledgements: Dict[str, str] = field(default_factory=dict)
+
+
+# Commands that are answered without the LLM. Values cover the movement enums
+# of the different robots, so the same grammar works across configurations.
+DEFAULT_INTENTS = [
+    IntentRule(
+        name="stop",
+        phrases={
+            "en": ["stop", "halt", "freeze", "stand still", "dont move", "stay"],
+            "es": ["para", "detente", "alto", "quieto", "no te muevas"],
+            "ru": ["стоп", "стой", "остановись", "замри", "не двигайся"],
+        },
+        values=["stand still", "reset", "be still", "idle"],
+        acknowledgements={"en": "Stopping.", "es": "Me detengo.", "ru": "Стою."},
+    ),
+    IntentRule(
+        name="sit",
+        phrases={
+            "en": ["sit", "sit down"],
+            "es": ["sientate", "sentado"],
+            "ru": ["сядь", "сидеть", "садись"],
+        },
+        values=["sit", "crouch"],
+        acknowledgements={"en": "Sitting down.", "es": "Me siento.", "ru": "Сажусь."},
+    ),
+    IntentRule(
+        name="stand_up",
+        phrases={
+            "en": ["stand up", "get up"],
+            "es": ["levantate", "ponte de pie"],
+            "ru": ["встань", "вставай"],
+        },
+        values=["stand up"],
+        acknowledgements={"en": "Standing up.", "es": "Me levanto.", "ru": "Встаю."},
+    ),
+    IntentRule(
+        name="turn_left",
+        phrases={
+            "en": ["turn left"],
+            "es": ["gira a la izquierda", "izquierda"],
+            "ru": ["повернись налево", "поверни налево", "налево"],
+        },
+        values=["turn left"],
+        acknowledgements={"en": "Turning left.", "es": "Giro a la izquierda."},
+    ),
+    IntentRule(
+        name="turn_right",
+        phrases={
+            "en": ["turn right"],
+            "es": ["gira a la derecha", "derecha"],
+            "ru": ["повернись направо", "поверни направо", "направо"],
+        },
+        values=["turn right"],
+        acknowledgements={"en": "Turning right.", "es": "Giro a la derecha."},
+    ),
+    IntentRule(
+        name="come_here",
+        phrases={
+            "en": ["come here", "come to me", "come over here"],
+            "es": ["ven aqui", "ven"],
+            "ru": ["иди сюда", "ко мне"],
+        },
+        values=["come on", "move forwards", "walk forward", "walk"],
+        acknowledgements={"en": "Coming.", "es": "Voy.", "ru": "Иду."},
+    ),
+    IntentRule(
+        name="move_back",
+        phrases={
+            "en": ["back up", "move back", "go back"],
+            "es": ["atras", "retrocede"],
+            "ru": ["назад", "отойди"],
+        },
+        values=["move back", "walk back", "walk backward"],
+    ),
+]
+
+# Words around a command that do not change it, e.g. "can you stop now"
+_PREFIXES = {
+    "en": ["can you", "could you", "would you", "will you", "robot", "now", "just"],
+    "es": ["por favor", "puedes", "ahora", "robot"],
+    "ru": ["пожалуйста", "давай", "сейчас", "робот"],
+}
+_SUFFIXES = {
+    "en": ["now", "right now", "for me", "robot"],
+    "es": ["por favor", "ahora", "ya"],
+    "ru": ["пожалуйста", "сейчас"],
+}
+
+
+def _fold(text: str) -> str:
+    """
+    Normalize an utterance and drop accents, which ASR output is inconsistent
+    about ("levántate", "levantate").
+    """
+    text = unicodedata.normalize("NFKD", normalize_question(text))
+    return "".join(char for char in text if not unicodedata.combining(char))
+
+
+def _action_values(agent_action: AgentAction) -> List[str]:
+    """
+    Get the values the action enum of an agent action accepts.
+    """
+    try:
+        input_type = T.get_type_hints(agent_action.interface)["input"]
+        action_type = T.get_type_hints(input_type).get("action")
+    except Exception:
+        return []
+    if isinstance(action_type, type) and issubclass(action_type, Enum):
+        return [member.value for member in action_type]
+    return []
+
+
+@dataclass
+class IntentMatch:
+    """
+    A spoken command recognized without the LLM.
+
+    Parameters
+    ----------
+    intent : str
+        Name of the intent.
+    confidence : float
+        1.0 for a phrase of the grammar, the similarity to the closest
+        phrase otherwise.
+    actions : List[Action]
+        The actions that carry out the command.
+    latency_ms : float
+        Time the matching took.
+    """
+
+    intent: str
+    confidence: float
+    actions: List[Action]
+    latency_ms: float
+
+
+class IntentMatcher:
+    """
+    Deterministic fast path for short spoken commands such as "stop" or
+    "sit down".
+
+    An utterance matches when, after normalization and removal of polite
+    words around it, it is one of the phrases of an intent. Short utterances
+    that are not are classified by their similarity to the phrases, which
+    absorbs ASR errors such as "sit dawn". Only intents that one of the
+    configured actions can carry out are compiled in.
+
+    Parameters
+    ----------
+    agent_actions : List[AgentAction]
+        The configured actions.
+    intents : Optional[List[IntentRule]]
+        The command grammar; `DEFAULT_INTENTS` when not given.
+    min_confidence : float
+        Lowest similarity at which a short utterance is taken as a command.
+    margin : float
+        A similar utterance is left to the LLM if a different intent is
+        within this margin of the best one.
+    max_words : int
+        Longer utterances are left to the LLM unless they match a phrase
+        exactly.
+    acknowledge : bool
+        Speak a short acknowledgement with the command.
+    """
+
+    def __init__(
+        self,
+        agent_actions: List[AgentAction],
+        intents: Optional[List[IntentRule]] = None,
+        min_confidence: float = 0.85,
+        margin: float = 0.05,
+        max_words: int = 4,
+        acknowledge: bool = False,
+    ):
+        self.min_confidence = min_confidence
+        self.margin = margin
+        self.max_words = max_words
+        self.acknowledge = acknowledge
+        self.has_speak = any(a.llm_label == "speak" for a in agent_actions)
+
+        # intent name -> (action label, action value)
+        self.targets: Dict[str, Tuple[str, str]] = {}
+        self.rules: Dict[str, IntentRule] = {}
+        # language -> folded phrase -> intent name
+        self.phrases: Dict[str, Dict[str, str]] = {}
+
+        for rule in DEFAULT_INTENTS if intents is None else intents:
+            target = self._resolve(rule, agent_actions)
+            if target is None:
+                logging.debug(f"Intent '{rule.name}' has no matching action")
+                continue
+            self.targets[rule.name] = target
+            self.rules[rule.name] = rule
+            for language, phrases in rule.phrases.items():
+                table = self.phrases.setdefault(language, {})
+                for phrase in phrases:
+                    table[_fold(phrase)] = rule.name
+
+        self._prefixes = {
+            lang: sorted((_fold(w) for w in words), key=len, reverse=True)
+            for lang, words in _PREFIXES.items()
+        }
+        self._suffixes = {
+            lang: sorted((_fold(w) for w in words), key=len, reverse=True)
+            for lang, words in _SUFFIXES.items()
+        }
+        logging.info(f"Intent fast path enabled for: {', '.join(self.targets)}")
+
+    @staticmethod
+    def _resolve(
+        rule: IntentRule, agent_actions: List[AgentAction]
+    ) -> Optional[Tuple[str, str]]:
+        for value in rule.values:
+            for agent_action in agent_actions:
+                if value in _action_values(agent_action):
+                    return agent_action.llm_label, value
+        return None
+
+    def _strip(self, text: str, language: str) -> str:
+        changed = True
+        while changed and text:
+            changed = False
+            for prefix in self._prefixes.get(language, []):
+                if text.startswith(prefix + " "):
+                    text, changed = text[len(prefix) + 1 :], True
+            for suffix in self._suffixes.get(language, []):
+                if text.endswith(" " + suffix):
+                    text, changed = text[: -len(suffix) - 1], True
+        return text
+
+    def _languages(self, language: Optional[str]) -> Sequence[str]:
+        # ASR language detection on one or two words is unreliable, so the
+        # other languages are tried after the detected one
+        return [language] + [lang for lang in self.phrases if lang != language]
+
+    @staticmethod
+    def _cross_language(text: str, lang: str, language: Optional[str]) -> bool:
+        # a single word of another language ("para", "stay") is too often an
+        # ordinary word of the spoken one, so only phrases of several words
+        # are taken from other languages unless no language was detected
+        return language is None or lang == language or " " in text
+
+    def _classify(self, text: str, language: str) -> Optional[Tuple[str, float]]:
+        scores: Dict[str, float] = {}
+        for phrase, intent in self.phrases.get(language, {}).items():
+            score = difflib.SequenceMatcher(None, text, phrase).ratio()
+            scores[intent] = max(scores.get(intent, 0.0), score)
+        if not scores:
+            return None
+
+        ranked = sorted(scores.items(), key=lambda item: item[1], reverse=True)
+        intent, confidence = ranked[0]
+        if confidence < self.min_confidence:
+            return None
+        if len(ranked) > 1 and confidence - ranked[1][1] < self.margin:
+            return None
+        return intent, confidence
+
+    def match(
+        self, utterance: str, language: Optional[str] = "en"
+    ) -> Optional[IntentMatch]:
+        """
+        Recognize a spoken command.
+
+        Parameters
+        ----------
+        utterance : str
+            The transcribed voice input.
+        language : Optional[str]
+            Language detected by the ASR, None if it is not known. Single
+            words are only matched in this language when it is given.
+
+        Returns
+        -------
+        Optional[IntentMatch]
+            The command, or None if the utterance should go to the LLM.
+        """
+        start = time.perf_counter()
+        folded = _fold(utterance)
+        if not folded or not self.targets:
+            return None
+
+        found = None
+        for lang in self._languages(language):
+            text = self._strip(folded, lang)
+            intent = self.phrases.get(lang, {}).get(text)
+            if intent is not None and self._cross_language(text, lang, language):
+                found = (intent, 1.0, lang)
+                break
+        if (
+            found is None
+            and language is not None
+            and len(folded.split()) <= self.max_words
+        ):
+            text = self._strip(folded, language)
+            classified = self._classify(text, language)
+            if classified is not None:
+                found = (*classified, language)
+        if found is None:
+            return None
+
+        intent, confidence, lang = found
+        label, value = self.targets[intent]
+        actions = [Action(type=label, value=value)]
+        acknowledgement = self.rules[intent].acknowledgements.get(lang)
+        if self.acknowledge and self.has_speak and acknowledgement:
+            actions.append(
+                Action(
+                    type="speak",
+                    value={"sentence": acknowledgement, "language": lang},
+                )
+            )
+        return IntentMatch(
+            intent=intent,
+            confidence=confidence,
+            actions=actions,
+            latency_ms=(time.perf_counter() - start) * 1000.0,
+        )
+
+
+def intent_matcher_from_config(
+    config: Optional[Dict], agent_actions: List[AgentAction]
+) -> Optional[IntentMatcher]:
+    """
+    Create the intent fast path configured by the `intent_fast_path` section
+    of an agent configuration.
+
+    Parameters
+    ----------
+    config : Optional[Dict]
+        The `intent_fast_path` section; the fast path is disabled when it is
+        missing or `enabled` is false.
+    agent_actions : List[AgentAction]
+        The configured actions.
+
+    Returns
+    -------
+    Optional[IntentMatcher]
+        The matcher, or None if it is disabled.
+    """
+    if not isinstance(config, dict) or not config.get("enabled", True):
+        return None
+
+    # extra phrasings are merged into the built-in grammar
+    intents = [
+        IntentRule(
+            rule.name,
+            {lang: list(phrases) for lang, phrases in rule.phrases.items()},
+            list(rule.values),
+            dict(rule.acknowledgements),
+        )
+        for rule in DEFAULT_INTENTS
+    ]
+    by_name = {rule.name: rule for rule in intents}
+    for name, phrases in config.get("phrases", {}).items():
+        if name not in by_name:
+            logging.warning(f"Unknown intent in intent_fast_path phrases: {name}")
+            continue
+        for language, extra in phrases.items():
+            by_name[name].phrases.setdefault(language, []).extend(extra)
+    disabled = set(config.get("disabled_intents", []))
+
+    return IntentMatcher(
+        agent_actions,
+        intents=[rule for rule in intents if rule.name not in disabled],
+        min_confidence=config.get("min_confidence", 0.85),
+        margin=config.get("margin", 0.05),
+        max_words=config.get("max_words", 4),
+        acknowledge=config.get("acknowledge", False),
+    )
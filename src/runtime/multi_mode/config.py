@@ -15,6 +15,7 @@ from inputs.base import Sensor, SensorConfig
 from llm import LLM, LLMConfig, load_llm
 from runtime.robotics import load_unitree
 from runtime.single_mode.config import RuntimeConfig, add_meta
+from runtime.startup import construct_concurrently
 from simulators import load_simulator
 from simulators.base import Simulator, SimulatorConfig
 
@@ -58,6 +59,8 @@ class TransitionRule:
         For time-based transitions, the time in seconds after which to switch modes. Defaults to None.
     context_conditions : Dict, optional
         Conditions based on context that must be met for the transition. Defaults to empty dict.
+    word_boundary : bool, optional
+        Only match trigger keywords as whole words, so "hi" does not match "this". Defaults to False.
     """
 
     from_mode: str
@@ -68,6 +71,7 @@ class TransitionRule:
     cooldown_seconds: float = 0.0
     timeout_seconds: Optional[float] = None
     context_conditions: Dict = field(default_factory=dict)
+    word_boundary: bool = False
 
 
 @dataclass
@@ -132,6 +136,8 @@ class ModeConfig:
             api_key=global_config.api_key,
             URID=global_config.URID,
             unitree_ethernet=global_config.unitree_ethernet,
+            answer_cache=global_config.answer_cache,
+            intent_fast_path=global_config.intent_fast_path,
         )
 
     def load_components(self, system_config: "ModeSystemConfig"):
@@ -191,12 +197,20 @@ class ModeSystemConfig:
     # Default LLM settings if mode doesn't override
     global_cortex_llm: Optional[Dict] = None
 
+    # Optional cache of LLM answers to repeated voice questions
+    answer_cache: Optional[Dict] = None
+
+    # Optional spoken commands carried out without the LLM
+    intent_fast_path: Optional[Dict] = None
+
     # Modes and transition rules
     modes: Dict[str, ModeConfig] = field(default_factory=dict)
     transition_rules: List[TransitionRule] = field(default_factory=list)
 
 
-def load_mode_config(config_name: str) -> ModeSystemConfig:
+def load_mode_config(
+    config_name: str, raw_config: Optional[Dict] = None
+) -> ModeSystemConfig:
     """
     Load a mode-aware configuration from a JSON5 file.
 
@@ -204,18 +218,21 @@ def load_mode_config(config_name: str) -> ModeSystemConfig:
     ----------
     config_name : str
         Name of the configuration file (without .json5 extension)
+    raw_config : Optional[Dict]
+        The already parsed configuration file; read from disk if not given
 
     Returns
     -------
     ModeSystemConfig
         Parsed mode system configuration
     """
-    config_path = os.path.join(
-        os.path.dirname(__file__), "../../../config", config_name + ".json5"
-    )
+    if raw_config is None:
+        config_path = os.path.join(
+            os.path.dirname(__file__), "../../../config", config_name + ".json5"
+        )
 
-    with open(config_path, "r") as f:
-        raw_config = json5.load(f)
+        with open(config_path, "r") as f:
+            raw_config = json5.load(f)
 
     g_robot_ip = raw_config.get("robot_ip", None)
     if g_robot_ip is None or g_robot_ip == "" or g_robot_ip == "192.168.0.241":
@@ -257,6 +274,8 @@ def load_mode_config(config_name: str) -> ModeSystemConfig:
         system_governance=raw_config.get("system_governance", ""),
         system_prompt_examples=raw_config.get("system_prompt_examples", ""),
         global_cortex_llm=raw_config.get("cortex_llm"),
+        answer_cache=raw_config.get("answer_cache"),
+        intent_fast_path=raw_config.get("intent_fast_path"),
     )
 
     for mode_name, mode_data in raw_config.get("modes", {}).items():
@@ -290,6 +309,7 @@ def load_mode_config(config_name: str) -> ModeSystemConfig:
             cooldown_seconds=rule_data.get("cooldown_seconds", 0.0),
             timeout_seconds=rule_data.get("timeout_seconds"),
             context_conditions=rule_data.get("context_conditions", {}),
+            word_boundary=rule_data.get("word_boundary", False),
         )
         mode_system_config.transition_rules.append(rule)
 
@@ -312,55 +332,75 @@ def _load_mode_components(mode_config: ModeConfig, system_config: ModeSystemConf
     g_URID = system_config.URID
     g_robot_ip = system_config.robot_ip
 
-    # Load inputs
-    mode_config.agent_inputs = [
-        load_input(inp["type"])(
-            config=SensorConfig(
-                **add_meta(
-                    inp.get("config", {}), g_api_key, g_ut_eth, g_URID, g_robot_ip
+    # Backgrounds, then inputs, so the providers they configure are not
+    # created with default settings by an action
+    components = construct_concurrently(
+        {
+            "backgrounds": [
+                lambda bg=bg: load_background(bg["type"])(
+                    config=BackgroundConfig(
+                        **add_meta(
+                            bg.get("config", {}),
+                            g_api_key,
+                            g_ut_eth,
+                            g_URID,
+                            g_robot_ip,
+                        )
+                    )
                 )
-            )
-        )
-        for inp in mode_config._raw_inputs
-    ]
-
-    # Load simulators
-    mode_config.simulators = [
-        load_simulator(sim["type"])(
-            config=SimulatorConfig(
-                name=sim["type"],
-                **add_meta(
-                    sim.get("config", {}), g_api_key, g_ut_eth, g_URID, g_robot_ip
-                ),
-            )
-        )
-        for sim in mode_config._raw_simulators
-    ]
-
-    # Load actions
-    mode_config.agent_actions = [
-        load_action(
-            {
-                **action,
-                "config": add_meta(
-                    action.get("config", {}), g_api_key, g_ut_eth, g_URID, g_robot_ip
-                ),
-            }
-        )
-        for action in mode_config._raw_actions
-    ]
-
-    # Load backgrounds
-    mode_config.backgrounds = [
-        load_background(bg["type"])(
-            config=BackgroundConfig(
-                **add_meta(
-                    bg.get("config", {}), g_api_key, g_ut_eth, g_URID, g_robot_ip
+                for bg in mode_config._raw_backgrounds
+            ],
+            "agent_inputs": [
+                lambda inp=inp: load_input(inp["type"])(
+                    config=SensorConfig(
+                        **add_meta(
+                            inp.get("config", {}),
+                            g_api_key,
+                            g_ut_eth,
+                            g_URID,
+                            g_robot_ip,
+                        )
+                    )
                 )
-            )
-        )
-        for bg in mode_config._raw_backgrounds
-    ]
+                for inp in mode_config._raw_inputs
+            ],
+            "simulators": [
+                lambda sim=sim: load_simulator(sim["type"])(
+                    config=SimulatorConfig(
+                        name=sim["type"],
+                        **add_meta(
+                            sim.get("config", {}),
+                            g_api_key,
+                            g_ut_eth,
+                            g_URID,
+                            g_robot_ip,
+                        ),
+                    )
+                )
+                for sim in mode_config._raw_simulators
+            ],
+            "agent_actions": [
+                lambda action=action: load_action(
+                    {
+                        **action,
+                        "config": add_meta(
+                            action.get("config", {}),
+                            g_api_key,
+                            g_ut_eth,
+                            g_URID,
+                            g_robot_ip,
+                        ),
+                    }
+                )
+                for action in mode_config._raw_actions
+            ],
+        },
+        first=["backgrounds", "agent_inputs"],
+    )
+    mode_config.agent_inputs = components["agent_inputs"]
+    mode_config.simulators = components["simulators"]
+    mode_config.agent_actions = components["agent_actions"]
+    mode_config.backgrounds = components["backgrounds"]
 
     # Load LLM
     llm_config = mode_config._raw_llm or system_config.global_cortex_llm
@@ -6,11 +6,17 @@ from actions.orchestrator import ActionOrchestrator
 from backgrounds.orchestrator import BackgroundOrchestrator
 from fuser import Fuser
 from inputs.orchestrator import InputOrchestrator
+from providers.answer_cache_provider import (
+    AnswerCacheProvider,
+    answer_cache_from_config,
+)
 from providers.elevenlabs_tts_provider import ElevenLabsTTSProvider
 from providers.io_provider import IOProvider
 from providers.sleep_ticker_provider import SleepTickerProvider
+from runtime.intents import IntentMatcher, intent_matcher_from_config
 from runtime.multi_mode.config import ModeSystemConfig, RuntimeConfig
 from runtime.multi_mode.manager import ModeManager
+from runtime.startup import startup_timer
 from simulators.orchestrator import SimulatorOrchestrator
 
 
@@ -41,6 +47,8 @@ class ModeCortexRuntime:
         self.simulator_orchestrator: Optional[SimulatorOrchestrator] = None
         self.background_orchestrator: Optional[BackgroundOrchestrator] = None
         self.input_orchestrator: Optional[InputOrchestrator] = None
+        self.answer_cache: Optional[AnswerCacheProvider] = None
+        self.intent_matcher: Optional[IntentMatcher] = None
 
         # Tasks for orchestrators
         self.input_listener_task: Optional[asyncio.Task] = None
@@ -82,6 +90,18 @@ class ModeCortexRuntime:
             self.current_config.cortex_llm.set_system_context(system_context)
             logging.info("System context set on LLM for mode '%s' (%d chars)", mode_name, len(system_context))
 
+        # Spoken commands such as "stop" that are carried out without the LLM
+        self.intent_matcher = intent_matcher_from_config(
+            self.current_config.intent_fast_path, self.current_config.agent_actions
+        )
+
+        # Answers to repeated voice questions, keyed on the mode's system context
+        self.answer_cache = answer_cache_from_config(
+            self.current_config.answer_cache,
+            mode_name,
+            self.fuser.get_system_context(),
+        )
+
         logging.info(f"Mode '{mode_name}' initialized successfully")
 
     async def _on_mode_transition(self, from_mode: str, to_mode: str):
@@ -299,6 +319,7 @@ class ModeCortexRuntime:
                     )
 
                 await self._tick()
+                startup_timer.mark_first_tick()
                 self.sleep_ticker_provider.skip_sleep = False
 
             except Exception as e:
@@ -327,7 +348,36 @@ class ModeCortexRuntime:
             logging.info(f"Mode switched to: {new_mode}")
             return
 
-        output = await self.current_config.cortex_llm.ask(prompt)
+        if self.intent_matcher and self.fuser.voice_input:
+            # the voice input stays in the buffer for several ticks; a
+            # command is carried out once
+            if prompt == self.io_provider.llm_prompt:
+                logging.debug("Skipping duplicate prompt")
+                return
+            match = self.intent_matcher.match(
+                self.fuser.voice_input, self.fuser.voice_language
+            )
+            if match is not None:
+                logging.info(
+                    f"Intent fast path: {match.intent} ({match.confidence:.2f}, "
+                    f"{match.latency_ms:.1f} ms) -> {match.actions}"
+                )
+                self.io_provider.set_llm_prompt(prompt)
+                if self.simulator_orchestrator:
+                    await self.simulator_orchestrator.promise(match.actions)
+                await self.action_orchestrator.promise(match.actions)
+                return
+
+        if self.answer_cache and self.fuser.voice_question:
+            output = await self.answer_cache.ask(
+                self.current_config.cortex_llm,
+                prompt,
+                self.fuser.voice_question,
+                self.fuser.language,
+                self.mode_manager.current_mode_name,
+            )
+        else:
+            output = await self.current_config.cortex_llm.ask(prompt)
         if output is None:
             logging.debug("No output from LLM")
             return
@@ -13,8 +13,8 @@ from runtime.multi_mode.config import (
     ModeConfig,
     ModeSystemConfig,
     TransitionRule,
-    TransitionType,
 )
+from runtime.multi_mode.transitions import CompiledTransitionRules, ModeRuleIndex
 from zenoh_msgs import (
     ModeStatusRequest,
     ModeStatusResponse,
@@ -79,6 +79,9 @@ class ModeManager:
                 f"Default mode '{config.default_mode}' not found in available modes"
             )
 
+        self._compiled_rules: Optional[CompiledTransitionRules] = None
+        self.compile_transition_rules()
+
         # Load persisted state if enabled
         if config.mode_memory_enabled:
             self._load_mode_state()
@@ -171,6 +174,39 @@ class ModeManager:
             except Exception as e:
                 logging.error(f"Error in transition callback: {e}")
 
+    def compile_transition_rules(self) -> None:
+        """
+        Compile the transition rules into per-mode indexes and keyword
+        automatons. Called once at startup, and again if the rules change.
+        """
+        self._compiled_rules = CompiledTransitionRules(
+            self.config.transition_rules, list(self.config.modes)
+        )
+        logging.debug(
+            f"Compiled {len(self.config.transition_rules)} transition rules "
+            f"for {len(self.config.modes)} modes"
+        )
+
+    def _rule_index(self) -> ModeRuleIndex:
+        """
+        Get the compiled rules of the current mode.
+
+        Returns
+        -------
+        ModeRuleIndex
+            The rules that apply in the current mode
+        """
+        compiled = self._compiled_rules
+        rules = self.config.transition_rules
+        if (
+            compiled is None
+            or compiled.rules is not rules
+            or compiled.rule_count != len(rules)
+        ):
+            self.compile_transition_rules()
+            compiled = self._compiled_rules
+        return compiled.for_mode(self.state.current_mode)
+
     def check_time_based_transitions(self) -> Optional[str]:
         """
         Check if any time-based transitions should be triggered.
@@ -190,15 +226,12 @@ class ModeManager:
             and mode_duration >= current_config.timeout_seconds
         ):
             # Find time-based transition rules for this mode
-            for rule in self.config.transition_rules:
-                if (
-                    rule.from_mode == self.state.current_mode or rule.from_mode == "*"
-                ) and rule.transition_type == TransitionType.TIME_BASED:
-                    if self._can_transition(rule):
-                        logging.info(
-                            f"Time-based transition triggered: {self.state.current_mode} -> {rule.to_mode}"
-                        )
-                        return rule.to_mode
+            for compiled in self._rule_index().time_rules:
+                if self._can_transition(compiled.rule, compiled.cooldown_key):
+                    logging.info(
+                        f"Time-based transition triggered: {self.state.current_mode} -> {compiled.rule.to_mode}"
+                    )
+                    return compiled.rule.to_mode
 
         return None
 
@@ -221,33 +254,22 @@ class ModeManager:
 
         input_lower = input_text.lower()
 
-        # Find matching transition rules sorted by priority (higher priority first)
-        matching_rules = []
-        for rule in self.config.transition_rules:
-            if (
-                rule.from_mode == self.state.current_mode or rule.from_mode == "*"
-            ) and rule.transition_type == TransitionType.INPUT_TRIGGERED:
-
-                # Check if any trigger keywords are present
-                for keyword in rule.trigger_keywords:
-                    if keyword.lower() in input_lower:
-                        if self._can_transition(rule):
-                            matching_rules.append(rule)
-                        break
-
-        if matching_rules:
-            # Sort by priority (higher first) and select the best match
-            matching_rules.sort(key=lambda r: r.priority, reverse=True)
-            best_rule = matching_rules[0]
-            logging.info(
-                f"Input-triggered transition: {self.state.current_mode} -> {best_rule.to_mode}"
-            )
-            logging.info(f"Triggered by keywords: {best_rule.trigger_keywords}")
-            return best_rule.to_mode
+        # Matching rules come out of the automaton sorted by priority
+        # (higher priority first), so the first one allowed to run wins
+        for compiled in self._rule_index().match_input(input_lower):
+            if self._can_transition(compiled.rule, compiled.cooldown_key):
+                best_rule = compiled.rule
+                logging.info(
+                    f"Input-triggered transition: {self.state.current_mode} -> {best_rule.to_mode}"
+                )
+                logging.info(f"Triggered by keywords: {best_rule.trigger_keywords}")
+                return best_rule.to_mode
 
         return None
 
-    def _can_transition(self, rule: TransitionRule) -> bool:
+    def _can_transition(
+        self, rule: TransitionRule, transition_key: Optional[str] = None
+    ) -> bool:
         """
         Check if a transition rule can be executed based on cooldowns and other constraints.
 
@@ -255,6 +277,8 @@ class ModeManager:
         ----------
         rule : TransitionRule
             The transition rule to check
+        transition_key : Optional[str]
+            The precomputed cooldown key; derived from the rule if not given
 
         Returns
         -------
@@ -263,7 +287,8 @@ class ModeManager:
         """
         current_time = time.time()
 
-        transition_key = f"{rule.from_mode}->{rule.to_mode}"
+        if transition_key is None:
+            transition_key = f"{rule.from_mode}->{rule.to_mode}"
         if transition_key in self.transition_cooldowns:
             if (
                 current_time - self.transition_cooldowns[transition_key]
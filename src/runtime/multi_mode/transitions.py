@@ -0,0 +1,258 @@
+from dataclasses import dataclass, field
+from typing import Dict, List, Set, Tuple
+
+from runtime.multi_mode.config import TransitionRule, TransitionType
+
+
+def _is_word_char(char: str) -> bool:
+    return char.isalnum() or char == "_"
+
+
+class KeywordAutomaton:
+    """
+    Aho-Corasick automaton that finds every occurrence of many keywords in a
+    single pass over the text.
+
+    Keywords are matched case-sensitively, so callers lowercase both the
+    keywords and the text.
+    """
+
+    def __init__(self):
+        # goto function of every state, and the failure link of every state
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        # (keyword length, keyword id, word_boundary) ending at each state,
+        # and including those reached through failure links
+        self._own: List[List[Tuple[int, int, bool]]] = [[]]
+        self._out: List[List[Tuple[int, int, bool]]] = [[]]
+        self._delta: List[Dict[str, int]] = [{}]
+        self._built = False
+
+    def add(self, keyword: str, keyword_id: int, word_boundary: bool = False) -> None:
+        """
+        Add a keyword.
+
+        Parameters
+        ----------
+        keyword : str
+            The non-empty keyword.
+        keyword_id : int
+            Reported by `search` when the keyword is found.
+        word_boundary : bool
+            Only report the keyword when it is not part of a longer word.
+        """
+        if not keyword:
+            raise ValueError("Keywords must not be empty")
+
+        state = 0
+        for char in keyword:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][char] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._own.append([])
+            state = next_state
+        self._own[state].append((len(keyword), keyword_id, word_boundary))
+        self._built = False
+
+    def build(self) -> None:
+        """
+        Compute the failure links and the transition table. Called by
+        `search` when needed.
+        """
+        self._out = [list(own) for own in self._own]
+        queue = list(self._goto[0].values())
+        for state in queue:
+            self._fail[state] = 0
+
+        head = 0
+        while head < len(queue):
+            state = queue[head]
+            head += 1
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                link = self._goto[fallback].get(char, 0)
+                self._fail[next_state] = link
+                self._out[next_state] = self._out[next_state] + self._out[link]
+
+        # fold the failure links into a deterministic transition table, so the
+        # search does a single lookup per character; characters that appear in
+        # no keyword are missing from every row and lead back to the root
+        self._delta = [dict(self._goto[0])]
+        self._delta.extend({} for _ in range(len(self._goto) - 1))
+        for state in queue:
+            row = dict(self._delta[self._fail[state]])
+            row.update(self._goto[state])
+            self._delta[state] = row
+        self._built = True
+
+    def search(self, text: str) -> Set[int]:
+        """
+        Find the keywords that occur in a text.
+
+        Parameters
+        ----------
+        text : str
+            The text to search.
+
+        Returns
+        -------
+        Set[int]
+            The ids of the keywords found.
+        """
+        if not self._built:
+            self.build()
+
+        found: Set[int] = set()
+        delta, out = self._delta, self._out
+        state = 0
+        for end, char in enumerate(text):
+            state = delta[state].get(char, 0)
+            if not out[state]:
+                continue
+
+            for length, keyword_id, word_boundary in out[state]:
+                if word_boundary:
+                    start = end - length + 1
+                    if start > 0 and _is_word_char(text[start - 1]):
+                        continue
+                    if end + 1 < len(text) and _is_word_char(text[end + 1]):
+                        continue
+                found.add(keyword_id)
+        return found
+
+
+@dataclass
+class CompiledRule:
+    """
+    A transition rule with its cooldown key resolved for one source mode.
+
+    Parameters
+    ----------
+    rule : TransitionRule
+        The rule.
+    cooldown_key : str
+        The key the transition is recorded under when it executes.
+    """
+
+    rule: TransitionRule
+    cooldown_key: str
+
+
+@dataclass
+class ModeRuleIndex:
+    """
+    The transition rules that apply in one source mode.
+
+    Parameters
+    ----------
+    input_rules : List[CompiledRule]
+        Input-triggered rules, highest priority first.
+    time_rules : List[CompiledRule]
+        Time-based rules, in configuration order.
+    automaton : KeywordAutomaton
+        Matches the keywords of `input_rules`; keyword ids are indexes into
+        `input_rules`.
+    always_match : Set[int]
+        Input rules with an empty keyword, which match any input.
+    """
+
+    input_rules: List[CompiledRule] = field(default_factory=list)
+    time_rules: List[CompiledRule] = field(default_factory=list)
+    automaton: KeywordAutomaton = field(default_factory=KeywordAutomaton)
+    always_match: Set[int] = field(default_factory=set)
+
+    def match_input(self, input_lower: str) -> List[CompiledRule]:
+        """
+        Find the input-triggered rules whose keywords occur in the input.
+
+        Parameters
+        ----------
+        input_lower : str
+            The lowercased input text.
+
+        Returns
+        -------
+        List[CompiledRule]
+            The matching rules, highest priority first.
+        """
+        matched = self.automaton.search(input_lower) | self.always_match
+        return [self.input_rules[i] for i in sorted(matched)]
+
+
+class CompiledTransitionRules:
+    """
+    Transition rules compiled into per-source-mode indexes.
+
+    Wildcard rules are included in the index of every mode, with the cooldown
+    key of that mode, so cooldowns apply to them the same way they do to
+    rules with an explicit source mode.
+
+    Parameters
+    ----------
+    rules : List[TransitionRule]
+        The transition rules, in configuration order.
+    modes : List[str]
+        The names of the configured modes.
+    """
+
+    def __init__(self, rules: List[TransitionRule], modes: List[str]):
+        self.rules = rules
+        self.rule_count = len(rules)
+        self._indexes: Dict[str, ModeRuleIndex] = {
+            mode: self._compile(mode) for mode in modes
+        }
+        self._wildcard_index = self._compile("*")
+
+    def _compile(self, mode: str) -> ModeRuleIndex:
+        index = ModeRuleIndex()
+
+        applicable = [rule for rule in self.rules if rule.from_mode in (mode, "*")]
+
+        for rule in applicable:
+            if rule.transition_type == TransitionType.TIME_BASED:
+                index.time_rules.append(CompiledRule(rule, f"{mode}->{rule.to_mode}"))
+
+        # stable sort, so equal priorities keep configuration order
+        input_rules = sorted(
+            (
+                rule
+                for rule in applicable
+                if rule.transition_type == TransitionType.INPUT_TRIGGERED
+            ),
+            key=lambda rule: -rule.priority,
+        )
+        for rule_id, rule in enumerate(input_rules):
+            index.input_rules.append(CompiledRule(rule, f"{mode}->{rule.to_mode}"))
+            for keyword in rule.trigger_keywords:
+                keyword = keyword.lower()
+                if keyword:
+                    index.automaton.add(keyword, rule_id, rule.word_boundary)
+                else:
+                    index.always_match.add(rule_id)
+
+        # the automaton builds its transition table on the first search, so
+        # modes that are never entered cost no more than their trie
+        return index
+
+    def for_mode(self, mode: str) -> ModeRuleIndex:
+        """
+        Get the rule index of a source mode.
+
+        Parameters
+        ----------
+        mode : str
+            The current mode.
+
+        Returns
+        -------
+        ModeRuleIndex
+            The rules that apply in the mode; only wildcard rules for an
+            unknown mode.
+        """
+        return self._indexes.get(mode, self._wildcard_index)
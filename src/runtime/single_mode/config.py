@@ -13,6 +13,7 @@ from inputs import load_input
 from inputs.base import Sensor, SensorConfig
 from llm import LLM, LLMConfig, load_llm
 from runtime.robotics import load_unitree
+from runtime.startup import construct_concurrently
 from simulators import load_simulator
 from simulators.base import Simulator, SimulatorConfig
 
@@ -48,6 +49,12 @@ class RuntimeConfig:
     # Optional external knowledge file path (relative to project root or absolute)
     knowledge_file: Optional[str] = None
 
+    # Optional cache of LLM answers to repeated voice questions
+    answer_cache: Optional[Dict] = None
+
+    # Optional spoken commands carried out without the LLM
+    intent_fast_path: Optional[Dict] = None
+
     @classmethod
     def load(cls, config_name: str) -> "RuntimeConfig":
         """Load a runtime configuration from a file."""
@@ -96,14 +103,19 @@ def validate_config_keys(raw_config: Dict, config_name: str) -> None:
         # llm_label is optional now - we provide a safe default
 
 
-def load_config(config_name: str) -> RuntimeConfig:
+def load_config(config_name: str, raw_config: Optional[Dict] = None) -> RuntimeConfig:
     """
     Load and parse a runtime configuration from a JSON file.
 
+    Backgrounds, inputs, simulators and actions are constructed concurrently;
+    the LLM is constructed last because it needs the actions.
+
     Parameters
     ----------
     config_name : str
         Name of the configuration file (without .json extension)
+    raw_config : Optional[Dict]
+        The already parsed configuration file; read from disk if not given
 
     Returns
     -------
@@ -123,15 +135,16 @@ def load_config(config_name: str) -> RuntimeConfig:
     ValueError
         If configuration values are invalid (e.g., negative hertz)
     """
-    config_path = os.path.join(
-        os.path.dirname(__file__), "../../../config", config_name + ".json5"
-    )
+    if raw_config is None:
+        config_path = os.path.join(
+            os.path.dirname(__file__), "../../../config", config_name + ".json5"
+        )
 
-    try:
-        with open(config_path, "r+") as f:
-            raw_config = json5.load(f)
-    except Exception as e:
-        raise Exception(f"Error loading configuration '{config_name}': {str(e)}")
+        try:
+            with open(config_path, "r+") as f:
+                raw_config = json5.load(f)
+        except Exception as e:
+            raise Exception(f"Error loading configuration '{config_name}': {str(e)}")
     
     # Validate configuration structure
     try:
@@ -189,59 +202,71 @@ def load_config(config_name: str) -> RuntimeConfig:
     conf = raw_config["cortex_llm"].get("config", {})
     logging.debug(f"config.py: {conf}")
 
-    parsed_config = {
-        **raw_config,
-        "backgrounds": [
-            load_background(bg["type"])(
-                config=BackgroundConfig(
-                    **add_meta(
-                        bg.get("config", {}), g_api_key, g_ut_eth, g_URID, g_robot_ip
+    components = construct_concurrently(
+        {
+            "backgrounds": [
+                lambda bg=bg: load_background(bg["type"])(
+                    config=BackgroundConfig(
+                        **add_meta(
+                            bg.get("config", {}),
+                            g_api_key,
+                            g_ut_eth,
+                            g_URID,
+                            g_robot_ip,
+                        )
                     )
                 )
-            )
-            for bg in raw_config.get("backgrounds", [])
-        ],
-        "agent_inputs": [
-            load_input(input["type"])(
-                config=SensorConfig(
-                    **add_meta(
-                        input.get("config", {}), g_api_key, g_ut_eth, g_URID, g_robot_ip
+                for bg in raw_config.get("backgrounds", [])
+            ],
+            "agent_inputs": [
+                lambda input=input: load_input(input["type"])(
+                    config=SensorConfig(
+                        **add_meta(
+                            input.get("config", {}),
+                            g_api_key,
+                            g_ut_eth,
+                            g_URID,
+                            g_robot_ip,
+                        )
                     )
                 )
-            )
-            for input in raw_config.get("agent_inputs", [])
-        ],
-        "simulators": [
-            load_simulator(simulator["type"])(
-                config=SimulatorConfig(
-                    name=simulator["type"],
-                    **add_meta(
-                        simulator.get("config", {}),
-                        g_api_key,
-                        g_ut_eth,
-                        g_URID,
-                        g_robot_ip,
-                    ),
+                for input in raw_config.get("agent_inputs", [])
+            ],
+            "simulators": [
+                lambda simulator=simulator: load_simulator(simulator["type"])(
+                    config=SimulatorConfig(
+                        name=simulator["type"],
+                        **add_meta(
+                            simulator.get("config", {}),
+                            g_api_key,
+                            g_ut_eth,
+                            g_URID,
+                            g_robot_ip,
+                        ),
+                    )
                 )
-            )
-            for simulator in raw_config.get("simulators", [])
-        ],
-        "agent_actions": [
-            load_action(
-                {
-                    **action,
-                    "config": add_meta(
-                        action.get("config", {}),
-                        g_api_key,
-                        g_ut_eth,
-                        g_URID,
-                        g_robot_ip,
-                    ),
-                }
-            )
-            for action in raw_config.get("agent_actions", [])
-        ],
-    }
+                for simulator in raw_config.get("simulators", [])
+            ],
+            "agent_actions": [
+                lambda action=action: load_action(
+                    {
+                        **action,
+                        "config": add_meta(
+                            action.get("config", {}),
+                            g_api_key,
+                            g_ut_eth,
+                            g_URID,
+                            g_robot_ip,
+                        ),
+                    }
+                )
+                for action in raw_config.get("agent_actions", [])
+            ],
+        },
+        first=["backgrounds", "agent_inputs"],
+    )
+
+    parsed_config = {**raw_config, **components}
 
     cortex_llm = (
         load_llm(raw_config["cortex_llm"]["type"])(
@@ -5,9 +5,12 @@ from actions.orchestrator import ActionOrchestrator
 from backgrounds.orchestrator import BackgroundOrchestrator
 from fuser import Fuser
 from inputs.orchestrator import InputOrchestrator
+from providers.answer_cache_provider import answer_cache_from_config
 from providers.io_provider import IOProvider
 from providers.sleep_ticker_provider import SleepTickerProvider
+from runtime.intents import intent_matcher_from_config
 from runtime.single_mode.config import RuntimeConfig
+from runtime.startup import startup_timer
 from simulators.orchestrator import SimulatorOrchestrator
 
 
@@ -58,6 +61,16 @@ class CortexRuntime:
             config.cortex_llm.set_system_context(system_context)
             logging.info("System context set on LLM (%d chars) - will be cached/reused", len(system_context))
 
+        # Spoken commands such as "stop" that are carried out without the LLM
+        self.intent_matcher = intent_matcher_from_config(
+            config.intent_fast_path, config.agent_actions
+        )
+
+        # Answers to repeated voice questions, keyed on the system context
+        self.answer_cache = answer_cache_from_config(
+            config.answer_cache, config.name, self.fuser.get_system_context()
+        )
+
     async def run(self) -> None:
         """
         Start the runtime's main execution loop.
@@ -124,6 +137,7 @@ class CortexRuntime:
             if not self.sleep_ticker_provider.skip_sleep:
                 await self.sleep_ticker_provider.sleep(1 / self.config.hertz)
             await self._tick()
+            startup_timer.mark_first_tick()
             self.sleep_ticker_provider.skip_sleep = False
 
     async def _tick(self) -> None:
@@ -158,6 +172,23 @@ class CortexRuntime:
             logging.debug(f"{tick_time} | Skipping duplicate prompt")
             return
 
+        if self.intent_matcher and self.fuser.voice_input:
+            match = self.intent_matcher.match(
+                self.fuser.voice_input, self.fuser.voice_language
+            )
+            if match is not None:
+                logging.info(
+                    f"{tick_time} | OUTPUT(Intent): {match.intent} "
+                    f"({match.confidence:.2f}, {match.latency_ms:.1f} ms) -> "
+                    f"{match.actions}"
+                )
+                # recorded like an LLM prompt, so the same voice input in
+                # the next ticks is skipped as a duplicate
+                self.io_provider.set_llm_prompt(prompt)
+                await self.action_orchestrator.promise(match.actions)
+                await self.simulator_orchestrator.promise(match.actions)
+                return
+
         # === STRUCTURED INPUT LOGGING ===
         logging.info("=" * 70)
         logging.info(f"{tick_time} | 📥 INPUT CYCLE START")
@@ -175,7 +206,16 @@ class CortexRuntime:
 
         # === LLM PROCESSING ===
         try:
-            output = await self.config.cortex_llm.ask(prompt)
+            if self.answer_cache and self.fuser.voice_question:
+                output = await self.answer_cache.ask(
+                    self.config.cortex_llm,
+                    prompt,
+                    self.fuser.voice_question,
+                    self.fuser.language,
+                    self.config.name,
+                )
+            else:
+                output = await self.config.cortex_llm.ask(prompt)
             if output is None:
                 logging.error(f"{tick_time} | ❌ OUTPUT(LLM): No response from LLM")
                 return
@@ -0,0 +1,347 @@
+import json
+import logging
+import os
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+# worker threads used to construct components and run pre-flight probes
+DEFAULT_MAX_WORKERS = int(os.getenv("STARTUP_MAX_WORKERS", "8"))
+
+
+class StartupTimer:
+    """
+    Records how long each startup phase takes, up to the first cortex tick.
+
+    Time to first tick after a reboot is an operational metric, so the summary
+    also reports the system uptime when it is available.
+    """
+
+    def __init__(self):
+        self.started_at = time.time()
+        self.phases: Dict[str, float] = {}
+        self.first_tick_s: Optional[float] = None
+        self._lock = threading.Lock()
+
+    def reset(self) -> None:
+        """
+        Restart the clock, at the beginning of `start`.
+        """
+        with self._lock:
+            self.started_at = time.time()
+            self.phases = {}
+            self.first_tick_s = None
+
+    @contextmanager
+    def phase(self, name: str):
+        """
+        Time a startup phase.
+
+        Parameters
+        ----------
+        name : str
+            The name of the phase.
+        """
+        began = time.time()
+        try:
+            yield
+        finally:
+            elapsed = time.time() - began
+            with self._lock:
+                self.phases[name] = elapsed
+            logging.info(f"Startup: {name} took {elapsed:.2f}s")
+
+    def mark_first_tick(self) -> None:
+        """
+        Record the first completed cortex tick. Later calls are ignored.
+        """
+        with self._lock:
+            if self.first_tick_s is not None:
+                return
+            self.first_tick_s = time.time() - self.started_at
+
+        uptime = _system_uptime()
+        uptime_str = f", system uptime {uptime:.1f}s" if uptime is not None else ""
+        phases = ", ".join(f"{k}={v:.2f}s" for k, v in self.phases.items())
+        logging.info(
+            f"Startup: time to first tick {self.first_tick_s:.2f}s{uptime_str} "
+            f"({phases})"
+        )
+
+    def summary(self) -> Dict[str, Any]:
+        """
+        Get the recorded timings.
+
+        Returns
+        -------
+        Dict[str, Any]
+            The phase durations and the time to first tick, in seconds.
+        """
+        with self._lock:
+            return {"phases": dict(self.phases), "first_tick_s": self.first_tick_s}
+
+
+def _system_uptime() -> Optional[float]:
+    try:
+        with open("/proc/uptime", "r") as f:
+            return float(f.read().split()[0])
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+startup_timer = StartupTimer()
+
+
+def construct_concurrently(
+    factories: Dict[str, List[Callable[[], Any]]],
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    first: Sequence[str] = (),
+) -> Dict[str, List[Any]]:
+    """
+    Construct independent components on a thread pool.
+
+    Component constructors mostly wait on hardware, sockets and model files,
+    so building them in parallel shortens startup. The order within each
+    group is preserved.
+
+    Providers are singletons configured by whoever constructs them first, so
+    the groups named in `first` are built beforehand, one component at a
+    time and in order. Backgrounds and inputs go there: they create
+    providers such as OdomProvider or RPLidarProvider with their settings,
+    which actions then use through a bare `RPLidarProvider()`.
+
+    Parameters
+    ----------
+    factories : Dict[str, List[Callable[[], Any]]]
+        Group name, such as "agent_inputs", to the constructors of the group.
+    max_workers : int
+        Maximum number of constructors running at once; 1 builds the
+        components one at a time.
+    first : Sequence[str]
+        Groups built sequentially before any other group is started.
+
+    Returns
+    -------
+    Dict[str, List[Any]]
+        Group name to the constructed components.
+
+    Raises
+    ------
+    Exception
+        The first constructor error, after all constructors of the phase
+        have finished.
+    """
+    built = {
+        name: [build() for build in factories[name]]
+        for name in first
+        if name in factories
+    }
+    rest = {name: group for name, group in factories.items() if name not in built}
+
+    total = sum(len(group) for group in rest.values())
+    if max_workers <= 1 or total <= 1:
+        built.update(
+            {name: [build() for build in group] for name, group in rest.items()}
+        )
+    else:
+        with ThreadPoolExecutor(
+            max_workers=min(max_workers, total), thread_name_prefix="startup"
+        ) as executor:
+            futures = {
+                name: [executor.submit(build) for build in group]
+                for name, group in rest.items()
+            }
+        built.update(
+            {name: [f.result() for f in group] for name, group in futures.items()}
+        )
+
+    return {name: built[name] for name in factories}
+
+
+class PreflightCache:
+    """
+    Remembers successful pre-flight probes for a short time, so a service
+    restart does not repeat them.
+
+    Parameters
+    ----------
+    path : str
+        JSON file holding the time of the last success of each probe.
+    ttl_s : float
+        Seconds a success stays valid; 0 disables the cache.
+    """
+
+    def __init__(self, path: str = "dump/preflight_cache.json", ttl_s: float = 300.0):
+        self.path = path
+        self.ttl_s = ttl_s
+        self._lock = threading.Lock()
+
+    def _load(self) -> Dict[str, float]:
+        try:
+            with open(self.path, "r") as f:
+                entries = json.load(f)
+            return entries if isinstance(entries, dict) else {}
+        except (OSError, ValueError):
+            return {}
+
+    def is_fresh(self, key: str) -> bool:
+        """
+        Whether the probe with this key passed within the TTL.
+
+        Parameters
+        ----------
+        key : str
+            The probe cache key.
+        """
+        if self.ttl_s <= 0:
+            return False
+        with self._lock:
+            passed_at = self._load().get(key)
+        return passed_at is not None and 0 <= time.time() - passed_at < self.ttl_s
+
+    def record_success(self, key: str) -> None:
+        """
+        Record that the probe with this key passed.
+
+        Parameters
+        ----------
+        key : str
+            The probe cache key.
+        """
+        if self.ttl_s <= 0:
+            return
+        with self._lock:
+            entries = self._load()
+            now = time.time()
+            entries = {k: v for k, v in entries.items() if now - v < self.ttl_s}
+            entries[key] = now
+            try:
+                os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+                tmp_path = f"{self.path}.tmp"
+                with open(tmp_path, "w") as f:
+                    json.dump(entries, f)
+                os.replace(tmp_path, self.path)
+            except OSError as e:
+                logging.warning(f"Could not write pre-flight cache: {e}")
+
+
+@dataclass
+class PreflightProbe:
+    """
+    A check that must pass before the agent starts.
+
+    Parameters
+    ----------
+    name : str
+        The name of the probe, used in logs.
+    check : Callable[[], bool]
+        Runs the probe; returns True when it passed.
+    cache_key : str
+        Identifies what was probed, such as the model name, so a cached
+        success is not reused after the configuration changes.
+    on_failure : Optional[Callable[[], None]]
+        Logs troubleshooting tips when the probe fails.
+    exclusive : bool
+        The probe needs a device that components also open, so components
+        are only constructed after it has finished.
+    """
+
+    name: str
+    check: Callable[[], bool]
+    cache_key: str = ""
+    on_failure: Optional[Callable[[], None]] = None
+    exclusive: bool = False
+
+
+class StartupOrchestrator:
+    """
+    Runs pre-flight probes concurrently, in the background of component
+    construction.
+
+    Parameters
+    ----------
+    probes : List[PreflightProbe]
+        The probes to run.
+    cache : Optional[PreflightCache]
+        Cache of recent successes; probes with a fresh success are skipped.
+    timer : StartupTimer
+        Where the probe timings are recorded.
+    """
+
+    def __init__(
+        self,
+        probes: List[PreflightProbe],
+        cache: Optional[PreflightCache] = None,
+        timer: StartupTimer = startup_timer,
+    ):
+        self.probes = probes
+        self.cache = cache
+        self.timer = timer
+        self._futures: Dict[str, Future] = {}
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def _cache_key(self, probe: PreflightProbe) -> str:
+        return f"{probe.name}:{probe.cache_key}"
+
+    def _run_probe(self, probe: PreflightProbe) -> bool:
+        key = self._cache_key(probe)
+        if self.cache is not None and self.cache.is_fresh(key):
+            logging.info(f"Pre-flight {probe.name}: passed recently, skipping")
+            return True
+
+        with self.timer.phase(f"preflight_{probe.name}"):
+            try:
+                ok = bool(probe.check())
+            except Exception as e:
+                logging.error(f"Pre-flight {probe.name} error: {e}")
+                ok = False
+
+        if ok and self.cache is not None:
+            self.cache.record_success(key)
+        return ok
+
+    def start(self) -> None:
+        """
+        Start all probes in the background.
+        """
+        if self._executor is not None or not self.probes:
+            return
+        self._executor = ThreadPoolExecutor(
+            max_workers=len(self.probes), thread_name_prefix="preflight"
+        )
+        for probe in self.probes:
+            self._futures[probe.name] = self._executor.submit(self._run_probe, probe)
+
+    def wait_for_exclusive(self) -> None:
+        """
+        Block until the probes that must not overlap component construction
+        have finished.
+        """
+        for probe in self.probes:
+            if probe.exclusive and probe.name in self._futures:
+                self._futures[probe.name].result()
+
+    def wait(self) -> Dict[str, bool]:
+        """
+        Block until all probes have finished.
+
+        Returns
+        -------
+        Dict[str, bool]
+            Probe name to whether it passed. Failed probes have already
+            logged their troubleshooting tips.
+        """
+        self.start()
+        results = {}
+        for probe in self.probes:
+            future = self._futures.get(probe.name)
+            results[probe.name] = future.result() if future is not None else True
+            if not results[probe.name] and probe.on_failure is not None:
+                probe.on_failure()
+
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+        return results
@@ -1,19 +1,19 @@
-import asyncio
 import logging
 import os
 import threading
 import time
 from dataclasses import asdict, dataclass
-from typing import Dict, List, Optional
+from typing import List, Mapping, Optional, Tuple
 
 import uvicorn
-from fastapi import FastAPI, WebSocket
+from fastapi import FastAPI, WebSocket, WebSocketDisconnect
 from fastapi.responses import HTMLResponse
 from fastapi.staticfiles import StaticFiles
 
 from llm.output_model import Action
 from providers.io_provider import Input, IOProvider
 from simulators.base import Simulator, SimulatorConfig
+from simulators.state_stream import StateStream
 
 
 @dataclass
@@ -40,10 +40,10 @@ class WebSim(Simulator):
 
         self._initialized = False
         self._lock = threading.Lock()
-        self._last_tick = time.time()
-        self._tick_interval = 0.1  # 100ms tick rate
 
         self.state_dict = {}
+        # (inputs version, earliest time, re-zeroed inputs) of the last update
+        self._inputs_cache: Optional[Tuple[int, float, List[dict]]] = None
         # Initialize state
         self.state = SimulatorState(
             inputs={},
@@ -76,6 +76,10 @@ class WebSim(Simulator):
 
         self.active_connections: List[WebSocket] = []
 
+        # Versioned state diffs with per-client, drop-to-latest send queues
+        self.stream = StateStream()
+        self.stream.publish(self.state.to_dict())
+
         # Setup routes
         @self.app.get("/")
         async def get_index():
@@ -265,9 +269,24 @@ class WebSim(Simulator):
                                     setConnected(true);
                                 };
 
+                                let version = 0;
                                 ws.onmessage = (event) => {
-                                    const data = JSON.parse(event.data);
-                                    setState(data);
+                                    const msg = JSON.parse(event.data);
+                                    if (msg.type === 'snapshot') {
+                                        version = msg.version;
+                                        setState(prev => ({ ...prev, ...msg.state }));
+                                    } else if (msg.type === 'diff') {
+                                        if (msg.version !== version + 1) {
+                                            ws.send('resync');
+                                            return;
+                                        }
+                                        version = msg.version;
+                                        setState(prev => {
+                                            const next = { ...prev, ...msg.changed };
+                                            msg.removed.forEach(key => delete next[key]);
+                                            return next;
+                                        });
+                                    }
                                 };
 
                                 ws.onerror = (error) => {
@@ -466,9 +485,9 @@ class WebSim(Simulator):
             await websocket.accept()
             self.active_connections.append(websocket)
             try:
-                await websocket.send_json(self.state.to_dict())
-                while True:
-                    await websocket.receive_text()
+                await self.stream.serve(websocket)
+            except WebSocketDisconnect:
+                logging.debug("WebSim client disconnected")
             except Exception as e:
                 logging.error(f"WebSocket error: {e}")
             finally:
@@ -526,32 +545,7 @@ class WebSim(Simulator):
         server = uvicorn.Server(config)
         server.run()
 
-    async def broadcast_state(self):
-        """Broadcast current state to all connected clients"""
-        if not self.active_connections:
-            return
-
-        try:
-
-            # Broadcast to all clients
-            disconnected = []
-            for connection in self.active_connections:
-                try:
-                    await connection.send_json(self.state_dict)
-                except Exception as e:
-                    logging.error(f"Error broadcasting to client: {e}")
-                    disconnected.append(connection)
-
-            for connection in disconnected:
-                try:
-                    self.active_connections.remove(connection)
-                except ValueError:
-                    pass
-
-        except Exception as e:
-            logging.error(f"Error in broadcast_state: {e}")
-
-    def get_earliest_time(self, inputs: Dict[str, Input]) -> float:
+    def get_earliest_time(self, inputs: Mapping[str, Input]) -> float:
         """Get earliest timestamp from inputs"""
         earliest_time = float("inf")
         for input_type, input_info in inputs.items():
@@ -566,26 +560,13 @@ class WebSim(Simulator):
         return earliest_time if earliest_time != float("inf") else 0.0
 
     def tick(self) -> None:
-        """Update simulator state"""
-        if self._initialized:
-            try:
-                # Get or create event loop
-                try:
-                    loop = asyncio.get_event_loop()
-                except RuntimeError:
-                    loop = asyncio.new_event_loop()
-                    asyncio.set_event_loop(loop)
-
-                try:
-                    loop.run_until_complete(self.broadcast_state())
-                except Exception:
-                    loop = asyncio.get_event_loop()
-                    loop.create_task(self.broadcast_state())
-
-            except Exception as e:
-                logging.error(f"Error in tick: {e}")
+        """
+        Keep the simulator thread idle.
 
-            time.sleep(0.5)
+        State is pushed to clients by `sim` as soon as it changes, so there is
+        nothing to broadcast on a fixed interval.
+        """
+        time.sleep(1.0)
 
     def sim(self, actions: List[Action]) -> None:
         """Handle simulation updates from commands"""
@@ -594,26 +575,37 @@ class WebSim(Simulator):
             return
 
         try:
-            updated = False
             with self._lock:
-                earliest_time = self.get_earliest_time(self.io_provider.inputs)
-                logging.debug(f"earliest_time: {earliest_time}")
-
-                input_rezeroed = []
-                for input_type, input_info in self.io_provider.inputs.items():
-                    timestamp = 0
-                    if (
-                        input_type != "GovernanceEthereum"
-                        and input_info.timestamp is not None
-                    ):
-                        timestamp = input_info.timestamp - earliest_time
-                    input_rezeroed.append(
-                        {
-                            "input_type": input_type,
-                            "timestamp": timestamp,
-                            "input": input_info.input,
-                        }
+                # The inputs are only re-zeroed when they changed since the
+                # last update
+                snapshot = self.io_provider.inputs_snapshot()
+                if self._inputs_cache is None or (
+                    self._inputs_cache[0] != snapshot.version
+                ):
+                    earliest_time = self.get_earliest_time(snapshot.inputs)
+                    logging.debug(f"earliest_time: {earliest_time}")
+
+                    input_rezeroed = []
+                    for input_type, input_info in snapshot.inputs.items():
+                        timestamp = 0
+                        if (
+                            input_type != "GovernanceEthereum"
+                            and input_info.timestamp is not None
+                        ):
+                            timestamp = input_info.timestamp - earliest_time
+                        input_rezeroed.append(
+                            {
+                                "input_type": input_type,
+                                "timestamp": timestamp,
+                                "input": input_info.input,
+                            }
+                        )
+                    self._inputs_cache = (
+                        snapshot.version,
+                        earliest_time,
+                        input_rezeroed,
                     )
+                _, earliest_time, input_rezeroed = self._inputs_cache
 
                 # Process system latency relative to earliest time
                 fuser_end_time = self.io_provider.fuser_end_time or 0
@@ -637,20 +629,11 @@ class WebSim(Simulator):
 
                 for action in actions:
                     if action.type == "move":
-                        new_action = action.value
-                        if new_action != self.state.current_action:
-                            self.state.current_action = new_action
-                            updated = True
+                        self.state.current_action = action.value
                     elif action.type == "speak":
-                        new_speech = action.value
-                        if new_speech != self.state.last_speech:
-                            self.state.last_speech = new_speech
-                            updated = True
+                        self.state.last_speech = action.value
                     elif action.type == "emotion":
-                        new_emotion = action.value
-                        if new_emotion != self.state.current_emotion:
-                            self.state.current_emotion = new_emotion
-                            updated = True
+                        self.state.current_emotion = action.value
 
                 self.state_dict = {
                     "current_action": self.state.current_action,
@@ -662,9 +645,8 @@ class WebSim(Simulator):
 
                 logging.info(f"Inputs and LLM Outputs: {self.state_dict}")
 
-            if updated:
-                self._last_tick = 0
-                self.tick()
+            # Only the fields that changed are pushed, and only if any did
+            self.stream.publish(self.state_dict)
 
         except Exception as e:
             logging.error(f"Error in sim update: {e}")
@@ -674,9 +656,5 @@ class WebSim(Simulator):
         logging.info("Cleaning up WebSim...")
         self._initialized = False
 
-        for connection in self.active_connections[:]:
-            try:
-                await connection.close()
-            except Exception as e:
-                logging.error(f"Error closing connection: {e}")
+        await self.stream.close_all()
         self.active_connections.clear()
@@ -0,0 +1,229 @@
+import asyncio
+import json
+import logging
+import threading
+from typing import Dict, List, Optional, Set, Tuple
+
+from fastapi import WebSocket
+
+
+class _StreamClient:
+    """
+    Per-connection send state.
+    """
+
+    def __init__(self, websocket: WebSocket):
+        self.websocket = websocket
+        self.version = 0
+        self.wakeup = asyncio.Event()
+
+
+class StateStream:
+    """
+    Versioned, delta-encoded state publisher for WebSocket clients.
+
+    Every `publish` serializes each top-level state field once and, if anything
+    changed, produces a single diff message shared by all clients. Each client
+    has its own sender task, so a slow browser never delays the others. A
+    client that falls behind skips the intermediate versions and receives one
+    full snapshot of the latest state (drop-to-latest).
+
+    Messages are JSON objects of the form
+    ``{"type": "snapshot", "version": n, "state": {...}}`` or
+    ``{"type": "diff", "version": n, "changed": {...}, "removed": [...]}``,
+    where a diff always applies to version n - 1.
+
+    Parameters
+    ----------
+    send_timeout : float
+        Seconds a single send may take before the client is disconnected.
+    """
+
+    def __init__(self, send_timeout: float = 10.0):
+        self.send_timeout = send_timeout
+
+        self._lock = threading.Lock()
+        self._version = 0
+        self._parts: Dict[str, str] = {}
+        self._diff_text: Optional[str] = None
+        self._snapshot_text: Optional[str] = None
+
+        self._clients: Set[_StreamClient] = set()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+        self.metrics = {
+            "published": 0,
+            "diffs_sent": 0,
+            "snapshots_sent": 0,
+            "versions_skipped": 0,
+            "clients": 0,
+        }
+
+    @property
+    def version(self) -> int:
+        """
+        The current state version.
+        """
+        return self._version
+
+    def publish(self, state: dict) -> bool:
+        """
+        Publish a new state. Safe to call from any thread.
+
+        Parameters
+        ----------
+        state : dict
+            The full, JSON serializable state.
+
+        Returns
+        -------
+        bool
+            True if the state changed and clients were notified.
+        """
+        parts = {
+            key: json.dumps(value, separators=(",", ":"), default=str)
+            for key, value in state.items()
+        }
+
+        with self._lock:
+            changed = [
+                key for key, text in parts.items() if self._parts.get(key) != text
+            ]
+            removed = [key for key in self._parts if key not in parts]
+            if not changed and not removed:
+                return False
+
+            self._version += 1
+            self._diff_text = (
+                f'{{"type":"diff","version":{self._version},"changed":{{'
+                + ",".join(f"{json.dumps(key)}:{parts[key]}" for key in changed)
+                + f'}},"removed":{json.dumps(removed)}}}'
+            )
+            self._parts = parts
+            self._snapshot_text = None
+            self.metrics["published"] += 1
+
+        self._notify()
+        return True
+
+    def message_for(self, client_version: int) -> Tuple[int, Optional[str]]:
+        """
+        Get the message that brings a client at `client_version` up to date.
+
+        Parameters
+        ----------
+        client_version : int
+            The last version the client received, or 0 for none.
+
+        Returns
+        -------
+        Tuple[int, Optional[str]]
+            The version the message brings the client to, and the serialized
+            message, or None if the client is already up to date.
+        """
+        with self._lock:
+            if client_version == self._version:
+                return self._version, None
+            if client_version == self._version - 1 and self._diff_text is not None:
+                return self._version, self._diff_text
+            if self._snapshot_text is None:
+                self._snapshot_text = (
+                    f'{{"type":"snapshot","version":{self._version},"state":{{'
+                    + ",".join(
+                        f"{json.dumps(key)}:{text}" for key, text in self._parts.items()
+                    )
+                    + "}}"
+                )
+            return self._version, self._snapshot_text
+
+    def _notify(self) -> None:
+        """
+        Wake every client sender on the server event loop.
+        """
+        loop = self._loop
+        if loop is None or loop.is_closed():
+            return
+        try:
+            loop.call_soon_threadsafe(self._wake_clients)
+        except RuntimeError:
+            pass
+
+    def _wake_clients(self) -> None:
+        for client in list(self._clients):
+            client.wakeup.set()
+
+    async def serve(self, websocket: WebSocket) -> None:
+        """
+        Stream state to an accepted WebSocket until it disconnects.
+
+        Clients may send the text "resync" to request a full snapshot.
+
+        Parameters
+        ----------
+        websocket : WebSocket
+            An accepted WebSocket connection.
+        """
+        self._loop = asyncio.get_running_loop()
+        client = _StreamClient(websocket)
+        self._clients.add(client)
+        self.metrics["clients"] = len(self._clients)
+        sender = asyncio.create_task(self._send_loop(client))
+        client.wakeup.set()
+
+        try:
+            while True:
+                text = await websocket.receive_text()
+                if text == "resync":
+                    client.version = 0
+                    client.wakeup.set()
+        finally:
+            sender.cancel()
+            self._clients.discard(client)
+            self.metrics["clients"] = len(self._clients)
+
+    async def _send_loop(self, client: _StreamClient) -> None:
+        """
+        Send the latest state to a single client whenever it changes.
+        """
+        try:
+            while True:
+                await client.wakeup.wait()
+                client.wakeup.clear()
+
+                previous = client.version
+                version, text = self.message_for(previous)
+                if text is None:
+                    continue
+
+                await asyncio.wait_for(
+                    client.websocket.send_text(text), timeout=self.send_timeout
+                )
+                client.version = version
+
+                if version == previous + 1 and previous != 0:
+                    self.metrics["diffs_sent"] += 1
+                else:
+                    self.metrics["snapshots_sent"] += 1
+                    if previous != 0:
+                        self.metrics["versions_skipped"] += version - previous - 1
+        except asyncio.CancelledError:
+            pass
+        except Exception as e:
+            logging.error(f"Error streaming state to client: {e}")
+            try:
+                await client.websocket.close()
+            except Exception:
+                pass
+
+    async def close_all(self) -> None:
+        """
+        Close every connected client.
+        """
+        clients: List[_StreamClient] = list(self._clients)
+        for client in clients:
+            try:
+                await client.websocket.close()
+            except Exception as e:
+                logging.error(f"Error closing connection: {e}")
+        self._clients.clear()
+        self.metrics["clients"] = 0
@@ -1,4 +1,12 @@
-from . import session
+from . import cdr, session
+from .cdr import (
+    ImageArray,
+    LaserScanArrays,
+    PointCloudArrays,
+    decode_image,
+    decode_laser_scan,
+    decode_point_cloud,
+)
 from .idl import (
     IMU,
     Accel,
@@ -116,10 +124,18 @@ __all__ = [
     "LaserScan",
     "DockStatus",
     "Paths",
+    # numpy decoding
+    "ImageArray",
+    "LaserScanArrays",
+    "PointCloudArrays",
+    "decode_image",
+    "decode_laser_scan",
+    "decode_point_cloud",
     # session
     "create_zenoh_config",
     "open_zenoh_session",
     # modules
+    "cdr",
     "session",
     # idl submodules
     "std_msgs",
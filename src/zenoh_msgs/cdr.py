@@ -0,0 +1,294 @@
+"""
+NumPy-native CDR decoding for large sensor messages.
+
+`IdlStruct.deserialize` turns every element of a sequence into a Python
+object, so a 2000 beam LaserScan becomes 4000 Python floats and a depth
+obstacle cloud becomes thousands of `Point32` dataclasses. The decoders in
+this module parse the fixed fields of the message and map the numeric
+sequences straight onto the payload with `np.frombuffer`, without a copy and
+without per-element objects.
+
+The returned arrays are read-only views of the payload.
+"""
+
+import struct
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+import numpy as np
+
+from .idl.sensor_msgs import PointField
+from .idl.std_msgs import Header, Time
+
+# encapsulation identifiers of plain CDR, big and little endian
+_CDR_BE = 0x00
+_CDR_LE = 0x01
+
+
+class CdrReader:
+    """
+    Sequential reader of a CDR encapsulated payload.
+
+    Parameters
+    ----------
+    payload : bytes
+        The serialized message, starting with the 4 byte encapsulation
+        header.
+    """
+
+    def __init__(self, payload: bytes):
+        if len(payload) < 4:
+            raise ValueError("CDR payload is shorter than its header")
+
+        kind = payload[1]
+        if payload[0] != 0 or kind not in (_CDR_BE, _CDR_LE):
+            raise ValueError(f"Unsupported CDR encapsulation {payload[:2].hex()}")
+
+        self.buffer = memoryview(payload)
+        self.order = "<" if kind == _CDR_LE else ">"
+        # alignment is relative to the end of the encapsulation header
+        self.base = 4
+        self.offset = 4
+
+    def align(self, size: int):
+        """
+        Skip padding up to the next multiple of `size`.
+        """
+        position = self.offset - self.base
+        self.offset += (-position) % size
+
+    def _unpack(self, fmt: str, size: int):
+        self.align(size)
+        value = struct.unpack_from(self.order + fmt, self.buffer, self.offset)[0]
+        self.offset += size
+        return value
+
+    def uint8(self) -> int:
+        value = self.buffer[self.offset]
+        self.offset += 1
+        return value
+
+    def int32(self) -> int:
+        return self._unpack("i", 4)
+
+    def uint32(self) -> int:
+        return self._unpack("I", 4)
+
+    def float32(self) -> float:
+        return self._unpack("f", 4)
+
+    def float64(self) -> float:
+        return self._unpack("d", 8)
+
+    def string(self) -> str:
+        """
+        Read a string, stored as its length including the terminating NUL.
+        """
+        length = self.uint32()
+        end = self.offset + length
+        if end > len(self.buffer):
+            raise ValueError("CDR string runs past the end of the payload")
+        value = bytes(self.buffer[self.offset : max(self.offset, end - 1)])
+        self.offset = end
+        return value.decode("utf-8", errors="replace")
+
+    def array(self, dtype: str, count: int) -> np.ndarray:
+        """
+        Map `count` elements of a numeric type onto the payload.
+
+        Parameters
+        ----------
+        dtype : str
+            NumPy type code without byte order, such as "f4" or "u1".
+        count : int
+            Number of elements.
+
+        Returns
+        -------
+        np.ndarray
+            A read-only view of the payload.
+        """
+        dt = np.dtype(self.order + dtype)
+        self.align(dt.alignment)
+        end = self.offset + dt.itemsize * count
+        if end > len(self.buffer):
+            raise ValueError("CDR sequence runs past the end of the payload")
+        values = np.frombuffer(self.buffer, dtype=dt, count=count, offset=self.offset)
+        self.offset = end
+        return values
+
+    def sequence(self, dtype: str) -> np.ndarray:
+        """
+        Read a length prefixed sequence of a numeric type.
+        """
+        return self.array(dtype, self.uint32())
+
+    def header(self) -> Header:
+        """
+        Read a std_msgs Header.
+        """
+        sec = self.int32()
+        nanosec = self.uint32()
+        return Header(stamp=Time(sec=sec, nanosec=nanosec), frame_id=self.string())
+
+
+@dataclass
+class LaserScanArrays:
+    """
+    sensor_msgs LaserScan with `ranges` and `intensities` as float32 arrays.
+    """
+
+    header: Header
+    angle_min: float
+    angle_max: float
+    angle_increment: float
+    time_increment: float
+    scan_time: float
+    range_min: float
+    range_max: float
+    ranges: np.ndarray
+    intensities: np.ndarray
+
+
+@dataclass
+class PointCloudArrays:
+    """
+    sensor_msgs PointCloud with `points` as an (N, 3) float32 array of x, y, z.
+    """
+
+    header: Header
+    points: np.ndarray
+    channels: List[PointField] = field(default_factory=list)
+
+
+@dataclass
+class ImageArray:
+    """
+    sensor_msgs Image with `data` as a uint8 array.
+    """
+
+    header: Header
+    height: int
+    width: int
+    encoding: str
+    is_bigendian: int
+    step: int
+    data: np.ndarray
+
+    # channels and element type of the common ROS image encodings
+    ENCODINGS = {
+        "mono8": (1, "u1"),
+        "8UC1": (1, "u1"),
+        "rgb8": (3, "u1"),
+        "bgr8": (3, "u1"),
+        "8UC3": (3, "u1"),
+        "rgba8": (4, "u1"),
+        "bgra8": (4, "u1"),
+        "8UC4": (4, "u1"),
+        "mono16": (1, "u2"),
+        "16UC1": (1, "u2"),
+        "32FC1": (1, "f4"),
+    }
+
+    def to_ndarray(self) -> Optional[np.ndarray]:
+        """
+        View the pixels as a (height, width[, channels]) array.
+
+        Returns
+        -------
+        Optional[np.ndarray]
+            The pixels, or None for an unknown encoding or a short buffer.
+        """
+        layout = self.ENCODINGS.get(self.encoding)
+        if layout is None or len(self.data) < self.height * self.step:
+            return None
+
+        channels, dtype = layout
+        dt = np.dtype((">" if self.is_bigendian else "<") + dtype)
+        rows = self.data[: self.height * self.step].reshape(self.height, self.step)
+        row_bytes = self.width * channels * dt.itemsize
+        pixels = rows[:, :row_bytes]
+        if dt.itemsize > 1:
+            pixels = np.ascontiguousarray(pixels).view(dt)
+        if channels == 1:
+            return pixels.reshape(self.height, self.width)
+        return pixels.reshape(self.height, self.width, channels)
+
+
+def decode_laser_scan(payload: bytes) -> LaserScanArrays:
+    """
+    Decode a serialized sensor_msgs LaserScan.
+
+    Parameters
+    ----------
+    payload : bytes
+        The CDR payload.
+
+    Returns
+    -------
+    LaserScanArrays
+        The scan, with range arrays viewing the payload.
+    """
+    reader = CdrReader(payload)
+    header = reader.header()
+    fixed = [reader.float32() for _ in range(7)]
+    ranges = reader.sequence("f4")
+    intensities = reader.sequence("f4")
+    return LaserScanArrays(header, *fixed, ranges=ranges, intensities=intensities)
+
+
+def decode_point_cloud(payload: bytes) -> PointCloudArrays:
+    """
+    Decode a serialized sensor_msgs PointCloud.
+
+    Parameters
+    ----------
+    payload : bytes
+        The CDR payload.
+
+    Returns
+    -------
+    PointCloudArrays
+        The cloud, with points viewing the payload.
+    """
+    reader = CdrReader(payload)
+    header = reader.header()
+    count = reader.uint32()
+    points = reader.array("f4", count * 3).reshape(count, 3)
+
+    channels = []
+    for _ in range(reader.uint32()):
+        name = reader.string()
+        offset = reader.uint32()
+        datatype = reader.uint8()
+        channels.append(
+            PointField(
+                name=name, offset=offset, datatype=datatype, count=reader.uint32()
+            )
+        )
+    return PointCloudArrays(header=header, points=points, channels=channels)
+
+
+def decode_image(payload: bytes) -> ImageArray:
+    """
+    Decode a serialized sensor_msgs Image.
+
+    Parameters
+    ----------
+    payload : bytes
+        The CDR payload.
+
+    Returns
+    -------
+    ImageArray
+        The image, with data viewing the payload.
+    """
+    reader = CdrReader(payload)
+    header = reader.header()
+    height = reader.uint32()
+    width = reader.uint32()
+    encoding = reader.string()
+    is_bigendian = reader.uint8()
+    step = reader.uint32()
+    data = reader.sequence("u1")
+    return ImageArray(header, height, width, encoding, is_bigendian, step, data)
@@ -0,0 +1,191 @@
+import math
+
+import pytest
+
+from actions.motion_controller import (
+    MotionController,
+    MotionGoal,
+    Pose,
+    wrap_degrees,
+)
+
+RATE_HZ = 20.0
+
+
+class SimulatedRobot:
+    """
+    Unicycle robot whose velocities lag the commands, with odometry that
+    arrives `latency` seconds late and a constant heading drift.
+    """
+
+    def __init__(self, yaw=0.0, lag=0.15, latency=0.05, drift=0.0):
+        self.x, self.y, self.yaw = 1.0, 2.0, yaw
+        self.linear = self.angular = 0.0
+        self.command = (0.0, 0.0)
+        self.lag = lag
+        self.latency = latency
+        self.drift = drift
+        self.now = 0.0
+        self.history = [(0.0, Pose(self.x, self.y, self.yaw, 0.0))]
+
+    def send(self, linear, angular):
+        self.command = (linear, angular)
+
+    def pose(self):
+        measured = [p for t, p in self.history if t <= self.now - self.latency]
+        return measured[-1] if measured else self.history[0][1]
+
+    def advance(self, dt):
+        steps = 10
+        for _ in range(steps):
+            h = dt / steps
+            self.linear += (self.command[0] - self.linear) * h / self.lag
+            self.angular += (self.command[1] - self.angular) * h / self.lag
+            self.yaw = wrap_degrees(
+                self.yaw + math.degrees(self.angular * h) + self.drift * h
+            )
+            heading = math.radians(self.yaw)
+            self.x += self.linear * math.cos(heading) * h
+            self.y += self.linear * math.sin(heading) * h
+        self.now += dt
+        self.history.append((self.now, Pose(self.x, self.y, self.yaw, self.now)))
+
+
+def _controller(robot, **kwargs):
+    return MotionController(
+        send_velocity=robot.send,
+        read_pose=robot.pose,
+        rate_hz=RATE_HZ,
+        clock=lambda: robot.now,
+        **kwargs,
+    )
+
+
+def _run(controller, robot, seconds):
+    for _ in range(int(seconds * RATE_HZ)):
+        controller.step(robot.now)
+        robot.advance(1.0 / RATE_HZ)
+        if not controller.busy:
+            break
+
+
+def test_turn_converges_without_overshoot():
+    robot = SimulatedRobot(yaw=170.0)
+    controller = _controller(robot)
+
+    controller.submit(MotionGoal(yaw=-100.0, label="turn left"))
+    _run(controller, robot, 10)
+
+    report = controller.reports[-1]
+    assert report.outcome == "reached"
+    assert abs(wrap_degrees(robot.yaw + 100.0)) < 4.0
+    # the short way round is 90 degrees to the left, across +-180
+    assert report.max_overshoot < 3.0
+    assert report.time_to_goal_s < 4.0
+
+
+def test_drive_holds_heading_against_drift():
+    robot = SimulatedRobot(yaw=30.0, drift=5.0)
+    controller = _controller(robot)
+
+    controller.submit(MotionGoal(yaw=30.0, distance=0.5))
+    _run(controller, robot, 10)
+
+    report = controller.reports[-1]
+    assert report.outcome == "reached"
+    assert abs(report.distance_error) <= 0.03
+    assert report.rms_cross_track < 0.02
+    travelled = math.hypot(robot.x - 1.0, robot.y - 2.0)
+    assert travelled == pytest.approx(0.5, abs=0.05)
+
+
+def test_drive_backwards():
+    robot = SimulatedRobot()
+    controller = _controller(robot)
+
+    controller.submit(MotionGoal(distance=-0.3, max_speed=0.2))
+    _run(controller, robot, 10)
+
+    assert controller.reports[-1].outcome == "reached"
+    assert robot.x == pytest.approx(0.7, abs=0.04)
+
+
+def test_goals_run_in_order_and_queue_is_bounded():
+    robot = SimulatedRobot()
+    controller = _controller(robot, max_queue=2)
+
+    assert controller.submit(MotionGoal(yaw=45.0, label="first"))
+    assert controller.submit(MotionGoal(turn=-30.0, distance=0.2, label="second"))
+    assert not controller.submit(MotionGoal(yaw=90.0, label="third"))
+    _run(controller, robot, 20)
+
+    assert [r.label for r in controller.reports] == ["first", "second"]
+    # the relative turn starts from where the first goal ended
+    assert abs(wrap_degrees(robot.yaw - 15.0)) < 4.0
+    assert all(r.outcome == "reached" for r in controller.reports)
+    assert controller.summary()["reached_rate"] == 1.0
+
+
+def test_stop_cancels_goals_and_zeroes_command():
+    robot = SimulatedRobot()
+    controller = _controller(robot)
+    controller.submit(MotionGoal(distance=1.0))
+    controller.submit(MotionGoal(yaw=90.0))
+    for _ in range(10):
+        controller.step(robot.now)
+        robot.advance(1.0 / RATE_HZ)
+    assert robot.command[0] > 0
+
+    controller.stop()
+
+    assert robot.command == (0.0, 0.0)
+    assert not controller.busy
+    assert controller.reports[-1].outcome == "cancelled"
+
+
+def test_stale_odometry_stops_the_robot():
+    robot = SimulatedRobot()
+    controller = _controller(robot, goal_timeout=2.0)
+    controller.submit(MotionGoal(distance=1.0))
+    for _ in range(10):
+        controller.step(robot.now)
+        robot.advance(1.0 / RATE_HZ)
+    assert robot.command[0] > 0
+
+    # odometry stops arriving
+    last_pose = robot.pose()
+    controller.read_pose = lambda: last_pose
+    for _ in range(20):
+        controller.step(robot.now)
+        robot.advance(1.0 / RATE_HZ)
+    assert robot.command == (0.0, 0.0)
+
+    _run(controller, robot, 3)
+    assert controller.reports[-1].outcome == "stale odometry"
+
+
+def test_blocked_drive_ends_goal():
+    robot = SimulatedRobot()
+    controller = _controller(robot, can_drive=lambda direction: direction < 0)
+
+    controller.submit(MotionGoal(distance=0.5))
+    _run(controller, robot, 2)
+
+    assert controller.reports[-1].outcome == "blocked"
+    assert robot.command == (0.0, 0.0)
+
+
+def test_blocked_turn_ends_goal():
+    robot = SimulatedRobot()
+    controller = _controller(robot, can_turn=lambda direction: direction < 0)
+
+    controller.submit(MotionGoal(turn=90.0))
+    _run(controller, robot, 2)
+
+    assert controller.reports[-1].outcome == "blocked"
+    assert robot.command == (0.0, 0.0)
+
+    # the other side is clear
+    controller.submit(MotionGoal(turn=-90.0))
+    _run(controller, robot, 10)
+    assert controller.reports[-1].outcome == "reached"
@@ -0,0 +1,98 @@
+import asyncio
+import subprocess
+import sys
+
+import pytest
+
+from control.log_stream import LogFilter, LogRing, detect_level, read_pipe
+
+
+def test_ring_keeps_capacity_and_sequence_numbers():
+    ring = LogRing(capacity=3)
+    for i in range(5):
+        ring.append(f"line {i}\n")
+
+    assert len(ring) == 3
+    assert [e.seq for e in ring.tail(10)] == [2, 3, 4]
+    assert ring.first_seq == 2
+    assert ring.tail(1)[0].text == "line 4"
+    assert ring.tail(1)[0].format().endswith("] line 4")
+
+
+def test_cursor_pagination_survives_eviction():
+    ring = LogRing(capacity=10)
+    for i in range(25):
+        ring.append(f"line {i}")
+
+    page, cursor = ring.since(0, limit=4)
+    # lines 0-14 were evicted, so paging resumes at the oldest retained line
+    assert [e.seq for e in page] == [15, 16, 17, 18]
+    page, cursor = ring.since(cursor, limit=4)
+    assert [e.seq for e in page] == [19, 20, 21, 22]
+    page, cursor = ring.since(cursor, limit=4)
+    assert [e.seq for e in page] == [23, 24]
+    assert ring.since(cursor) == ([], 25)
+
+    latest, cursor = ring.since(None, limit=2)
+    assert [e.seq for e in latest] == [23, 24]
+    assert cursor == 25
+
+
+def test_level_and_pattern_filters():
+    ring = LogRing()
+    ring.append("2025-01-01 INFO cortex tick")
+    ring.append("2025-01-01 WARNING audio underrun")
+    ring.append("2025-01-01 ERROR speak failed")
+    ring.append("plain output")
+
+    assert detect_level("WARN something") == "WARNING"
+    warnings, _ = ring.since(0, log_filter=LogFilter(level="warning"))
+    assert [e.level for e in warnings] == ["WARNING", "ERROR"]
+    speak, cursor = ring.since(0, log_filter=LogFilter(pattern="SPEAK|tick"))
+    assert [e.seq for e in speak] == [0, 2]
+    assert cursor == 4
+
+
+@pytest.mark.asyncio
+async def test_subscribers_get_pushed_lines_and_drop_oldest_when_slow():
+    ring = LogRing()
+    errors = ring.subscribe(LogFilter(level="ERROR"))
+    slow = ring.subscribe(max_queue=2)
+
+    for text in ["INFO a", "ERROR b", "INFO c", "ERROR d"]:
+        ring.append(text)
+
+    assert (await errors.get()).text == "ERROR b"
+    assert (await errors.get()).text == "ERROR d"
+    assert slow.dropped == 2
+    assert [(await slow.get()).text for _ in range(2)] == ["INFO c", "ERROR d"]
+
+    ring.unsubscribe(slow)
+    ring.append("ERROR e")
+    assert slow.queue.empty()
+
+
+@pytest.mark.asyncio
+async def test_read_pipe_streams_subprocess_output():
+    ring = LogRing()
+    process = subprocess.Popen(
+        [
+            sys.executable,
+            "-c",
+            "for i in range(3): print(f'INFO line {i}', flush=True)",
+        ],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        bufsize=0,
+    )
+    subscription = ring.subscribe()
+
+    await asyncio.wait_for(read_pipe(process.stdout, ring), timeout=10)
+    process.wait(timeout=10)
+
+    assert [e.text for e in ring.tail(10)] == [
+        "INFO line 0",
+        "INFO line 1",
+        "INFO line 2",
+    ]
+    assert subscription.queue.qsize() == 3
@@ -84,3 +84,25 @@ def test_fuser_with_inputs_and_actions(mock_describe):
             io_provider.fuser_available_actions
             == "AVAILABLE ACTIONS:\naction description\n\naction description\n\n\n\nWhat will you do? Actions:"
         )
+
+
+class TextSensor:
+    def __init__(self, text):
+        self.text = text
+
+    def formatted_latest_buffer(self):
+        return self.text
+
+
+def test_voice_question_only_when_voice_is_the_only_input():
+    voice = TextSensor("INPUT: Voice\n// START\nwhere is the restroom\n// END\n")
+    vision = TextSensor("INPUT: Vision\n// START\na man with a map\n// END\n")
+
+    with patch("fuser.IOProvider", return_value=IOProvider()):
+        fuser = Fuser(MockConfig())
+        fuser.fuse([voice], [])
+        assert fuser.voice_question == "where is the restroom"
+
+        fuser.fuse([voice, vision], [])
+        assert fuser.voice_input == "where is the restroom"
+        assert fuser.voice_question is None
@@ -37,7 +37,7 @@ def mock_io_provider():
 def face_emotion(mock_cv2, mock_io_provider, mock_deepface):
     with patch("inputs.plugins.webcam_to_face_emotion.check_webcam", return_value=True):
         instance = FaceEmotionCapture()
-        instance.face_cascade.detectMultiScale = Mock(return_value=[(10, 10, 50, 50)])
+        instance.tracker.detector = Mock(return_value=[(10, 10, 50, 50)])
         instance.have_cam = True
         mock_cap = Mock()
         mock_cap.read.return_value = (True, np.zeros((100, 100, 3)))
@@ -48,7 +48,7 @@ def face_emotion(mock_cv2, mock_io_provider, mock_deepface):
 def test_init(face_emotion, mock_cv2):
     assert isinstance(face_emotion.messages, list)
     assert face_emotion.emotion == ""
-    mock_cv2.CascadeClassifier.assert_called_once()
+    assert face_emotion.tracking_mode == "hybrid"
     mock_cv2.VideoCapture.assert_called_once_with(0)
 
 
@@ -63,7 +63,7 @@ async def test_poll(face_emotion):
 @pytest.mark.asyncio
 async def test_raw_to_text_with_face(face_emotion, mock_cv2, mock_deepface):
     frame = np.zeros((100, 100, 3), dtype=np.uint8)
-    face_emotion.face_cascade.detectMultiScale.return_value = [(10, 10, 50, 50)]
+    face_emotion.tracker.detector.return_value = [(10, 10, 50, 50)]
 
     result = await face_emotion._raw_to_text(frame)
 
@@ -75,7 +75,7 @@ async def test_raw_to_text_with_face(face_emotion, mock_cv2, mock_deepface):
 @pytest.mark.asyncio
 async def test_raw_to_text_no_face(face_emotion, mock_cv2, mock_deepface):
     frame = np.zeros((100, 100, 3), dtype=np.uint8)
-    face_emotion.face_cascade.detectMultiScale.return_value = []
+    face_emotion.tracker.detector.return_value = []
 
     result = await face_emotion._raw_to_text(frame)
 
@@ -83,6 +83,19 @@ async def test_raw_to_text_no_face(face_emotion, mock_cv2, mock_deepface):
     mock_deepface.analyze.assert_not_called()
 
 
+@pytest.mark.asyncio
+async def test_raw_to_text_classifies_tracked_face_once(face_emotion, mock_deepface):
+    frame = np.zeros((100, 100, 3), dtype=np.uint8)
+
+    first = await face_emotion._raw_to_text(frame)
+    second = await face_emotion._raw_to_text(frame)
+
+    assert "happy" in first.message
+    assert "happy" in second.message
+    mock_deepface.analyze.assert_called_once()
+    assert face_emotion.tracker.timer.summary()["classify"]["count"] == 1
+
+
 @pytest.mark.asyncio
 async def test_raw_to_text_buffer_management(face_emotion, mock_deepface):
     frame = np.zeros((100, 100, 3), dtype=np.uint8)
@@ -0,0 +1,131 @@
+import json
+import time
+from types import SimpleNamespace
+
+import pytest
+from pydantic import BaseModel
+
+from llm import LLM, LLMConfig, load_function_provider
+from providers.function_call_provider import LLMFunction
+
+
+class MockLLM(LLM[BaseModel]):
+    async def ask(self, prompt: str) -> BaseModel:
+        raise NotImplementedError
+
+
+class FakeLocations:
+    def __init__(self):
+        self.calls = []
+
+    @LLMFunction("Distance to a location", read_only=True)
+    def get_distance(self, location_name: str) -> dict:
+        time.sleep(0.2)
+        return {"success": True, "distance": len(location_name)}
+
+    @LLMFunction("Navigation status", read_only=True)
+    def get_status(self) -> dict:
+        time.sleep(0.2)
+        return {"success": True, "navigating": False}
+
+    @LLMFunction("Go to a location")
+    def navigate(self, location_name: str) -> dict:
+        self.calls.append(location_name)
+        return {"success": True}
+
+    @LLMFunction("Hang", read_only=True)
+    def hang(self) -> dict:
+        time.sleep(1.0)
+        return {"success": True}
+
+
+def _call(call_id, name, arguments=None):
+    return SimpleNamespace(
+        id=call_id,
+        function=SimpleNamespace(name=name, arguments=json.dumps(arguments or {})),
+    )
+
+
+def _message(*tool_calls):
+    return SimpleNamespace(content=None, tool_calls=list(tool_calls) or None)
+
+
+class ScriptedModel:
+    def __init__(self, *responses):
+        self.responses = list(responses)
+        self.requests = []
+
+    async def __call__(self, messages):
+        self.requests.append(messages)
+        return self.responses[min(len(self.requests), len(self.responses)) - 1]
+
+
+@pytest.fixture
+def llm():
+    llm = MockLLM(LLMConfig(max_tool_rounds=2, tool_budget=0.5))
+    llm.register_llm_functions(FakeLocations())
+    return llm
+
+
+def test_registered_functions_get_schemas(llm):
+    assert set(llm.llm_functions) == {"get_distance", "get_status", "navigate", "hang"}
+    assert {s["function"]["name"] for s in llm.function_schemas} == set(
+        llm.llm_functions
+    )
+
+
+@pytest.mark.asyncio
+async def test_function_results_are_fed_back_in_one_follow_up(llm):
+    speak = _call("c3", "speak", {"sentence": "The kitchen is 7 m away"})
+    model = ScriptedModel(
+        _message(
+            _call("c1", "get_distance", {"location_name": "kitchen"}),
+            _call("c2", "get_status"),
+            _call("c0", "emotion", {"action": "happy"}),
+        ),
+        _message(speak, _call("c4", "emotion", {"action": "happy"})),
+    )
+
+    started = time.monotonic()
+    actions = await llm._run_tool_loop(model, [{"role": "user", "content": "hi"}])
+
+    # the two read-only lookups ran concurrently
+    assert time.monotonic() - started < 0.35
+    assert len(model.requests) == 2
+    follow_up = model.requests[1]
+    assert [m["role"] for m in follow_up] == [
+        "user",
+        "assistant",
+        "tool",
+        "tool",
+        "tool",
+    ]
+    assert json.loads(follow_up[2]["content"]) == {"success": True, "distance": 7}
+    assert json.loads(follow_up[4]["content"])["message"] == "Action queued"
+
+    # the repeated emotion action is only returned once
+    assert [a["function"]["name"] for a in actions] == ["emotion", "speak"]
+
+
+@pytest.mark.asyncio
+async def test_rounds_and_latency_are_capped(llm):
+    navigate = _call("c1", "navigate", {"location_name": "desk"})
+    model = ScriptedModel(_message(navigate))
+    assert await llm._run_tool_loop(model, []) == []
+    assert len(model.requests) == 3
+    assert llm.llm_functions["navigate"].__self__.calls == ["desk", "desk"]
+
+    model = ScriptedModel(_message(_call("c1", "hang")), _message())
+    started = time.monotonic()
+    await llm._run_tool_loop(model, [])
+    assert time.monotonic() - started < 0.9
+    assert json.loads(model.requests[1][-1]["content"]) == {
+        "success": False,
+        "message": "Timed out",
+    }
+
+
+def test_unknown_function_provider_is_skipped():
+    assert load_function_provider("NoSuchProvider") is None
+    llm = MockLLM(LLMConfig(function_providers=["NoSuchProvider"]))
+    assert llm.llm_functions == {}
@@ -0,0 +1,217 @@
+import json
+from unittest.mock import AsyncMock
+
+import pytest
+
+from llm.output_model import Action, CortexOutputModel
+from providers.answer_cache_provider import (
+    AnswerCacheProvider,
+    HashingEmbedder,
+    answer_cache_from_config,
+    normalize_question,
+)
+from providers.singleton import singleton
+
+
+@pytest.fixture(autouse=True)
+def reset_singleton():
+    singleton.instances = {}
+    yield
+    singleton.instances = {}
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = AnswerCacheProvider(path=str(tmp_path / "answers.json"))
+    cache.set_context("conversation", "BASIC CONTEXT: receptionist")
+    return cache
+
+
+def _answer(sentence):
+    return CortexOutputModel(
+        actions=[Action(type="speak", value={"sentence": sentence, "language": "en"})]
+    )
+
+
+def _llm(sentence="The restroom is down the hall."):
+    llm = AsyncMock()
+    llm.ask.return_value = _answer(sentence)
+    llm.history_manager.history = []
+    return llm
+
+
+def test_normalize_question():
+    assert (
+        normalize_question("[LANG:en]  Um, where's the RESTROOM?!")
+        == "where is the restroom"
+    )
+    assert normalize_question("[LANG:es] ¿Dónde está el baño?") == "dónde está el baño"
+
+
+@pytest.mark.asyncio
+async def test_exact_and_similar_hits_skip_the_llm(cache):
+    cache.embedder = HashingEmbedder()
+    cache.similarity_threshold = 0.85
+    llm = _llm()
+
+    first = await cache.ask(
+        llm, "p1", "[LANG:en] Where is the restroom?", "en", "conversation"
+    )
+    again = await cache.ask(llm, "p2", "where is the restroom", "en", "conversation")
+    similar = await cache.ask(
+        llm, "p3", "Where is the restroom located?", "en", "conversation"
+    )
+
+    assert llm.ask.await_count == 1
+    assert again == first == similar
+    stats = cache.stats()
+    assert stats["exact_hits"] == 1
+    assert stats["similar_hits"] == 1
+    assert stats["misses"] == 1
+    assert stats["hit_rate"] == pytest.approx(2 / 3)
+
+
+@pytest.mark.asyncio
+async def test_different_questions_languages_and_modes_miss(cache):
+    llm = _llm()
+    await cache.ask(llm, "p", "where is the restroom", "en", "conversation")
+
+    await cache.ask(llm, "p", "what are your hours", "en", "conversation")
+    await cache.ask(llm, "p", "where is the restroom", "es", "conversation")
+    await cache.ask(llm, "p", "where is the restroom", "en", "guard")
+
+    assert llm.ask.await_count == 4
+
+
+@pytest.mark.asyncio
+async def test_ambiguous_similar_questions_miss(cache):
+    cache.embedder = HashingEmbedder()
+    cache.similarity_threshold = 0.5
+    cache.ambiguity_margin = 1.0
+    cache.store("where is the restroom", "en", "m", _answer("Hall.").model_dump(), 1)
+    cache.store("where is the elevator", "en", "m", _answer("Lobby.").model_dump(), 1)
+
+    llm = _llm()
+    await cache.ask(llm, "p", "where is the restroom located", "en", "m")
+    assert llm.ask.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_questions_differing_in_one_word_miss_by_default(tmp_path):
+    cache = answer_cache_from_config(
+        {"path": str(tmp_path / "answers.json")}, "conversation", "context"
+    )
+    await cache.ask(
+        _llm("Doctor Smith has openings on Tuesday."),
+        "p",
+        "is doctor smith available for appointments this week",
+        "en",
+        "conversation",
+    )
+
+    llm = _llm("Doctor Jones is away this week.")
+    output = await cache.ask(
+        llm,
+        "p",
+        "is doctor jones available for appointments this week",
+        "en",
+        "conversation",
+    )
+
+    assert llm.ask.await_count == 1
+    assert output == _answer("Doctor Jones is away this week.")
+
+
+@pytest.mark.asyncio
+async def test_uncacheable_and_silent_answers_are_not_stored(cache):
+    await cache.ask(_llm(), "p", "what do you see", "en", "conversation")
+    await cache.ask(
+        _llm("NO ACTIONS"), "p", "tell me about your company", "en", "conversation"
+    )
+    assert len(cache) == 0
+
+
+@pytest.mark.parametrize(
+    "question",
+    ["yes", "tell me more", "what about the other one", "where is it", "and parking"],
+)
+def test_follow_ups_are_not_cacheable(cache, question):
+    assert not cache.is_cacheable(normalize_question(question))
+    assert cache.is_cacheable("where is the restroom")
+
+
+@pytest.mark.asyncio
+async def test_llm_with_history_bypasses_the_cache(cache):
+    llm = _llm()
+    llm.history_manager.history = ["Visitor asked about doctor smith"]
+
+    await cache.ask(llm, "p", "where is the restroom", "en", "conversation")
+    await cache.ask(llm, "p", "where is the restroom", "en", "conversation")
+
+    assert llm.ask.await_count == 2
+    assert len(cache) == 0
+
+
+@pytest.mark.asyncio
+async def test_only_spoken_answers_are_replayed(cache):
+    llm = _llm()
+    llm.ask.return_value = CortexOutputModel(
+        actions=[
+            Action(type="move", value="turn left"),
+            *_answer("The restroom is down the hall.").actions,
+        ]
+    )
+    await cache.ask(llm, "p", "where is the restroom", "en", "conversation")
+
+    replay = await cache.ask(llm, "p", "where is the restroom", "en", "conversation")
+    assert llm.ask.await_count == 1
+    assert replay == _answer("The restroom is down the hall.")
+
+
+@pytest.mark.asyncio
+async def test_context_change_and_ttl_invalidate(cache):
+    await cache.ask(_llm(), "p", "where is the restroom", "en", "conversation")
+    assert len(cache) == 1
+
+    cache.set_context("conversation", "BASIC CONTEXT: receptionist, new hours")
+    assert len(cache) == 0
+
+    await cache.ask(_llm(), "p", "where is the restroom", "en", "conversation")
+    cache.ttl_s = 0.0
+    llm = _llm()
+    await cache.ask(llm, "p", "where is the restroom", "en", "conversation")
+    assert llm.ask.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_lru_eviction(cache):
+    cache.max_entries = 2
+    for question in ("where is the restroom", "what are your hours", "who are you"):
+        await cache.ask(_llm(), "p", question, "en", "conversation")
+
+    assert len(cache) == 2
+    assert cache.lookup("where is the restroom", "en", "conversation") is None
+
+
+@pytest.mark.asyncio
+async def test_persisted_answers_survive_restart(tmp_path):
+    config = {"path": str(tmp_path / "answers.json")}
+    cache = answer_cache_from_config(config, "conversation", "context")
+    await cache.ask(_llm(), "p", "where is the restroom", "en", "conversation")
+    assert len(json.loads((tmp_path / "answers.json").read_text())) == 1
+
+    singleton.instances = {}
+    restarted = answer_cache_from_config(config, "conversation", "context")
+    llm = _llm()
+    await restarted.ask(llm, "p", "where is the restroom", "en", "conversation")
+    assert llm.ask.await_count == 0
+
+    # a different knowledge base or prompt drops the persisted answers
+    singleton.instances = {}
+    changed = answer_cache_from_config(config, "conversation", "new context")
+    assert len(changed) == 0
+
+
+def test_disabled_config():
+    assert answer_cache_from_config(None, "m", "context") is None
+    assert answer_cache_from_config({"enabled": False}, "m", "context") is None
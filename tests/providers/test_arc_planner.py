@@ -0,0 +1,64 @@
+import numpy as np
+import pytest
+
+from providers.arc_planner import ArcPlanner
+
+
+@pytest.fixture
+def planner():
+    return ArcPlanner(half_width=0.2)
+
+
+def _pillar(x: float, y: float, half_width: float = 0.1):
+    ys = np.linspace(y - half_width, y + half_width, 9)
+    return np.full_like(ys, x), ys
+
+
+def test_open_space_drives_straight_at_full_speed(planner):
+    plan = planner.plan([], [])
+
+    assert plan.admissible
+    assert plan.linear == pytest.approx(0.5)
+    assert plan.angular == pytest.approx(0.0)
+    assert plan.distance == pytest.approx(1.0)
+    assert plan.clearance_map.shape == (9, 41)
+    assert np.allclose(plan.clearance_map, planner.linear_samples[:, None] * 2.0)
+
+
+def test_curves_around_a_pillar_instead_of_stopping(planner):
+    x, y = _pillar(1.0, -0.05)
+    plan = planner.plan(x, y)
+
+    assert plan.admissible
+    # the pillar sits slightly right, so the arc goes left of it
+    assert plan.angular > 0
+    assert plan.turn > 5.0
+    assert plan.free_length == pytest.approx(plan.linear * planner.horizon)
+    # driving straight would stop short of the pillar
+    straight = planner.plan(x, y, linear=0.5, angular=0.0, angular_accel=0.0)
+    assert straight.free_length < plan.free_length
+
+
+def test_straight_arc_collision_is_exact(planner):
+    free, _ = planner.evaluate([0.8, 0.8], [0.19, -0.21])
+    straight = np.argmin(np.abs(planner._w) + (planner.linear_samples[-1] - planner._v))
+
+    # 0.19 m to the side is inside the footprint, 0.21 m is not
+    assert free[straight] == pytest.approx(0.8 - np.sqrt(0.2**2 - 0.19**2), abs=1e-4)
+
+
+def test_surrounded_robot_has_no_admissible_arc(planner):
+    bearings = np.linspace(-np.pi, np.pi, 360, endpoint=False)
+    plan = planner.plan(0.3 * np.cos(bearings), 0.3 * np.sin(bearings))
+
+    assert not plan.admissible
+    assert (plan.linear, plan.angular) == (0.0, 0.0)
+
+
+def test_goal_heading_and_dynamic_window(planner):
+    assert planner.plan([], [], goal_heading=45.0).angular > 0
+    assert planner.plan([], [], goal_heading=-45.0).angular < 0
+
+    plan = planner.plan([], [], goal_heading=45.0, linear=0.2, angular=0.0, dt=0.1)
+    assert plan.linear <= 0.3 + 1e-9
+    assert plan.angular <= 0.3 + 1e-9
@@ -0,0 +1,97 @@
+import sys
+import threading
+import time
+
+import pytest
+
+from providers.audio_session_provider import AudioSessionProvider
+from providers.singleton import singleton
+
+
+@pytest.fixture
+def session():
+    singleton.instances = {}
+    yield AudioSessionProvider(tail_padding_s=0.2, barge_in_rms=0.1, barge_in_min_s=0.3)
+    singleton.instances = {}
+
+
+def test_playback_and_tail_padding(session):
+    assert not session.is_playing()
+
+    with session.playback("Hello there"):
+        start = time.time()
+        assert session.is_playing()
+    end = time.time()
+
+    assert session.is_playing()
+    assert session.overlaps_playback(start - 5.0, start + 0.01)
+    assert not session.overlaps_playback(start - 5.0, start - 1.0)
+    assert not session.overlaps_playback(end + 1.0, end + 2.0)
+
+    time.sleep(0.25)
+    assert not session.is_playing()
+    assert session.metrics["playbacks"] == 1
+
+
+def test_tts_state_adapter(session):
+    session.on_tts_state_change("processing")
+    session.on_tts_state_change("processing")
+    assert session.is_playing()
+    session.on_tts_state_change("completed")
+    time.sleep(0.25)
+    assert not session.is_playing()
+    assert session.metrics["playbacks"] == 1
+
+
+def test_echo_detection(session):
+    with session.playback("Welcome to the lobby! How can I help you today?"):
+        pass
+
+    assert session.is_echo("[LANG:en] welcome to the lobby how can I help you today")
+    assert session.is_echo("how can I help you")
+    assert not session.is_echo("Where is the bathroom?")
+    assert not session.is_echo("")
+
+
+def test_barge_in_requires_sustained_input(session):
+    interrupted = []
+    session.register_interrupt_callback(lambda: interrupted.append(True))
+
+    # loud input outside of playback is ignored
+    assert not session.report_input_level(0.5, 0.2)
+
+    with session.playback("A long answer"):
+        assert not session.report_input_level(0.5, 0.2)
+        assert not session.report_input_level(0.01, 0.2)
+        assert not session.report_input_level(0.5, 0.2)
+        assert session.report_input_level(0.5, 0.2)
+
+    assert interrupted == [True]
+    assert session.interrupted.is_set()
+    assert session.metrics["barge_ins"] == 1
+
+
+def test_barge_in_disabled_by_default():
+    singleton.instances = {}
+    session = AudioSessionProvider()
+    with session.playback():
+        assert not session.report_input_level(1.0, 5.0)
+    singleton.instances = {}
+
+
+def test_run_player_is_terminated_on_interrupt(session):
+    cmd = [sys.executable, "-c", "import time; time.sleep(10)"]
+    result = {}
+
+    def play():
+        result["process"] = session.run_player(cmd, text="long", timeout=20)
+
+    thread = threading.Thread(target=play)
+    thread.start()
+    time.sleep(0.5)
+    assert session.is_playing()
+
+    session.interrupt()
+    thread.join(timeout=5)
+    assert not thread.is_alive()
+    assert result["process"].returncode != 0
@@ -0,0 +1,175 @@
+import threading
+
+import cv2
+import numpy as np
+import pytest
+
+from providers.badge_ocr_pipeline import (
+    BadgeOCRPipeline,
+    box_iou,
+    detect_text_regions,
+)
+
+
+def _frame(badge_at=None, blur=0):
+    frame = np.full((720, 1280, 3), 90, dtype=np.uint8)
+    if badge_at is not None:
+        x, y = badge_at
+        cv2.rectangle(frame, (x, y), (x + 360, y + 220), (255, 255, 255), -1)
+        cv2.putText(
+            frame,
+            "JOHN SMITH",
+            (x + 20, y + 90),
+            cv2.FONT_HERSHEY_SIMPLEX,
+            1.4,
+            (0, 0, 0),
+            4,
+        )
+        cv2.putText(
+            frame,
+            "ACME CORP",
+            (x + 20, y + 170),
+            cv2.FONT_HERSHEY_SIMPLEX,
+            1.2,
+            (0, 0, 0),
+            3,
+        )
+    if blur:
+        frame = cv2.GaussianBlur(frame, (0, 0), blur)
+    return frame
+
+
+class _FakeOCR:
+    def __init__(self, text="JOHN SMITH"):
+        self.text = text
+        self.calls = []
+        self.release = threading.Event()
+        self.release.set()
+
+    def __call__(self, crop):
+        self.calls.append(crop.shape)
+        self.release.wait(5)
+        return [(None, self.text, 0.9)]
+
+
+def _pipeline(ocr, parse=lambda results: results[0][1] or None, **kwargs):
+    return BadgeOCRPipeline(ocr=ocr, parse=parse, **kwargs)
+
+
+def test_detects_badge_region_and_ignores_blank_frames():
+    boxes, sharpness = detect_text_regions(_frame())
+    assert boxes == []
+
+    boxes, sharpness = detect_text_regions(_frame(badge_at=(400, 200)))
+    assert len(boxes) == 1
+    assert box_iou(boxes[0], (400, 200, 360, 220)) > 0.4
+    assert sharpness[0] > detect_text_regions(_frame((400, 200), blur=4))[1][0]
+
+
+def test_badge_is_read_once_while_tracked():
+    ocr = _FakeOCR()
+    pipeline = _pipeline(ocr)
+    try:
+        reads = []
+        for i in range(10):
+            reads += pipeline.process(_frame(badge_at=(400 + 3 * i, 200)), now=i * 0.1)
+            pipeline.wait(1)
+
+        assert [read.value for read in reads] == ["JOHN SMITH"]
+        assert len(ocr.calls) == 1
+        assert len(pipeline.tracks) == 1
+
+        # the badge leaves and comes back: a new track is read again
+        pipeline.process(_frame(), now=5.0)
+        assert pipeline.tracks == []
+        pipeline.process(_frame(badge_at=(400, 200)), now=5.1)
+        pipeline.wait(1)
+        reads = pipeline.process(_frame(badge_at=(400, 200)), now=5.2)
+        assert [read.value for read in reads] == ["JOHN SMITH"]
+        assert len(ocr.calls) == 2
+    finally:
+        pipeline.close()
+
+
+def test_unreadable_badge_is_retried_only_when_sharper():
+    ocr = _FakeOCR(text="")
+    pipeline = _pipeline(ocr, max_ocr_attempts=2, resharpen_ratio=1.5)
+    try:
+        blurry = _frame(badge_at=(400, 200), blur=2)
+        for i in range(5):
+            pipeline.process(blurry, now=i * 0.1)
+            pipeline.wait(1)
+        assert len(ocr.calls) == 1
+
+        for i in range(5, 10):
+            pipeline.process(_frame(badge_at=(400, 200)), now=i * 0.1)
+            pipeline.wait(1)
+        assert len(ocr.calls) == 2
+    finally:
+        pipeline.close()
+
+
+def test_process_does_not_block_on_ocr():
+    ocr = _FakeOCR()
+    ocr.release.clear()
+    pipeline = _pipeline(ocr)
+    try:
+        for i in range(5):
+            assert pipeline.process(_frame(badge_at=(400, 200)), now=i * 0.1) == []
+        assert pipeline.ocr_runs == 1
+
+        ocr.release.set()
+        pipeline.wait(1)
+        reads = pipeline.process(_frame(badge_at=(400, 200)), now=0.6)
+        assert [read.value for read in reads] == ["JOHN SMITH"]
+    finally:
+        ocr.release.set()
+        pipeline.close()
+
+
+def test_on_read_delivers_without_another_frame():
+    ocr = _FakeOCR()
+    delivered = threading.Event()
+    reads = []
+
+    def on_read(read):
+        reads.append(read)
+        delivered.set()
+
+    pipeline = _pipeline(ocr, on_read=on_read)
+    try:
+        assert pipeline.process(_frame(badge_at=(400, 200)), now=0.0) == []
+        assert delivered.wait(1)
+        assert [read.value for read in reads] == ["JOHN SMITH"]
+        assert pipeline.tracks[0].value == "JOHN SMITH"
+
+        # the badge stays in view: not read or delivered again
+        assert pipeline.process(_frame(badge_at=(400, 200)), now=0.1) == []
+        pipeline.wait(1)
+        assert len(reads) == 1
+        assert len(ocr.calls) == 1
+    finally:
+        pipeline.close()
+
+
+def test_blurry_regions_are_not_read():
+    ocr = _FakeOCR()
+    pipeline = _pipeline(ocr, min_sharpness=1e9)
+    try:
+        pipeline.process(_frame(badge_at=(400, 200)), now=0.0)
+        assert len(pipeline.tracks) == 1
+        assert ocr.calls == []
+    finally:
+        pipeline.close()
+
+
+@pytest.mark.parametrize(
+    "a, b, expected",
+    [
+        ((0, 0, 10, 10), (0, 0, 10, 10), 1.0),
+        ((0, 0, 10, 10), (5, 0, 10, 10), 50 / 150),
+        ((0, 0, 10, 10), (20, 20, 5, 5), 0.0),
+    ],
+)
+def test_box_iou(a, b, expected):
+    assert box_iou(a, b) == pytest.approx(expected)
@@ -0,0 +1,74 @@
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pytest
+
+from providers.d435_provider import (
+    OBSTACLE_DTYPE,
+    D435Provider,
+    build_obstacle_array,
+)
+from providers.singleton import singleton
+from zenoh_msgs import Header, Point32, PointCloud, Time
+
+
+def test_build_obstacle_array_angles_and_distances():
+    obstacle = build_obstacle_array(np.array([[1.0, 1.0, 0.2], [0.0, -2.0, 0.5]]))
+
+    assert obstacle.dtype == OBSTACLE_DTYPE
+    assert obstacle["angle"] == pytest.approx([45.0, -90.0])
+    assert obstacle["distance"] == pytest.approx([np.sqrt(2.0), 2.0])
+    assert obstacle["z"] == pytest.approx([0.2, 0.5])
+
+
+def test_height_filter_drops_floor_and_overhangs():
+    points = np.array(
+        [[1.0, 0.0, -0.05], [1.0, 0.0, 0.3], [1.0, 0.0, 1.5], [np.nan, 0.0, 0.3]]
+    )
+    obstacle = build_obstacle_array(points, min_height=0.0, max_height=1.0)
+    assert obstacle["z"] == pytest.approx([0.3])
+
+
+def test_voxel_downsampling_keeps_centroids():
+    rng = np.random.default_rng(0)
+    cluster_a = rng.uniform(0.0, 0.09, (500, 3))
+    cluster_b = rng.uniform(0.0, 0.09, (500, 3)) + [1.0, 0.0, 0.0]
+    points = np.vstack((cluster_a, cluster_b))
+
+    obstacle = build_obstacle_array(points, voxel_size=0.1)
+
+    assert len(obstacle) == 2
+    xs = np.sort(obstacle["x"])
+    assert xs[0] == pytest.approx(cluster_a[:, 0].mean(), abs=1e-5)
+    assert xs[1] == pytest.approx(cluster_b[:, 0].mean(), abs=1e-5)
+
+
+def test_empty_cloud():
+    obstacle = build_obstacle_array(np.empty((0, 3)), voxel_size=0.1)
+    assert len(obstacle) == 0
+
+
+@pytest.fixture
+def provider():
+    singleton.instances = {}
+    with patch("providers.d435_provider.open_zenoh_session", return_value=MagicMock()):
+        yield D435Provider(min_height=0.0)
+    singleton.instances = {}
+
+
+def test_obstacle_callback_and_path_points(provider):
+    msg = PointCloud(
+        header=Header(stamp=Time(sec=0, nanosec=0), frame_id="camera"),
+        points=[Point32(x=0.5, y=0.5, z=0.1), Point32(x=1.0, y=0.0, z=-0.2)],
+        channels=[],
+    )
+    sample = MagicMock()
+    sample.payload.to_bytes.return_value = msg.serialize()
+
+    provider.obstacle_callback(sample)
+
+    assert len(provider.obstacle) == 1
+    path_points = provider.get_path_points()
+    assert path_points.shape == (1, 4)
+    assert path_points.dtype == np.float64
+    assert path_points[0] == pytest.approx([0.5, 0.5, 45.0, np.sqrt(0.5)])
@@ -0,0 +1,177 @@
+import asyncio
+import json
+import queue
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from inputs.base import SensorConfig
+from inputs.plugins.face_presence_input import FacePresence
+from providers.face_presence_provider import FacePresenceProvider
+from providers.singleton import singleton
+
+
+class _PresenceServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, stream: bool):
+        super().__init__(("127.0.0.1", 0), _PresenceHandler)
+        self.stream = stream
+        self.version = 0
+        self.names = []
+        self.events: "queue.Queue" = queue.Queue()
+        self.statuses = []
+
+    def set_names(self, names):
+        self.names = names
+        self.version += 1
+
+    def body(self):
+        return {"now": self.names, "unknown_now": 0, "server_ts": time.time()}
+
+
+class _PresenceHandler(BaseHTTPRequestHandler):
+    server: _PresenceServer
+
+    def log_message(self, *args):
+        pass
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        etag = f'"{self.server.version}"'
+        if self.headers.get("If-None-Match") == etag:
+            self.server.statuses.append(304)
+            self.send_response(304)
+            self.end_headers()
+            return
+
+        data = json.dumps(self.server.body()).encode()
+        self.server.statuses.append(200)
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.send_header("ETag", etag)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_GET(self):
+        if not self.server.stream or not self.path.startswith("/who/stream"):
+            self.send_response(404)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.end_headers()
+        self.wfile.write(b": connected\n\n")
+        self.wfile.flush()
+        while True:
+            try:
+                names = self.server.events.get(timeout=0.1)
+            except queue.Empty:
+                continue
+            if names is None:
+                return
+            data = json.dumps(
+                {"now": names, "unknown_now": 0, "server_ts": 1.0}, ensure_ascii=False
+            )
+            self.wfile.write(f"event: presence\ndata: {data}\n\n".encode())
+            self.wfile.flush()
+
+
+def _serve(stream: bool):
+    server = _PresenceServer(stream)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def _wait_for(predicate, timeout=3.0):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.02)
+    return False
+
+
+@pytest.fixture(autouse=True)
+def reset_singletons():
+    singleton.instances = {}
+    yield
+    singleton.instances = {}
+
+
+def _provider(server, **kwargs):
+    provider = FacePresenceProvider(
+        base_url=f"http://127.0.0.1:{server.server_address[1]}", fps=20.0, **kwargs
+    )
+    lines = []
+    provider.register_message_callback(lines.append)
+    provider.start()
+    return provider, lines
+
+
+def test_conditional_polling_emits_only_changes():
+    server = _serve(stream=False)
+    provider, lines = _provider(server)
+    try:
+        assert _wait_for(lambda: len(lines) == 1)
+        assert "present=[none]" in lines[0]
+
+        # unchanged snapshots are answered with 304 and not emitted
+        assert _wait_for(lambda: server.statuses.count(304) >= 3)
+        assert len(lines) == 1
+
+        server.set_names(["alice"])
+        assert _wait_for(lambda: len(lines) == 2)
+        assert "present=[alice]" in lines[1]
+    finally:
+        provider.stop(wait=True)
+        server.shutdown()
+
+
+def test_streaming_subscription():
+    server = _serve(stream=True)
+    provider, lines = _provider(server)
+    try:
+        server.events.put(["alice"])
+        server.events.put(["alice"])
+        server.events.put(["alice", "bob"])
+        server.events.put(["zoë"])
+
+        assert _wait_for(lambda: len(lines) == 3)
+        assert "present=[alice]" in lines[0]
+        assert "present=[alice, bob]" in lines[1]
+        assert "present=[zoë]" in lines[2]
+        assert server.statuses == []
+        assert provider.latest.names_now == ["zoë"]
+    finally:
+        server.events.put(None)
+        provider.stop(wait=True)
+        server.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_input_is_woken_by_provider():
+    server = _serve(stream=False)
+    face_input = FacePresence(
+        SensorConfig(face_http_base_url=f"http://127.0.0.1:{server.server_address[1]}")
+    )
+    try:
+        first = await asyncio.wait_for(face_input._poll(), timeout=3.0)
+        assert "present=[none]" in first
+
+        poll = asyncio.create_task(face_input._poll())
+        await asyncio.sleep(0.05)
+        assert not poll.done()
+
+        threading.Thread(
+            target=face_input._handle_face_message, args=("present=[carol]",)
+        ).start()
+        assert await asyncio.wait_for(poll, timeout=1.0) == "present=[carol]"
+    finally:
+        face_input.provider.stop(wait=True)
+        server.shutdown()
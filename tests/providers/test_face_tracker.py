@@ -0,0 +1,120 @@
+import numpy as np
+import pytest
+
+from providers.face_tracker import FaceTracker, StageTimer, box_iou
+
+FACE = 120
+
+
+def _patch():
+    rng = np.random.default_rng(0)
+    return (
+        rng.integers(0, 255, (FACE // 8, FACE // 8), dtype=np.uint8)
+        .repeat(8, axis=0)
+        .repeat(8, axis=1)
+    )
+
+
+PATCH = _patch()
+
+
+def _frame(x, y):
+    frame = np.full((480, 640, 3), 128, dtype=np.uint8)
+    frame[y : y + FACE, x : x + FACE] = PATCH[..., None]
+    return frame
+
+
+class _Detector:
+    """
+    Finds the textured patch, reporting it in the downscaled frame.
+    """
+
+    def __init__(self, scale):
+        self.scale = scale
+        self.position = None
+        self.calls = 0
+
+    def __call__(self, gray):
+        self.calls += 1
+        if self.position is None:
+            return []
+        x, y = self.position
+        size = FACE * self.scale
+        return [(x * self.scale, y * self.scale, size, size)]
+
+
+def test_tracks_face_between_detections():
+    detector = _Detector(scale=0.5)
+    tracker = FaceTracker(detector=detector, detect_width=320, detect_interval=1.0)
+
+    detector.position = (100, 100)
+    tracks = tracker.update(_frame(100, 100), now=0.0)
+    assert len(tracks) == 1
+    track_id = tracks[0].track_id
+
+    for step in range(1, 8):
+        x, y = 100 + 6 * step, 100 + 3 * step
+        tracks = tracker.update(_frame(x, y), now=step * 0.1)
+        assert len(tracks) == 1
+        assert box_iou(tracks[0].box, (x, y, FACE, FACE)) > 0.7
+
+    assert detector.calls == 1
+
+    # the next detection confirms the tracked face instead of starting over
+    detector.position = (150, 125)
+    tracks = tracker.update(_frame(150, 125), now=1.0)
+    assert detector.calls == 2
+    assert [track.track_id for track in tracks] == [track_id]
+
+    summary = tracker.timer.summary()
+    assert summary["detect"]["count"] == 2
+    assert summary["track"]["count"] == 7
+    assert summary["preprocess"]["count"] == 9
+
+
+def test_detector_drops_faces_it_no_longer_finds():
+    detector = _Detector(scale=0.5)
+    tracker = FaceTracker(detector=detector, detect_width=320, detect_interval=1.0)
+
+    detector.position = (100, 100)
+    assert len(tracker.update(_frame(100, 100), now=0.0)) == 1
+
+    detector.position = None
+    assert tracker.update(_frame(100, 100), now=1.0) == []
+    # nothing to track, so every frame runs the detector
+    tracker.update(_frame(100, 100), now=1.1)
+    assert detector.calls == 3
+
+
+def test_detect_every_frame_at_full_resolution():
+    detector = _Detector(scale=1.0)
+    detector.position = (100, 100)
+    tracker = FaceTracker(detector=detector, detect_width=0, detect_interval=0.0)
+
+    for step in range(3):
+        tracks = tracker.update(_frame(100, 100), now=step * 0.1)
+        assert tracks[0].box == (100, 100, FACE, FACE)
+    assert detector.calls == 3
+
+
+def test_needs_classification():
+    detector = _Detector(scale=0.5)
+    detector.position = (100, 100)
+    tracker = FaceTracker(detector=detector, reclassify_after=5.0)
+    track = tracker.update(_frame(100, 100), now=0.0)[0]
+
+    assert tracker.needs_classification(track, 0.0)
+    track.set_label("happy", 0.0)
+    assert not tracker.needs_classification(track, 1.0)
+    assert tracker.needs_classification(track, 5.0)
+
+    track.box = (300, 300, FACE, FACE)
+    assert tracker.needs_classification(track, 1.0)
+
+
+def test_stage_timer_counts_failed_stages():
+    timer = StageTimer()
+    with pytest.raises(ValueError):
+        with timer.stage("classify"):
+            raise ValueError
+    assert timer.summary()["classify"]["count"] == 1
@@ -0,0 +1,34 @@
+import time
+from datetime import datetime, timezone
+
+import pytest
+
+from providers.gps_provider import GpsProvider
+from providers.singleton import singleton
+
+
+@pytest.fixture
+def gps():
+    singleton.instances = {}
+    # no serial port, so nothing is registered with the reactor
+    yield GpsProvider()
+    singleton.instances = {}
+
+
+def test_gps_packet_without_read_time_uses_host_time(gps):
+    before = time.time()
+    gps.magGPSProcessor(
+        "GPS:3747.1234N,12225.5678W,0,hd:90.0,alt:12.5,sat:8,"
+        "time:25:10:18:12:30:45:500,qua:1"
+    )
+
+    assert before <= gps.read_ts <= time.time()
+    assert gps.lat == pytest.approx(3747.1234)
+    assert gps.lon == pytest.approx(-12225.5678)
+    assert gps.sat == 8
+    assert gps.qua == 1
+    assert (
+        gps.gps_unix_ts
+        == datetime(2025, 10, 18, 12, 30, 45, 500000, tzinfo=timezone.utc).timestamp()
+    )
+    assert gps.data["gps_read_ts"] == gps.read_ts
@@ -3,15 +3,14 @@ from typing import Optional
 
 import pytest
 
-from providers.io_provider import Input, IOProvider
+from providers.io_provider import Input, InputsSnapshot, IOProvider
 
 
 @pytest.fixture
 def io_provider():
     provider = IOProvider()
     yield provider
-    provider._inputs.clear()
-    provider._input_timestamps.clear()
+    provider._snapshot = InputsSnapshot()
     provider._fuser_start_time = None
     provider._fuser_end_time = None
     provider._llm_prompt = None
@@ -97,3 +96,45 @@ def test_thread_safety(io_provider):
         t.join()
 
     assert len(io_provider.inputs) == 10
+
+
+def test_snapshots_are_immutable_and_versioned(io_provider):
+    version = io_provider.inputs_version
+    io_provider.add_input("key1", "value1", 1.0)
+    snapshot = io_provider.inputs_snapshot()
+    assert snapshot.version == version + 1
+
+    io_provider.add_input("key2", "value2", 2.0)
+    io_provider.add_input_timestamp("key1", 3.0)
+    io_provider.remove_input("missing")
+
+    # the earlier snapshot is unaffected by later changes
+    assert dict(snapshot.inputs) == {"key1": Input(input="value1", timestamp=1.0)}
+    assert io_provider.inputs["key1"].timestamp == 3.0
+    assert io_provider.inputs_version == version + 3
+    with pytest.raises(TypeError):
+        snapshot.inputs["key3"] = Input(input="value3")
+
+
+def test_readers_see_consistent_snapshots(io_provider):
+    import threading
+
+    stop = threading.Event()
+
+    def writer():
+        i = 0
+        while not stop.is_set():
+            io_provider.add_input("a", str(i), float(i))
+            io_provider.add_input("b", str(i), float(i))
+            i += 1
+
+    thread = threading.Thread(target=writer)
+    thread.start()
+    try:
+        for _ in range(2000):
+            snapshot = io_provider.inputs_snapshot()
+            for key, value in snapshot.inputs.items():
+                assert snapshot.timestamps[key] == value.timestamp
+    finally:
+        stop.set()
+        thread.join()
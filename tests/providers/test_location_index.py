@@ -0,0 +1,164 @@
+import json
+import math
+import random
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+from providers.location_index import (
+    LocationIndex,
+    LocationJournal,
+    normalize_name,
+    phonetic_key,
+)
+from providers.singleton import singleton
+
+
+@pytest.fixture
+def index():
+    index = LocationIndex(cell_size=2.0)
+    for name, x, y in [
+        ("kitchen", 1.0, 1.0),
+        ("front desk", 5.0, 0.0),
+        ("conference room a", -3.0, 4.0),
+        ("conference room b", -3.0, 8.0),
+        ("restroom", 20.0, -7.0),
+    ]:
+        index.add(name, x, y)
+    return index
+
+
+def test_normalize_and_phonetic_key():
+    assert normalize_name("  The Kitchen! ") == "kitchen"
+    assert normalize_name("Café") == "cafe"
+    assert phonetic_key("kitchen") == phonetic_key("kitchin")
+    assert phonetic_key("rest room") == phonetic_key("restroom")
+    assert phonetic_key("conference room") != phonetic_key("conference rooms")
+
+
+def test_nearest_and_within_match_brute_force():
+    rng = random.Random(0)
+    index = LocationIndex(cell_size=1.5)
+    points = {f"p{i}": (rng.uniform(-30, 30), rng.uniform(-30, 30)) for i in range(500)}
+    for name, (x, y) in points.items():
+        index.add(name, x, y)
+    for name in list(points)[:100]:
+        index.remove(name)
+        del points[name]
+
+    for _ in range(20):
+        qx, qy = rng.uniform(-40, 40), rng.uniform(-40, 40)
+        expected = sorted(
+            (math.hypot(x - qx, y - qy), name) for name, (x, y) in points.items()
+        )
+        nearest = index.nearest(qx, qy, count=5)
+        assert [name for name, _ in nearest] == [name for _, name in expected[:5]]
+
+        within = index.within(qx, qy, 6.0)
+        assert [name for name, _ in within] == [
+            name for distance, name in expected if distance <= 6.0
+        ]
+
+
+def test_nearest_respects_max_distance(index):
+    assert index.nearest(0.0, 0.0, count=3, max_distance=6.0) == [
+        ("kitchen", pytest.approx(math.sqrt(2))),
+        ("conference room a", pytest.approx(5.0)),
+        ("front desk", pytest.approx(5.0)),
+    ]
+    assert index.nearest(100.0, 100.0, max_distance=10.0) == []
+
+
+@pytest.mark.parametrize(
+    "heard,expected",
+    [
+        ("Kitchen", "kitchen"),
+        ("the kitchin", "kitchen"),
+        ("rest room", "restroom"),
+        ("front desks", "front desk"),
+    ],
+)
+def test_resolves_misheard_names(index, heard, expected):
+    assert index.resolve(heard)[0] == expected
+
+
+def test_ambiguous_or_unknown_names_are_not_resolved(index):
+    name, candidates = index.resolve("conference room")
+    assert name is None
+    assert {c for c, _ in candidates[:2]} == {"conference room a", "conference room b"}
+
+    assert index.resolve("parking garage")[0] is None
+
+
+def test_journal_replays_and_compacts(tmp_path):
+    snapshot = tmp_path / "locations.json"
+    snapshot.write_text(json.dumps({"lobby": {"name": "lobby"}}))
+
+    journal = LocationJournal(str(snapshot), compact_after=3)
+    journal.append("put", "kitchen", {"name": "kitchen"})
+    journal.append("delete", "lobby")
+    # a crash in the middle of a write
+    with open(journal.journal_file, "a") as f:
+        f.write('{"op": "put", "name": "ha')
+
+    reloaded = LocationJournal(str(snapshot), compact_after=3)
+    locations = reloaded.load()
+    assert locations == {"kitchen": {"name": "kitchen"}}
+    assert reloaded.entries == 2
+
+    reloaded.append("put", "desk", {"name": "desk"})
+    assert reloaded.needs_compaction()
+    reloaded.compact({**locations, "desk": {"name": "desk"}})
+
+    assert not (tmp_path / "locations.json.journal").exists()
+    assert set(json.loads(snapshot.read_text())) == {"kitchen", "desk"}
+
+
+def _pose(x, y):
+    return SimpleNamespace(
+        position=SimpleNamespace(x=x, y=y, z=0.0),
+        orientation=SimpleNamespace(x=0.0, y=0.0, z=0.0, w=1.0),
+    )
+
+
+@pytest.fixture
+def location_provider(tmp_path):
+    singleton.instances = {}
+    with (
+        patch("providers.unitree_go2_location_provider.UnitreeGo2AMCLProvider") as amcl,
+        patch("providers.unitree_go2_location_provider.UnitreeGo2NavigationProvider"),
+    ):
+        from providers.unitree_go2_location_provider import UnitreeGo2LocationProvider
+
+        amcl.return_value.is_localized = True
+        amcl.return_value.pose = _pose(0.0, 0.0)
+        provider = UnitreeGo2LocationProvider(locations_folder_path=str(tmp_path))
+        yield provider
+    singleton.instances = {}
+
+
+def test_provider_llm_functions(location_provider, tmp_path):
+    amcl = location_provider.amcl_provider
+    for name, x, y in [("Kitchen", 1.0, 0.0), ("Front Desk", 4.0, 0.0)]:
+        amcl.pose = _pose(x, y)
+        assert location_provider.record_location(name)["success"]
+    amcl.pose = _pose(0.0, 0.0)
+
+    assert not (tmp_path / "locations.json").exists()
+    assert (tmp_path / "locations.json.journal").exists()
+
+    nearest = location_provider.find_nearest_locations(1)
+    assert nearest["locations"] == [{"name": "kitchen", "distance_meters": 1.0}]
+    assert len(location_provider.find_locations_within(5.0)["locations"]) == 2
+
+    assert location_provider.get_location_info("the kitchin")["success"]
+    assert location_provider.navigate_to_location("front desks")["success"]
+    # deletion needs the exact name
+    assert not location_provider.delete_location("kitchin")["success"]
+    assert location_provider.delete_location("Kitchen")["success"]
+    assert location_provider.search_location_names("desk")["matches"][0]["name"] == (
+        "front desk"
+    )
+
+    assert "find_nearest_locations" in location_provider.generate_llm_functions()
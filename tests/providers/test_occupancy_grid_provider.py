@@ -0,0 +1,68 @@
+import math
+
+import numpy as np
+import pytest
+
+from providers.occupancy_grid_provider import OccupancyGrid
+
+
+def _wall_scan(distance: float, n: int = 360):
+    """
+    Scan of a robot at the origin facing +x with a wall at x = distance.
+    """
+    bearings = np.linspace(-math.pi, math.pi, n, endpoint=False)
+    with np.errstate(divide="ignore"):
+        ranges = np.where(np.cos(bearings) > 0.1, distance / np.cos(bearings), np.inf)
+    return bearings, ranges
+
+
+@pytest.fixture
+def grid():
+    grid = OccupancyGrid(resolution=0.05, tile_size=16, max_tiles=1000)
+    bearings, ranges = _wall_scan(2.0)
+    for _ in range(3):
+        grid.integrate_scan((0.0, 0.0, 0.0), bearings, ranges, max_range=6.0)
+    return grid
+
+
+def test_wall_is_occupied_and_free_space_is_free(grid):
+    assert grid.probability(2.01, 0.0) > 0.65
+    assert grid.probability(1.0, 0.0) < 0.5
+    assert grid.probability(-10.0, -10.0) == pytest.approx(0.5)
+
+
+def test_is_free_along(grid):
+    assert grid.is_free_along(0.0, 0.0, 1.5, 0.0, half_width=0.2)
+    assert not grid.is_free_along(0.0, 0.0, 3.0, 0.0, half_width=0.2)
+    assert not grid.is_free_along(0.0, 5.0, 0.0, 6.0, unknown_is_free=False)
+
+
+def test_nearest_obstacle(grid):
+    dist, ox, _ = grid.nearest_obstacle(0.0, 0.0, max_radius=3.0)
+    assert dist == pytest.approx(2.0, abs=0.1)
+    assert ox == pytest.approx(2.0, abs=0.1)
+    assert grid.nearest_obstacle(-5.0, 0.0, max_radius=1.0) is None
+
+
+def test_local_costmap_shape(grid):
+    probs, origin = grid.local_costmap(0.0, 0.0, size_m=1.0)
+    assert probs.shape == (20, 20)
+    assert origin == pytest.approx((-0.5, -0.5))
+
+
+def test_scan_is_placed_by_pose():
+    grid = OccupancyGrid(resolution=0.05)
+    bearings, ranges = _wall_scan(1.0)
+    grid.integrate_scan((5.0, 5.0, math.pi / 2), bearings, ranges)
+    # facing +y, so the wall is at y = 6 and the robot's right side is open
+    assert grid.probability(5.0, 6.01) > 0.5
+    assert grid.probability(6.01, 5.0) < 0.5
+
+
+def test_tile_budget_is_enforced():
+    grid = OccupancyGrid(resolution=0.05, tile_size=16, max_tiles=20)
+    bearings, ranges = _wall_scan(3.0)
+    for x in range(10):
+        grid.integrate_scan((float(x), 0.0, 0.0), bearings, ranges)
+    assert len(grid.tiles) <= 20
+    assert grid.memory_bytes == len(grid.tiles) * 16 * 16 * 4
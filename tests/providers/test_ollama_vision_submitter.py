@@ -0,0 +1,140 @@
+import asyncio
+import base64
+
+import cv2
+import numpy as np
+import pytest
+from aiohttp import web
+
+from providers.ollama_vision_submitter import (
+    OllamaVisionSubmitter,
+    native_image_side,
+    resize_to_side,
+)
+
+
+class _FakeOllama:
+    def __init__(self):
+        self.requests = []
+        self.release = asyncio.Event()
+        self.release.set()
+
+    async def generate(self, request):
+        payload = await request.json()
+        image = cv2.imdecode(
+            np.frombuffer(base64.b64decode(payload["images"][0]), np.uint8),
+            cv2.IMREAD_COLOR,
+        )
+        self.requests.append(image)
+        await self.release.wait()
+        await asyncio.sleep(0.06)
+        return web.json_response(
+            {
+                "response": f" frame {int(image.mean())} ",
+                "total_duration": 50_000_000,
+            }
+        )
+
+
+@pytest.fixture
+async def ollama():
+    fake = _FakeOllama()
+    app = web.Application()
+    app.router.add_post("/api/generate", fake.generate)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    fake.url = f"http://127.0.0.1:{site._server.sockets[0].getsockname()[1]}"
+    yield fake
+    await runner.cleanup()
+
+
+def _frame(value):
+    return np.full((1080, 1920, 3), value, dtype=np.uint8)
+
+
+def _submitter(ollama, results, **kwargs):
+    return OllamaVisionSubmitter(
+        base_url=ollama.url,
+        model="llava-llama3:8b",
+        prompt="describe",
+        timeout=5.0,
+        on_result=results.append,
+        **kwargs,
+    )
+
+
+async def _wait_for(predicate, timeout=3.0):
+    async def poll():
+        while not predicate():
+            await asyncio.sleep(0.01)
+
+    await asyncio.wait_for(poll(), timeout)
+
+
+def test_native_image_side_and_resize():
+    assert native_image_side("llava-llama3:8b") == 336
+    assert native_image_side("library/moondream") == 378
+    assert native_image_side("unknown-model") == 672
+
+    assert resize_to_side(_frame(0), 336).shape == (189, 336, 3)
+    small = np.zeros((100, 200, 3), np.uint8)
+    assert resize_to_side(small, 336) is small
+
+
+@pytest.mark.asyncio
+async def test_submits_downscaled_frame_with_timing(ollama):
+    results = []
+    submitter = _submitter(ollama, results)
+    try:
+        assert submitter.submit(_frame(100))
+        await _wait_for(lambda: results)
+
+        assert ollama.requests[0].shape == (189, 336, 3)
+        assert results[0].description == "frame 100"
+        assert results[0].timing.inference_s == pytest.approx(0.05)
+        assert results[0].timing.encode_s > 0
+    finally:
+        await submitter.close()
+
+
+@pytest.mark.asyncio
+async def test_skips_near_identical_frames(ollama):
+    results = []
+    submitter = _submitter(ollama, results)
+    try:
+        assert submitter.submit(_frame(100))
+        await _wait_for(lambda: results)
+
+        assert not submitter.submit(_frame(101))
+        assert submitter.skipped_duplicates == 1
+        assert submitter.submit(_frame(160))
+        await _wait_for(lambda: len(results) == 2)
+        assert len(ollama.requests) == 2
+    finally:
+        await submitter.close()
+
+
+@pytest.mark.asyncio
+async def test_one_request_in_flight_and_latest_frame_wins(ollama):
+    results = []
+    submitter = _submitter(ollama, results, dedup_threshold=0)
+    ollama.release.clear()
+    try:
+        submitter.submit(_frame(10))
+        await _wait_for(lambda: ollama.requests)
+
+        for value in (50, 90, 130):
+            submitter.submit(_frame(value))
+        await asyncio.sleep(0.05)
+        assert len(ollama.requests) == 1
+        assert submitter.superseded == 2
+
+        ollama.release.set()
+        await _wait_for(lambda: len(results) == 2)
+        assert [r.description for r in results] == ["frame 10", "frame 130"]
+        assert len(ollama.requests) == 2
+    finally:
+        ollama.release.set()
+        await submitter.close()
@@ -0,0 +1,81 @@
+import math
+import threading
+
+import numpy as np
+import pytest
+
+from providers.pose_history import PoseHistory
+
+
+def test_empty_history():
+    history = PoseHistory(8)
+    assert len(history) == 0
+    assert history.latest() is None
+    assert history.pose_at(1.0) is None
+
+
+def test_interpolates_position():
+    history = PoseHistory(8)
+    history.append(10.0, 0.0, 0.0, 0.0)
+    history.append(11.0, 1.0, 2.0, 0.0)
+
+    x, y, yaw = history.pose_at(10.25)
+    assert x == pytest.approx(0.25)
+    assert y == pytest.approx(0.5)
+    assert yaw == pytest.approx(0.0)
+
+
+def test_interpolates_yaw_across_seam():
+    history = PoseHistory(8)
+    history.append(0.0, 0.0, 0.0, math.radians(170))
+    history.append(1.0, 0.0, 0.0, math.radians(-170))
+
+    _, _, yaw = history.pose_at(0.5)
+    assert abs(yaw) == pytest.approx(math.pi)
+
+
+def test_vectorized_validity_mask():
+    history = PoseHistory(8)
+    history.append(1.0, 0.0, 0.0, 0.0)
+    history.append(2.0, 1.0, 0.0, 0.0)
+
+    poses, valid = history.interpolate([0.5, 1.5, 2.05, 3.0])
+    assert valid.tolist() == [False, True, True, False]
+    assert poses[1, 0] == pytest.approx(0.5)
+    assert poses[3, 0] == pytest.approx(1.0)
+
+
+def test_ring_wraps_and_rejects_old_samples():
+    history = PoseHistory(4)
+    for i in range(10):
+        history.append(float(i), float(i), 0.0, 0.0)
+    assert not history.append(5.0, 0.0, 0.0, 0.0)
+
+    data = history.snapshot()
+    assert len(history) == 4
+    assert np.all(np.diff(data[:, 0]) > 0)
+    assert data[-1, 0] == 9.0
+    assert history.pose_at(2.0) is None
+
+
+def test_concurrent_reads_are_ordered():
+    history = PoseHistory(16)
+    stop = threading.Event()
+
+    def writer():
+        t = 0.0
+        while not stop.is_set():
+            t += 1.0
+            history.append(t, t, -t, 0.0)
+
+    thread = threading.Thread(target=writer)
+    thread.start()
+    try:
+        for _ in range(2000):
+            data = history.snapshot()
+            if len(data) > 1:
+                assert np.all(np.diff(data[:, 0]) == 1.0)
+                assert np.array_equal(data[:, 1], data[:, 0])
+    finally:
+        stop.set()
+        thread.join()
@@ -0,0 +1,94 @@
+import os
+import threading
+import time
+
+import pytest
+
+from providers.serial_reactor import (
+    CRSFParser,
+    LineParser,
+    NMEAParser,
+    SerialReactor,
+    crsf_crc8,
+    nmea_checksum,
+)
+
+
+def _nmea(body: str) -> str:
+    return f"${body}*{nmea_checksum(body):02X}"
+
+
+GGA = _nmea("GNGGA,231225.30,3723.2475,N,12158.3416,W,4,12,0.9,545.4,M,46.9,M,1.0,0000")
+
+
+def test_line_parser_handles_split_reads():
+    parser = LineParser()
+    assert parser.feed(b"HDG:12") == []
+    assert parser.feed(b"3.4\r\nYPR:1,2") == ["HDG:123.4"]
+    assert parser.feed(b",3\n\nSAT:9\n") == ["YPR:1,2,3", "SAT:9"]
+
+
+def test_line_parser_drops_runaway_line():
+    parser = LineParser(max_line_length=16)
+    assert parser.feed(b"x" * 32) == []
+    assert parser.feed(b"HDG:1\n") == ["HDG:1"]
+
+
+def test_nmea_parser_validates_checksum_and_type():
+    parser = NMEAParser(sentence_types=["GGA"])
+    corrupted = GGA[:-2] + "00"
+    stream = f"garbage{GGA}\r\n{_nmea('GNRMC,1,2,3')}\r\n{corrupted}\r\n{GGA[:20]}"
+
+    assert parser.feed(stream.encode()) == [GGA]
+    assert parser.checksum_errors == 1
+    assert parser.feed(GGA[20:].encode() + b"\r\n") == [GGA]
+
+
+def _crsf_frame(ptype: int, payload: bytes) -> bytes:
+    body = bytes([ptype]) + payload
+    return bytes([0xC8, len(body) + 1]) + body + bytes([crsf_crc8(body)])
+
+
+def test_crsf_parser_resyncs_after_noise():
+    parser = CRSFParser()
+    good = _crsf_frame(0x1E, b"\x00\x01\x00\x02\x00\x03")
+    bad = bytearray(good)
+    bad[4] ^= 0xFF
+
+    frames = parser.feed(b"\x01\x02" + bytes(bad) + good[:5])
+    assert frames == []
+    assert parser.feed(good[5:] + good) == [good, good]
+    assert parser.crc_errors == 1
+
+
+@pytest.mark.skipif(not hasattr(os, "openpty"), reason="requires a pty")
+def test_reactor_delivers_lines_with_read_time():
+    master, slave = os.openpty()
+    port = os.ttyname(slave)
+
+    received = []
+    done = threading.Event()
+
+    def on_lines(lines, read_ts):
+        received.extend((line, read_ts) for line in lines)
+        if len(received) >= 2:
+            done.set()
+
+    reactor = SerialReactor()
+    try:
+        assert reactor.register(port, 115200, LineParser(), on_lines)
+        time.sleep(0.1)
+
+        before = time.time()
+        os.write(master, b"HDG:90.0\nGPS:")
+        os.write(master, b"partial\n")
+        assert done.wait(2.0)
+
+        assert [line for line, _ in received] == ["HDG:90.0", "GPS:partial"]
+        assert all(ts >= before for _, ts in received)
+        assert reactor.write(port, b"actuator:1\r\n")
+        assert os.read(master, 64) == b"actuator:1\r\n"
+    finally:
+        reactor.unregister(port)
+        os.close(master)
+        os.close(slave)
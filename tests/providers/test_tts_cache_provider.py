@@ -0,0 +1,92 @@
+import io
+import os
+
+import numpy as np
+import pytest
+import soundfile as sf
+
+from providers.singleton import singleton
+from providers.tts_cache_provider import TTSCacheProvider, tts_cache_key
+
+
+def _wav_bytes(seconds: float = 0.1, sample_rate: int = 16000) -> bytes:
+    buffer = io.BytesIO()
+    samples = np.zeros(int(seconds * sample_rate), dtype=np.float32)
+    sf.write(buffer, samples, sample_rate, format="WAV", subtype="PCM_16")
+    return buffer.getvalue()
+
+
+@pytest.fixture
+def cache(tmp_path):
+    singleton.instances = {}
+    yield TTSCacheProvider(cache_dir=str(tmp_path), max_disk_mb=1, max_memory_mb=1)
+    singleton.instances = {}
+
+
+def test_key_normalizes_text_and_includes_params():
+    key = tts_cache_key("piper", "Hello  there.\n", voice="ryan", length_scale=1.0)
+    assert key == tts_cache_key("piper", "Hello there.", voice="ryan", length_scale=1.0)
+    assert key != tts_cache_key("piper", "Hello there.", voice="ryan", length_scale=1.1)
+    assert key != tts_cache_key("espeak", "Hello there.", voice="ryan")
+    assert key != tts_cache_key("piper", "hello there.", voice="ryan")
+
+
+def test_put_and_get(cache):
+    key = tts_cache_key("piper", "Welcome!")
+    assert cache.get_path(key) is None
+
+    data = _wav_bytes()
+    path = cache.put_bytes(key, data)
+    assert cache.owns(path)
+    assert cache.get_bytes(key) == data
+
+    samples, sample_rate = cache.get_pcm(key)
+    assert sample_rate == 16000
+    assert len(samples) == 1600
+    assert cache.get_pcm(key)[0] is samples
+    assert cache.stats()["memory_entries"] == 1
+
+
+def test_put_file_moves_into_store(cache, tmp_path):
+    source = tmp_path / "speech_1.wav"
+    source.write_bytes(_wav_bytes())
+    key = tts_cache_key("piper", "Moved")
+
+    path = cache.put_file(key, str(source))
+    assert not source.exists()
+    assert path.endswith(".wav") and os.path.exists(path)
+
+
+def test_disk_cap_evicts_least_recently_used(cache):
+    chunk = b"\0" * (400 * 1024)
+    keys = [tts_cache_key("piper", f"phrase {i}") for i in range(3)]
+    cache.put_bytes(keys[0], chunk)
+    cache.put_bytes(keys[1], chunk)
+    cache.get_path(keys[0])
+    cache.put_bytes(keys[2], chunk)
+
+    assert cache.contains(keys[0])
+    assert not cache.contains(keys[1])
+    assert cache.contains(keys[2])
+    assert cache.stats()["disk_bytes"] <= 1024 * 1024
+
+
+def test_index_survives_restart(cache, tmp_path):
+    key = tts_cache_key("piper", "Persistent")
+    cache.put_bytes(key, _wav_bytes())
+
+    singleton.instances = {}
+    reopened = TTSCacheProvider(cache_dir=str(tmp_path))
+    assert reopened.get_path(key) is not None
+
+
+def test_warm_up_renders_missing_phrases(cache):
+    rendered = []
+
+    def render(phrase):
+        rendered.append(phrase)
+        cache.put_bytes(tts_cache_key("piper", phrase), _wav_bytes())
+
+    cache.warm_up(["Hello", "", "Goodbye"], render, background=False)
+    assert rendered == ["Hello", "Goodbye"]
+    assert cache.contains(tts_cache_key("piper", "Goodbye"))
@@ -0,0 +1,139 @@
+import gzip
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+import pytest
+
+from providers.singleton import singleton
+from providers.uplink_provider import UplinkChannel, UplinkProvider, UplinkQueue
+
+
+class _StandInHandler(BaseHTTPRequestHandler):
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers["Content-Length"]))
+        if self.headers.get("Content-Encoding") == "gzip":
+            body = gzip.decompress(body)
+        self.server.received.append(json.loads(body))
+        status = self.server.statuses.pop(0) if self.server.statuses else 201
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.end_headers()
+        self.wfile.write(b"{}")
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def stand_in():
+    server = HTTPServer(("127.0.0.1", 0), _StandInHandler)
+    server.received = []
+    server.statuses = []
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def uplink(tmp_path):
+    singleton.instances = {}
+    provider = UplinkProvider(db_path=str(tmp_path / "uplink.sqlite"))
+    provider.backoff_base_s = 0.01
+    provider.backoff_max_s = 0.05
+    yield provider
+    provider.stop()
+    singleton.instances = {}
+
+
+def _url(server) -> str:
+    return f"http://127.0.0.1:{server.server_address[1]}/submit"
+
+
+def test_queue_fifo_and_ack():
+    queue = UplinkQueue(":memory:")
+    for i in range(3):
+        queue.put("a", {"i": i})
+    rows = queue.peek("a", 2)
+    assert [json.loads(r[1])["i"] for r in rows] == [0, 1]
+    queue.ack([r[0] for r in rows])
+    assert queue.depth("a") == 1
+
+
+def test_queue_coalesce_and_trim():
+    queue = UplinkQueue(":memory:")
+    queue.put("status", {"v": 1}, coalesce=True)
+    queue.put("status", {"v": 2}, coalesce=True)
+    assert queue.depth("status") == 1
+
+    for i in range(5):
+        queue.put("fabric", {"i": i})
+    assert queue.trim("fabric", 3) == 2
+    rows = queue.peek("fabric", 10)
+    assert [json.loads(r[1])["i"] for r in rows] == [2, 3, 4]
+
+
+def test_queue_survives_reopen(tmp_path):
+    path = str(tmp_path / "uplink.sqlite")
+    queue = UplinkQueue(path)
+    queue.put("fabric", {"i": 1})
+    queue.close()
+    assert UplinkQueue(path).depth("fabric") == 1
+
+
+def test_single_delivery(uplink, stand_in):
+    uplink.register_channel(UplinkChannel(name="single", url=_url(stand_in)))
+    uplink.enqueue("single", {"payload_idx": 1})
+    assert uplink.flush(timeout=5)
+    assert stand_in.received == [{"payload_idx": 1}]
+    assert uplink.metrics()["single"]["sent"] == 1
+
+
+def test_batched_compressed_delivery(uplink, stand_in):
+    uplink.register_channel(
+        UplinkChannel(
+            name="batched",
+            url=_url(stand_in),
+            batch_size=10,
+            linger_s=0.2,
+            compress=True,
+        )
+    )
+    for i in range(4):
+        uplink.enqueue("batched", {"payload_idx": i})
+    assert uplink.flush(timeout=5)
+    assert stand_in.received == [[{"payload_idx": i} for i in range(4)]]
+
+
+def test_retry_after_server_error(uplink, stand_in):
+    stand_in.statuses = [503, 503]
+    uplink.register_channel(UplinkChannel(name="retry", url=_url(stand_in)))
+    uplink.enqueue("retry", {"payload_idx": 7})
+    assert uplink.flush(timeout=5)
+    metrics = uplink.metrics()["retry"]
+    assert metrics["failed_attempts"] == 2
+    assert metrics["sent"] == 1
+    assert len(stand_in.received) == 3
+
+
+def test_payloads_kept_while_offline(uplink):
+    uplink.register_channel(
+        UplinkChannel(name="offline", url="http://127.0.0.1:9/submit")
+    )
+    uplink.enqueue("offline", {"payload_idx": 1})
+    assert not uplink.flush(timeout=0.3)
+    metrics = uplink.metrics()["offline"]
+    assert metrics["queue_depth"] == 1
+    assert metrics["dropped"] == 0
+
+
+def test_backoff_is_capped_after_many_failures(uplink):
+    channel = UplinkChannel(name="fabric", url="http://127.0.0.1:9/submit")
+    uplink._failures[channel.name] = 10_000
+
+    delay = uplink._schedule_retry(channel)
+
+    assert delay <= uplink.backoff_max_s * 1.2
+    assert uplink._failures[channel.name] == 10_001
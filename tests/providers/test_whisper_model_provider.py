@@ -0,0 +1,118 @@
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+
+from providers.singleton import singleton
+from providers.whisper_model_provider import (
+    WhisperModelProvider,
+    whisper_models_in_config,
+)
+
+
+class FakeModel:
+    def __init__(self, *key, **kwargs):
+        self.key = key
+
+
+@pytest.fixture
+def loads():
+    singleton.instances = {}
+    calls = []
+
+    def load(*key, **kwargs):
+        calls.append(key)
+        time.sleep(0.05)
+        return FakeModel(*key)
+
+    with patch("providers.whisper_model_provider._load_whisper_model", load):
+        yield calls
+    singleton.instances = {}
+
+
+def test_model_is_loaded_once_and_shared(loads):
+    provider = WhisperModelProvider(idle_timeout=0)
+    handles = []
+
+    def acquire():
+        handles.append(provider.acquire("tiny.en"))
+
+    threads = [threading.Thread(target=acquire) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert loads == [("tiny.en", "cpu", "int8")]
+    assert len({id(h.model) for h in handles}) == 1
+    assert provider.stats()["tiny.en/cpu/int8"]["refs"] == 4
+
+    other = provider.acquire("tiny.en", compute_type="float32")
+    assert other.model is not handles[0].model
+    assert len(loads) == 2
+
+
+def test_released_models_are_evicted_when_idle(loads):
+    provider = WhisperModelProvider(idle_timeout=0.1)
+    first = provider.acquire("base")
+    second = provider.acquire("base")
+
+    first.release()
+    first.release()
+    assert provider.evict_idle(force=True) == []
+
+    second.release()
+    # released too recently
+    assert provider.evict_idle() == []
+    time.sleep(0.3)
+    # the idle timer has unloaded it
+    assert provider.stats() == {}
+
+    provider.acquire("base").release()
+    assert len(loads) == 2
+
+
+def test_preloaded_models_are_kept_and_waited_for(loads):
+    provider = WhisperModelProvider(idle_timeout=0.01)
+    future = provider.preload("tiny")
+    # an input built during the preload waits for it instead of loading again
+    with provider.acquire("tiny") as model:
+        assert model is future.result(timeout=1)
+
+    time.sleep(0.05)
+    assert provider.evict_idle() == []
+    assert loads == [("tiny", "cpu", "int8")]
+    assert provider.evict_idle(force=True) == [("tiny", "cpu", "int8")]
+
+
+def test_models_in_config_cover_all_modes():
+    raw_config = {
+        "agent_inputs": [
+            {"type": "LocalASRInput", "config": {"engine": "faster-whisper"}},
+        ],
+        "modes": {
+            "a": {
+                "agent_inputs": [
+                    {
+                        "type": "LocalASRInput",
+                        "config": {"engine": "faster-whisper", "model_size": "tiny"},
+                    },
+                    {"type": "GoogleASRInput", "config": {}},
+                ]
+            },
+            "b": {
+                "agent_inputs": [
+                    {
+                        "type": "LocalASRInput",
+                        "config": {"engine": "faster-whisper", "model_size": "tiny"},
+                    }
+                ]
+            },
+        },
+    }
+
+    # the first input relies on its class default, which is not preloaded
+    assert whisper_models_in_config(raw_config) == [
+        {"model_size": "tiny", "device": "cpu", "compute_type": "int8"},
+    ]
@@ -0,0 +1,121 @@
+import time
+from unittest.mock import patch
+
+import pytest
+
+from runtime.multi_mode.config import (
+    ModeConfig,
+    ModeSystemConfig,
+    TransitionRule,
+    TransitionType,
+)
+from runtime.multi_mode.manager import ModeManager
+from runtime.multi_mode.transitions import CompiledTransitionRules, KeywordAutomaton
+
+
+def _rule(from_mode, to_mode, keywords, priority=1, **kwargs):
+    return TransitionRule(
+        from_mode=from_mode,
+        to_mode=to_mode,
+        transition_type=TransitionType.INPUT_TRIGGERED,
+        trigger_keywords=keywords,
+        priority=priority,
+        **kwargs,
+    )
+
+
+def test_automaton_finds_overlapping_keywords():
+    automaton = KeywordAutomaton()
+    for keyword_id, keyword in enumerate(["he", "she", "his", "hers"]):
+        automaton.add(keyword, keyword_id)
+
+    assert automaton.search("ushers") == {0, 1, 3}
+    assert automaton.search("this") == {2}
+    assert automaton.search("") == set()
+
+
+def test_automaton_word_boundaries():
+    automaton = KeywordAutomaton()
+    automaton.add("hi", 0, word_boundary=True)
+    automaton.add("help me", 1, word_boundary=True)
+
+    assert automaton.search("hi there") == {0}
+    assert automaton.search("well, hi!") == {0}
+    assert automaton.search("this and that") == set()
+    assert automaton.search("please help me.") == {1}
+    assert automaton.search("help meow") == set()
+
+
+def test_compiled_rules_priority_and_wildcards():
+    rules = [
+        _rule("a", "b", ["go"], priority=1),
+        _rule("*", "c", ["go now"], priority=5),
+        _rule("a", "d", ["go"], priority=1),
+        _rule("b", "a", ["go"], priority=9),
+        TransitionRule("a", "b", TransitionType.TIME_BASED),
+    ]
+    compiled = CompiledTransitionRules(rules, ["a", "b", "c", "d"])
+
+    index = compiled.for_mode("a")
+    assert [r.rule.to_mode for r in index.match_input("go now")] == ["c", "b", "d"]
+    assert [r.cooldown_key for r in index.match_input("go now")] == [
+        "a->c",
+        "a->b",
+        "a->d",
+    ]
+    assert [r.rule.to_mode for r in index.time_rules] == ["b"]
+    assert compiled.for_mode("b").match_input("go")[0].rule.to_mode == "a"
+    assert compiled.for_mode("unknown").match_input("go now")[0].cooldown_key == (
+        "*->c"
+    )
+
+
+def _manager(rules):
+    modes = {
+        name: ModeConfig(
+            name=name, display_name=name, description="", system_prompt_base=""
+        )
+        for name in ("default", "help", "tour")
+    }
+    config = ModeSystemConfig(
+        name="test", default_mode="default", modes=modes, mode_memory_enabled=False
+    )
+    config.transition_rules = rules
+    with patch("runtime.multi_mode.manager.open_zenoh_session"):
+        return ModeManager(config)
+
+
+def test_manager_matches_whole_words_only_when_asked():
+    manager = _manager(
+        [
+            _rule("default", "tour", ["tour"], word_boundary=True),
+            _rule("default", "help", ["help"]),
+        ]
+    )
+
+    assert manager.check_input_triggered_transitions("Detour ahead") is None
+    assert manager.check_input_triggered_transitions("Give me a TOUR") == "tour"
+    assert manager.check_input_triggered_transitions("helpful") == "help"
+
+
+def test_wildcard_rule_cooldown_uses_current_mode():
+    manager = _manager([_rule("*", "help", ["help"], cooldown_seconds=60.0)])
+
+    assert manager.check_input_triggered_transitions("help") == "help"
+    manager.transition_cooldowns["default->help"] = time.time()
+    assert manager.check_input_triggered_transitions("help") is None
+
+
+def test_manager_recompiles_when_rules_change():
+    manager = _manager([_rule("default", "help", ["help"])])
+    assert manager.check_input_triggered_transitions("a tour please") is None
+
+    manager.config.transition_rules.append(_rule("default", "tour", ["tour"]))
+    assert manager.check_input_triggered_transitions("a tour please") == "tour"
+
+
+@pytest.mark.parametrize("text", ["", None])
+def test_empty_input(text):
+    manager = _manager([_rule("default", "help", [""])])
+    assert manager.check_input_triggered_transitions(text) is None
+    assert manager.check_input_triggered_transitions("anything") == "help"
@@ -0,0 +1,113 @@
+from unittest.mock import Mock
+
+import pytest
+
+from actions.base import AgentAction
+from actions.move_go2_autonomy.interface import Move as Go2Move
+from actions.move_go2_teleops.interface import Move as TeleopsMove
+from actions.move_ub.interface import Move as UbMove
+from actions.speak.interface import Speak
+from runtime.intents import IntentMatcher, intent_matcher_from_config
+
+
+def _action(llm_label, interface):
+    return AgentAction(
+        name=llm_label,
+        llm_label=llm_label,
+        interface=interface,
+        connector=Mock(),
+        exclude_from_prompt=False,
+    )
+
+
+@pytest.fixture
+def actions():
+    return [_action("speak", Speak), _action("move", Go2Move)]
+
+
+@pytest.mark.parametrize(
+    "utterance,language,value",
+    [
+        ("Stop!", "en", "stand still"),
+        ("[LANG:en] Okay, can you stop now please", "en", "stand still"),
+        ("Turn left.", "en", "turn left"),
+        ("Come here", "en", "move forwards"),
+        ("¡Detente!", "es", "stand still"),
+        ("Gira a la izquierda", "es", "turn left"),
+        ("Стоп", "ru", "stand still"),
+        ("Повернись направо", "ru", "turn right"),
+        # ASR picked the wrong language for a command of several words
+        ("turn left", "es", "turn left"),
+        # no language tag on the voice input
+        ("para", None, "stand still"),
+    ],
+)
+def test_matches_commands(actions, utterance, language, value):
+    match = IntentMatcher(actions).match(utterance, language)
+
+    assert match is not None
+    assert match.confidence == 1.0
+    assert [(a.type, a.value) for a in match.actions] == [("move", value)]
+
+
+def test_similar_short_utterance_is_classified(actions):
+    match = IntentMatcher(actions).match("Tern left", "en")
+
+    assert match.intent == "turn_left"
+    assert 0.85 <= match.confidence < 1.0
+
+
+@pytest.mark.parametrize(
+    "utterance",
+    [
+        "Where is the restroom?",
+        "Can you stop talking about pricing and tell me about support",
+        "Don't stop",
+        "Hello",
+    ],
+)
+def test_leaves_other_input_to_the_llm(actions, utterance):
+    assert IntentMatcher(actions).match(utterance, "en") is None
+
+
+@pytest.mark.parametrize(
+    "utterance,language",
+    [("para", "en"), ("stay", "es"), ("ven", "en"), ("alto", "en")],
+)
+def test_single_words_are_not_taken_from_other_languages(actions, utterance, language):
+    assert IntentMatcher(actions).match(utterance, language) is None
+
+
+def test_intents_follow_configured_actions():
+    teleops = IntentMatcher([_action("move", TeleopsMove)])
+    assert teleops.match("sit down", "en").actions[0].value == "sit"
+    assert teleops.match("stand up", "en").actions[0].value == "stand up"
+    assert teleops.match("turn left", "en") is None
+
+    humanoid = IntentMatcher([_action("move", UbMove)])
+    assert humanoid.match("stop", "en").actions[0].value == "reset"
+    assert humanoid.match("come here", "en").actions[0].value == "come on"
+
+    assert IntentMatcher([_action("speak", Speak)]).match("stop", "en") is None
+
+
+def test_acknowledgement_in_spoken_language(actions):
+    match = IntentMatcher(actions, acknowledge=True).match("para", "es")
+
+    assert match.actions[1].type == "speak"
+    assert match.actions[1].value == {"sentence": "Me detengo.", "language": "es"}
+
+
+def test_config_adds_phrases_and_disables_intents(actions):
+    matcher = intent_matcher_from_config(
+        {
+            "phrases": {"stop": {"en": ["hold it"]}},
+            "disabled_intents": ["come_here"],
+        },
+        actions,
+    )
+
+    assert matcher.match("hold it", "en").intent == "stop"
+    assert matcher.match("come here", "en") is None
+    assert intent_matcher_from_config(None, actions) is None
+    assert intent_matcher_from_config({"enabled": False}, actions) is None
@@ -0,0 +1,197 @@
+import threading
+import time
+
+import pytest
+
+from providers.singleton import singleton
+from runtime.startup import (
+    PreflightCache,
+    PreflightProbe,
+    StartupOrchestrator,
+    StartupTimer,
+    construct_concurrently,
+)
+
+
+def _slow(value, delay=0.2):
+    def build():
+        time.sleep(delay)
+        return value
+
+    return build
+
+
+def test_construct_concurrently_preserves_order_and_overlaps():
+    start = time.time()
+    components = construct_concurrently(
+        {"inputs": [_slow("a"), _slow("b"), _slow("c")], "actions": [_slow("x")]},
+        max_workers=8,
+    )
+    elapsed = time.time() - start
+
+    assert components == {"inputs": ["a", "b", "c"], "actions": ["x"]}
+    assert elapsed < 0.6
+
+
+def test_construct_concurrently_sequential_and_errors():
+    assert construct_concurrently({"inputs": [_slow(1, 0), _slow(2, 0)]}, 1) == {
+        "inputs": [1, 2]
+    }
+
+    def broken():
+        raise ValueError("no such device")
+
+    with pytest.raises(ValueError):
+        construct_concurrently({"inputs": [_slow(1), broken]}, max_workers=4)
+
+
+def test_construct_concurrently_builds_first_groups_before_the_others():
+    singleton.instances = {}
+
+    @singleton
+    class SharedProvider:
+        def __init__(self, channel="default"):
+            self.channel = channel
+
+    def background():
+        # slower than the action, which would win the singleton otherwise
+        time.sleep(0.2)
+        return SharedProvider("odom").channel
+
+    components = construct_concurrently(
+        {
+            "agent_actions": [lambda: SharedProvider().channel],
+            "agent_inputs": [_slow("asr", 0)],
+            "backgrounds": [background],
+        },
+        max_workers=8,
+        first=["backgrounds"],
+    )
+
+    assert components == {
+        "agent_actions": ["odom"],
+        "agent_inputs": ["asr"],
+        "backgrounds": ["odom"],
+    }
+    assert list(components) == ["agent_actions", "agent_inputs", "backgrounds"]
+
+
+def test_construct_concurrently_inputs_configure_providers_before_actions():
+    singleton.instances = {}
+
+    @singleton
+    class LidarProvider:
+        def __init__(self, serial_port="/dev/ttyUSB0", local_planner=False):
+            self.serial_port = serial_port
+            self.local_planner = local_planner
+
+    def lidar_input():
+        time.sleep(0.2)
+        return LidarProvider("/dev/cu.usbserial", local_planner=True)
+
+    components = construct_concurrently(
+        {
+            "agent_inputs": [lidar_input],
+            "agent_actions": [LidarProvider, _slow("speak", 0)],
+        },
+        max_workers=8,
+        first=["backgrounds", "agent_inputs"],
+    )
+
+    lidar = components["agent_actions"][0]
+    assert lidar is components["agent_inputs"][0]
+    assert (lidar.serial_port, lidar.local_planner) == ("/dev/cu.usbserial", True)
+
+
+def test_preflight_cache_ttl(tmp_path):
+    path = str(tmp_path / "cache" / "preflight.json")
+    cache = PreflightCache(path=path, ttl_s=0.2)
+
+    assert not cache.is_fresh("llm:llama3.1:8b")
+    cache.record_success("llm:llama3.1:8b")
+    assert cache.is_fresh("llm:llama3.1:8b")
+    assert PreflightCache(path=path, ttl_s=0.2).is_fresh("llm:llama3.1:8b")
+    assert not cache.is_fresh("llm:other")
+
+    time.sleep(0.25)
+    assert not cache.is_fresh("llm:llama3.1:8b")
+
+    disabled = PreflightCache(path=path, ttl_s=0)
+    disabled.record_success("audio:None")
+    assert not disabled.is_fresh("audio:None")
+
+
+def test_orchestrator_runs_probes_concurrently_and_caches(tmp_path):
+    cache = PreflightCache(path=str(tmp_path / "preflight.json"), ttl_s=60)
+    calls = []
+    failures = []
+
+    def probe(name, ok):
+        def check():
+            calls.append(name)
+            time.sleep(0.2)
+            return ok
+
+        return check
+
+    probes = [
+        PreflightProbe("llm", probe("llm", True), cache_key="m"),
+        PreflightProbe(
+            "audio",
+            probe("audio", False),
+            on_failure=lambda: failures.append("audio"),
+            exclusive=True,
+        ),
+    ]
+
+    start = time.time()
+    results = StartupOrchestrator(probes, cache=cache, timer=StartupTimer()).wait()
+    assert time.time() - start < 0.35
+    assert results == {"llm": True, "audio": False}
+    assert failures == ["audio"]
+
+    calls.clear()
+    results = StartupOrchestrator(probes, cache=cache, timer=StartupTimer()).wait()
+    assert results == {"llm": True, "audio": False}
+    assert calls == ["audio"]
+
+
+def test_wait_for_exclusive_only_waits_for_exclusive_probes():
+    release = threading.Event()
+    probes = [
+        PreflightProbe("llm", lambda: release.wait(5)),
+        PreflightProbe("audio", lambda: True, exclusive=True),
+    ]
+    orchestrator = StartupOrchestrator(probes, timer=StartupTimer())
+    orchestrator.start()
+
+    orchestrator.wait_for_exclusive()
+    assert not orchestrator._futures["llm"].done()
+
+    release.set()
+    assert orchestrator.wait() == {"llm": True, "audio": True}
+
+
+def test_probe_exception_counts_as_failure():
+    def boom():
+        raise RuntimeError("ollama down")
+
+    orchestrator = StartupOrchestrator(
+        [PreflightProbe("llm", boom)], timer=StartupTimer()
+    )
+    assert orchestrator.wait() == {"llm": False}
+
+
+def test_timer_records_phases_and_first_tick_once():
+    timer = StartupTimer()
+    with timer.phase("parse_config"):
+        time.sleep(0.01)
+
+    timer.mark_first_tick()
+    first = timer.summary()["first_tick_s"]
+    time.sleep(0.01)
+    timer.mark_first_tick()
+
+    summary = timer.summary()
+    assert summary["phases"]["parse_config"] >= 0.01
+    assert summary["first_tick_s"] == first
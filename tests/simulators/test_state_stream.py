@@ -0,0 +1,97 @@
+import asyncio
+import json
+
+import pytest
+
+from simulators.state_stream import StateStream
+
+
+class FakeWebSocket:
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self.sent = []
+        self.incoming: asyncio.Queue = asyncio.Queue()
+
+    async def send_text(self, text: str):
+        await asyncio.sleep(self.delay)
+        self.sent.append(json.loads(text))
+
+    async def receive_text(self) -> str:
+        return await self.incoming.get()
+
+    async def close(self):
+        pass
+
+
+def test_publish_only_on_change():
+    stream = StateStream()
+    assert stream.publish({"a": 1, "b": [1, 2]})
+    assert not stream.publish({"a": 1, "b": [1, 2]})
+    assert stream.publish({"a": 2, "b": [1, 2]})
+    assert stream.version == 2
+
+
+def test_message_for_diff_and_snapshot():
+    stream = StateStream()
+    stream.publish({"a": 1, "b": 2})
+    stream.publish({"a": 1, "c": 3})
+
+    version, text = stream.message_for(1)
+    diff = json.loads(text)
+    assert version == 2
+    assert diff == {"type": "diff", "version": 2, "changed": {"c": 3}, "removed": ["b"]}
+
+    _, text = stream.message_for(0)
+    snapshot = json.loads(text)
+    assert snapshot == {"type": "snapshot", "version": 2, "state": {"a": 1, "c": 3}}
+
+    assert stream.message_for(2) == (2, None)
+
+
+@pytest.mark.asyncio
+async def test_slow_client_gets_latest_snapshot():
+    stream = StateStream()
+    stream.publish({"tick": 0})
+
+    fast = FakeWebSocket()
+    slow = FakeWebSocket(delay=0.2)
+    tasks = [
+        asyncio.create_task(stream.serve(fast)),
+        asyncio.create_task(stream.serve(slow)),
+    ]
+    await asyncio.sleep(0.05)
+
+    for i in range(1, 6):
+        stream.publish({"tick": i})
+        await asyncio.sleep(0.02)
+    await asyncio.sleep(0.5)
+
+    # the fast client saw every version as a diff
+    assert [m["version"] for m in fast.sent] == [1, 2, 3, 4, 5, 6]
+    assert all(m["type"] == "diff" for m in fast.sent[1:])
+
+    # the slow client skipped versions and caught up with one snapshot
+    assert slow.sent[-1] == {"type": "snapshot", "version": 6, "state": {"tick": 5}}
+    assert len(slow.sent) < len(fast.sent)
+    assert stream.metrics["versions_skipped"] > 0
+
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+
+@pytest.mark.asyncio
+async def test_resync_sends_snapshot():
+    stream = StateStream()
+    stream.publish({"a": 1})
+    stream.publish({"a": 2})
+
+    ws = FakeWebSocket()
+    task = asyncio.create_task(stream.serve(ws))
+    await asyncio.sleep(0.05)
+    await ws.incoming.put("resync")
+    await asyncio.sleep(0.05)
+
+    assert [m["type"] for m in ws.sent] == ["snapshot", "snapshot"]
+    task.cancel()
+    await asyncio.gather(task, return_exceptions=True)
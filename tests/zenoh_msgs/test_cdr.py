@@ -0,0 +1,106 @@
+import numpy as np
+import pytest
+from pycdr2 import Endianness
+
+from zenoh_msgs import (
+    Header,
+    Image,
+    LaserScan,
+    Point32,
+    PointCloud,
+    PointField,
+    Time,
+    decode_image,
+    decode_laser_scan,
+    decode_point_cloud,
+)
+
+
+def _header(frame_id: str = "laser") -> Header:
+    return Header(stamp=Time(sec=12, nanosec=345), frame_id=frame_id)
+
+
+@pytest.mark.parametrize("endianness", [Endianness.Little, Endianness.Big])
+def test_laser_scan_matches_pycdr2(endianness):
+    msg = LaserScan(
+        header=_header(),
+        angle_min=-3.0,
+        angle_max=3.0,
+        angle_increment=0.5,
+        time_increment=0.001,
+        scan_time=0.1,
+        range_min=0.15,
+        range_max=12.0,
+        ranges=[1.0, 2.5, float("inf"), 0.25],
+        intensities=[10.0, 20.0],
+    )
+    payload = msg.serialize(endianness=endianness)
+    reference = LaserScan.deserialize(payload)
+
+    scan = decode_laser_scan(payload)
+    assert scan.header == reference.header
+    assert scan.angle_increment == pytest.approx(reference.angle_increment)
+    assert scan.range_max == pytest.approx(reference.range_max)
+    np.testing.assert_array_equal(scan.ranges, reference.ranges)
+    np.testing.assert_array_equal(scan.intensities, reference.intensities)
+    assert not scan.ranges.flags.writeable
+
+
+@pytest.mark.parametrize("frame_id", ["", "a", "camera_depth_optical_frame"])
+def test_point_cloud_matches_pycdr2(frame_id):
+    msg = PointCloud(
+        header=_header(frame_id),
+        points=[Point32(x=1.0, y=2.0, z=3.0), Point32(x=-4.0, y=5.5, z=0.0)],
+        channels=[PointField(name="intensity", offset=0, datatype=7, count=1)],
+    )
+    cloud = decode_point_cloud(msg.serialize())
+
+    assert cloud.header.frame_id == frame_id
+    assert cloud.points.shape == (2, 3)
+    np.testing.assert_array_equal(cloud.points[1], [-4.0, 5.5, 0.0])
+    assert cloud.channels == msg.channels
+
+
+def test_empty_point_cloud():
+    msg = PointCloud(header=_header(), points=[], channels=[])
+    assert decode_point_cloud(msg.serialize()).points.shape == (0, 3)
+
+
+def test_image_to_ndarray():
+    pixels = np.arange(2 * 4 * 3, dtype=np.uint8)
+    msg = Image(
+        header=_header("camera"),
+        height=2,
+        width=3,
+        encoding="rgb8",
+        is_bigendian=0,
+        step=12,
+        data=pixels.tobytes(),
+    )
+    image = decode_image(msg.serialize())
+
+    assert (image.height, image.width, image.encoding) == (2, 3, "rgb8")
+    array = image.to_ndarray()
+    assert array.shape == (2, 3, 3)
+    # the last 3 bytes of every row are padding
+    np.testing.assert_array_equal(array[1, 0], [12, 13, 14])
+
+    image.encoding = "yuv422"
+    assert image.to_ndarray() is None
+
+
+def test_truncated_payload_raises():
+    msg = LaserScan(
+        header=_header(),
+        angle_min=0.0,
+        angle_max=1.0,
+        angle_increment=0.1,
+        time_increment=0.0,
+        scan_time=0.1,
+        range_min=0.1,
+        range_max=10.0,
+        ranges=[1.0] * 10,
+        intensities=[],
+    )
+    with pytest.raises(ValueError):
+        decode_laser_scan(msg.serialize()[:-20])